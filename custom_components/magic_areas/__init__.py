@@ -8,8 +8,26 @@ from homeassistant.const import ATTR_NAME
 from homeassistant.core import HomeAssistant
 from custom_components.magic_areas.coordinator import (
     MagicAreasCoordinator,
+    async_get_reload_queue,
+    SETUP_PHASE_CONFIG,
+    SETUP_PHASE_FIRST_REFRESH,
+    SETUP_PHASE_PLATFORMS,
+    SETUP_PHASE_RUNTIME_CONTROLLERS,
+    async_get_setup_pipeline,
+    async_release_setup_pipeline,
     attach_registry_listeners,
 )
+from custom_components.magic_areas.area_state import META_AREA_GLOBAL
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.config import reload_max_concurrency
+from custom_components.magic_areas.core.control_intents import (
+    async_release_adaptive_lighting_executor,
+    async_release_role_target_cache,
+)
+from custom_components.magic_areas.core.controls import (
+    async_release_cover_command_batcher,
+)
+from custom_components.magic_areas.core.meta import async_release_area_topology_index
 from custom_components.magic_areas.enums import MagicConfigEntryVersion
 from custom_components.magic_areas.helpers import build_area_config_for_config_entry
 from custom_components.magic_areas.migrations import apply_applicable_migrations
@@ -25,91 +43,99 @@ async def async_setup_entry(
     hass: HomeAssistant, config_entry: MagicAreasConfigEntry
 ) -> bool:
     """Set up the component."""
+    setup_pipeline = async_get_setup_pipeline(hass)
 
     async def _async_setup_integration() -> bool:
         """Load integration when Hass has finished starting."""
         _LOGGER.debug("Setting up entry for %s", config_entry.data[ATTR_NAME])
 
-        # Build AreaConfig directly from registry (coordinator's primary config source)
-        area_config = build_area_config_for_config_entry(hass, config_entry)
-        if area_config is None:
-            _LOGGER.error(
-                "Failed to build area config for entry %s",
-                config_entry.entry_id,
+        entry_id = config_entry.entry_id
+        with setup_pipeline.phase(entry_id, SETUP_PHASE_CONFIG):
+            # Build AreaConfig directly from registry (coordinator's primary config source)
+            area_config = build_area_config_for_config_entry(hass, config_entry)
+            if area_config is None:
+                _LOGGER.error(
+                    "Failed to build area config for entry %s",
+                    config_entry.entry_id,
+                )
+                return False
+
+            _LOGGER.debug(
+                "%s: Magic Area (%s) created: %s",
+                area_config.name,
+                area_config.id,
+                str(area_config.config),
             )
-            return False
 
-        _LOGGER.debug(
-            "%s: Magic Area (%s) created: %s",
-            area_config.name,
-            area_config.id,
-            str(area_config.config),
-        )
+            # The global meta area holds house-wide options.
+            if area_config.id == META_AREA_GLOBAL.lower():
+                async_get_reload_queue(hass).max_concurrency = reload_max_concurrency(
+                    area_config.config
+                )
 
-        # Setup config update listener
-        tracked_listeners: list[Callable[[], None]] = [
-            config_entry.add_update_listener(async_update_options)
-        ]
+            # Setup config update listener
+            tracked_listeners: list[Callable[[], None]] = [
+                config_entry.add_update_listener(async_update_options)
+            ]
+
+            # Watch for area changes.
+            if not area_config.is_meta():
+                attach_registry_listeners(
+                    hass,
+                    config_entry,
+                    area_config,
+                    tracked_listeners,
+                    hot_apply=lambda: _async_hot_apply_inventory(hass, config_entry),
+                )
 
-        # Watch for area changes.
-        if not area_config.is_meta():
-            attach_registry_listeners(
-                hass, config_entry, area_config, tracked_listeners
-            )
+        # At startup every entry sets up at once; let child setups land first.
+        # Later reloads are already ordered children-first by the reload queue.
+        if area_config.is_meta() and not hass.is_running:
+            await setup_pipeline.async_wait_for_children(entry_id)
 
-        coordinator = MagicAreasCoordinator(hass, area_config, config_entry)
-        if config_entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
-            await coordinator.async_config_entry_first_refresh()
-        else:
-            await coordinator.async_refresh()
+        coordinator = MagicAreasCoordinator(
+            hass,
+            area_config,
+            config_entry,
+            hot_apply=lambda: _async_hot_apply_inventory(hass, config_entry),
+        )
+        with setup_pipeline.phase(entry_id, SETUP_PHASE_FIRST_REFRESH):
+            if config_entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
+                await coordinator.async_config_entry_first_refresh()
+            else:
+                await coordinator.async_refresh()
 
         config_entry.runtime_data = MagicAreasRuntimeData(
             coordinator=coordinator,
             listeners=tracked_listeners,
         )
 
-        from custom_components.magic_areas.coordinator import (
-            async_reconcile_managed_adaptive_lighting,
-            async_reconcile_managed_surfaces,
-        )
         from custom_components.magic_areas.features.dispatch import (
+            async_apply_feature_surfaces,
             async_start_feature_runtime_controllers,
-            collect_feature_managed_adaptive_lighting_configs,
-            collect_feature_managed_surfaces,
         )
         from custom_components.magic_areas.features.registry import FEATURE_REGISTRY
 
         if coordinator.data:
-            await async_reconcile_managed_surfaces(
+            await async_apply_feature_surfaces(
                 hass=hass,
                 owner_entry_id=config_entry.entry_id,
-                desired_surfaces=collect_feature_managed_surfaces(
-                    registry=FEATURE_REGISTRY,
-                    data=coordinator.data,
-                    area_config=area_config,
-                    logger=_LOGGER,
-                ),
+                registry=FEATURE_REGISTRY,
+                data=coordinator.data,
+                area_config=area_config,
+                logger=_LOGGER,
             )
-            await async_reconcile_managed_adaptive_lighting(
-                hass=hass,
-                area_id=area_config.id,
-                desired_configs=collect_feature_managed_adaptive_lighting_configs(
-                    registry=FEATURE_REGISTRY,
-                    data=coordinator.data,
-                    area_config=area_config,
-                    logger=_LOGGER,
-                ),
-            )
-            config_entry.runtime_data.runtime_controllers = (
-                await async_start_feature_runtime_controllers(
-                    registry=FEATURE_REGISTRY,
-                    data=coordinator.data,
-                    area_config=area_config,
-                    coordinator=coordinator,
-                    track_cleanup=tracked_listeners.append,
-                    logger=_LOGGER,
+            with setup_pipeline.phase(entry_id, SETUP_PHASE_RUNTIME_CONTROLLERS):
+                config_entry.runtime_data.runtime_controllers = (
+                    await async_start_feature_runtime_controllers(
+                        registry=FEATURE_REGISTRY,
+                        data=coordinator.data,
+                        area_config=area_config,
+                        coordinator=coordinator,
+                        track_cleanup=tracked_listeners.append,
+                        logger=_LOGGER,
+                    )
                 )
-            )
 
         # Setup platforms (get from coordinator data after refresh)
         platforms = (
@@ -117,10 +143,34 @@ async def async_setup_entry(
             if coordinator.data
             else []
         )
-        await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+        with setup_pipeline.phase(entry_id, SETUP_PHASE_PLATFORMS):
+            await hass.config_entries.async_forward_entry_setups(
+                config_entry, platforms
+            )
         return True
 
-    return await _async_setup_integration()
+    setup_pipeline.begin(config_entry.entry_id)
+    try:
+        return await _async_setup_integration()
+    finally:
+        setup_pipeline.mark_ready(config_entry.entry_id)
+
+
+async def _async_hot_apply_inventory(
+    hass: HomeAssistant, config_entry: MagicAreasConfigEntry
+) -> bool:
+    """Apply an inventory or child membership change to a loaded entry in place."""
+    from custom_components.magic_areas.features.dispatch import (
+        async_hot_apply_feature_inventory,
+    )
+    from custom_components.magic_areas.features.registry import FEATURE_REGISTRY
+
+    return await async_hot_apply_feature_inventory(
+        hass=hass,
+        config_entry=config_entry,
+        registry=FEATURE_REGISTRY,
+        logger=_LOGGER,
+    )
 
 
 async def async_update_options(
@@ -130,7 +180,9 @@ async def async_update_options(
     _LOGGER.debug(
         "Detected options change for entry %s, reloading", config_entry.entry_id
     )
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    async_get_reload_queue(hass).request(
+        config_entry.entry_id, reason="options updated"
+    )
 
 
 async def async_unload_entry(
@@ -154,9 +206,24 @@ async def async_unload_entry(
     for tracked_listener in area_data.listeners:
         tracked_listener()
 
+    if not any(
+        entry.entry_id != config_entry.entry_id
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ):
+        _async_release_house_listeners(hass)
+
     return all_unloaded
 
 
+def _async_release_house_listeners(hass: HomeAssistant) -> None:
+    """Drop house-level registry listeners once the last area has unloaded."""
+    async_release_role_target_cache(hass)
+    async_release_adaptive_lighting_executor(hass)
+    async_release_area_topology_index(hass)
+    async_release_setup_pipeline(hass)
+    async_release_cover_command_batcher(hass)
+
+
 # Update config version
 async def async_migrate_entry(
     hass: HomeAssistant, config_entry: MagicAreasConfigEntry
@@ -10,14 +10,16 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 
 from custom_components.magic_areas.entity import MagicEntity
 from custom_components.magic_areas.const import (
     ATTR_ACTIVE_SENSORS,
 )
+from custom_components.magic_areas.core.ble_location import (
+    async_get_ble_location_router,
+)
 from custom_components.magic_areas.features.config.readers import (
     ble_tracker_config,
 )
@@ -36,6 +38,7 @@ class AreaBLETrackerBinarySensor(MagicEntity, BinarySensorEntity):
 
     feature_id = MagicAreasFeatures.BLE_TRACKER
     _sensors: list[str]
+    _active_sensors: tuple[str, ...]
     _listener_registry: ListenerRegistry
     _area_id: str
     _area_name: str
@@ -60,6 +63,7 @@ class AreaBLETrackerBinarySensor(MagicEntity, BinarySensorEntity):
             ATTR_ACTIVE_SENSORS: [],
         }
         self._attr_is_on: bool = False
+        self._active_sensors = ()
         self._listener_registry = ListenerRegistry(logger_name=type(self).__module__)
 
     async def async_added_to_hass(self) -> None:
@@ -75,41 +79,31 @@ class AreaBLETrackerBinarySensor(MagicEntity, BinarySensorEntity):
         _LOGGER.debug("%s: BLE Tracker monitor sensor initialized", self._area_name)
 
     async def _setup_listeners(self) -> None:
-        """Attach state change listeners."""
+        """Register this area's sensors with the house-level BLE router."""
+        router = async_get_ble_location_router(self.hass)
         self._listener_registry.track(
-            "sensor_state_change",
-            async_track_state_change_event(
-                self.hass, self._sensors, self._sensor_state_change
+            "ble_location_router",
+            router.register(
+                self._area_id,
+                sensors=self._sensors,
+                locations=(self._area_slug, self._area_id, self._area_name),
+                on_change=self._active_sensors_changed,
             ),
         )
+        self._active_sensors = router.active_sensors(self._area_id)
 
-    def _sensor_state_change(self, event: Event[EventStateChangedData]) -> None:
-        """Call update state from track state change event."""
-
+    @callback
+    def _active_sensors_changed(self, active_sensors: tuple[str, ...]) -> None:
+        """Publish the sensors the router now places in this area."""
+        self._active_sensors = active_sensors
         self._update_state()
 
     @callback
     def _update_state(self, extra: datetime | None = None) -> None:
-        """Calculate state based off BLE tracker sensors."""
-
-        calculated_state: bool = False
-        active_sensors: list[str] = []
-
-        for sensor in self._sensors:
-            sensor_state = self.hass.states.get(sensor)
-
-            if not sensor_state:
-                continue
-
-            normalized_state = sensor_state.state.lower()
+        """Publish state from the sensors currently reporting this area."""
 
-            if (
-                normalized_state == self._area_slug
-                or normalized_state == self._area_id
-                or normalized_state == self._area_name.lower()
-            ):
-                calculated_state = True
-                active_sensors.append(sensor)
+        calculated_state = bool(self._active_sensors)
+        active_sensors = list(self._active_sensors)
 
         _LOGGER.debug(
             "%s: BLE Tracker monitor sensor state change: %s -> %s",
@@ -120,8 +114,7 @@ class AreaBLETrackerBinarySensor(MagicEntity, BinarySensorEntity):
 
         self._attr_is_on = calculated_state
         self._attr_extra_state_attributes[ATTR_ACTIVE_SENSORS] = active_sensors
-        # BLE callbacks may arrive off the event loop; keep scheduler writes.
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up listeners on removal."""
@@ -1,6 +1,6 @@
 """Main presence tracking entity for Magic Areas."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING
@@ -11,8 +11,8 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.components.sun.const import STATE_ABOVE_HORIZON
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
 from homeassistant.helpers.event import (
     async_call_later,
@@ -36,7 +36,6 @@ from custom_components.magic_areas.const import (
     ATTR_PRESENCE_SENSORS,
     ATTR_STATES,
     ATTR_TYPE,
-    DOMAIN,
     ONE_MINUTE,
 )
 from custom_components.magic_areas.config_keys.area import (
@@ -49,15 +48,17 @@ from custom_components.magic_areas.core.config import (
     secondary_states_config,
 )
 from custom_components.magic_areas.core.listener_registry import ListenerRegistry
-from custom_components.magic_areas.core.meta import aggregate_secondary_states
+from custom_components.magic_areas.core.meta import SecondaryStateCounters
+from custom_components.magic_areas.core.meta_tree import (
+    LeafSignature,
+    async_get_meta_propagation_tree,
+    meta_parent_id,
+)
 from custom_components.magic_areas.core.presence_tracker import (
     PresenceTracker,
     PresenceUpdate,
     compute_secondary_states,
 )
-from custom_components.magic_areas.core.runtime_model import (
-    build_presence_tracking_unique_id,
-)
 
 if TYPE_CHECKING:  # pragma: no cover
     from custom_components.magic_areas.core.runtime_model import AreaConfig
@@ -77,6 +78,7 @@ _STATE_DISPLAY_ORDER: tuple[str, ...] = (
     AreaStates.DARK.value,
     AreaStates.BRIGHT.value,
 )
+_CONFIGURABLE_AREA_STATES: tuple[str, ...] = tuple(CONFIGURABLE_AREA_STATE_MAP)
 _STATE_LABELS: dict[str, str] = {
     AreaStates.CLEAR.value: "Clear",
     AreaStates.OCCUPIED.value: "Occupied",
@@ -566,6 +568,13 @@ class MetaAreaStateBinarySensor(AreaStateBinarySensor):
 
     ignore_non_state_change: bool = False
 
+    def __init__(
+        self, area_config: "AreaConfig", coordinator: "MagicAreasCoordinator"
+    ) -> None:
+        """Initialize the meta presence sensor and its child-state counters."""
+        super().__init__(area_config, coordinator)
+        self._secondary_counters = SecondaryStateCounters()
+
     async def _load_attributes(self) -> None:
         await super()._load_attributes()
         # Get child areas from coordinator snapshot (all child areas, not just active)
@@ -576,37 +585,82 @@ class MetaAreaStateBinarySensor(AreaStateBinarySensor):
             }
         )
 
-    def _get_secondary_states(self) -> list[str]:
-        """Return secondary states for an area through calculation."""
+    def _track_presence_sensor_listener(self, sensors: list[str]) -> None:
+        """Receive child presence changes through the meta propagation tree."""
+        self._clear_presence_sensor_listener()
+        if not sensors:
+            return
+        self._presence_sensor_listener_remove = async_get_meta_propagation_tree(
+            self.hass
+        ).register(
+            self._area_id,
+            sensors,
+            self,
+            parent_id=meta_parent_id(self._area_id),
+            composable=self._secondary_states_mode() == CalculationMode.ANY,
+        )
 
-        mode: CalculationMode = CalculationMode(
-            secondary_states_calculation_mode(self._area_config_dict)
+    def sync_meta_children(
+        self, children: Mapping[str, LeafSignature]
+    ) -> LeafSignature:
+        """Reset the child-state counters from the tree's current children."""
+        self._secondary_counters.retain(children)
+        for child_id, signature in children.items():
+            self._secondary_counters.set_child(
+                child_id, _active_child_states(signature)
+            )
+        return self._derived_signature()
+
+    def apply_meta_child_change(
+        self, child_id: str, old: LeafSignature, new: LeafSignature
+    ) -> LeafSignature:
+        """Apply one child's delta and return this meta area's new signature."""
+        self._secondary_counters.set_child(child_id, _active_child_states(new))
+        changed = self._presence_tracker.handle_sensor_state_change(
+            entity_id=child_id,
+            to_state=new[0],
+            old_state=old[0],
+            ignore_non_state_change=self.ignore_non_state_change,
+        )
+        if changed:
+            # The tree delivers on the event loop, so re-evaluate in place.
+            if new[0] not in self._tracker.valid_on_states():
+                self._remove_clear_timeout()
+            self._update_state()
+        return self._derived_signature()
+
+    def _derived_signature(self) -> LeafSignature:
+        """Return the presence and secondary states derived from the children."""
+        counters = self._secondary_counters
+        return (
+            STATE_ON if counters.active_child_count else STATE_OFF,
+            frozenset(self._get_secondary_states()),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up child membership changes from a refreshed meta snapshot."""
+        child_areas = self._coordinator_child_areas(active_only=False)
+        if self._attr_extra_state_attributes.get(ATTR_AREAS) != child_areas:
+            self._attr_extra_state_attributes[ATTR_AREAS] = child_areas
+            self.schedule_update_ha_state()
+        super()._handle_coordinator_update()
+
+    def _apply_sensor_inventory_update(self, new_sensors: list[str]) -> None:
+        """Track a changed child inventory and re-evaluate from live child states."""
+        super()._apply_sensor_inventory_update(new_sensors)
+        self._schedule_state_refresh()
+
+    def _get_secondary_states(self) -> list[str]:
+        """Return secondary states aggregated from live child-state counters."""
+        return self._secondary_counters.aggregate(
+            str(self._secondary_states_mode().value), _CONFIGURABLE_AREA_STATES
         )
 
-        # Get child areas from coordinator snapshot
-        child_areas = self._coordinator_child_areas(active_only=True)
-        child_state_lists: list[list[str]] = []
-
-        entity_registry = er.async_get(self.hass)
-        for area_id in child_areas:
-            if not (
-                area_entity_id := entity_registry.async_get_entity_id(
-                    BINARY_SENSOR_DOMAIN,
-                    DOMAIN,
-                    build_presence_tracking_unique_id(area_id=area_id),
-                )
-            ):
-                continue
-            if not (area_state := self.hass.states.get(area_entity_id)):
-                continue
-            if not isinstance(states := area_state.attributes.get(ATTR_STATES), list):
-                continue
-            child_state_lists.append(states)
-
-        return aggregate_secondary_states(
-            child_state_lists=child_state_lists,
-            mode=str(mode.value),
-            configurable_states=list(CONFIGURABLE_AREA_STATE_MAP.keys()),
+    def _secondary_states_mode(self) -> CalculationMode:
+        """Return how this meta area aggregates its children's secondary states."""
+        return CalculationMode(
+            secondary_states_calculation_mode(self._area_config_dict)
         )
 
     def _coordinator_child_areas(self, *, active_only: bool) -> list[str]:
@@ -616,3 +670,9 @@ class MetaAreaStateBinarySensor(AreaStateBinarySensor):
         if active_only:
             return self._coordinator.data.active_areas
         return self._coordinator.data.child_areas
+
+
+def _active_child_states(signature: LeafSignature) -> frozenset[str] | None:
+    """Return a child's states while its presence is on."""
+    state, states = signature
+    return states if state == STATE_ON else None
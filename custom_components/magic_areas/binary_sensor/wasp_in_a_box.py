@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -10,9 +10,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import STATE_OFF
 from homeassistant.core import Event, EventStateChangedData, State, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 
 from custom_components.magic_areas.entity import MagicEntity
 from custom_components.magic_areas.const import ONE_MINUTE
@@ -41,6 +44,10 @@ _LOGGER = logging.getLogger(__name__)
 ATTR_BOX = "box"
 ATTR_WASP = "wasp"
 
+# Sensor ON counts follow state-change deltas; a periodic full read corrects
+# any drift from missed or out-of-order events.
+WASP_COUNT_RESYNC_INTERVAL = timedelta(minutes=5)
+
 
 class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
     """Wasp In The Box logic tracking sensor for the area."""
@@ -126,6 +133,10 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
                 if dc_state:
                     self._box_sensors.append(dc_entity_id)
 
+        self._machine.resync(
+            self._get_current_wasp_states(), self._get_current_box_states()
+        )
+
         # Add listeners
         if self._wasp_sensors:
             self._listener_registry.track(
@@ -141,6 +152,13 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
                     self.hass, self._box_sensors, self._async_box_sensor_state_change
                 ),
             )
+        if self._wasp_sensors or self._box_sensors:
+            self._listener_registry.track(
+                "sensor_count_resync",
+                async_track_time_interval(
+                    self.hass, self._async_resync_counts, WASP_COUNT_RESYNC_INTERVAL
+                ),
+            )
 
     async def async_will_remove_from_hass(self) -> None:
         """Call to remove the entity to hass."""
@@ -160,6 +178,10 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
 
         new_state: State | None = event.data.get("new_state")
         old_state: State | None = event.data.get("old_state")
+        self._machine.apply_wasp_change(
+            old_state.state if old_state else None,
+            new_state.state if new_state else None,
+        )
 
         # Ignore state reports that aren't really a state change
         if new_state is None or old_state is None:
@@ -167,11 +189,7 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
         if new_state.state == old_state.state:
             return
 
-        # Build current sensor states and update machine
-        wasp_states = self._get_current_wasp_states()
-        box_states = self._get_current_box_states()
-        update = self._machine.update_all(wasp_states, box_states)
-        self._apply_update(update)
+        self._apply_update(self._machine.evaluate())
 
     @callback
     async def _async_box_sensor_state_change(
@@ -181,6 +199,10 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
 
         new_state: State | None = event.data.get("new_state")
         old_state: State | None = event.data.get("old_state")
+        self._machine.apply_box_change(
+            old_state.state if old_state else None,
+            new_state.state if new_state else None,
+        )
 
         # Ignore state reports that aren't really a state change
         if new_state is None or old_state is None:
@@ -198,20 +220,21 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
                 self._delay, self._on_box_delay_complete, new_state.state
             )
         else:
-            # Immediate update
-            wasp_states = self._get_current_wasp_states()
-            box_states = self._get_current_box_states()
-            update = self._machine.update_all(wasp_states, box_states)
-            self._apply_update(update)
+            self._apply_update(self._machine.evaluate())
 
     def _on_box_delay_complete(self, box_state_at_event: str) -> None:
         """Handle completion of box sensor delay after close event."""
         self._box_delay_handle = None
-        # Get current states now that delay has elapsed
-        wasp_states = self._get_current_wasp_states()
-        box_states = self._get_current_box_states()
-        update = self._machine.on_delay_complete(wasp_states, box_states)
-        self._apply_update(update)
+        self._apply_update(self._machine.evaluate())
+
+    async def _async_resync_counts(self, now: datetime) -> None:
+        """Re-read every sensor and re-evaluate if the counts had drifted."""
+        del now
+        drifted = self._machine.resync(
+            self._get_current_wasp_states(), self._get_current_box_states()
+        )
+        if drifted and self._box_delay_handle is None:
+            self._apply_update(self._machine.evaluate())
 
     def _get_current_wasp_states(self) -> dict[str, str]:
         """Get current state of all wasp sensors."""
@@ -259,18 +282,8 @@ class AreaWaspInABoxBinarySensor(MagicEntity, BinarySensorEntity):
         if self._attr_extra_state_attributes is None:
             self._attr_extra_state_attributes = {}
 
-        # Determine current wasp and box states for attributes
-        wasp_states = self._get_current_wasp_states()
-        box_states = self._get_current_box_states()
-        current_wasp = (
-            STATE_ON if any(s == STATE_ON for s in wasp_states.values()) else STATE_OFF
-        )
-        current_box = (
-            STATE_ON if any(s == STATE_ON for s in box_states.values()) else STATE_OFF
-        )
-
-        self._attr_extra_state_attributes[ATTR_BOX] = current_box
-        self._attr_extra_state_attributes[ATTR_WASP] = current_wasp
+        self._attr_extra_state_attributes[ATTR_BOX] = self._machine.box_counts.state
+        self._attr_extra_state_attributes[ATTR_WASP] = self._machine.wasp_counts.state
         self._attr_is_on = update.is_present
 
         self.async_write_ha_state()
@@ -42,15 +42,22 @@ from custom_components.magic_areas.config_keys.area import (
 )
 from custom_components.magic_areas.config_keys.area import (
     CONF_IGNORE_DIAGNOSTIC_ENTITIES,
+    CONF_RELOAD_MAX_CONCURRENCY,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
+    CONF_VERBOSE_CONTROL_DIAGNOSTICS,
 )
 from custom_components.magic_areas.defaults import (
     ALL_PRESENCE_DEVICE_PLATFORMS,
 )
-from custom_components.magic_areas.area_state import AreaStates, AreaType
+from custom_components.magic_areas.area_state import (
+    META_AREA_GLOBAL,
+    AreaStates,
+    AreaType,
+)
 from custom_components.magic_areas.enums import CalculationMode, SelectorTranslationKeys
 from custom_components.magic_areas.policy import ALL_BINARY_SENSOR_DEVICE_CLASSES
 from custom_components.magic_areas.schemas import (
+    GLOBAL_META_AREA_BASIC_OPTIONS_SCHEMA,
     META_AREA_BASIC_OPTIONS_SCHEMA,
     META_AREA_PRESENCE_TRACKING_OPTIONS_SCHEMA,
     META_AREA_SECONDARY_STATES_SCHEMA,
@@ -160,11 +167,13 @@ async def handle_area_config(
 ) -> config_entries.ConfigFlowResult:
     """Handle area configuration step."""
     success_step = on_success or flow.async_step_show_menu
-    options_schema = (
-        META_AREA_BASIC_OPTIONS_SCHEMA
-        if (flow._area_config and flow._area_config.is_meta())
-        else REGULAR_AREA_BASIC_OPTIONS_SCHEMA
-    )
+    options_schema = REGULAR_AREA_BASIC_OPTIONS_SCHEMA
+    if flow._area_config and flow._area_config.is_meta():
+        options_schema = (
+            GLOBAL_META_AREA_BASIC_OPTIONS_SCHEMA
+            if flow._area_config.id == META_AREA_GLOBAL.lower()
+            else META_AREA_BASIC_OPTIONS_SCHEMA
+        )
 
     errors, validated = await handle_step_validation(
         user_input=user_input,
@@ -191,6 +200,10 @@ async def handle_area_config(
         ),
         CONF_RELOAD_ON_REGISTRY_CHANGE: build_selector_boolean(),
         CONF_IGNORE_DIAGNOSTIC_ENTITIES: build_selector_boolean(),
+        CONF_VERBOSE_CONTROL_DIAGNOSTICS: build_selector_boolean(),
+        CONF_RELOAD_MAX_CONCURRENCY: build_selector_number(
+            min_value=1, max_value=10, unit_of_measurement="reloads"
+        ),
     }
 
     data_schema = flow._build_schema_from_vol(
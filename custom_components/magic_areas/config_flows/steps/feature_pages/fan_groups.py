@@ -178,6 +178,7 @@ def _fan_controller_schema(saved: Mapping[str, object]) -> vol.Schema:
                 [
                     FanDetectionMode.THRESHOLD.value,
                     FanDetectionMode.THRESHOLD_TREND.value,
+                    FanDetectionMode.THRESHOLD_STREAMING_TREND.value,
                     FanDetectionMode.ROOM_STATE.value,
                 ]
             ),
@@ -241,6 +242,7 @@ def _fan_controller_selectors(flow: OptionsFlowHandler) -> SelectorMap:
             options=[
                 FanDetectionMode.THRESHOLD.value,
                 FanDetectionMode.THRESHOLD_TREND.value,
+                FanDetectionMode.THRESHOLD_STREAMING_TREND.value,
                 FanDetectionMode.ROOM_STATE.value,
             ],
             multiple=False,
@@ -12,6 +12,7 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_COVER_GROUPS_ACCENT_ACTION,
     CONF_COVER_GROUPS_ACCENT_STATES,
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES,
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS,
     CONF_COVER_GROUPS_DAYLIGHT_ACTION,
     CONF_COVER_GROUPS_DAYLIGHT_STATES,
     CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS,
@@ -140,6 +141,12 @@ def add_non_light_feature_selectors(
             max_value=86_400,
             unit_of_measurement="seconds",
         )
+        selectors[CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS] = build_selector_number(
+            min_value=0,
+            max_value=60,
+            step=0.5,
+            unit_of_measurement="seconds",
+        )
         for key in _COVER_PRESET_ACTION_KEYS:
             selectors[key] = build_selector_select(
                 options=[action.value for action in CoverPresetAction],
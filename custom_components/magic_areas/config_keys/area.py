@@ -18,6 +18,8 @@ CONF_KEEP_ONLY_ENTITIES = "keep_only_entities"
 # System-level area options
 CONF_RELOAD_ON_REGISTRY_CHANGE = "reload_on_registry_change"
 CONF_IGNORE_DIAGNOSTIC_ENTITIES = "ignore_diagnostic_entities"
+CONF_VERBOSE_CONTROL_DIAGNOSTICS = "verbose_control_diagnostics"
+CONF_RELOAD_MAX_CONCURRENCY = "reload_max_concurrency"
 
 # Presence/secondary-state keys
 CONF_PRESENCE_DEVICE_PLATFORMS = "presence_device_platforms"
@@ -43,6 +45,7 @@ CONF_HEALTH_SENSOR_DEVICE_CLASSES = "health_binary_sensor_device_classes"
 
 CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES = "automation_device_classes"
 CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS = "manual_hold_seconds"
+CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS = "command_stagger_seconds"
 CONF_COVER_GROUPS_DAYLIGHT_ACTION = "daylight_action"
 CONF_COVER_GROUPS_DAYLIGHT_STATES = "daylight_states"
 CONF_COVER_GROUPS_PRIVACY_ACTION = "privacy_action"
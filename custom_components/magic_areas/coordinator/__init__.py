@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 import logging
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -17,8 +20,28 @@ from custom_components.magic_areas.core.controls import GroupRegistry
 from custom_components.magic_areas.coordinator.pipeline import (
     MetaAreaReloadManager,
     MagicAreasData,
+    INVENTORY_APPLY_STATS,
+    META_RELOAD_STATS,
+    CachedSnapshot,
+    MetaChildInventory,
+    RELOAD_QUEUE,
+    SETUP_PHASE_ADAPTIVE_LIGHTING,
+    SETUP_PHASE_CONFIG,
+    SETUP_PHASE_FIRST_REFRESH,
+    SETUP_PHASE_MANAGED_SURFACES,
+    SETUP_PHASE_PLATFORMS,
+    SETUP_PHASE_RUNTIME_CONTROLLERS,
+    SETUP_PIPELINE,
+    SNAPSHOT_CACHE,
+    async_get_meta_reload_stats,
+    async_get_reload_queue,
+    async_get_setup_pipeline,
+    async_get_snapshot_cache,
+    async_release_setup_pipeline,
     attach_registry_listeners as attach_registry_listeners,
     build_snapshot,
+    build_warm_snapshot,
+    registry_fingerprint,
 )
 from custom_components.magic_areas.coordinator.managed_surfaces import (
     async_reconcile_config_entry_helpers,
@@ -41,11 +64,26 @@ _EXPECTED_UPDATE_ERRORS = (
 )
 
 __all__ = [
+    "INVENTORY_APPLY_STATS",
+    "META_RELOAD_STATS",
     "MagicAreasCoordinator",
     "MagicAreasData",
+    "RELOAD_QUEUE",
+    "SETUP_PHASE_ADAPTIVE_LIGHTING",
+    "SETUP_PHASE_CONFIG",
+    "SETUP_PHASE_FIRST_REFRESH",
+    "SETUP_PHASE_MANAGED_SURFACES",
+    "SETUP_PHASE_PLATFORMS",
+    "SETUP_PHASE_RUNTIME_CONTROLLERS",
+    "SETUP_PIPELINE",
+    "SNAPSHOT_CACHE",
     "async_reconcile_config_entry_helpers",
     "async_reconcile_label_surfaces",
     "async_reconcile_managed_adaptive_lighting",
+    "async_get_reload_queue",
+    "async_get_setup_pipeline",
+    "async_release_setup_pipeline",
+    "async_get_snapshot_cache",
     "async_reconcile_managed_surfaces",
     "attach_registry_listeners",
 ]
@@ -59,8 +97,14 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
         hass: HomeAssistant,
         area_config: AreaConfig,
         config_entry: MagicAreasConfigEntry,
+        *,
+        hot_apply: Callable[[], Awaitable[bool]] | None = None,
     ) -> None:
-        """Initialize coordinator."""
+        """Initialize coordinator.
+
+        ``hot_apply`` lets a meta area apply child membership changes to the
+        loaded entry before falling back to a reload.
+        """
         super().__init__(
             hass,
             logger=_LOGGER,
@@ -71,9 +115,16 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
         self._area_config = area_config
         self._lifecycle: MetaAreaReloadManager | None = None
         self._group_registry = GroupRegistry()
+        self._meta_inventory: MetaChildInventory | None = (
+            MetaChildInventory() if area_config.is_meta() else None
+        )
         self._last_snapshot_ready_key: (
             tuple[str, str | None, str, str | None] | None
         ) = None
+        self._warm_start_pending = not area_config.is_meta()
+        self._unsub_warm_verify: CALLBACK_TYPE | None = None
+        self._registry_fingerprint: str | None = None
+        self._unsub_registry_updates: list[CALLBACK_TYPE] = []
 
         if area_config.is_meta():
             self._lifecycle = MetaAreaReloadManager(
@@ -83,7 +134,10 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
                 get_entry_id=lambda: self.config_entry.entry_id
                 if self.config_entry
                 else None,
-                schedule_reload=hass.config_entries.async_schedule_reload,
+                schedule_reload=lambda entry_id: async_get_reload_queue(hass).request(
+                    entry_id, reason="meta membership change"
+                ),
+                hot_apply=hot_apply,
             )
             self._lifecycle.start()
 
@@ -92,8 +146,21 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
         """Return the meta-area lifecycle manager when this coordinator uses one."""
         return self._lifecycle
 
+    @property
+    def meta_inventory(self) -> MetaChildInventory | None:
+        """Return the child contribution cache when this is a meta area."""
+        return self._meta_inventory
+
     async def async_shutdown(self) -> None:
         """Shut down the coordinator and clean up subscriptions."""
+        if self._unsub_warm_verify is not None:
+            self._unsub_warm_verify()
+            self._unsub_warm_verify = None
+        for unsub in self._unsub_registry_updates:
+            unsub()
+        self._unsub_registry_updates = []
+        if self._meta_inventory is not None:
+            self._meta_inventory.async_unlisten()
         if self._lifecycle is not None:
             await self._lifecycle.shutdown()
             self._lifecycle = None
@@ -104,13 +171,12 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
         assert self.config_entry is not None
 
         try:
-            snapshot = await build_snapshot(
-                hass=self.hass,
-                area_config=self._area_config,
-                config_entry_id=self.config_entry.entry_id,
-                group_registry=self._group_registry,
-            )
-            if not self._area_config.is_meta():
+            snapshot = await self._async_build_snapshot(self.config_entry.entry_id)
+            if self._area_config.is_meta():
+                async_get_meta_reload_stats(self.hass).record_snapshot_built(
+                    self.config_entry.entry_id
+                )
+            else:
                 ready_key = (
                     self._area_config.area_type,
                     self._area_config.floor_id,
@@ -130,3 +196,79 @@ class MagicAreasCoordinator(DataUpdateCoordinator[MagicAreasData]):
             return snapshot
         except _EXPECTED_UPDATE_ERRORS as err:
             raise UpdateFailed(f"Unable to update area data: {err}") from err
+
+    async def _async_build_snapshot(self, entry_id: str) -> MagicAreasData:
+        """Build a snapshot, warm from the cache on a regular area's first refresh."""
+        if self._area_config.is_meta():
+            return await build_snapshot(
+                hass=self.hass,
+                area_config=self._area_config,
+                config_entry_id=entry_id,
+                group_registry=self._group_registry,
+                meta_inventory=self._meta_inventory,
+            )
+
+        cache = await async_get_snapshot_cache(self.hass)
+        fingerprint = self._async_registry_fingerprint(entry_id)
+        if self._warm_start_pending:
+            self._warm_start_pending = False
+            if (cached := cache.get(entry_id, fingerprint)) is not None:
+                self._unsub_warm_verify = async_at_started(
+                    self.hass, self._async_schedule_warm_verify
+                )
+                return build_warm_snapshot(
+                    hass=self.hass,
+                    area_config=self._area_config,
+                    config_entry_id=entry_id,
+                    group_registry=self._group_registry,
+                    cached=cached,
+                )
+
+        snapshot = await build_snapshot(
+            hass=self.hass,
+            area_config=self._area_config,
+            config_entry_id=entry_id,
+            group_registry=self._group_registry,
+        )
+        cache.put(entry_id, CachedSnapshot.from_snapshot(snapshot, fingerprint))
+        return snapshot
+
+    @callback
+    def _async_registry_fingerprint(self, entry_id: str) -> str:
+        """Return the registry fingerprint, recomputed only after registry edits.
+
+        Entity and device registry updates drop the memoized value; every
+        other refresh reuses it instead of rescanning the registries.
+        """
+        if not self._unsub_registry_updates:
+
+            def _registry_updated(
+                _event: Event[er.EventEntityRegistryUpdatedData]
+                | Event[dr.EventDeviceRegistryUpdatedData],
+            ) -> None:
+                self._registry_fingerprint = None
+
+            invalidate = callback(_registry_updated)
+            self._unsub_registry_updates = [
+                self.hass.bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED, invalidate
+                ),
+                self.hass.bus.async_listen(
+                    dr.EVENT_DEVICE_REGISTRY_UPDATED, invalidate
+                ),
+            ]
+        if self._registry_fingerprint is None:
+            self._registry_fingerprint = registry_fingerprint(
+                self.hass, self._area_config, entry_id
+            )
+        return self._registry_fingerprint
+
+    @callback
+    def _async_schedule_warm_verify(self, hass: HomeAssistant) -> None:
+        """Rebuild a warm-started snapshot cold once Home Assistant has started."""
+        self._unsub_warm_verify = None
+        hass.async_create_task(
+            self.async_refresh(),
+            f"{DOMAIN} verify warm snapshot",
+            eager_start=False,
+        )
@@ -8,10 +8,14 @@ from custom_components.magic_areas.coordinator.pipeline.entity_ingestion import
     is_magic_area_entity,
     load_area_entities,
     load_meta_area_entities,
+    MetaChildInventory,
     should_exclude_entity,
 )
 from custom_components.magic_areas.coordinator.pipeline.lifecycle import (
+    INVENTORY_APPLY_STATS,
+    META_RELOAD_STATS,
     MetaAreaReloadManager,
+    async_get_meta_reload_stats,
     make_device_registry_filter,
     make_entity_registry_filter,
     attach_registry_listeners,
@@ -19,19 +23,68 @@ from custom_components.magic_areas.coordinator.pipeline.lifecycle import (
 from custom_components.magic_areas.coordinator.pipeline.presence_ingestion import (
     build_presence_sensors,
 )
+from custom_components.magic_areas.coordinator.pipeline.reload_queue import (
+    RELOAD_QUEUE,
+    ReloadQueue,
+    async_get_reload_queue,
+)
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    SETUP_PHASE_ADAPTIVE_LIGHTING,
+    SETUP_PHASE_CONFIG,
+    SETUP_PHASE_FIRST_REFRESH,
+    SETUP_PHASE_MANAGED_SURFACES,
+    SETUP_PHASE_PLATFORMS,
+    SETUP_PHASE_READINESS_CONVERGENCE,
+    SETUP_PHASE_RUNTIME_CONTROLLERS,
+    SETUP_PIPELINE,
+    SetupPipeline,
+    async_get_setup_pipeline,
+    async_release_setup_pipeline,
+)
 from custom_components.magic_areas.coordinator.pipeline.snapshot import (
     MagicAreasData,
     build_snapshot,
+    build_warm_snapshot,
+)
+from custom_components.magic_areas.coordinator.pipeline.snapshot_cache import (
+    SNAPSHOT_CACHE,
+    CachedSnapshot,
+    SnapshotCache,
+    async_get_snapshot_cache,
+    registry_fingerprint,
 )
 
 __all__ = [
     "EntitySnapshot",
+    "INVENTORY_APPLY_STATS",
+    "META_RELOAD_STATS",
     "MagicAreasData",
+    "MetaChildInventory",
     "MetaAreaReloadManager",
+    "RELOAD_QUEUE",
+    "ReloadQueue",
+    "SETUP_PHASE_ADAPTIVE_LIGHTING",
+    "SETUP_PHASE_CONFIG",
+    "SETUP_PHASE_FIRST_REFRESH",
+    "SETUP_PHASE_MANAGED_SURFACES",
+    "SETUP_PHASE_PLATFORMS",
+    "SETUP_PHASE_READINESS_CONVERGENCE",
+    "SETUP_PHASE_RUNTIME_CONTROLLERS",
+    "SETUP_PIPELINE",
+    "SNAPSHOT_CACHE",
+    "CachedSnapshot",
+    "SetupPipeline",
+    "SnapshotCache",
     "build_entity_dict",
     "build_presence_sensors",
+    "async_get_meta_reload_stats",
+    "async_get_reload_queue",
+    "async_get_setup_pipeline",
+    "async_release_setup_pipeline",
+    "async_get_snapshot_cache",
     "attach_registry_listeners",
     "build_snapshot",
+    "build_warm_snapshot",
     "filter_entity_list",
     "group_entities",
     "is_magic_area_entity",
@@ -39,5 +92,6 @@ __all__ = [
     "load_meta_area_entities",
     "make_device_registry_filter",
     "make_entity_registry_filter",
+    "registry_fingerprint",
     "should_exclude_entity",
 ]
@@ -8,6 +8,9 @@ from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.registr
     is_magic_area_entity,
     should_exclude_entity,
 )
+from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.meta_inventory import (
+    MetaChildInventory,
+)
 from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.loader import (
     load_area_entities,
     load_meta_area_entities,
@@ -15,6 +18,7 @@ from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.loader
 
 __all__ = [
     "EntitySnapshot",
+    "MetaChildInventory",
     "build_entity_dict",
     "filter_entity_list",
     "group_entities",
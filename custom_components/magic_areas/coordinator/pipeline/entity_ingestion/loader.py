@@ -14,7 +14,6 @@ from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.registr
     EntitySnapshot,
     build_entity_dict,
     get_area_entities,
-    get_child_magic_entities,
     get_device_entities_for_area,
     get_device_registry,
     get_entity_registry,
@@ -22,9 +21,14 @@ from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.registr
     get_magic_entities_for_config_entry,
     group_entities,
 )
+from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.meta_inventory import (
+    MetaChildInventory,
+    registry_entity_snapshot,
+)
 from custom_components.magic_areas.core.managed_surface_registry import (
     is_managed_surface_config_entry,
 )
+from custom_components.magic_areas.core.meta import async_get_area_topology_index
 
 if TYPE_CHECKING:  # pragma: no cover
     from homeassistant.core import HomeAssistant
@@ -139,8 +143,9 @@ async def load_meta_area_entities(
     config_entry_id: str,
     config: dict[str, object],
     logger: logging.Logger | None = None,
+    inventory: MetaChildInventory | None = None,
 ) -> tuple[dict[str, list[dict[str, str]]], dict[str, list[dict[str, str]]]]:
-    """Load entities for a meta area from child area magic entities.
+    """Load entities for a meta area from child area snapshots.
 
     Args:
         hass: Home Assistant instance
@@ -148,6 +153,7 @@ async def load_meta_area_entities(
         config_entry_id: Config entry ID for filtering
         config: Meta area configuration
         logger: Optional logger for debug output
+        inventory: Meta area's child contribution cache, reused across refreshes
 
     Returns:
         Tuple of (entities_by_domain, magic_entities_by_domain)
@@ -155,29 +161,26 @@ async def load_meta_area_entities(
     """
     if logger is None:
         logger = _LOGGER
-
-    entity_list: list[RegistryEntry] = []
-    exclude_entity_ids = exclude_entities(config)
-
-    entity_registry = get_entity_registry(hass)
-    entity_list.extend(
-        get_child_magic_entities(
-            hass=hass,
-            entity_registry=entity_registry,
-            child_area_slugs=child_area_slugs,
-            exclude_entities=exclude_entity_ids,
-        )
+    if inventory is None:
+        inventory = MetaChildInventory()
+
+    entity_snapshots = inventory.compose(
+        hass,
+        get_entity_registry(hass),
+        child_entry_ids=async_get_area_topology_index(hass).child_entry_ids(
+            child_area_slugs
+        ),
+        exclude_entities=exclude_entities(config),
     )
-
-    # Process entity list
-    entities_by_domain = await _process_entity_list(
-        hass, entity_list, "meta_area", logger
+    logger.debug(
+        "Composed meta area inventory from child snapshots: %s",
+        inventory.diagnostics(),
     )
 
     # Meta areas return empty magic_entities (they aggregate child magic entities)
     magic_entities_by_domain: dict[str, list[dict[str, str]]] = {}
 
-    return entities_by_domain, magic_entities_by_domain
+    return group_entities(entity_snapshots), magic_entities_by_domain
 
 
 async def _process_entity_list(
@@ -210,29 +213,9 @@ async def _process_entity_list(
                 continue
 
             latest_state = hass.states.get(entity.entity_id)
-
-            # Combine state attributes with registry metadata (device_class, unit_of_measurement)
-            combined_attributes: dict[str, object] = (
-                dict(latest_state.attributes) if latest_state else {}
-            )
-            if entity.original_device_class:
-                # Handle both Enum and string device classes
-                if hasattr(entity.original_device_class, "value"):
-                    combined_attributes["device_class"] = str(
-                        entity.original_device_class.value
-                    )
-                else:
-                    combined_attributes["device_class"] = str(
-                        entity.original_device_class
-                    )
-            if entity.unit_of_measurement:
-                combined_attributes["unit_of_measurement"] = entity.unit_of_measurement
-
             snapshots.append(
-                EntitySnapshot(
-                    entity_id=entity.entity_id,
-                    domain=entity.domain,
-                    attributes=combined_attributes if combined_attributes else None,
+                registry_entity_snapshot(
+                    entity, latest_state.attributes if latest_state else None
                 )
             )
 
@@ -0,0 +1,249 @@
+"""Meta-area entity inventory composed from child area snapshots."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, Event, State, callback
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.magic_areas.coordinator.pipeline.entity_ingestion.registry_queries import (
+    EntitySnapshot,
+)
+from custom_components.magic_areas.core.managed_surface_registry import (
+    iter_managed_surface_entity_entries,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_registry import EntityRegistry, RegistryEntry
+
+
+def registry_entity_snapshot(
+    entity: RegistryEntry, attributes: Mapping[str, object] | None
+) -> EntitySnapshot:
+    """Return an entity snapshot with registry device class and unit applied."""
+    combined_attributes: dict[str, object] = dict(attributes) if attributes else {}
+    if entity.original_device_class:
+        # Handle both Enum and string device classes
+        if hasattr(entity.original_device_class, "value"):
+            combined_attributes["device_class"] = str(
+                entity.original_device_class.value
+            )
+        else:
+            combined_attributes["device_class"] = str(entity.original_device_class)
+    if entity.unit_of_measurement:
+        combined_attributes["unit_of_measurement"] = entity.unit_of_measurement
+    return EntitySnapshot(
+        entity_id=entity.entity_id,
+        domain=entity.domain,
+        attributes=combined_attributes if combined_attributes else None,
+    )
+
+
+type ContributionSource = tuple[RegistryEntry, State | None]
+
+
+def child_contribution_sources(
+    hass: HomeAssistant,
+    entity_registry: EntityRegistry,
+    *,
+    entry_id: str,
+) -> tuple[ContributionSource, ...]:
+    """Return the registry entries and states one child contributes.
+
+    A child contributes every registry entity of its config entry plus the
+    helper entities it owns as managed surfaces, each with its current state.
+    """
+    entities = [
+        *entity_registry.entities.get_entries_for_config_entry_id(entry_id),
+        *iter_managed_surface_entity_entries(
+            hass,
+            entity_registry,
+            owner_entry_id=entry_id,
+            loaded_only=True,
+        ),
+    ]
+    return tuple(
+        (entity, hass.states.get(entity.entity_id))
+        for entity in entities
+        if entity.domain
+    )
+
+
+def build_child_contribution(
+    sources: Iterable[ContributionSource],
+) -> tuple[EntitySnapshot, ...]:
+    """Return the entity snapshots for one child's contribution sources."""
+    return tuple(
+        registry_entity_snapshot(entity, state.attributes if state else None)
+        for entity, state in sources
+    )
+
+
+@dataclass(slots=True)
+class MetaChildContribution:
+    """Entities one child contributed, and the child update they follow."""
+
+    coordinator: object
+    magic_entities: Mapping[str, object]
+    entities: tuple[EntitySnapshot, ...]
+    unsubscribe: CALLBACK_TYPE
+
+    @property
+    def entity_ids(self) -> frozenset[str]:
+        """Return the contributed entity IDs."""
+        return frozenset(entity.entity_id for entity in self.entities)
+
+
+@dataclass(slots=True)
+class MetaChildInventory:
+    """Per-child entity contributions for one meta area.
+
+    A child's contribution is built once and reused until that child changes:
+    its coordinator publishes a snapshot with different magic entities, its
+    coordinator is replaced by a reload, or an entity registry update touches
+    one of its entities. Those updates mark the child dirty as they happen,
+    so a compose only rebuilds the dirty children and meta refresh cost
+    follows what changed. Entity attributes are read when a child is rebuilt.
+    """
+
+    recomposed: int = 0
+    reused: int = 0
+    _contributions: dict[str, MetaChildContribution] = field(default_factory=dict)
+    _dirty: set[str] = field(default_factory=set)
+    _unsub_registry: CALLBACK_TYPE | None = None
+
+    def compose(
+        self,
+        hass: HomeAssistant,
+        entity_registry: EntityRegistry,
+        *,
+        child_entry_ids: Iterable[str],
+        exclude_entities: list[str],
+    ) -> list[EntitySnapshot]:
+        """Return the meta inventory for loaded child entries, in child order."""
+        self._async_listen(hass)
+        excluded = set(exclude_entities)
+        live_entry_ids: set[str] = set()
+        entities: list[EntitySnapshot] = []
+        for entry_id in child_entry_ids:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.state != ConfigEntryState.LOADED:
+                continue
+            coordinator = entry.runtime_data.coordinator
+            snapshot = coordinator.data
+            if snapshot is None:
+                continue
+            live_entry_ids.add(entry_id)
+            contribution = self._contributions.get(entry_id)
+            if (
+                contribution is None
+                or contribution.coordinator is not coordinator
+                or entry_id in self._dirty
+            ):
+                if contribution is not None:
+                    contribution.unsubscribe()
+                contribution = self._contributions[entry_id] = MetaChildContribution(
+                    coordinator=coordinator,
+                    magic_entities=snapshot.magic_entities,
+                    entities=build_child_contribution(
+                        child_contribution_sources(
+                            hass, entity_registry, entry_id=entry_id
+                        )
+                    ),
+                    unsubscribe=coordinator.async_add_listener(
+                        partial(self._child_updated, entry_id, coordinator)
+                    ),
+                )
+                self.recomposed += 1
+            else:
+                self.reused += 1
+            entities.extend(
+                entity
+                for entity in contribution.entities
+                if entity.entity_id not in excluded
+            )
+
+        self._dirty.clear()
+        for entry_id in set(self._contributions) - live_entry_ids:
+            self._contributions.pop(entry_id).unsubscribe()
+        return entities
+
+    @callback
+    def async_unlisten(self) -> None:
+        """Drop registry and child coordinator subscriptions."""
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+        for contribution in self._contributions.values():
+            contribution.unsubscribe()
+        self._contributions.clear()
+        self._dirty.clear()
+
+    def _async_listen(self, hass: HomeAssistant) -> None:
+        """Subscribe to entity registry updates once."""
+        if self._unsub_registry is not None:
+            return
+
+        def _registry_updated(event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+            self._registry_updated(event.data)
+
+        self._unsub_registry = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, callback(_registry_updated)
+        )
+
+    def _registry_updated(self, data: er.EventEntityRegistryUpdatedData) -> None:
+        """Mark the children whose contribution a registry update touches."""
+        if data["action"] == "create" or (
+            data["action"] == "update" and "config_entry_id" in data["changes"]
+        ):
+            # The new owner is not known without a registry lookup.
+            self._dirty.update(self._contributions)
+            return
+        entity_ids = {data["entity_id"]}
+        if data["action"] == "update" and "old_entity_id" in data:
+            entity_ids.add(data["old_entity_id"])
+        self._dirty.update(
+            entry_id
+            for entry_id, contribution in self._contributions.items()
+            if not entity_ids.isdisjoint(contribution.entity_ids)
+        )
+
+    def _child_updated(self, entry_id: str, coordinator: object) -> None:
+        """Mark a child dirty when its published magic entities change."""
+        contribution = self._contributions.get(entry_id)
+        if contribution is None or contribution.coordinator is not coordinator:
+            return
+        snapshot = getattr(coordinator, "data", None)
+        if snapshot is not None and snapshot.magic_entities != (
+            contribution.magic_entities
+        ):
+            self._dirty.add(entry_id)
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return child contribution counters."""
+        return {
+            "children": len(self._contributions),
+            "entities": sum(
+                len(contribution.entities)
+                for contribution in self._contributions.values()
+            ),
+            "dirty": len(self._dirty),
+            "recomposed": self.recomposed,
+            "reused": self.reused,
+        }
+
+
+__all__ = [
+    "ContributionSource",
+    "MetaChildContribution",
+    "MetaChildInventory",
+    "build_child_contribution",
+    "child_contribution_sources",
+    "registry_entity_snapshot",
+]
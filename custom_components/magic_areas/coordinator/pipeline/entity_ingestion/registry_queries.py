@@ -9,17 +9,15 @@ from typing import TYPE_CHECKING
 
 from homeassistant.const import EntityCategory
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.config_entries import ConfigEntryState
 from homeassistant.helpers.device_registry import async_get as devicereg_async_get
 from homeassistant.helpers.entity_registry import async_get as entityreg_async_get
 
-from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    record_registry_lookups,
+)
 from custom_components.magic_areas.defaults import (
     DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES,
 )
-from custom_components.magic_areas.core.managed_surface_registry import (
-    iter_managed_surface_entity_entries,
-)
 
 if TYPE_CHECKING:  # pragma: no cover
     from homeassistant.core import HomeAssistant
@@ -147,6 +145,7 @@ def get_device_entities_for_area(
     """Return registry entries for devices in the given area."""
     entity_list: list[RegistryEntry] = []
     devices_in_area = device_registry.devices.get_devices_for_area_id(area_id)
+    record_registry_lookups(1 + len(devices_in_area))
     for device in devices_in_area:
         device_entities = [
             entity
@@ -172,6 +171,7 @@ def get_area_entities(
 ) -> list[RegistryEntry]:
     """Return registry entries explicitly assigned to the area."""
     entities_in_area = entity_registry.entities.get_entries_for_area_id(area_id)
+    record_registry_lookups()
     return [
         entity
         for entity in entities_in_area
@@ -194,6 +194,7 @@ def get_included_entities(
 ) -> list[RegistryEntry]:
     """Return explicitly included entities."""
     entity_list: list[RegistryEntry] = []
+    record_registry_lookups(len(include_entities))
     for include_entity in include_entities:
         entity_entry = entity_registry.async_get(include_entity)
         if entity_entry and not should_exclude_entity(
@@ -206,50 +207,9 @@ def get_included_entities(
     return entity_list
 
 
-def get_child_magic_entities(
-    hass: HomeAssistant,
-    entity_registry: EntityRegistry,
-    child_area_slugs: list[str],
-    exclude_entities: list[str],
-) -> list[RegistryEntry]:
-    """Return magic entities for child areas in a meta area."""
-    entity_list: list[RegistryEntry] = []
-    entries = hass.config_entries.async_entries(DOMAIN)
-    for entry in entries:
-        if entry.state != ConfigEntryState.LOADED:
-            continue
-        if entry.domain != DOMAIN:
-            continue
-
-        coordinator_data = entry.runtime_data.coordinator.data
-        if coordinator_data is None:
-            continue
-        if coordinator_data.area_config.slug not in child_area_slugs:
-            continue
-
-        child_magic_entities = entity_registry.entities.get_entries_for_config_entry_id(
-            entry.entry_id
-        )
-        for entity_entry in child_magic_entities:
-            if entity_entry.entity_id in exclude_entities:
-                continue
-            entity_list.append(entity_entry)
-
-        for entity_entry in iter_managed_surface_entity_entries(
-            hass,
-            entity_registry,
-            owner_entry_id=entry.entry_id,
-            loaded_only=True,
-        ):
-            if entity_entry.entity_id in exclude_entities:
-                continue
-            entity_list.append(entity_entry)
-
-    return entity_list
-
-
 def get_magic_entities_for_config_entry(
     entity_registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return magic entities for the given config entry."""
+    record_registry_lookups()
     return entity_registry.entities.get_entries_for_config_entry_id(config_entry_id)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Collection, Coroutine, Mapping
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
+from time import monotonic
 
 from homeassistant.const import (
     ATTR_NAME,
@@ -29,6 +30,7 @@ from homeassistant.helpers.entity_registry import (
     async_get as entityreg_async_get,
 )
 from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from custom_components.magic_areas.components import (
     MAGICAREAS_UNIQUEID_PREFIX,
@@ -38,6 +40,13 @@ from custom_components.magic_areas.const import DOMAIN
 from custom_components.magic_areas.core.runtime_model import AreaConfig
 from custom_components.magic_areas.core.config import reload_on_registry_change
 from custom_components.magic_areas.core.meta_reload import evaluate_reload
+from custom_components.magic_areas.coordinator.pipeline.reload_queue import (
+    async_get_reload_queue,
+)
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    SETUP_PHASE_READINESS_CONVERGENCE,
+    async_get_setup_pipeline,
+)
 from custom_components.magic_areas.coordinator.pipeline.snapshot import MagicAreasData
 from custom_components.magic_areas.enums import MagicAreasEvents
 from custom_components.magic_areas.components import MagicAreasConfigEntry
@@ -138,8 +147,63 @@ class ReadinessGatePlan:
     action: ReadinessGateAction
 
 
+@dataclass(slots=True)
+class InventoryApplyRecord:
+    """Hot-apply and reload counters for one area config entry."""
+
+    hot_applies: int = 0
+    reloads: int = 0
+    last_reason: str | None = None
+
+
+@dataclass(slots=True)
+class InventoryApplyStats:
+    """Non-meta inventory convergence counters, kept across entry reloads."""
+
+    _records: dict[str, InventoryApplyRecord] = field(default_factory=dict)
+
+    def record_hot_apply(self, entry_id: str, reason: str) -> None:
+        """Count one inventory change applied without reloading the entry."""
+        record = self._records.setdefault(entry_id, InventoryApplyRecord())
+        record.hot_applies += 1
+        record.last_reason = reason
+
+    def record_reload(self, entry_id: str, reason: str) -> None:
+        """Count one convergence request that fell back to an entry reload."""
+        record = self._records.setdefault(entry_id, InventoryApplyRecord())
+        record.reloads += 1
+        record.last_reason = reason
+
+    def diagnostics(self, entry_id: str) -> dict[str, object]:
+        """Return counters for one area entry."""
+        record = self._records.get(entry_id) or InventoryApplyRecord()
+        return {
+            "hot_applies": record.hot_applies,
+            "reloads": record.reloads,
+            "last_reason": record.last_reason,
+        }
+
+
+INVENTORY_APPLY_STATS: HassKey[InventoryApplyStats] = HassKey(
+    f"{DOMAIN}_inventory_apply_stats"
+)
+
+
+def async_get_inventory_apply_stats(hass: HomeAssistant) -> InventoryApplyStats:
+    """Return the shared inventory convergence counters for this instance."""
+    stats = hass.data.get(INVENTORY_APPLY_STATS)
+    if stats is None:
+        stats = hass.data[INVENTORY_APPLY_STATS] = InventoryApplyStats()
+    return stats
+
+
 class ReadinessConvergenceManager:
-    """Bounded convergence scheduler for non-meta runtime readiness signals."""
+    """Bounded convergence scheduler for non-meta runtime readiness signals.
+
+    When a hot-apply callback is supplied, a scheduled convergence first tries
+    to apply the refreshed inventory to the loaded entry in place; the entry
+    is reloaded only when the callback reports a structural change.
+    """
 
     def __init__(
         self,
@@ -149,6 +213,7 @@ class ReadinessConvergenceManager:
         area_config: AreaConfig,
         get_snapshot: Callable[[], MagicAreasData | None],
         should_auto_reload: Callable[[], bool],
+        hot_apply: Callable[[], Awaitable[bool]] | None = None,
     ) -> None:
         """Initialize convergence manager."""
         self._hass = hass
@@ -156,6 +221,7 @@ class ReadinessConvergenceManager:
         self._area_config = area_config
         self._get_snapshot = get_snapshot
         self._should_auto_reload = should_auto_reload
+        self._hot_apply = hot_apply
 
         self._window_started_at: float | None = None
         self._reload_count = 0
@@ -237,17 +303,37 @@ class ReadinessConvergenceManager:
         if self._reload_in_flight:
             return
         self._reload_in_flight = True
-        self._reload_count += 1
         reason = self._pending_reason or "readiness trigger"
+        try:
+            with async_get_setup_pipeline(self._hass).phase(
+                self._config_entry.entry_id, SETUP_PHASE_READINESS_CONVERGENCE
+            ):
+                await self._async_converge(reason)
+        finally:
+            self._reload_in_flight = False
+
+    async def _async_converge(self, reason: str) -> None:
+        """Hot-apply the pending change, or reload the entry when structural."""
+        if self._hot_apply is not None and await self._hot_apply():
+            _LOGGER.debug(
+                "%s: Applied inventory change in place (%s)",
+                self._config_entry.data[ATTR_NAME],
+                reason,
+            )
+            async_get_inventory_apply_stats(self._hass).record_hot_apply(
+                self._config_entry.entry_id, reason
+            )
+            return
+        self._reload_count += 1
         _LOGGER.debug(
             "%s: Reloading entry due readiness convergence (%s)",
             self._config_entry.data[ATTR_NAME],
             reason,
         )
-        try:
-            await async_reload_entry(self._hass, self._config_entry)
-        finally:
-            self._reload_in_flight = False
+        async_get_inventory_apply_stats(self._hass).record_reload(
+            self._config_entry.entry_id, reason
+        )
+        await async_reload_entry(self._hass, self._config_entry, reason=reason)
 
     async def _async_handle_state_readiness(
         self,
@@ -426,8 +512,82 @@ def _extract_changed_area_id(changes: object) -> str | None:
     return changed_area_id if isinstance(changed_area_id, str) else None
 
 
+@dataclass(slots=True)
+class MetaReloadRecord:
+    """Hot-update and reload counters for one meta area config entry."""
+
+    hot_updates: int = 0
+    reloads: int = 0
+    last_reload_seconds: float | None = None
+    total_reload_seconds: float = 0.0
+    reload_started_at: float | None = None
+
+
+@dataclass(slots=True)
+class MetaReloadStats:
+    """Meta-area membership update counters, kept across entry reloads.
+
+    A reload's duration runs from scheduling the entry reload to the first
+    snapshot built by the reloaded entry's coordinator.
+    """
+
+    _records: dict[str, MetaReloadRecord] = field(default_factory=dict)
+
+    def record_hot_update(self, entry_id: str) -> None:
+        """Count one membership change applied without reloading."""
+        self._record(entry_id).hot_updates += 1
+
+    def record_reload_started(self, entry_id: str) -> None:
+        """Count one scheduled entry reload and start timing it."""
+        record = self._record(entry_id)
+        record.reloads += 1
+        record.reload_started_at = monotonic()
+
+    def record_snapshot_built(self, entry_id: str) -> None:
+        """Finish timing an in-flight reload once the entry has a snapshot."""
+        record = self._records.get(entry_id)
+        if record is None or record.reload_started_at is None:
+            return
+        elapsed = monotonic() - record.reload_started_at
+        record.reload_started_at = None
+        record.last_reload_seconds = round(elapsed, 3)
+        record.total_reload_seconds += elapsed
+
+    def diagnostics(self, entry_id: str) -> dict[str, object]:
+        """Return counters and reload timings for one meta area entry."""
+        record = self._records.get(entry_id) or MetaReloadRecord()
+        return {
+            "hot_updates": record.hot_updates,
+            "reloads": record.reloads,
+            "last_reload_seconds": record.last_reload_seconds,
+            "total_reload_seconds": round(record.total_reload_seconds, 3),
+            "reload_in_flight": record.reload_started_at is not None,
+        }
+
+    def _record(self, entry_id: str) -> MetaReloadRecord:
+        return self._records.setdefault(entry_id, MetaReloadRecord())
+
+
+META_RELOAD_STATS: HassKey[MetaReloadStats] = HassKey(f"{DOMAIN}_meta_reload_stats")
+
+
+def async_get_meta_reload_stats(hass: HomeAssistant) -> MetaReloadStats:
+    """Return the shared meta reload counters for this Home Assistant instance."""
+    stats = hass.data.get(META_RELOAD_STATS)
+    if stats is None:
+        stats = hass.data[META_RELOAD_STATS] = MetaReloadStats()
+    return stats
+
+
 class MetaAreaReloadManager:
-    """Own meta-area snapshot-ready orchestration and reload scheduling."""
+    """Own meta-area snapshot-ready orchestration and reload scheduling.
+
+    When a hot-apply callback is supplied, matching child changes first apply
+    the new child set to the loaded entry in place: the snapshot is refreshed,
+    managed helpers are reconciled, and runtime controllers restart. The entry
+    is reloaded only when the callback reports that the meta area's platform
+    entities would change.
+    """
 
     _MAX_META_DATA_RETRIES = 10
     _META_DATA_RETRY_DELAY_SECONDS = 1.0
@@ -440,6 +600,7 @@ class MetaAreaReloadManager:
         get_snapshot: Callable[[], MagicAreasData | None],
         get_entry_id: Callable[[], str | None],
         schedule_reload: Callable[[str], None],
+        hot_apply: Callable[[], Awaitable[bool]] | None = None,
     ) -> None:
         """Initialize lifecycle manager."""
         self._hass = hass
@@ -447,6 +608,7 @@ class MetaAreaReloadManager:
         self._get_snapshot = get_snapshot
         self._get_entry_id = get_entry_id
         self._schedule_reload = schedule_reload
+        self._hot_apply = hot_apply
 
         self._last_reload: datetime = datetime.min.replace(tzinfo=dt_util.UTC)
         self._reloading: bool = False
@@ -573,7 +735,11 @@ class MetaAreaReloadManager:
         if plan.action == MetaReloadAction.EXECUTE_RELOAD:
             self._schedule_meta_reload_callback(
                 delay=plan.delay_seconds,
-                callback=self.async_execute_reload,
+                callback=(
+                    self.async_execute_reload
+                    if self._hot_apply is None
+                    else self.async_execute_hot_update
+                ),
                 trigger_area_type=trigger_area_type,
                 trigger_area_id=trigger_area_id,
                 reason=plan.reason,
@@ -699,6 +865,28 @@ class MetaAreaReloadManager:
             trigger_area_id=trigger_area_id,
         )
 
+    async def async_execute_hot_update(
+        self, trigger_area_type: str, trigger_area_id: str
+    ) -> None:
+        """Apply a child change in place, reloading only if entities change."""
+        self._pending_reload_handle = None
+        if self._reloading or self._hot_apply is None:
+            return
+        entry_id = self._get_entry_id()
+        if not entry_id:
+            return
+        self._last_reload = dt_util.utcnow()
+        if await self._hot_apply():
+            async_get_meta_reload_stats(self._hass).record_hot_update(entry_id)
+            _LOGGER.debug(
+                "%s: Applied child change without reload (type=%s, area=%s)",
+                self._area_config.name,
+                trigger_area_type,
+                trigger_area_id,
+            )
+            return
+        await self.async_execute_reload(trigger_area_type, trigger_area_id)
+
     async def async_execute_reload(
         self, trigger_area_type: str, trigger_area_id: str
     ) -> None:
@@ -730,6 +918,7 @@ class MetaAreaReloadManager:
                 self._reloading_guard_handle.cancel()
                 self._reloading_guard_handle = None
             raise
+        async_get_meta_reload_stats(self._hass).record_reload_started(entry_id)
 
     @callback
     def _clear_reloading_guard(self) -> None:
@@ -898,16 +1087,16 @@ def make_device_registry_filter(
 
 
 async def async_reload_entry(
-    hass: HomeAssistant, config_entry: MagicAreasConfigEntry
+    hass: HomeAssistant,
+    config_entry: MagicAreasConfigEntry,
+    *,
+    reason: str = "registry change",
 ) -> None:
-    """Trigger a reload by updating the entry data timestamp."""
+    """Queue a reload of the entry on the shared reload queue."""
     if not hass.is_running:
         return
 
-    hass.config_entries.async_update_entry(
-        config_entry,
-        data={**config_entry.data, "entity_ts": dt_util.utcnow()},
-    )
+    async_get_reload_queue(hass).request(config_entry.entry_id, reason=reason)
 
 
 def _merged_area_config_data(config_entry: MagicAreasConfigEntry) -> dict[str, object]:
@@ -935,8 +1124,14 @@ def attach_registry_listeners(
     config_entry: MagicAreasConfigEntry,
     area_config: AreaConfig,
     tracked_listeners: list[Callable[[], None]],
+    *,
+    hot_apply: Callable[[], Awaitable[bool]] | None = None,
 ) -> None:
-    """Attach entity/device registry listeners for a non-meta area."""
+    """Attach entity/device registry listeners for a non-meta area.
+
+    Registry and readiness changes go through ``hot_apply`` first when given,
+    so membership churn updates the loaded entry instead of reloading it.
+    """
 
     def _auto_reload_enabled() -> bool:
         return reload_on_registry_change(_merged_area_config_data(config_entry))
@@ -947,6 +1142,7 @@ def attach_registry_listeners(
         area_config=area_config,
         get_snapshot=lambda: _runtime_snapshot(config_entry),
         should_auto_reload=_auto_reload_enabled,
+        hot_apply=hot_apply,
     )
     manager.start()
     tracked_listeners.append(manager.shutdown)
@@ -0,0 +1,217 @@
+"""Integration-wide config entry reload queue."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from time import monotonic
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.floor_registry import async_get as floorreg_async_get
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.area_state import MetaAreaType
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.defaults import DEFAULT_RELOAD_MAX_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+_EXPECTED_RELOAD_ERRORS = (HomeAssistantError, KeyError, ValueError, RuntimeError)
+
+# Reload order: regular areas, then type/floor metas, then the global meta.
+RELOAD_RANK_AREA = 0
+RELOAD_RANK_META = 1
+RELOAD_RANK_GLOBAL = 2
+
+
+def entry_reload_rank(hass: HomeAssistant, entry_id: str) -> int:
+    """Return where an entry reloads relative to its meta parents."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    area_id = entry.data.get(ATTR_ID) if entry is not None else None
+    if area_id == MetaAreaType.GLOBAL:
+        return RELOAD_RANK_GLOBAL
+    if area_id in (MetaAreaType.INTERIOR, MetaAreaType.EXTERIOR):
+        return RELOAD_RANK_META
+    if isinstance(area_id, str) and floorreg_async_get(hass).async_get_floor(area_id):
+        return RELOAD_RANK_META
+    return RELOAD_RANK_AREA
+
+
+@dataclass(slots=True)
+class PendingReload:
+    """One queued entry reload and the reasons it was requested for."""
+
+    entry_id: str
+    rank: int
+    requested_at: float
+    reasons: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class EntryReloadRecord:
+    """Reload counters and timings for one config entry."""
+
+    reloads: int = 0
+    failures: int = 0
+    last_reasons: tuple[str, ...] = ()
+    last_wait_seconds: float | None = None
+    last_reload_seconds: float | None = None
+    total_reload_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class ReloadQueue:
+    """Coalesced, ordered, concurrency-bounded config entry reloads.
+
+    Requests for an entry that is already queued merge into the queued
+    reload. Queued reloads start lowest rank first, and a meta area waits
+    while any lower-ranked (child) reload is queued or running. At most
+    ``max_concurrency`` reloads run at once (the global meta area's
+    ``reload_max_concurrency`` option); an entry never reloads twice
+    concurrently, so a request arriving mid-reload queues one follow-up.
+    """
+
+    hass: HomeAssistant
+    max_concurrency: int = DEFAULT_RELOAD_MAX_CONCURRENCY
+    requested: int = 0
+    coalesced: int = 0
+    skipped: int = 0
+    max_queue_depth: int = 0
+    _pending: dict[str, PendingReload] = field(default_factory=dict)
+    _running: dict[str, int] = field(default_factory=dict)
+    _records: dict[str, EntryReloadRecord] = field(default_factory=dict)
+
+    @callback
+    def request(self, entry_id: str, *, reason: str) -> None:
+        """Queue a reload for one entry, merging with a queued request."""
+        self.requested += 1
+        if (pending := self._pending.get(entry_id)) is not None:
+            self.coalesced += 1
+            if reason not in pending.reasons:
+                pending.reasons.append(reason)
+            return
+        self._pending[entry_id] = PendingReload(
+            entry_id=entry_id,
+            rank=entry_reload_rank(self.hass, entry_id),
+            requested_at=monotonic(),
+            reasons=[reason],
+        )
+        self.max_queue_depth = max(self.max_queue_depth, len(self._pending))
+        self._drain()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of reloads waiting to start."""
+        return len(self._pending)
+
+    def diagnostics(self, entry_id: str | None = None) -> dict[str, object]:
+        """Return queue state, and one entry's reload history when given."""
+        diagnostics: dict[str, object] = {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "running": len(self._running),
+            "requested": self.requested,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "pending_reasons": {
+                pending.entry_id: list(pending.reasons)
+                for pending in self._pending.values()
+            },
+        }
+        if entry_id is not None:
+            record = self._records.get(entry_id) or EntryReloadRecord()
+            diagnostics["entry"] = {
+                "reloads": record.reloads,
+                "failures": record.failures,
+                "last_reasons": list(record.last_reasons),
+                "last_wait_seconds": record.last_wait_seconds,
+                "last_reload_seconds": record.last_reload_seconds,
+                "total_reload_seconds": round(record.total_reload_seconds, 3),
+            }
+        return diagnostics
+
+    @callback
+    def _drain(self) -> None:
+        """Start queued reloads while there is capacity."""
+        while len(self._running) < max(1, self.max_concurrency):
+            pending = self._next_ready()
+            if pending is None:
+                return
+            del self._pending[pending.entry_id]
+            self._running[pending.entry_id] = pending.rank
+            self.hass.async_create_task(
+                self._async_reload(pending),
+                f"{DOMAIN} reload {pending.entry_id}",
+                eager_start=False,
+            )
+
+    def _next_ready(self) -> PendingReload | None:
+        """Return the next queued reload allowed to start, if any."""
+        candidates = sorted(
+            (
+                pending
+                for pending in self._pending.values()
+                if pending.entry_id not in self._running
+            ),
+            key=lambda pending: (pending.rank, pending.requested_at),
+        )
+        if not candidates:
+            return None
+        first = candidates[0]
+        lowest_pending = min(pending.rank for pending in self._pending.values())
+        lowest_running = min(self._running.values(), default=first.rank)
+        if first.rank > min(lowest_pending, lowest_running):
+            return None
+        return first
+
+    async def _async_reload(self, pending: PendingReload) -> None:
+        """Reload one entry and record its timing."""
+        entry = self.hass.config_entries.async_get_entry(pending.entry_id)
+        if entry is None or entry.state is ConfigEntryState.NOT_LOADED:
+            # Removed or unloaded while queued; reloading would set it up again.
+            self.skipped += 1
+            del self._running[pending.entry_id]
+            self._drain()
+            return
+        record = self._records.setdefault(pending.entry_id, EntryReloadRecord())
+        started_at = monotonic()
+        record.last_reasons = tuple(pending.reasons)
+        record.last_wait_seconds = round(started_at - pending.requested_at, 3)
+        try:
+            await self.hass.config_entries.async_reload(pending.entry_id)
+        except _EXPECTED_RELOAD_ERRORS:
+            record.failures += 1
+            _LOGGER.exception(
+                "Failed to reload entry %s (%s)",
+                pending.entry_id,
+                ", ".join(pending.reasons),
+            )
+        finally:
+            elapsed = monotonic() - started_at
+            record.reloads += 1
+            record.last_reload_seconds = round(elapsed, 3)
+            record.total_reload_seconds += elapsed
+            del self._running[pending.entry_id]
+            self._drain()
+
+
+RELOAD_QUEUE: HassKey[ReloadQueue] = HassKey(f"{DOMAIN}_reload_queue")
+
+
+def async_get_reload_queue(hass: HomeAssistant) -> ReloadQueue:
+    """Return the shared reload queue for this Home Assistant instance."""
+    queue = hass.data.get(RELOAD_QUEUE)
+    if queue is None:
+        queue = hass.data[RELOAD_QUEUE] = ReloadQueue(hass=hass)
+    return queue
+
+
+__all__ = [
+    "RELOAD_QUEUE",
+    "ReloadQueue",
+    "async_get_reload_queue",
+    "entry_reload_rank",
+]
@@ -0,0 +1,273 @@
+"""House-level ordering and phase timing of config entry setups."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+from time import monotonic
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.helpers.label_registry import EVENT_LABEL_REGISTRY_UPDATED
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.reload_queue import (
+    RELOAD_RANK_AREA,
+    entry_reload_rank,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SETUP_CHILD_WAIT_TIMEOUT = 60.0
+
+SETUP_PHASE_CONFIG = "config"
+SETUP_PHASE_CHILD_WAIT = "child_wait"
+SETUP_PHASE_FIRST_REFRESH = "first_refresh"
+SETUP_PHASE_MANAGED_SURFACES = "managed_surfaces"
+SETUP_PHASE_ADAPTIVE_LIGHTING = "adaptive_lighting"
+SETUP_PHASE_RUNTIME_CONTROLLERS = "runtime_controllers"
+SETUP_PHASE_PLATFORMS = "platforms"
+SETUP_PHASE_READINESS_CONVERGENCE = "readiness_convergence"
+
+
+@dataclass(slots=True)
+class SetupPhaseRecord:
+    """Timing and side-effect counts of one setup phase of one entry."""
+
+    runs: int = 0
+    last_seconds: float | None = None
+    total_seconds: float = 0.0
+    registry_lookups: int = 0
+    registry_updates: int = 0
+    service_calls: int = 0
+    open: int = 0
+
+
+# The innermost open phase of the running task. Registry and service-call
+# events are dispatched synchronously in the caller's context, so listeners
+# attribute them to the phase that caused them.
+_ACTIVE_PHASE: ContextVar[SetupPhaseRecord | None] = ContextVar(
+    f"{DOMAIN}_setup_phase", default=None
+)
+
+
+def record_registry_lookups(count: int = 1) -> None:
+    """Attribute registry lookups to the caller's open setup phase, if any."""
+    if (record := _ACTIVE_PHASE.get()) is not None and record.open:
+        record.registry_lookups += count
+
+
+@dataclass(slots=True)
+class EntrySetupRecord:
+    """How long one entry's setup waited on lower-ranked entries."""
+
+    waited_for: int = 0
+    wait_seconds: float = 0.0
+    timed_out: bool = False
+
+
+@dataclass(slots=True)
+class SetupPipeline:
+    """Let meta entries start only after concurrently setting-up children.
+
+    Home Assistant sets up all entries of the integration concurrently.
+    Every entry marks itself ready when its setup ends, successfully or not.
+    A meta entry first waits for lower-ranked entries (per
+    ``entry_reload_rank``) that are still setting up. Its first snapshot then
+    composes loaded children instead of being rebuilt as each child appears.
+    The wait is bounded by ``child_wait_timeout``.
+
+    Setup steps run inside ``phase`` blocks, which record duration plus the
+    registry lookups, registry updates and service calls made while the phase
+    is open.
+    """
+
+    hass: HomeAssistant
+    child_wait_timeout: float = SETUP_CHILD_WAIT_TIMEOUT
+    _ready: dict[str, asyncio.Event] = field(default_factory=dict)
+    _records: dict[str, EntrySetupRecord] = field(default_factory=dict)
+    _phases: dict[str, dict[str, SetupPhaseRecord]] = field(default_factory=dict)
+    _setup_started_at: dict[str, float] = field(default_factory=dict)
+    _setup_seconds: dict[str, float] = field(default_factory=dict)
+    _unsubscribers: list[CALLBACK_TYPE] = field(default_factory=list)
+
+    @callback
+    def begin(self, entry_id: str) -> None:
+        """Mark an entry as setting up."""
+        self._event(entry_id).clear()
+        self._setup_started_at[entry_id] = monotonic()
+
+    @callback
+    def mark_ready(self, entry_id: str) -> None:
+        """Release entries waiting on this one."""
+        self._event(entry_id).set()
+        if (started_at := self._setup_started_at.pop(entry_id, None)) is not None:
+            self._setup_seconds[entry_id] = round(monotonic() - started_at, 3)
+
+    @contextmanager
+    def phase(self, entry_id: str, name: str) -> Iterator[None]:
+        """Time one setup phase and count its registry and service calls."""
+        self._ensure_listeners()
+        record = self._phases.setdefault(entry_id, {}).setdefault(
+            name, SetupPhaseRecord()
+        )
+        token = _ACTIVE_PHASE.set(record)
+        record.open += 1
+        started_at = monotonic()
+        try:
+            yield
+        finally:
+            elapsed = monotonic() - started_at
+            record.open -= 1
+            record.runs += 1
+            record.last_seconds = round(elapsed, 3)
+            record.total_seconds += elapsed
+            _ACTIVE_PHASE.reset(token)
+
+    async def async_wait_for_children(self, entry_id: str) -> None:
+        """Wait for lower-ranked entries that are still setting up."""
+        rank = entry_reload_rank(self.hass, entry_id)
+        if rank == RELOAD_RANK_AREA:
+            return
+        pending = [
+            self._event(entry.entry_id)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id != entry_id
+            and entry.state is ConfigEntryState.SETUP_IN_PROGRESS
+            and entry_reload_rank(self.hass, entry.entry_id) < rank
+        ]
+        pending = [event for event in pending if not event.is_set()]
+        record = self._records[entry_id] = EntrySetupRecord(waited_for=len(pending))
+        if not pending:
+            return
+        started_at = monotonic()
+        try:
+            with self.phase(entry_id, SETUP_PHASE_CHILD_WAIT):
+                async with asyncio.timeout(self.child_wait_timeout):
+                    await asyncio.gather(*(event.wait() for event in pending))
+        except TimeoutError:
+            record.timed_out = True
+            _LOGGER.warning(
+                "Entry %s stopped waiting for child setups after %ss",
+                entry_id,
+                self.child_wait_timeout,
+            )
+        finally:
+            record.wait_seconds = round(monotonic() - started_at, 3)
+
+    def diagnostics(self, entry_id: str) -> dict[str, object]:
+        """Return this entry's setup timing and house-wide setup totals."""
+        record = self._records.get(entry_id) or EntrySetupRecord()
+        return {
+            "waited_for": record.waited_for,
+            "wait_seconds": record.wait_seconds,
+            "timed_out": record.timed_out,
+            "setup_seconds": self._setup_seconds.get(entry_id),
+            "phases": {
+                name: {
+                    "runs": phase.runs,
+                    "last_seconds": phase.last_seconds,
+                    "total_seconds": round(phase.total_seconds, 3),
+                    "registry_lookups": phase.registry_lookups,
+                    "registry_updates": phase.registry_updates,
+                    "service_calls": phase.service_calls,
+                }
+                for name, phase in self._phases.get(entry_id, {}).items()
+            },
+            "setting_up": sorted(
+                pending_id
+                for pending_id, event in self._ready.items()
+                if not event.is_set()
+            ),
+            "house": {
+                "entries": len(self._setup_seconds),
+                "slowest_setup_seconds": max(
+                    self._setup_seconds.values(), default=None
+                ),
+                "total_setup_seconds": round(sum(self._setup_seconds.values()), 3),
+            },
+        }
+
+    def async_unlisten(self) -> None:
+        """Detach the registry and service-call counters."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+
+    def _ensure_listeners(self) -> None:
+        """Attach registry and service-call counters on first use."""
+        if self._unsubscribers:
+            return
+        bus = self.hass.bus
+        self._unsubscribers = [
+            bus.async_listen(EVENT_CALL_SERVICE, self._count_service_call),
+            bus.async_listen(
+                EVENT_DEVICE_REGISTRY_UPDATED, self._count_registry_update
+            ),
+            bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED, self._count_registry_update
+            ),
+            bus.async_listen(EVENT_LABEL_REGISTRY_UPDATED, self._count_registry_update),
+        ]
+
+    @callback
+    def _count_service_call(self, event: object) -> None:
+        """Attribute a service call to the caller's open phase."""
+        if (record := _ACTIVE_PHASE.get()) is not None and record.open:
+            record.service_calls += 1
+
+    @callback
+    def _count_registry_update(self, event: object) -> None:
+        """Attribute a registry update to the caller's open phase."""
+        if (record := _ACTIVE_PHASE.get()) is not None and record.open:
+            record.registry_updates += 1
+
+    def _event(self, entry_id: str) -> asyncio.Event:
+        """Return the readiness event for an entry, creating it unset."""
+        if (event := self._ready.get(entry_id)) is None:
+            event = self._ready[entry_id] = asyncio.Event()
+        return event
+
+
+SETUP_PIPELINE: HassKey[SetupPipeline] = HassKey(f"{DOMAIN}_setup_pipeline")
+
+
+def async_get_setup_pipeline(hass: HomeAssistant) -> SetupPipeline:
+    """Return the shared setup pipeline for this Home Assistant instance."""
+    pipeline = hass.data.get(SETUP_PIPELINE)
+    if pipeline is None:
+        pipeline = hass.data[SETUP_PIPELINE] = SetupPipeline(hass=hass)
+    return pipeline
+
+
+def async_release_setup_pipeline(hass: HomeAssistant) -> None:
+    """Unsubscribe and drop the shared setup pipeline."""
+    pipeline = hass.data.pop(SETUP_PIPELINE, None)
+    if pipeline is not None:
+        pipeline.async_unlisten()
+
+
+__all__ = [
+    "SETUP_CHILD_WAIT_TIMEOUT",
+    "SETUP_PHASE_ADAPTIVE_LIGHTING",
+    "SETUP_PHASE_CHILD_WAIT",
+    "SETUP_PHASE_CONFIG",
+    "SETUP_PHASE_FIRST_REFRESH",
+    "SETUP_PHASE_MANAGED_SURFACES",
+    "SETUP_PHASE_PLATFORMS",
+    "SETUP_PHASE_READINESS_CONVERGENCE",
+    "SETUP_PHASE_RUNTIME_CONTROLLERS",
+    "SETUP_PIPELINE",
+    "SetupPipeline",
+    "async_get_setup_pipeline",
+    "async_release_setup_pipeline",
+    "record_registry_lookups",
+]
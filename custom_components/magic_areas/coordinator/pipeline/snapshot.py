@@ -5,12 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
-from custom_components.magic_areas.const import DOMAIN
 from custom_components.magic_areas.core.runtime_model import AreaConfig, AreaRuntime
 from custom_components.magic_areas.core.config import (
     normalize_custom_control_groups,
@@ -20,19 +18,24 @@ from custom_components.magic_areas.core.controls import GroupRegistry
 from custom_components.magic_areas.core.runtime_model import (
     EntityReferences,
     build_entity_references,
-    build_presence_tracking_unique_id,
 )
 from custom_components.magic_areas.core.meta import (
+    area_topology_descriptor,
+    async_get_area_topology_index,
     collect_child_areas,
     resolve_active_areas,
 )
 from custom_components.magic_areas.coordinator.pipeline.entity_ingestion import (
+    MetaChildInventory,
     load_area_entities,
     load_meta_area_entities,
 )
 from custom_components.magic_areas.coordinator.pipeline.presence_ingestion import (
     build_presence_sensors,
 )
+from custom_components.magic_areas.coordinator.pipeline.snapshot_cache import (
+    CachedSnapshot,
+)
 
 type EntitySnapshotDict = dict[str, str]
 type EntitiesByDomain = dict[str, list[EntitySnapshotDict]]
@@ -65,12 +68,14 @@ async def build_snapshot(
     area_config: AreaConfig,
     config_entry_id: str,
     group_registry: GroupRegistry,
+    meta_inventory: MetaChildInventory | None = None,
 ) -> MagicAreasData:
     """Build a coordinator snapshot for the given area."""
     child_areas_list, entities, magic_entities = await _load_entities_for_area(
         hass=hass,
         area_config=area_config,
         config_entry_id=config_entry_id,
+        meta_inventory=meta_inventory,
     )
 
     enabled_features, feature_configs = _resolve_feature_config(area_config=area_config)
@@ -89,8 +94,11 @@ async def build_snapshot(
         enabled_features=enabled_features,
         entity_references=entity_references,
         child_areas=child_areas_list,
-        entity_registry=entity_registry,
     )
+    if not area_config.is_meta():
+        async_get_area_topology_index(hass).publish(
+            config_entry_id, area_topology_descriptor(area_config)
+        )
 
     return _build_magic_areas_data(
         area_config=area_config,
@@ -106,6 +114,40 @@ async def build_snapshot(
     )
 
 
+def build_warm_snapshot(
+    hass: HomeAssistant,
+    area_config: AreaConfig,
+    config_entry_id: str,
+    group_registry: GroupRegistry,
+    cached: CachedSnapshot,
+) -> MagicAreasData:
+    """Build a regular-area snapshot from a cached inventory.
+
+    Entity loading, presence resolution, and reference lookups are replaced by
+    the cached results; feature config and custom groups are still derived
+    from the area config, which the cache fingerprint covers.
+    """
+    enabled_features, feature_configs = _resolve_feature_config(area_config=area_config)
+    _register_custom_control_groups(
+        area_config=area_config, group_registry=group_registry
+    )
+    async_get_area_topology_index(hass).publish(
+        config_entry_id, area_topology_descriptor(area_config)
+    )
+    return _build_magic_areas_data(
+        area_config=area_config,
+        entities=cached.entities,
+        magic_entities=cached.magic_entities,
+        presence_sensors=list(cached.presence_sensors),
+        active_areas=[],
+        child_areas=[],
+        enabled_features=enabled_features,
+        feature_configs=feature_configs,
+        group_registry=group_registry,
+        entity_references=cached.entity_references,
+    )
+
+
 def _resolve_feature_config(
     *,
     area_config: AreaConfig,
@@ -123,7 +165,6 @@ def _resolve_presence_projection(
     enabled_features: set[str],
     entity_references: EntityReferences,
     child_areas: list[str],
-    entity_registry: er.EntityRegistry,
 ) -> tuple[list[str], list[str]]:
     """Resolve effective presence sensors and active child areas."""
     default_presence_sensors = build_presence_sensors(
@@ -137,7 +178,6 @@ def _resolve_presence_projection(
         hass=hass,
         area_config=area_config,
         child_areas=child_areas,
-        entity_registry=entity_registry,
         default_presence_sensors=default_presence_sensors,
     )
 
@@ -179,6 +219,7 @@ async def _load_entities_for_area(
     hass: HomeAssistant,
     area_config: AreaConfig,
     config_entry_id: str,
+    meta_inventory: MetaChildInventory | None = None,
 ) -> tuple[list[str], EntitiesByDomain, EntitiesByDomain]:
     """Load area/meta entities and return child areas when applicable."""
     if area_config.is_meta():
@@ -193,6 +234,7 @@ async def _load_entities_for_area(
             child_area_slugs=child_areas,
             config_entry_id=config_entry_id,
             config=area_config.config,
+            inventory=meta_inventory,
         )
         return child_areas, entities, magic_entities
 
@@ -234,21 +276,17 @@ def _resolve_meta_presence_state(
     hass: HomeAssistant,
     area_config: AreaConfig,
     child_areas: list[str],
-    entity_registry: er.EntityRegistry,
     default_presence_sensors: list[str],
 ) -> tuple[list[str], list[str]]:
     """Resolve effective presence sensors and active areas for meta snapshots."""
     if not area_config.is_meta():
         return default_presence_sensors, []
 
+    topology = async_get_area_topology_index(hass)
     child_presence_sensors: list[str] = []
     state_map: dict[str, str] = {}
     for child_area_id in child_areas:
-        child_entity_id = entity_registry.async_get_entity_id(
-            BINARY_SENSOR_DOMAIN,
-            DOMAIN,
-            build_presence_tracking_unique_id(area_id=child_area_id),
-        )
+        child_entity_id = topology.presence_entity_id(child_area_id)
         if child_entity_id is None:
             continue
         child_presence_sensors.append(child_entity_id)
@@ -0,0 +1,291 @@
+"""Persisted warm-start cache of regular-area snapshot inventories."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import async_get as devicereg_async_get
+from homeassistant.helpers.entity_registry import async_get as entityreg_async_get
+from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    record_registry_lookups,
+)
+from custom_components.magic_areas.core.config import include_entities
+from custom_components.magic_areas.core.runtime_model import EntityReferences
+
+if TYPE_CHECKING:  # pragma: no cover
+    from homeassistant.helpers.entity_registry import RegistryEntry
+
+    from custom_components.magic_areas.coordinator.pipeline.snapshot import (
+        MagicAreasData,
+    )
+    from custom_components.magic_areas.core.runtime_model import AreaConfig
+
+SNAPSHOT_CACHE_STORAGE_KEY = f"{DOMAIN}.snapshot_cache"
+SNAPSHOT_CACHE_STORAGE_VERSION = 1
+SNAPSHOT_CACHE_SAVE_DELAY = 30
+
+type CachedEntitiesByDomain = dict[str, list[dict[str, str]]]
+type SnapshotCacheData = dict[str, dict[str, object]]
+
+
+def _registry_stamp(entry: object) -> tuple[str, str]:
+    """Return an (id, last-modified) pair for a registry entry."""
+    modified_at = getattr(entry, "modified_at", None)
+    return (
+        str(getattr(entry, "entity_id", None) or getattr(entry, "id", "")),
+        modified_at.isoformat() if modified_at is not None else "",
+    )
+
+
+def registry_fingerprint(
+    hass: HomeAssistant, area_config: AreaConfig, config_entry_id: str
+) -> str:
+    """Return a digest of the registry and config inputs of a regular area.
+
+    Covers the area's devices and their entities, entities assigned to the
+    area directly, explicitly included entities, the entry's own entities, and
+    the merged area config. Any registry edit bumps ``modified_at``, so a
+    matching fingerprint means a cold snapshot would read the same inputs.
+    """
+    entity_registry = entityreg_async_get(hass)
+    device_registry = devicereg_async_get(hass)
+    stamps: set[tuple[str, str]] = set()
+    devices = device_registry.devices.get_devices_for_area_id(area_config.id)
+    for device in devices:
+        stamps.add(_registry_stamp(device))
+        stamps.update(
+            _registry_stamp(entity)
+            for entity in entity_registry.entities.get_entries_for_device_id(device.id)
+        )
+    entities: list[RegistryEntry] = [
+        *entity_registry.entities.get_entries_for_area_id(area_config.id),
+        *entity_registry.entities.get_entries_for_config_entry_id(config_entry_id),
+    ]
+    included = include_entities(area_config.config)
+    for entity_id in included:
+        if (entity := entity_registry.async_get(entity_id)) is not None:
+            entities.append(entity)
+    record_registry_lookups(3 + len(devices) + len(included))
+    stamps.update(_registry_stamp(entity) for entity in entities)
+
+    payload = json.dumps(
+        [sorted(stamps), area_config.config],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _copy_entities(entities: CachedEntitiesByDomain) -> CachedEntitiesByDomain:
+    """Return a copy of domain-grouped entity dicts."""
+    return {
+        domain: [dict(entity) for entity in domain_entities]
+        for domain, domain_entities in entities.items()
+    }
+
+
+def _entity_ids(entities: CachedEntitiesByDomain) -> tuple[tuple[str, ...], ...]:
+    """Return the sorted entity ids of each domain, ordered by domain."""
+    return tuple(
+        tuple(sorted(entity.get(ATTR_ENTITY_ID, "") for entity in entities[domain]))
+        for domain in sorted(entities)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSnapshot:
+    """Inventory of one regular-area snapshot, tied to its fingerprint."""
+
+    fingerprint: str
+    entities: CachedEntitiesByDomain
+    magic_entities: CachedEntitiesByDomain
+    presence_sensors: list[str]
+    entity_references: EntityReferences
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: MagicAreasData, fingerprint: str
+    ) -> CachedSnapshot:
+        """Return the cacheable inventory of a cold-built snapshot."""
+        return cls(
+            fingerprint=fingerprint,
+            entities=_copy_entities(snapshot.entities),
+            magic_entities=_copy_entities(snapshot.magic_entities),
+            presence_sensors=list(snapshot.presence_sensors),
+            entity_references=snapshot.entity_references,
+        )
+
+    def inventory_key(self) -> tuple[object, ...]:
+        """Return the identity of this inventory, ignoring state attributes."""
+        return (
+            self.fingerprint,
+            _entity_ids(self.entities),
+            _entity_ids(self.magic_entities),
+            tuple(self.presence_sensors),
+            self.entity_references,
+        )
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the JSON-serializable stored form."""
+        return {
+            "fingerprint": self.fingerprint,
+            "entities": self.entities,
+            "magic_entities": self.magic_entities,
+            "presence_sensors": self.presence_sensors,
+            "entity_references": asdict(self.entity_references),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> CachedSnapshot | None:
+        """Return a cached snapshot from its stored form, if well-formed."""
+        fingerprint = data.get("fingerprint")
+        entities = data.get("entities")
+        magic_entities = data.get("magic_entities")
+        presence_sensors = data.get("presence_sensors")
+        references = data.get("entity_references")
+        if not (
+            isinstance(fingerprint, str)
+            and isinstance(entities, dict)
+            and isinstance(magic_entities, dict)
+            and isinstance(presence_sensors, list)
+            and isinstance(references, dict)
+        ):
+            return None
+        known_fields = set(EntityReferences.__dataclass_fields__)
+        return cls(
+            fingerprint=fingerprint,
+            entities=entities,
+            magic_entities=magic_entities,
+            presence_sensors=[str(entity_id) for entity_id in presence_sensors],
+            entity_references=EntityReferences(
+                **{
+                    key: value if isinstance(value, str) else None
+                    for key, value in references.items()
+                    if key in known_fields
+                }
+            ),
+        )
+
+
+@dataclass(slots=True)
+class SnapshotCache:
+    """Per-entry snapshot inventories persisted across restarts.
+
+    A regular area's first refresh after setup is served from its cached
+    inventory when the registry fingerprint still matches. Every cold build
+    offers its inventory back; unchanged inventories are not re-saved.
+    """
+
+    hass: HomeAssistant
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    updates: int = 0
+    _records: dict[str, CachedSnapshot] = field(default_factory=dict)
+    _warm_started: set[str] = field(default_factory=set)
+    _loaded: bool = False
+    _load_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _store: Store[SnapshotCacheData] | None = None
+
+    async def async_load(self) -> None:
+        """Load persisted inventories once."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._store = Store(
+                self.hass,
+                SNAPSHOT_CACHE_STORAGE_VERSION,
+                SNAPSHOT_CACHE_STORAGE_KEY,
+                private=True,
+            )
+            stored = await self._store.async_load() or {}
+            for entry_id, data in stored.items():
+                if isinstance(data, dict) and (
+                    cached := CachedSnapshot.from_dict(data)
+                ):
+                    self._records[entry_id] = cached
+            self._loaded = True
+
+    def get(self, entry_id: str, fingerprint: str) -> CachedSnapshot | None:
+        """Return the cached inventory when its fingerprint still matches."""
+        self._warm_started.discard(entry_id)
+        cached = self._records.get(entry_id)
+        if cached is None:
+            self.misses += 1
+            return None
+        if cached.fingerprint != fingerprint:
+            self.stale += 1
+            return None
+        self.hits += 1
+        self._warm_started.add(entry_id)
+        return cached
+
+    def put(self, entry_id: str, cached: CachedSnapshot) -> None:
+        """Record an entry's current inventory, saving only when it changed.
+
+        State attributes churn on every refresh, so they are kept in memory
+        but only a change to the fingerprint or the entity, presence, or
+        reference set schedules a save.
+        """
+        current = self._records.get(entry_id)
+        self._records[entry_id] = cached
+        if current is not None and current.inventory_key() == cached.inventory_key():
+            return
+        self.updates += 1
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_CACHE_SAVE_DELAY)
+
+    def diagnostics(self, entry_id: str) -> dict[str, object]:
+        """Return cache counters and whether this entry started warm."""
+        cached = self._records.get(entry_id)
+        return {
+            "entries": len(self._records),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "updates": self.updates,
+            "cached": cached is not None,
+            "warm_started": entry_id in self._warm_started,
+        }
+
+    def _data_to_save(self) -> SnapshotCacheData:
+        """Return stored inventories for entries that still exist."""
+        return {
+            entry_id: cached.as_dict()
+            for entry_id, cached in self._records.items()
+            if self.hass.config_entries.async_get_entry(entry_id) is not None
+        }
+
+
+SNAPSHOT_CACHE: HassKey[SnapshotCache] = HassKey(f"{DOMAIN}_snapshot_cache")
+
+
+async def async_get_snapshot_cache(hass: HomeAssistant) -> SnapshotCache:
+    """Return the shared snapshot cache, loading it on first use."""
+    cache = hass.data.get(SNAPSHOT_CACHE)
+    if cache is None:
+        cache = hass.data[SNAPSHOT_CACHE] = SnapshotCache(hass=hass)
+    await cache.async_load()
+    return cache
+
+
+__all__ = [
+    "CachedSnapshot",
+    "SNAPSHOT_CACHE",
+    "SNAPSHOT_CACHE_STORAGE_KEY",
+    "SnapshotCache",
+    "async_get_snapshot_cache",
+    "registry_fingerprint",
+]
@@ -0,0 +1,267 @@
+"""House-level fan-out of area-aware media announcements by player platform."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+from time import monotonic
+
+from homeassistant.components.media_player.const import (
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
+    SERVICE_PLAY_MEDIA,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util.hass_dict import HassKey
+import voluptuous as vol
+
+from custom_components.magic_areas.const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ANNOUNCEMENT_PARTITION_TIMEOUT = 10.0
+ANNOUNCEMENT_UNKNOWN_PLATFORM = "unknown"
+ANNOUNCEMENT_ERROR_TIMEOUT = "timeout"
+ANNOUNCEMENT_ERROR_CANCELLED = "cancelled"
+
+_EXPECTED_ANNOUNCEMENT_ERRORS = (
+    HomeAssistantError,
+    KeyError,
+    TypeError,
+    ValueError,
+    AttributeError,
+    RuntimeError,
+    vol.Invalid,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class AnnouncementPartitionResult:
+    """Outcome of one platform partition of one announcement."""
+
+    platform: str
+    entity_ids: tuple[str, ...]
+    seconds: float
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class PlatformAnnouncementStats:
+    """Latency and failure counters for one media player platform."""
+
+    dispatches: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    last_seconds: float | None = None
+    max_seconds: float = 0.0
+    last_error: str | None = None
+
+
+@dataclass(slots=True)
+class AnnouncementDispatcher:
+    """Send announcements to each player platform concurrently.
+
+    Integrations serve a ``play_media`` call for their own entities one after
+    another, so a single call spanning Sonos, Cast and ESPHome players takes
+    as long as all of them together. Targets are grouped by entity registry
+    platform and each group gets its own blocking call. An announcement then
+    takes as long as its slowest platform, and a failing platform does not
+    stop the others. A call still running after ``partition_timeout`` is
+    reported as timed out but left to finish, so slow speakers still play.
+    """
+
+    hass: HomeAssistant
+    partition_timeout: float = ANNOUNCEMENT_PARTITION_TIMEOUT
+    announcements: int = 0
+    _platforms: dict[str, PlatformAnnouncementStats] = field(default_factory=dict)
+    _last: tuple[AnnouncementPartitionResult, ...] = ()
+
+    def partition(self, entity_ids: Iterable[str]) -> dict[str, tuple[str, ...]]:
+        """Group media player entity IDs by their integration platform."""
+        registry = er.async_get(self.hass)
+        partitions: dict[str, list[str]] = {}
+        for entity_id in entity_ids:
+            entry = registry.async_get(entity_id)
+            platform = entry.platform if entry else ANNOUNCEMENT_UNKNOWN_PLATFORM
+            partitions.setdefault(platform, []).append(entity_id)
+        return {platform: tuple(ids) for platform, ids in sorted(partitions.items())}
+
+    @callback
+    def async_announce(
+        self, entity_ids: Iterable[str], data: Mapping[str, object]
+    ) -> None:
+        """Dispatch an announcement in the background without awaiting it."""
+        self.hass.async_create_background_task(
+            self.async_dispatch(entity_ids, data), f"{DOMAIN} announcement"
+        )
+
+    async def async_dispatch(
+        self, entity_ids: Iterable[str], data: Mapping[str, object]
+    ) -> tuple[AnnouncementPartitionResult, ...]:
+        """Play media on every target, one concurrent call per platform."""
+        partitions = self.partition(entity_ids)
+        if not partitions:
+            return ()
+        self.announcements += 1
+        started_at = monotonic()
+        outcomes = await asyncio.gather(
+            *(
+                self._async_play_partition(platform, ids, data)
+                for platform, ids in partitions.items()
+            ),
+            return_exceptions=True,
+        )
+        results = tuple(
+            outcome
+            if isinstance(outcome, AnnouncementPartitionResult)
+            else self._record(
+                platform,
+                ids,
+                seconds=round(monotonic() - started_at, 3),
+                error=f"{type(outcome).__name__}: {outcome}",
+            )
+            for (platform, ids), outcome in zip(
+                partitions.items(), outcomes, strict=True
+            )
+        )
+        self._last = results
+        return results
+
+    async def _async_play_partition(
+        self, platform: str, entity_ids: tuple[str, ...], data: Mapping[str, object]
+    ) -> AnnouncementPartitionResult:
+        """Issue one platform's call and record its latency or failure."""
+        started_at = monotonic()
+        call = self.hass.async_create_background_task(
+            self.hass.services.async_call(
+                MEDIA_PLAYER_DOMAIN,
+                SERVICE_PLAY_MEDIA,
+                {**data, ATTR_ENTITY_ID: list(entity_ids)},
+                blocking=True,
+            ),
+            f"{DOMAIN} announcement to {platform}",
+        )
+        done, _ = await asyncio.wait({call}, timeout=self.partition_timeout)
+        error: str | None = None
+        if not done:
+            # Cancelling would cut the announcement off on a slow speaker.
+            call.add_done_callback(partial(self._late_call_done, platform, entity_ids))
+            error = ANNOUNCEMENT_ERROR_TIMEOUT
+        elif call.cancelled():
+            error = ANNOUNCEMENT_ERROR_CANCELLED
+        elif (exc := call.exception()) is not None:
+            if not isinstance(exc, _EXPECTED_ANNOUNCEMENT_ERRORS):
+                raise exc
+            error = f"{type(exc).__name__}: {exc}"
+        return self._record(
+            platform,
+            entity_ids,
+            seconds=round(monotonic() - started_at, 3),
+            error=error,
+        )
+
+    def _late_call_done(
+        self,
+        platform: str,
+        entity_ids: tuple[str, ...],
+        call: asyncio.Task[object],
+    ) -> None:
+        """Log the outcome of a call that outlived its partition timeout."""
+        if call.cancelled() or (exc := call.exception()) is None:
+            return
+        _LOGGER.warning(
+            "Announcement to %s players %s failed after timing out: %s: %s",
+            platform,
+            ", ".join(entity_ids),
+            type(exc).__name__,
+            exc,
+        )
+
+    def _record(
+        self,
+        platform: str,
+        entity_ids: tuple[str, ...],
+        *,
+        seconds: float,
+        error: str | None,
+    ) -> AnnouncementPartitionResult:
+        """Update one platform's counters from a partition outcome."""
+        stats = self._platforms.setdefault(platform, PlatformAnnouncementStats())
+        stats.dispatches += 1
+        stats.last_seconds = seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        if error is not None:
+            stats.failures += 1
+            if error == ANNOUNCEMENT_ERROR_TIMEOUT:
+                stats.timeouts += 1
+            stats.last_error = error
+            _LOGGER.warning(
+                "Announcement to %s players %s failed after %ss: %s",
+                platform,
+                ", ".join(entity_ids),
+                seconds,
+                error,
+            )
+        return AnnouncementPartitionResult(
+            platform=platform, entity_ids=entity_ids, seconds=seconds, error=error
+        )
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return per-platform latency and the last announcement's partitions."""
+        return {
+            "announcements": self.announcements,
+            "partition_timeout": self.partition_timeout,
+            "platforms": {
+                platform: {
+                    "dispatches": stats.dispatches,
+                    "failures": stats.failures,
+                    "timeouts": stats.timeouts,
+                    "last_seconds": stats.last_seconds,
+                    "max_seconds": stats.max_seconds,
+                    "last_error": stats.last_error,
+                }
+                for platform, stats in self._platforms.items()
+            },
+            "last": [
+                {
+                    "platform": result.platform,
+                    "entity_ids": list(result.entity_ids),
+                    "seconds": result.seconds,
+                    "error": result.error,
+                }
+                for result in self._last
+            ],
+        }
+
+
+ANNOUNCEMENT_DISPATCHER: HassKey[AnnouncementDispatcher] = HassKey(
+    f"{DOMAIN}_announcement_dispatcher"
+)
+
+
+def async_get_announcement_dispatcher(hass: HomeAssistant) -> AnnouncementDispatcher:
+    """Return the shared announcement dispatcher for this Home Assistant instance."""
+    dispatcher = hass.data.get(ANNOUNCEMENT_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = hass.data[ANNOUNCEMENT_DISPATCHER] = AnnouncementDispatcher(
+            hass=hass
+        )
+    return dispatcher
+
+
+__all__ = [
+    "ANNOUNCEMENT_DISPATCHER",
+    "ANNOUNCEMENT_ERROR_CANCELLED",
+    "ANNOUNCEMENT_ERROR_TIMEOUT",
+    "ANNOUNCEMENT_PARTITION_TIMEOUT",
+    "ANNOUNCEMENT_UNKNOWN_PLATFORM",
+    "AnnouncementDispatcher",
+    "AnnouncementPartitionResult",
+    "PlatformAnnouncementStats",
+    "async_get_announcement_dispatcher",
+]
@@ -0,0 +1,198 @@
+"""House-level router from BLE location sensors to the areas they name."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+
+type BLEActiveSensorsHandler = Callable[[tuple[str, ...]], None]
+
+
+def ble_location(state: State | None) -> str | None:
+    """Return the normalized area reference a BLE sensor reports."""
+    return None if state is None else state.state.lower()
+
+
+@dataclass(slots=True)
+class BLELocationSubscriber:
+    """One area's BLE tracker registered with the router."""
+
+    area_id: str
+    sensors: tuple[str, ...]
+    locations: frozenset[str]
+    on_change: BLEActiveSensorsHandler
+
+
+@dataclass(slots=True)
+class BLELocationRouter:
+    """Single listener that routes BLE sensor locations to area trackers.
+
+    Every tracked sensor's state is normalized once per change and looked up
+    in a location -> area index built from area slugs, IDs and names. Only
+    the areas that the sensor left or entered, and that track it, have their
+    active-sensor sets updated and their handlers called. Registering or
+    removing an area touches only that area's index entries and sensors.
+    """
+
+    hass: HomeAssistant
+    routed: int = 0
+    suppressed: int = 0
+    _subscribers: dict[str, BLELocationSubscriber] = field(default_factory=dict)
+    _areas_by_location: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    _locations: dict[str, str | None] = field(default_factory=dict)
+    _active: dict[str, frozenset[str]] = field(default_factory=dict)
+    _sensor_refs: dict[str, int] = field(default_factory=dict)
+    _sensor_unsubscribers: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
+
+    def register(
+        self,
+        area_id: str,
+        *,
+        sensors: Iterable[str],
+        locations: Iterable[str],
+        on_change: BLEActiveSensorsHandler,
+    ) -> Callable[[], None]:
+        """Register or replace an area's tracker; return its remover."""
+        subscriber = BLELocationSubscriber(
+            area_id=area_id,
+            sensors=tuple(sensors),
+            locations=frozenset(location.lower() for location in locations),
+            on_change=on_change,
+        )
+        if (previous := self._subscribers.get(area_id)) is not None:
+            self._detach(previous)
+        self._attach(subscriber)
+
+        def _remove() -> None:
+            if self._subscribers.get(area_id) is subscriber:
+                self._detach(subscriber)
+
+        return _remove
+
+    def active_sensors(self, area_id: str) -> tuple[str, ...]:
+        """Return the area's sensors currently reporting it, in config order."""
+        subscriber = self._subscribers.get(area_id)
+        if subscriber is None:
+            return ()
+        active = self._active.get(area_id, frozenset())
+        return tuple(sensor for sensor in subscriber.sensors if sensor in active)
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return index size and routing counters."""
+        return {
+            "areas": len(self._subscribers),
+            "tracked_sensors": len(self._locations),
+            "routed": self.routed,
+            "suppressed": self.suppressed,
+        }
+
+    def _attach(self, subscriber: BLELocationSubscriber) -> None:
+        """Index one area and start tracking sensors new to the router."""
+        self._subscribers[subscriber.area_id] = subscriber
+        for location in subscriber.locations:
+            self._areas_by_location[location] = (
+                *self._areas_by_location.get(location, ()),
+                subscriber.area_id,
+            )
+        for sensor in set(subscriber.sensors):
+            self._sensor_refs[sensor] = self._sensor_refs.get(sensor, 0) + 1
+            if sensor in self._sensor_unsubscribers:
+                continue
+            self._locations[sensor] = ble_location(self.hass.states.get(sensor))
+            self._sensor_unsubscribers[sensor] = async_track_state_change_event(
+                self.hass, sensor, self._sensor_state_changed
+            )
+        self._active[subscriber.area_id] = frozenset(
+            sensor
+            for sensor in subscriber.sensors
+            if self._locations[sensor] in subscriber.locations
+        )
+
+    def _detach(self, subscriber: BLELocationSubscriber) -> None:
+        """Drop one area and stop tracking sensors no other area uses."""
+        del self._subscribers[subscriber.area_id]
+        self._active.pop(subscriber.area_id, None)
+        for location in subscriber.locations:
+            area_ids = tuple(
+                area_id
+                for area_id in self._areas_by_location.get(location, ())
+                if area_id != subscriber.area_id
+            )
+            if area_ids:
+                self._areas_by_location[location] = area_ids
+            else:
+                self._areas_by_location.pop(location, None)
+        for sensor in set(subscriber.sensors):
+            self._sensor_refs[sensor] -= 1
+            if self._sensor_refs[sensor]:
+                continue
+            del self._sensor_refs[sensor]
+            del self._locations[sensor]
+            self._sensor_unsubscribers.pop(sensor)()
+
+    @callback
+    def _sensor_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Move one sensor between the areas its old and new values name."""
+        sensor = event.data["entity_id"]
+        location = ble_location(event.data["new_state"])
+        previous = self._locations.get(sensor)
+        if location == previous:
+            self.suppressed += 1
+            return
+        self._locations[sensor] = location
+        self.routed += 1
+
+        affected = {
+            *self._areas_by_location.get(previous or "", ()),
+            *self._areas_by_location.get(location or "", ()),
+        }
+        for area_id in affected:
+            subscriber = self._subscribers[area_id]
+            if sensor not in subscriber.sensors:
+                continue
+            active = self._active.get(area_id, frozenset())
+            updated = (
+                active | {sensor}
+                if location in subscriber.locations
+                else active - {sensor}
+            )
+            if updated == active:
+                continue
+            self._active[area_id] = updated
+            subscriber.on_change(self.active_sensors(area_id))
+
+
+BLE_LOCATION_ROUTER: HassKey[BLELocationRouter] = HassKey(
+    f"{DOMAIN}_ble_location_router"
+)
+
+
+def async_get_ble_location_router(hass: HomeAssistant) -> BLELocationRouter:
+    """Return the shared BLE location router for this Home Assistant instance."""
+    router = hass.data.get(BLE_LOCATION_ROUTER)
+    if router is None:
+        router = hass.data[BLE_LOCATION_ROUTER] = BLELocationRouter(hass=hass)
+    return router
+
+
+__all__ = [
+    "BLE_LOCATION_ROUTER",
+    "BLEActiveSensorsHandler",
+    "BLELocationRouter",
+    "BLELocationSubscriber",
+    "async_get_ble_location_router",
+    "ble_location",
+]
@@ -12,10 +12,12 @@ from custom_components.magic_areas.core.config.area import (
     normalize_custom_control_groups,
     presence_device_platforms,
     presence_sensor_device_classes,
+    reload_max_concurrency,
     reload_on_registry_change,
     secondary_states_calculation_mode,
     secondary_states_config,
     sleep_timeout_minutes,
+    verbose_control_diagnostics,
 )
 from custom_components.magic_areas.core.config.feature import (
     coerce_float,
@@ -43,9 +45,11 @@ __all__ = [
     "enum_string_list",
     "presence_device_platforms",
     "presence_sensor_device_classes",
+    "reload_max_concurrency",
     "reload_on_registry_change",
     "secondary_states_calculation_mode",
     "secondary_states_config",
     "sleep_timeout_minutes",
     "string_list",
+    "verbose_control_diagnostics",
 ]
@@ -16,19 +16,23 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_KEEP_ONLY_ENTITIES,
     CONF_PRESENCE_DEVICE_PLATFORMS,
     CONF_PRESENCE_SENSOR_DEVICE_CLASS,
+    CONF_RELOAD_MAX_CONCURRENCY,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
     CONF_SECONDARY_STATES,
     CONF_SECONDARY_STATES_CALCULATION_MODE,
     CONF_SLEEP_TIMEOUT,
     CONF_TYPE,
+    CONF_VERBOSE_CONTROL_DIAGNOSTICS,
 )
 from custom_components.magic_areas.defaults import (
     DEFAULT_EXTENDED_TIME,
     DEFAULT_EXTENDED_TIMEOUT,
     DEFAULT_PRESENCE_DEVICE_PLATFORMS,
+    DEFAULT_RELOAD_MAX_CONCURRENCY,
     DEFAULT_RELOAD_ON_REGISTRY_CHANGE,
     DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
     DEFAULT_SLEEP_TIMEOUT,
+    DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS,
 )
 from custom_components.magic_areas.core.controls import ControlGroupDefinition
 from custom_components.magic_areas.core.runtime_model import (
@@ -166,6 +170,20 @@ def reload_on_registry_change(config: ConfigMapping) -> bool:
     )
 
 
+def reload_max_concurrency(config: ConfigMapping) -> int:
+    """Return how many config entry reloads may run at once house-wide."""
+    value = config.get(CONF_RELOAD_MAX_CONCURRENCY)
+    if isinstance(value, bool) or not isinstance(value, int | float) or value < 1:
+        return DEFAULT_RELOAD_MAX_CONCURRENCY
+    return int(value)
+
+
+def verbose_control_diagnostics(config: ConfigMapping) -> bool:
+    """Return whether control switches log evaluations instead of attributes."""
+    value = config.get(CONF_VERBOSE_CONTROL_DIAGNOSTICS)
+    return value if isinstance(value, bool) else DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS
+
+
 def _string_tuple(value: object) -> tuple[str, ...]:
     """Return tuple[str, ...] from list-like values."""
     if not isinstance(value, list):
@@ -49,7 +49,12 @@ from custom_components.magic_areas.core.control_intents.adaptive_lighting_regist
     switch_sets_from_hass_registry,
 )
 from custom_components.magic_areas.core.control_intents.adaptive_lighting_executor import (
+    ADAPTIVE_LIGHTING_EXECUTOR,
+    ADAPTIVE_LIGHTING_MAX_CONCURRENT_CALLS,
+    AdaptiveLightingExecutor,
     async_execute_adaptive_lighting_intents,
+    async_get_adaptive_lighting_executor,
+    async_release_adaptive_lighting_executor,
 )
 from custom_components.magic_areas.core.control_intents.engine import (
     ConstraintEffect,
@@ -66,6 +71,12 @@ from custom_components.magic_areas.core.control_intents.models import (
     ControlTargetSource,
     RoleTarget,
 )
+from custom_components.magic_areas.core.control_intents.target_cache import (
+    ROLE_TARGET_CACHE,
+    RoleTargetCache,
+    async_get_role_target_cache,
+    async_release_role_target_cache,
+)
 from custom_components.magic_areas.core.control_intents.targets import (
     custom_control_label_name,
     resolve_custom_control_target,
@@ -76,6 +87,8 @@ __all__ = [
     "ADAPT_BRIGHTNESS_SWITCH",
     "ADAPT_COLOR_SWITCH",
     "ADAPTIVE_LIGHTING_DOMAIN",
+    "ADAPTIVE_LIGHTING_EXECUTOR",
+    "ADAPTIVE_LIGHTING_MAX_CONCURRENT_CALLS",
     "ATTR_LIGHTS",
     "MAIN_SWITCH",
     "MANAGED_ADAPTIVE_LIGHTING_AREA_ID",
@@ -88,6 +101,7 @@ __all__ = [
     "SERVICE_TURN_ON",
     "SLEEP_SWITCH",
     "AdaptiveLightingCoordinationReason",
+    "AdaptiveLightingExecutor",
     "AdaptiveLightingServiceIntent",
     "AdaptiveLightingSwitchCandidate",
     "AdaptiveLightingSwitchSet",
@@ -104,7 +118,9 @@ __all__ = [
     "IntentConstraint",
     "IntentDecision",
     "IntentReason",
+    "ROLE_TARGET_CACHE",
     "RoleTarget",
+    "RoleTargetCache",
     "adaptive_lighting_accent_adaptation_intents",
     "adaptive_lighting_apply_data",
     "adaptive_lighting_change_switch_settings_data",
@@ -122,6 +138,10 @@ __all__ = [
     "managed_adaptive_lighting_reconcile_plan",
     "managed_switch_set_from_hass_registry",
     "async_execute_adaptive_lighting_intents",
+    "async_get_adaptive_lighting_executor",
+    "async_release_adaptive_lighting_executor",
+    "async_get_role_target_cache",
+    "async_release_role_target_cache",
     "custom_control_label_name",
     "evaluate_intent",
     "resolve_custom_control_target",
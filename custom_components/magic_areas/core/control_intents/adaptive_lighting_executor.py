@@ -2,29 +2,128 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 
+from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
 
+from custom_components.magic_areas.const import DOMAIN
 from custom_components.magic_areas.core.control_intents.adaptive_lighting import (
     AdaptiveLightingServiceIntent,
 )
 
+ADAPTIVE_LIGHTING_MAX_CONCURRENT_CALLS = 4
+
+
+@dataclass(slots=True)
+class AdaptiveLightingExecutor:
+    """Run Adaptive Lighting intents concurrently, ordered per switch.
+
+    Intents are keyed by the switch they target (their ``entity_id``).
+    Intents for the same switch run one after another in submission order,
+    including across batches. Intents for different switches overlap, with
+    at most ``max_concurrency`` blocking calls in flight house-wide. Intents
+    without a single target switch are not ordered.
+    """
+
+    max_concurrency: int = ADAPTIVE_LIGHTING_MAX_CONCURRENT_CALLS
+    _switch_locks: dict[str, asyncio.Lock] = field(default_factory=dict)
+    _semaphore: asyncio.Semaphore | None = None
+
+    async def async_execute(
+        self,
+        hass: HomeAssistant,
+        intents: tuple[AdaptiveLightingServiceIntent, ...],
+    ) -> None:
+        """Execute one batch, overlapping intents for different switches."""
+        by_switch: dict[str | None, list[AdaptiveLightingServiceIntent]] = {}
+        for intent in intents:
+            by_switch.setdefault(_switch_key(intent), []).append(intent)
+        await asyncio.gather(
+            *(
+                self._async_execute_switch(hass, switch, switch_intents)
+                for switch, switch_intents in by_switch.items()
+            )
+        )
+
+    async def _async_execute_switch(
+        self,
+        hass: HomeAssistant,
+        switch: str | None,
+        intents: list[AdaptiveLightingServiceIntent],
+    ) -> None:
+        """Execute one switch's intents behind earlier intents for that switch."""
+        if switch is None:
+            for intent in intents:
+                await self._async_call(hass, intent)
+            return
+        lock = self._switch_locks.setdefault(switch, asyncio.Lock())
+        async with lock:
+            for intent in intents:
+                await self._async_call(hass, intent)
+
+    async def _async_call(
+        self, hass: HomeAssistant, intent: AdaptiveLightingServiceIntent
+    ) -> None:
+        """Make one blocking call within the house-wide concurrency bound."""
+        if not hass.services.has_service(intent.domain, intent.service):
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        async with self._semaphore:
+            await hass.services.async_call(
+                intent.domain,
+                intent.service,
+                intent.data,
+                blocking=True,
+            )
+
+
+ADAPTIVE_LIGHTING_EXECUTOR: HassKey[AdaptiveLightingExecutor] = HassKey(
+    f"{DOMAIN}_adaptive_lighting_executor"
+)
+
+
+def async_get_adaptive_lighting_executor(
+    hass: HomeAssistant,
+) -> AdaptiveLightingExecutor:
+    """Return the shared Adaptive Lighting executor."""
+    executor = hass.data.get(ADAPTIVE_LIGHTING_EXECUTOR)
+    if executor is None:
+        executor = hass.data[ADAPTIVE_LIGHTING_EXECUTOR] = AdaptiveLightingExecutor()
+    return executor
+
+
+def async_release_adaptive_lighting_executor(hass: HomeAssistant) -> None:
+    """Drop the shared Adaptive Lighting executor."""
+    hass.data.pop(ADAPTIVE_LIGHTING_EXECUTOR, None)
+
 
 async def async_execute_adaptive_lighting_intents(
     hass: HomeAssistant,
     intents: Iterable[AdaptiveLightingServiceIntent],
 ) -> None:
     """Execute Adaptive Lighting coordination intents through HA services."""
-    for intent in intents:
-        if not hass.services.has_service(intent.domain, intent.service):
-            continue
-        await hass.services.async_call(
-            intent.domain,
-            intent.service,
-            intent.data,
-            blocking=True,
-        )
+    batch = tuple(intents)
+    if not batch:
+        return
+    await async_get_adaptive_lighting_executor(hass).async_execute(hass, batch)
+
+
+def _switch_key(intent: AdaptiveLightingServiceIntent) -> str | None:
+    """Return the single switch an intent targets, if any."""
+    entity_id = intent.data.get(ATTR_ENTITY_ID)
+    return entity_id if isinstance(entity_id, str) else None
 
 
-__all__ = ["async_execute_adaptive_lighting_intents"]
+__all__ = [
+    "ADAPTIVE_LIGHTING_EXECUTOR",
+    "ADAPTIVE_LIGHTING_MAX_CONCURRENT_CALLS",
+    "AdaptiveLightingExecutor",
+    "async_execute_adaptive_lighting_intents",
+    "async_get_adaptive_lighting_executor",
+    "async_release_adaptive_lighting_executor",
+]
@@ -0,0 +1,251 @@
+"""Registry-invalidated cache of resolved control-intent role targets."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from time import monotonic
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.control_intents.models import (
+    ControlTargetSource,
+    RoleTarget,
+)
+from custom_components.magic_areas.core.control_intents.targets import (
+    resolve_role_target,
+)
+
+type RoleTargetSlot = tuple[str, str, str]
+type RoleTargetInputs = tuple[object, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRoleTarget:
+    """One resolved role target and the inputs it was resolved from."""
+
+    inputs: RoleTargetInputs
+    target: RoleTarget
+    resolved_at: float
+    entity_ids: frozenset[str] = frozenset()
+    helper_unique_id: str | None = None
+    uses_label: bool = False
+
+    def depends_on(self, entity_ids: Iterable[str], unique_id: str | None) -> bool:
+        """Return whether a registry change to these entities can alter it."""
+        if unique_id is not None and unique_id == self.helper_unique_id:
+            return True
+        return not self.entity_ids.isdisjoint(entity_ids)
+
+
+@dataclass(slots=True)
+class RoleTargetCache:
+    """Resolved role targets per (area, domain, role).
+
+    Resolution reads the entity and label registries only. An entity registry
+    update drops the slots that read the changed entity: its area members,
+    its resolved helper, or a helper matching the entity's unique ID. A label
+    registry update drops the label-based slots. A slot whose caller inputs
+    changed (area members, fallback members, label name) is re-resolved in
+    place.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    last_invalidated_at: float | None = None
+    _entries: dict[RoleTargetSlot, CachedRoleTarget] = field(default_factory=dict)
+    _unsubscribers: list[Callable[[], None]] = field(default_factory=list)
+
+    def resolve(
+        self,
+        hass: HomeAssistant,
+        *,
+        area_id: str,
+        domain: str,
+        role: str,
+        area_entity_ids: Iterable[str],
+        label_name: str | None = None,
+        allow_broad_label_target: bool = False,
+        helper_unique_id: str | None = None,
+        helper_entity_domain: str | None = None,
+        helper_config_entry_domain: str | None = None,
+        fallback_entity_ids: Iterable[str] = (),
+        fallback_source: ControlTargetSource = ControlTargetSource.GROUP_REGISTRY,
+        compatibility_entity_id: str | None = None,
+    ) -> RoleTarget:
+        """Return the cached target for a role, resolving it on a miss."""
+        area_entities = tuple(area_entity_ids)
+        fallback_entities = tuple(fallback_entity_ids)
+        slot: RoleTargetSlot = (area_id, domain, role)
+        inputs: RoleTargetInputs = (
+            area_entities,
+            label_name,
+            allow_broad_label_target,
+            helper_unique_id,
+            helper_entity_domain,
+            helper_config_entry_domain,
+            fallback_entities,
+            fallback_source,
+            compatibility_entity_id,
+        )
+        cached = self._entries.get(slot)
+        if cached is not None and cached.inputs == inputs:
+            self.hits += 1
+            return cached.target
+
+        self.misses += 1
+        target = resolve_role_target(
+            hass,
+            area_id=area_id,
+            domain=domain,
+            role=role,
+            area_entity_ids=area_entities,
+            label_name=label_name,
+            allow_broad_label_target=allow_broad_label_target,
+            helper_unique_id=helper_unique_id,
+            helper_entity_domain=helper_entity_domain,
+            helper_config_entry_domain=helper_config_entry_domain,
+            fallback_entity_ids=fallback_entities,
+            fallback_source=fallback_source,
+            compatibility_entity_id=compatibility_entity_id,
+        )
+        self._entries[slot] = CachedRoleTarget(
+            inputs=inputs,
+            target=target,
+            resolved_at=monotonic(),
+            entity_ids=frozenset(
+                (*area_entities, *target.target_entity_ids, *fallback_entities)
+            ),
+            helper_unique_id=helper_unique_id,
+            uses_label=label_name is not None,
+        )
+        return target
+
+    def invalidate(self) -> None:
+        """Drop every resolved target."""
+        self._entries.clear()
+        self._mark_invalidated()
+
+    def invalidate_entities(
+        self, entity_ids: Iterable[str], *, unique_id: str | None = None
+    ) -> int:
+        """Drop the slots that depend on any of these entities."""
+        changed = tuple(entity_ids)
+        return self._drop(
+            lambda entry: entry.depends_on(changed, unique_id),
+        )
+
+    def invalidate_labels(self) -> int:
+        """Drop the slots resolved through a label."""
+        return self._drop(lambda entry: entry.uses_label)
+
+    def _drop(self, predicate: Callable[[CachedRoleTarget], bool]) -> int:
+        """Drop matching slots and return how many were dropped."""
+        stale = [slot for slot, entry in self._entries.items() if predicate(entry)]
+        for slot in stale:
+            del self._entries[slot]
+        if stale:
+            self._mark_invalidated()
+        return len(stale)
+
+    def _mark_invalidated(self) -> None:
+        """Record one invalidation."""
+        self.invalidations += 1
+        self.last_invalidated_at = monotonic()
+
+    def diagnostics(self, now: float | None = None) -> dict[str, object]:
+        """Return cache size, hit counters, and entry staleness."""
+        now = monotonic() if now is None else now
+        oldest = min(
+            (entry.resolved_at for entry in self._entries.values()),
+            default=None,
+        )
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "oldest_entry_age_seconds": (
+                None if oldest is None else round(now - oldest, 3)
+            ),
+            "seconds_since_invalidation": (
+                None
+                if self.last_invalidated_at is None
+                else round(now - self.last_invalidated_at, 3)
+            ),
+        }
+
+    def async_listen(self, hass: HomeAssistant) -> None:
+        """Invalidate on entity and label registry updates."""
+        if self._unsubscribers:
+            return
+
+        def _entity_registry_updated(
+            event: Event[er.EventEntityRegistryUpdatedData],
+        ) -> None:
+            if not self._entries:
+                return
+            entity_id = event.data["entity_id"]
+            changed = [entity_id]
+            if event.data["action"] == "update" and "old_entity_id" in event.data:
+                changed.append(event.data["old_entity_id"])
+            entry = er.async_get(hass).async_get(entity_id)
+            self.invalidate_entities(
+                changed, unique_id=None if entry is None else entry.unique_id
+            )
+
+        @callback
+        def _label_registry_updated(_event: object) -> None:
+            self.invalidate_labels()
+
+        self._unsubscribers = [
+            hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, callback(_entity_registry_updated)
+            ),
+            hass.bus.async_listen(
+                lr.EVENT_LABEL_REGISTRY_UPDATED, _label_registry_updated
+            ),
+        ]
+
+    def async_unlisten(self) -> None:
+        """Stop listening for registry updates."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+
+    def __len__(self) -> int:
+        """Return the number of cached role targets."""
+        return len(self._entries)
+
+
+ROLE_TARGET_CACHE: HassKey[RoleTargetCache] = HassKey(f"{DOMAIN}_role_targets")
+
+
+def async_get_role_target_cache(hass: HomeAssistant) -> RoleTargetCache:
+    """Return the shared role-target cache, subscribing it on first use."""
+    cache = hass.data.get(ROLE_TARGET_CACHE)
+    if cache is None:
+        cache = hass.data[ROLE_TARGET_CACHE] = RoleTargetCache()
+        cache.async_listen(hass)
+    return cache
+
+
+def async_release_role_target_cache(hass: HomeAssistant) -> None:
+    """Unsubscribe and drop the shared role-target cache."""
+    cache = hass.data.pop(ROLE_TARGET_CACHE, None)
+    if cache is not None:
+        cache.async_unlisten()
+
+
+__all__ = [
+    "CachedRoleTarget",
+    "ROLE_TARGET_CACHE",
+    "RoleTargetCache",
+    "async_get_role_target_cache",
+    "async_release_role_target_cache",
+]
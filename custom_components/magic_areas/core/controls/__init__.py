@@ -1,5 +1,11 @@
 """Public API for shared control-group contracts, execution, and runtime helpers."""
 
+from custom_components.magic_areas.core.controls.command_context import (
+    CommandContextIndex,
+    CommandContextRecord,
+    async_get_command_context_index,
+    event_is_self_caused,
+)
 from custom_components.magic_areas.core.controls.control_group import (
     ControlAction,
     ControlActionType,
@@ -16,6 +22,17 @@ from custom_components.magic_areas.core.controls.control_group import (
     build_noop_decision,
     get_custom_control_group_templates,
 )
+from custom_components.magic_areas.core.controls.cover_commands import (
+    COVER_COMMAND_BATCHER,
+    CoverCommandBatcher,
+    async_get_cover_command_batcher,
+    async_release_cover_command_batcher,
+)
+from custom_components.magic_areas.core.controls.evaluation_log import (
+    CONTROL_EVALUATION_LOG,
+    ControlEvaluationLog,
+    async_get_control_evaluation_log,
+)
 from custom_components.magic_areas.core.controls.control_group_runtime import (
     read_area_presence_states,
     register_area_and_group_state_listeners,
@@ -43,22 +60,33 @@ from custom_components.magic_areas.core.controls.builders import (
 )
 
 __all__ = [
+    "CONTROL_EVALUATION_LOG",
+    "COVER_COMMAND_BATCHER",
     "CategorizedGroupSpec",
+    "CommandContextIndex",
+    "CommandContextRecord",
     "ControlAction",
     "ControlActionType",
     "ControlGroupContext",
     "ControlGroupDecision",
     "ControlGroupDefinition",
+    "ControlEvaluationLog",
     "ControlGroupPolicy",
     "ControlRuntimeEffect",
     "ControlRuntimeEffectType",
+    "CoverCommandBatcher",
     "GroupRegistry",
     "MonotonicDeadlineMap",
     "RegisteredControlGroup",
+    "async_get_command_context_index",
+    "async_get_control_evaluation_log",
+    "async_get_cover_command_batcher",
+    "async_release_cover_command_batcher",
     "build_noop_decision",
     "build_categorized_group_entities",
     "build_control_switch_entities",
     "evaluate_and_execute_control_group_policy",
+    "event_is_self_caused",
     "evaluate_and_execute_control_group_policy_sync",
     "execute_control_group_decision",
     "execute_control_group_runtime_effects",
@@ -0,0 +1,196 @@
+"""Integration-wide index of service-call contexts issued by Magic Areas."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from time import monotonic
+
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+
+COMMAND_CONTEXT_MAX_ENTRIES = 512
+COMMAND_CONTEXT_TTL_SECONDS = 120.0
+
+
+@dataclass(frozen=True, slots=True)
+class CommandContextRecord:
+    """Origin of one Magic Areas service call."""
+
+    area_id: str
+    controller: str
+    action: str
+    expires_at: float
+    shared_controllers: frozenset[str] = frozenset()
+
+
+@dataclass(slots=True)
+class CommandContextIndex:
+    """Bounded, expiring map of context_id to the command that created it."""
+
+    max_entries: int = COMMAND_CONTEXT_MAX_ENTRIES
+    ttl_seconds: float = COMMAND_CONTEXT_TTL_SECONDS
+    _records: OrderedDict[str, CommandContextRecord] = field(
+        default_factory=OrderedDict
+    )
+
+    def issue(
+        self,
+        *,
+        area_id: str,
+        controller: str,
+        action: str,
+        now: float | None = None,
+    ) -> Context:
+        """Create a fresh context and record it as Magic Areas-owned."""
+        context = Context()
+        self.register(
+            context,
+            area_id=area_id,
+            controller=controller,
+            action=action,
+            now=now,
+        )
+        return context
+
+    def register(
+        self,
+        context: Context,
+        *,
+        area_id: str,
+        controller: str,
+        action: str,
+        now: float | None = None,
+    ) -> CommandContextRecord:
+        """Record an existing context, evicting expired and oldest entries."""
+        now = monotonic() if now is None else now
+        self._drop_expired(now)
+        record = CommandContextRecord(
+            area_id=area_id,
+            controller=controller,
+            action=action,
+            expires_at=now + self.ttl_seconds,
+        )
+        self._records[context.id] = record
+        self._records.move_to_end(context.id)
+        while len(self._records) > max(1, self.max_entries):
+            self._records.popitem(last=False)
+        return record
+
+    def share(
+        self, context: Context, source: Context, now: float | None = None
+    ) -> bool:
+        """Let a live context also stand for the controller that issued ``source``.
+
+        Used when one service call carries commands from several controllers.
+        """
+        now = monotonic() if now is None else now
+        record = self._records.get(context.id)
+        source_record = self._records.get(source.id)
+        if (
+            record is None
+            or source_record is None
+            or now >= record.expires_at
+            or now >= source_record.expires_at
+        ):
+            return False
+        if source_record.controller != record.controller:
+            self._records[context.id] = replace(
+                record,
+                shared_controllers=record.shared_controllers
+                | {source_record.controller},
+            )
+        return True
+
+    def lookup(
+        self, context: Context | None, now: float | None = None
+    ) -> CommandContextRecord | None:
+        """Return the command record for a context or its parent, if still live."""
+        if context is None:
+            return None
+        now = monotonic() if now is None else now
+        for context_id in (context.id, context.parent_id):
+            if context_id is None:
+                continue
+            record = self._records.get(context_id)
+            if record is None:
+                continue
+            if now >= record.expires_at:
+                self._records.pop(context_id, None)
+                continue
+            return record
+        return None
+
+    def is_self_caused(
+        self,
+        context: Context | None,
+        *,
+        controller: str | None = None,
+        now: float | None = None,
+    ) -> bool:
+        """Return whether a state event context came from a Magic Areas command."""
+        record = self.lookup(context, now)
+        if record is None:
+            return False
+        return (
+            controller is None
+            or record.controller == controller
+            or controller in record.shared_controllers
+        )
+
+    def _drop_expired(self, now: float) -> None:
+        """Drop expired records from the oldest end of the index."""
+        while self._records:
+            oldest = next(iter(self._records.values()))
+            if now < oldest.expires_at:
+                return
+            self._records.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of stored (possibly expired) records."""
+        return len(self._records)
+
+
+COMMAND_CONTEXT_INDEX: HassKey[CommandContextIndex] = HassKey(
+    f"{DOMAIN}_command_contexts"
+)
+
+
+def async_get_command_context_index(hass: HomeAssistant) -> CommandContextIndex:
+    """Return the shared command-context index for this Home Assistant instance."""
+    index = hass.data.get(COMMAND_CONTEXT_INDEX)
+    if index is None:
+        index = hass.data[COMMAND_CONTEXT_INDEX] = CommandContextIndex()
+    return index
+
+
+def event_is_self_caused(
+    hass: HomeAssistant,
+    event: object,
+    *,
+    controller: str | None = None,
+) -> bool:
+    """Return whether a state event carries a context issued by Magic Areas."""
+    context = getattr(event, "context", None)
+    if not isinstance(context, Context):
+        return False
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return False
+    index = data.get(COMMAND_CONTEXT_INDEX)
+    if not isinstance(index, CommandContextIndex):
+        return False
+    return index.is_self_caused(context, controller=controller)
+
+
+__all__ = [
+    "COMMAND_CONTEXT_INDEX",
+    "COMMAND_CONTEXT_MAX_ENTRIES",
+    "COMMAND_CONTEXT_TTL_SECONDS",
+    "CommandContextIndex",
+    "CommandContextRecord",
+    "async_get_command_context_index",
+    "event_is_self_caused",
+]
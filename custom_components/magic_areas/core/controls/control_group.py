@@ -10,7 +10,7 @@ from inspect import isawaitable
 import logging
 from typing import Protocol
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, HomeAssistant
 
 from custom_components.magic_areas.core.runtime_model import ControlGroupPolicyId
 
@@ -197,6 +197,7 @@ async def execute_control_group_decision(
     *,
     blocking: bool = False,
     on_runtime_effect: Callable[[ControlRuntimeEffect], None] | None = None,
+    context: Context | None = None,
 ) -> None:
     """Execute runtime effects and service actions in a control-group decision."""
     execute_control_group_runtime_effects(
@@ -221,4 +222,5 @@ async def execute_control_group_decision(
                 **action.service_data,
             },
             blocking=blocking,
+            context=context,
         )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from enum import Enum
 from typing import Protocol
 
@@ -24,7 +24,7 @@ from custom_components.magic_areas.core.runtime_model import (
     build_presence_tracking_unique_id,
 )
 from custom_components.magic_areas.core.managed_surface_registry import (
-    resolve_managed_surface_entity_id,
+    resolve_managed_surface_entity_ids,
 )
 from custom_components.magic_areas.enums import MagicAreasEvents
 
@@ -67,6 +67,45 @@ def _metadata_matches(
     return True
 
 
+def _resolve_registered_group_entity_ids(
+    hass: HomeAssistant,
+    entity_registry: entity_registry_module.EntityRegistry,
+    *,
+    domain: str,
+    group_ids: Iterable[str],
+) -> dict[str, str]:
+    """Resolve custom Magic Areas groups or their native HA group-helper replacements.
+
+    Registry lookups by unique ID come first; groups still unresolved share
+    one pass over the managed group-helper config entries.
+    """
+    resolved: dict[str, str] = {}
+    pending: list[str] = []
+    for group_id in group_ids:
+        entity_id = entity_registry.async_get_entity_id(
+            domain, DOMAIN, group_id
+        ) or entity_registry.async_get_entity_id(
+            domain,
+            NATIVE_GROUP_HELPER_PLATFORM,
+            group_id,
+        )
+        if entity_id:
+            resolved[group_id] = entity_id
+        else:
+            pending.append(group_id)
+    if pending:
+        managed = resolve_managed_surface_entity_ids(
+            hass,
+            entity_registry,
+            [(group_id, domain) for group_id in pending],
+            config_entry_domain=NATIVE_GROUP_HELPER_PLATFORM,
+        )
+        for group_id in pending:
+            if (entity_id := managed.get((group_id, domain))) is not None:
+                resolved[group_id] = entity_id
+    return resolved
+
+
 def _resolve_registered_group_entity_id(
     hass: HomeAssistant,
     entity_registry: entity_registry_module.EntityRegistry,
@@ -75,23 +114,12 @@ def _resolve_registered_group_entity_id(
     group_id: str,
 ) -> str | None:
     """Resolve a custom Magic Areas group or its native HA group-helper replacement."""
-    entity_id = entity_registry.async_get_entity_id(domain, DOMAIN, group_id)
-    if entity_id:
-        return entity_id
-    entity_id = entity_registry.async_get_entity_id(
-        domain,
-        NATIVE_GROUP_HELPER_PLATFORM,
-        group_id,
-    )
-    if entity_id:
-        return entity_id
-    return resolve_managed_surface_entity_id(
+    return _resolve_registered_group_entity_ids(
         hass,
         entity_registry,
-        unique_id=group_id,
-        entity_domain=domain,
-        config_entry_domain=NATIVE_GROUP_HELPER_PLATFORM,
-    )
+        domain=domain,
+        group_ids=(group_id,),
+    ).get(group_id)
 
 
 def resolve_group_entity_id(
@@ -147,9 +175,7 @@ def resolve_group_entity_ids_by_metadata(
     metadata_filters: Mapping[str, str] | None = None,
 ) -> dict[str, str]:
     """Resolve entity IDs keyed by a group metadata value."""
-    entity_registry = er.async_get(hass)
-    resolved: dict[str, str] = {}
-
+    group_ids_by_value: dict[str, str] = {}
     for entry in group_registry.get_for_area_policy(area_id, policy_id):
         metadata_value = entry.definition.metadata.get(metadata_key)
         if not isinstance(metadata_value, str) or not _metadata_matches(
@@ -159,16 +185,19 @@ def resolve_group_entity_ids_by_metadata(
             metadata_filters=metadata_filters,
         ):
             continue
-        entity_id = _resolve_registered_group_entity_id(
-            hass,
-            entity_registry,
-            domain=domain,
-            group_id=entry.definition.group_id,
-        )
-        if entity_id:
-            resolved[metadata_value] = entity_id
+        group_ids_by_value[metadata_value] = entry.definition.group_id
 
-    return resolved
+    entity_ids = _resolve_registered_group_entity_ids(
+        hass,
+        er.async_get(hass),
+        domain=domain,
+        group_ids=group_ids_by_value.values(),
+    )
+    return {
+        metadata_value: entity_ids[group_id]
+        for metadata_value, group_id in group_ids_by_value.items()
+        if group_id in entity_ids
+    }
 
 
 def resolve_group_entity_ids_for_metadata_values(
@@ -0,0 +1,339 @@
+"""House-level batching and staggering of cover automation commands."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from homeassistant.components.cover import ATTR_CURRENT_POSITION, ATTR_POSITION
+from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_CLOSE_COVER,
+    SERVICE_OPEN_COVER,
+    SERVICE_SET_COVER_POSITION,
+    STATE_CLOSED,
+    STATE_OPEN,
+)
+from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
+import voluptuous as vol
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.controls.command_context import (
+    async_get_command_context_index,
+)
+from custom_components.magic_areas.core.controls.control_group import ControlAction
+
+_LOGGER = logging.getLogger(__name__)
+
+COVER_COMMAND_BATCH_WINDOW_SECONDS = 0.1
+
+_EXPECTED_COVER_COMMAND_ERRORS = (
+    HomeAssistantError,
+    KeyError,
+    TypeError,
+    ValueError,
+    AttributeError,
+    RuntimeError,
+    vol.Invalid,
+)
+
+# Position each service drives a cover to, used to order batches and to skip
+# covers that are already there when the batch is sent.
+_SERVICE_TARGET_POSITION: dict[str, int] = {
+    SERVICE_CLOSE_COVER: 0,
+    SERVICE_OPEN_COVER: 100,
+}
+_SERVICE_TARGET_STATE: dict[str, str] = {
+    SERVICE_CLOSE_COVER: STATE_CLOSED,
+    SERVICE_OPEN_COVER: STATE_OPEN,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CoverCommandKey:
+    """Service and data shared by every cover in one batched call."""
+
+    service: str
+    service_data: tuple[tuple[str, object], ...] = ()
+
+    @classmethod
+    def from_action(cls, action: ControlAction) -> CoverCommandKey:
+        """Build the batching key for a cover control action."""
+        return cls(
+            service=action.service,
+            service_data=tuple(sorted(action.service_data.items())),
+        )
+
+    @property
+    def target_position(self) -> int | None:
+        """Return the position this command drives covers to, if known."""
+        position = dict(self.service_data).get(ATTR_POSITION)
+        if self.service == SERVICE_SET_COVER_POSITION and isinstance(position, int):
+            return position
+        return _SERVICE_TARGET_POSITION.get(self.service)
+
+
+@dataclass(slots=True)
+class PendingCoverBatch:
+    """Covers collected for one key during the current batching window."""
+
+    entity_ids: dict[str, None] = field(default_factory=dict)
+    contexts: dict[str, Context] = field(default_factory=dict)
+    stagger_seconds: dict[str | None, float] = field(default_factory=dict)
+    skip_handlers: list[Callable[[str], None]] = field(default_factory=list)
+    waiters: list[tuple[asyncio.Future[None], bool]] = field(default_factory=list)
+    blocking: bool = False
+
+    def resolve(self, err: BaseException | None = None) -> None:
+        """Release submitters; only blocking ones see a failed call."""
+        for waiter, blocking in self.waiters:
+            if waiter.done():
+                continue
+            if err is not None and blocking:
+                waiter.set_exception(err)
+            else:
+                waiter.set_result(None)
+
+    def cancel(self) -> None:
+        """Cancel submitters still waiting on this batch."""
+        for waiter, _blocking in self.waiters:
+            waiter.cancel()
+
+
+@dataclass(slots=True)
+class CoverCommandBatcher:
+    """Coalesce cover commands from all areas into one call per target.
+
+    Cover switches submit their actions instead of calling services. Actions
+    that arrive within ``window_seconds`` are merged per service and service
+    data. Each merged group is sent as one multi-entity call, blocking only if
+    a submitter asked to. The call carries the first submitter's context, and
+    that context is shared with every other contributing controller so each
+    one recognizes the resulting state changes as its own. Groups are sent in
+    target-position order. Covers already at the target, or in a failed call,
+    are reported to the submitters' skip handlers. A failed call is logged and
+    does not stop later groups. An area's command stagger pauses between the
+    groups that area contributes to.
+    """
+
+    hass: HomeAssistant
+    window_seconds: float = COVER_COMMAND_BATCH_WINDOW_SECONDS
+    submitted: int = 0
+    calls: int = 0
+    failed: int = 0
+    skipped_at_target: int = 0
+    _pending: dict[CoverCommandKey, PendingCoverBatch] = field(default_factory=dict)
+    _flush_task: asyncio.Task[None] | None = None
+
+    def submit(
+        self,
+        action: ControlAction,
+        *,
+        area_id: str | None = None,
+        context: Context | None = None,
+        stagger_seconds: float = 0.0,
+        on_skipped: Callable[[str], None] | None = None,
+        blocking: bool = False,
+    ) -> asyncio.Future[None]:
+        """Queue one cover action for the next batched flush.
+
+        The returned future resolves once the action's batch has been sent.
+        It carries the call's error only when ``blocking`` is set.
+        """
+        self.submitted += 1
+        key = CoverCommandKey.from_action(action)
+        if (batch := self._pending.get(key)) is None:
+            batch = self._pending[key] = PendingCoverBatch()
+        batch.entity_ids.update(dict.fromkeys(action.target_entity_ids))
+        if context is not None:
+            batch.contexts.setdefault(context.id, context)
+        batch.stagger_seconds[area_id] = max(
+            batch.stagger_seconds.get(area_id, 0.0), stagger_seconds
+        )
+        if on_skipped is not None:
+            batch.skip_handlers.append(on_skipped)
+        batch.blocking = batch.blocking or blocking
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        batch.waiters.append((waiter, blocking))
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(
+                self._async_flush(), f"{DOMAIN} cover command flush"
+            )
+        return waiter
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending flush and release anyone waiting on it."""
+        pending, self._pending = self._pending, {}
+        for batch in pending.values():
+            batch.cancel()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def _async_flush(self) -> None:
+        """Send every pending batch after the collection window closes."""
+        await asyncio.sleep(self.window_seconds)
+        pending, self._pending = self._pending, {}
+        batches = sorted(pending.items(), key=_batch_order)
+        sent_areas: set[str | None] = set()
+        try:
+            for key, batch in batches:
+                await self._async_send(key, batch, sent_areas)
+        finally:
+            for _key, batch in batches:
+                batch.cancel()
+            self._flush_task = None
+            if self._pending:
+                self._flush_task = self.hass.async_create_task(
+                    self._async_flush(), f"{DOMAIN} cover command flush"
+                )
+
+    async def _async_send(
+        self,
+        key: CoverCommandKey,
+        batch: PendingCoverBatch,
+        sent_areas: set[str | None],
+    ) -> None:
+        """Send one batch, pausing first for areas that already sent one."""
+        targets: list[str] = []
+        for entity_id in batch.entity_ids:
+            if not self._at_target(entity_id, key):
+                targets.append(entity_id)
+                continue
+            self.skipped_at_target += 1
+            _report_skipped(batch, entity_id)
+        if not targets:
+            batch.resolve()
+            return
+
+        stagger_seconds = max(
+            (
+                seconds
+                for area_id, seconds in batch.stagger_seconds.items()
+                if area_id in sent_areas
+            ),
+            default=0.0,
+        )
+        if stagger_seconds > 0:
+            await asyncio.sleep(stagger_seconds)
+        try:
+            await self.hass.services.async_call(
+                COVER_DOMAIN,
+                key.service,
+                {ATTR_ENTITY_ID: targets, **dict(key.service_data)},
+                blocking=batch.blocking,
+                context=self._call_context(batch),
+            )
+        except _EXPECTED_COVER_COMMAND_ERRORS as err:
+            self.failed += 1
+            _LOGGER.warning(
+                "Cover command %s for %s failed: %s", key.service, targets, err
+            )
+            for entity_id in targets:
+                _report_skipped(batch, entity_id)
+            batch.resolve(err)
+            return
+        self.calls += 1
+        sent_areas.update(batch.stagger_seconds)
+        batch.resolve()
+
+    def _call_context(self, batch: PendingCoverBatch) -> Context | None:
+        """Return the first submitter's context, shared with the other submitters."""
+        contexts = iter(batch.contexts.values())
+        context = next(contexts, None)
+        if context is None:
+            return None
+        index = async_get_command_context_index(self.hass)
+        for other in contexts:
+            index.share(context, other)
+        return context
+
+    def _at_target(
+        self,
+        entity_id: str,
+        key: CoverCommandKey,
+        *,
+        _seen: frozenset[str] = frozenset(),
+    ) -> bool:
+        """Return whether a cover already rests where the command would move it.
+
+        Cover groups report ``open`` while any member is open and drop the
+        position when members lack one, so a group is at target only when
+        every member is.
+        """
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return False
+        members = state.attributes.get(ATTR_ENTITY_ID)
+        if isinstance(members, list) and members:
+            seen = _seen | {entity_id}
+            return all(
+                member not in seen and self._at_target(member, key, _seen=seen)
+                for member in members
+            )
+        position = key.target_position
+        current = state.attributes.get(ATTR_CURRENT_POSITION)
+        if position is not None and isinstance(current, int):
+            return current == position
+        return state.state == _SERVICE_TARGET_STATE.get(key.service)
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return batching counters."""
+        return {
+            "submitted": self.submitted,
+            "calls": self.calls,
+            "failed": self.failed,
+            "skipped_at_target": self.skipped_at_target,
+            "pending": sum(len(batch.entity_ids) for batch in self._pending.values()),
+        }
+
+
+def _report_skipped(batch: PendingCoverBatch, entity_id: str) -> None:
+    """Tell every submitter of a batch that one of its covers will not move."""
+    for handler in batch.skip_handlers:
+        handler(entity_id)
+
+
+def _batch_order(item: tuple[CoverCommandKey, PendingCoverBatch]) -> tuple[int, str]:
+    """Order batches by target position, lowest first, then by service."""
+    key = item[0]
+    position = key.target_position
+    return (-1 if position is None else position, key.service)
+
+
+COVER_COMMAND_BATCHER: HassKey[CoverCommandBatcher] = HassKey(
+    f"{DOMAIN}_cover_command_batcher"
+)
+
+
+def async_get_cover_command_batcher(hass: HomeAssistant) -> CoverCommandBatcher:
+    """Return the shared cover command batcher for this Home Assistant instance."""
+    batcher = hass.data.get(COVER_COMMAND_BATCHER)
+    if batcher is None:
+        batcher = hass.data[COVER_COMMAND_BATCHER] = CoverCommandBatcher(hass=hass)
+    return batcher
+
+
+@callback
+def async_release_cover_command_batcher(hass: HomeAssistant) -> None:
+    """Cancel and drop the shared cover command batcher."""
+    batcher = hass.data.pop(COVER_COMMAND_BATCHER, None)
+    if batcher is not None:
+        batcher.async_cancel()
+
+
+__all__ = [
+    "COVER_COMMAND_BATCHER",
+    "COVER_COMMAND_BATCH_WINDOW_SECONDS",
+    "CoverCommandBatcher",
+    "CoverCommandKey",
+    "PendingCoverBatch",
+    "async_get_cover_command_batcher",
+    "async_release_cover_command_batcher",
+]
@@ -0,0 +1,92 @@
+"""Integration-wide record of control switch evaluation publishing."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from time import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.const import DOMAIN
+
+CONTROL_EVALUATION_LOG_MAX_ENTRIES = 50
+
+
+@dataclass(slots=True)
+class AreaEvaluationRecord:
+    """Publishing counters and recent verbose evaluations for one area."""
+
+    published: int = 0
+    unchanged: int = 0
+    logged: int = 0
+    recent: deque[dict[str, object]] = field(default_factory=deque)
+
+
+@dataclass(slots=True)
+class ControlEvaluationLog:
+    """Count debug-attribute publishes and keep verbose evaluations in memory.
+
+    Control switches publish evaluation details as state attributes only when
+    they differ from the last published details. Areas with verbose control
+    diagnostics enabled log every evaluation here instead, in a bounded ring
+    buffer per area, and keep the details off their entities.
+    """
+
+    max_entries: int = CONTROL_EVALUATION_LOG_MAX_ENTRIES
+    _areas: dict[str, AreaEvaluationRecord] = field(default_factory=dict)
+
+    def published(self, area_id: str) -> None:
+        """Count a debug-attribute publish."""
+        self._area(area_id).published += 1
+
+    def unchanged(self, area_id: str) -> None:
+        """Count an evaluation whose details matched the published ones."""
+        self._area(area_id).unchanged += 1
+
+    def log(self, area_id: str, controller: str, details: dict[str, object]) -> None:
+        """Append one evaluation to the area's ring buffer."""
+        record = self._area(area_id)
+        record.logged += 1
+        record.recent.append(
+            {"at": time(), "controller": controller, "details": dict(details)}
+        )
+
+    def diagnostics(self, area_id: str) -> dict[str, object]:
+        """Return publishing counters and recent evaluations for one area."""
+        record = self._areas.get(area_id) or AreaEvaluationRecord()
+        return {
+            "published": record.published,
+            "unchanged": record.unchanged,
+            "logged": record.logged,
+            "recent": list(record.recent),
+        }
+
+    def _area(self, area_id: str) -> AreaEvaluationRecord:
+        if (record := self._areas.get(area_id)) is None:
+            record = self._areas[area_id] = AreaEvaluationRecord(
+                recent=deque(maxlen=max(1, self.max_entries))
+            )
+        return record
+
+
+CONTROL_EVALUATION_LOG: HassKey[ControlEvaluationLog] = HassKey(
+    f"{DOMAIN}_control_evaluation_log"
+)
+
+
+def async_get_control_evaluation_log(hass: HomeAssistant) -> ControlEvaluationLog:
+    """Return the shared control evaluation log for this Home Assistant instance."""
+    log = hass.data.get(CONTROL_EVALUATION_LOG)
+    if log is None:
+        log = hass.data[CONTROL_EVALUATION_LOG] = ControlEvaluationLog()
+    return log
+
+
+__all__ = [
+    "CONTROL_EVALUATION_LOG",
+    "CONTROL_EVALUATION_LOG_MAX_ENTRIES",
+    "ControlEvaluationLog",
+    "async_get_control_evaluation_log",
+]
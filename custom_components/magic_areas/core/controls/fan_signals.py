@@ -1,7 +1,10 @@
-"""Managed signal-helper planning for fan controller roles."""
+"""Trend signal planning and in-process trend estimation for fan controllers."""
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass, field
+
 from homeassistant.components.trend.const import DOMAIN as TREND_DOMAIN
 
 from custom_components.magic_areas.core.controls.policies.fan import (
@@ -12,6 +15,11 @@ from custom_components.magic_areas.core.runtime_model import SignalHelperSurface
 from custom_components.magic_areas.core.runtime_model import trend_signal_surface
 
 FAN_CONTROLLER_TREND_SIGNAL_ROLE_PREFIX = "fan_controller"
+FAN_CONTROLLER_TREND_MAX_SAMPLES = 4
+FAN_CONTROLLER_TREND_MIN_SAMPLES = 2
+# Sample times are kept relative to a recent origin so the running sums of
+# squared times stay small enough not to lose precision.
+_STREAMING_TREND_REBASE_SECONDS = 3600.0
 
 
 def fan_controller_trend_signal_role(controller_id: str) -> str:
@@ -19,6 +27,72 @@ def fan_controller_trend_signal_role(controller_id: str) -> str:
     return f"{FAN_CONTROLLER_TREND_SIGNAL_ROLE_PREFIX}_{controller_id}"
 
 
+@dataclass(slots=True)
+class StreamingTrend:
+    """Least-squares slope over the last samples of one sensor.
+
+    Mirrors the managed Trend helper settings (same sample window, zero
+    minimum gradient) without a helper entity. Running sums are updated as
+    samples enter and leave the window, so each sample costs O(1).
+    """
+
+    max_samples: int = FAN_CONTROLLER_TREND_MAX_SAMPLES
+    min_samples: int = FAN_CONTROLLER_TREND_MIN_SAMPLES
+    _samples: deque[tuple[float, float]] = field(default_factory=deque)
+    _origin: float | None = None
+    _sum_t: float = 0.0
+    _sum_v: float = 0.0
+    _sum_tt: float = 0.0
+    _sum_tv: float = 0.0
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add one sample, dropping the oldest once the window is full."""
+        if self._origin is None:
+            self._origin = timestamp
+        t = timestamp - self._origin
+        if t > _STREAMING_TREND_REBASE_SECONDS and self._samples:
+            t -= self._rebase()
+        self._samples.append((t, value))
+        self._accumulate(t, value, 1.0)
+        if len(self._samples) > self.max_samples:
+            old_t, old_value = self._samples.popleft()
+            self._accumulate(old_t, old_value, -1.0)
+
+    @property
+    def gradient(self) -> float | None:
+        """Return the window's slope, or None with too few distinct samples."""
+        count = len(self._samples)
+        if count < self.min_samples:
+            return None
+        denominator = count * self._sum_tt - self._sum_t**2
+        if denominator <= 0:
+            return None
+        return (count * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    @property
+    def rising(self) -> bool | None:
+        """Return whether the window trends upward, like the Trend helper."""
+        gradient = self.gradient
+        return None if gradient is None else gradient > 0.0
+
+    def _rebase(self) -> float:
+        """Move the origin to the oldest sample and rebuild the sums."""
+        shift = self._samples[0][0]
+        assert self._origin is not None
+        self._origin += shift
+        self._samples = deque((t - shift, value) for t, value in self._samples)
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        for t, value in self._samples:
+            self._accumulate(t, value, 1.0)
+        return shift
+
+    def _accumulate(self, t: float, value: float, sign: float) -> None:
+        self._sum_t += sign * t
+        self._sum_v += sign * value
+        self._sum_tt += sign * t * t
+        self._sum_tv += sign * t * value
+
+
 def fan_controller_trend_signal_surface(
     *,
     entry_id: str,
@@ -42,15 +116,18 @@ def fan_controller_trend_signal_surface(
         source_entity_id=controller.sensor_entity_id,
         min_gradient=0.0,
         sample_duration=0,
-        max_samples=4,
-        min_samples=2,
+        max_samples=FAN_CONTROLLER_TREND_MAX_SAMPLES,
+        min_samples=FAN_CONTROLLER_TREND_MIN_SAMPLES,
         device_identifier=device_identifier,
         device_name=device_name,
     )
 
 
 __all__ = [
+    "FAN_CONTROLLER_TREND_MAX_SAMPLES",
+    "FAN_CONTROLLER_TREND_MIN_SAMPLES",
     "FAN_CONTROLLER_TREND_SIGNAL_ROLE_PREFIX",
+    "StreamingTrend",
     "TREND_DOMAIN",
     "fan_controller_trend_signal_role",
     "fan_controller_trend_signal_surface",
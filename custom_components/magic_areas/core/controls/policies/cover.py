@@ -73,6 +73,7 @@ class CoverGroupsConfig:
     automation_device_classes: tuple[str, ...]
     manual_hold_seconds: int
     presets: tuple[CoverPresetConfig, ...]
+    command_stagger_seconds: float = 0.0
 
 
 @dataclass(frozen=True, slots=True)
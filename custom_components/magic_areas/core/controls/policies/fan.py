@@ -47,10 +47,12 @@ __all__ = [
     "FanDetectionMode",
     "FanSensorUnavailableBehavior",
     "FanPolicySignals",
+    "FanValueBand",
     "build_fan_control_group_policy",
     "build_fan_policy",
     "evaluate_fan_controllers",
     "fan_controller_evaluation_to_control_group",
+    "fan_controller_value_band",
     "fan_decision_to_control_group",
     "legacy_cooling_controller",
 ]
@@ -126,8 +128,17 @@ class FanDetectionMode(StrEnum):
 
     THRESHOLD = "threshold"
     THRESHOLD_TREND = "threshold_trend"
+    THRESHOLD_STREAMING_TREND = "threshold_streaming_trend"
     ROOM_STATE = "room_state"
 
+    @property
+    def uses_trend(self) -> bool:
+        """Return whether a rising trend can activate inside hysteresis."""
+        return self in {
+            FanDetectionMode.THRESHOLD_TREND,
+            FanDetectionMode.THRESHOLD_STREAMING_TREND,
+        }
+
 
 class FanClearBehavior(StrEnum):
     """How a controller reason responds when occupancy/state gating clears."""
@@ -145,6 +156,15 @@ class FanSensorUnavailableBehavior(StrEnum):
     HOLD_UNTIL_RESTORED = "hold_until_restored"
 
 
+class FanValueBand(StrEnum):
+    """Sensor value ranges inside which a threshold reason cannot change."""
+
+    UNAVAILABLE = "unavailable"
+    BELOW_CLEAR = "below_clear"
+    HYSTERESIS = "hysteresis"
+    AT_OR_ABOVE_ON = "at_or_above_on"
+
+
 @dataclass(frozen=True, slots=True)
 class FanControllerConfig:
     """Normalized config for one reason a fan may need to run."""
@@ -288,6 +308,24 @@ def legacy_cooling_controller(
     )
 
 
+def fan_controller_value_band(
+    controller: FanControllerConfig, sensor_value: float | None
+) -> FanValueBand:
+    """Return the band of a sensor value relative to a controller's thresholds.
+
+    ``_evaluate_fan_controller`` only compares the sensor value against
+    ``on_threshold`` and ``off_threshold``, so with every other input fixed
+    two values in the same band produce the same reason.
+    """
+    if sensor_value is None:
+        return FanValueBand.UNAVAILABLE
+    if sensor_value >= controller.on_threshold:
+        return FanValueBand.AT_OR_ABOVE_ON
+    if sensor_value >= controller.off_threshold:
+        return FanValueBand.HYSTERESIS
+    return FanValueBand.BELOW_CLEAR
+
+
 def evaluate_fan_controllers(
     controllers: Sequence[FanControllerConfig],
     *,
@@ -443,7 +481,7 @@ def _evaluate_fan_controller(
         )
 
     if (
-        controller.detection_mode is FanDetectionMode.THRESHOLD_TREND
+        controller.detection_mode.uses_trend
         and trend_states.get(controller.controller_id) is True
         and sensor_value >= controller.off_threshold
     ):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
@@ -65,28 +65,56 @@ def iter_managed_surface_entity_entries(
             yield registry_entry
 
 
-def resolve_managed_surface_entity_id(
+def resolve_managed_surface_entity_ids(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
+    requests: Iterable[tuple[str, str]],
     *,
-    unique_id: str,
-    entity_domain: str,
     config_entry_domain: str | None = None,
-) -> str | None:
-    """Resolve the entity ID for a managed surface by config-entry ownership ID."""
+) -> dict[tuple[str, str], str]:
+    """Resolve many ``(unique_id, entity_domain)`` managed surfaces in one pass.
+
+    Config entries are scanned once for all requests instead of once per
+    request. Unresolved requests are absent from the result.
+    """
+    wanted: dict[str, set[str]] = {}
+    for unique_id, entity_domain in requests:
+        wanted.setdefault(unique_id, set()).add(entity_domain)
+    resolved: dict[tuple[str, str], str] = {}
+    if not wanted:
+        return resolved
     for entry in iter_managed_surface_config_entries(
         hass,
         domain=config_entry_domain,
     ):
-        if entry.unique_id != unique_id:
+        if entry.unique_id is None or entry.unique_id not in wanted:
             continue
+        entity_domains = wanted[entry.unique_id]
         for registry_entry in er.async_entries_for_config_entry(
             entity_registry,
             entry.entry_id,
         ):
-            if registry_entry.domain == entity_domain:
-                return registry_entry.entity_id
-    return None
+            key = (entry.unique_id, registry_entry.domain)
+            if registry_entry.domain in entity_domains and key not in resolved:
+                resolved[key] = registry_entry.entity_id
+    return resolved
+
+
+def resolve_managed_surface_entity_id(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    *,
+    unique_id: str,
+    entity_domain: str,
+    config_entry_domain: str | None = None,
+) -> str | None:
+    """Resolve the entity ID for a managed surface by config-entry ownership ID."""
+    return resolve_managed_surface_entity_ids(
+        hass,
+        entity_registry,
+        [(unique_id, entity_domain)],
+        config_entry_domain=config_entry_domain,
+    ).get((unique_id, entity_domain))
 
 
 __all__ = [
@@ -94,4 +122,5 @@ __all__ = [
     "iter_managed_surface_config_entries",
     "iter_managed_surface_entity_entries",
     "resolve_managed_surface_entity_id",
+    "resolve_managed_surface_entity_ids",
 ]
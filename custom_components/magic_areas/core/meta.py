@@ -1,14 +1,23 @@
-"""Pure meta-area helpers for Magic Areas."""
+"""Meta-area helpers and topology index for Magic Areas."""
 
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 
-from homeassistant.config_entries import ConfigEntryState
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntryState,
+)
 from homeassistant.const import STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util.hass_dict import HassKey
 
 from custom_components.magic_areas.area_state import (
     AreaStates,
@@ -16,10 +25,12 @@ from custom_components.magic_areas.area_state import (
     MetaAreaType,
 )
 from custom_components.magic_areas.config_keys.area import CONF_TYPE
-from custom_components.magic_areas.core.runtime_model import AreaDescriptor
-
-if TYPE_CHECKING:  # pragma: no cover
-    from custom_components.magic_areas.components import MagicAreasRuntimeData
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.runtime_model import (
+    AreaConfig,
+    AreaDescriptor,
+    build_presence_tracking_unique_id,
+)
 
 
 def collect_child_areas(
@@ -28,10 +39,7 @@ def collect_child_areas(
     slug: str,
     floor_id: str | None,
 ) -> list[str]:
-    """Return child area ids for a meta area by inspecting loaded config entries.
-
-    Iterates all loaded magic_areas config entries, reads their coordinator snapshots,
-    and delegates to resolve_child_areas() to apply meta-area matching rules.
+    """Return child area ids for a meta area from the area topology index.
 
     Args:
         hass: Home Assistant instance.
@@ -43,36 +51,248 @@ def collect_child_areas(
         List of child area ids that belong to this meta area.
 
     """
-    entries = hass.config_entries.async_entries("magic_areas")
-    descriptors: list[AreaDescriptor] = []
+    return async_get_area_topology_index(hass).child_areas(area_id, slug, floor_id)
+
+
+def area_topology_descriptor(area_config: AreaConfig) -> AreaDescriptor:
+    """Return the topology descriptor for an area configuration."""
+    area_type = area_config.config.get(CONF_TYPE, area_config.id)
+    return AreaDescriptor(
+        id=area_config.id,
+        slug=area_config.slug,
+        floor_id=area_config.floor_id,
+        area_type=str(area_type),
+        is_meta=area_type == AreaType.META,
+    )
 
-    for entry in entries:
-        if entry.state != ConfigEntryState.LOADED:
-            continue
-        runtime_data: MagicAreasRuntimeData = entry.runtime_data
-        coordinator_data = runtime_data.coordinator.data
-        if coordinator_data is None:
-            continue
-        area_config = coordinator_data.area_config
-        area_type = area_config.config.get(CONF_TYPE, area_config.id)
-        descriptors.append(
-            AreaDescriptor(
-                id=area_config.id,
-                slug=area_config.slug,
-                floor_id=area_config.floor_id,
-                area_type=str(area_type),
-                is_meta=area_type == AreaType.META,
-            )
+
+type MetaTopologyKey = tuple[str, str, str | None]
+
+
+@dataclass(slots=True)
+class AreaTopologyIndex:
+    """Maintained map of loaded areas for meta-area lookups.
+
+    Holds one descriptor per loaded Magic Areas config entry, plus derived
+    meta area -> child area ids, area slug -> config entry id, and area id ->
+    presence entity id maps. The descriptors are re-read from loaded entries
+    only after a Magic Areas config entry changes or an indexed area or floor
+    changes in its registry; presence entity ids are dropped only when the
+    entity registry touches that entity. Meta snapshot builds and runtime
+    lookups read the maps instead of scanning config entries.
+    """
+
+    hass: HomeAssistant
+    rebuilds: int = 0
+    hits: int = 0
+    misses: int = 0
+    _descriptors: dict[str, AreaDescriptor] | None = None
+    _entry_ids_by_slug: dict[str, str] = field(default_factory=dict)
+    _children: dict[MetaTopologyKey, tuple[str, ...]] = field(default_factory=dict)
+    _presence_entity_ids: dict[str, str | None] = field(default_factory=dict)
+    _unsubscribers: list[Callable[[], None]] = field(default_factory=list)
+
+    def child_areas(self, area_id: str, slug: str, floor_id: str | None) -> list[str]:
+        """Return child area ids for a meta area."""
+        descriptors = self._ensure_descriptors()
+        key: MetaTopologyKey = (area_id, slug, floor_id)
+        children = self._children.get(key)
+        if children is not None:
+            self.hits += 1
+            return list(children)
+        self.misses += 1
+        meta_descriptor = AreaDescriptor(
+            id=area_id,
+            slug=slug,
+            floor_id=floor_id,
+            area_type=str(area_id),
+            is_meta=True,
+        )
+        children = tuple(resolve_child_areas(meta_descriptor, descriptors.values()))
+        self._children[key] = children
+        return list(children)
+
+    def child_entry_ids(self, child_area_slugs: Iterable[str]) -> list[str]:
+        """Return loaded config entry ids for child area slugs."""
+        self._ensure_descriptors()
+        entry_ids = self._entry_ids_by_slug
+        return [entry_ids[slug] for slug in child_area_slugs if slug in entry_ids]
+
+    def presence_entity_id(self, area_id: str) -> str | None:
+        """Return the presence tracking entity id for an area."""
+        if area_id in self._presence_entity_ids:
+            return self._presence_entity_ids[area_id]
+        entity_id = er.async_get(self.hass).async_get_entity_id(
+            BINARY_SENSOR_DOMAIN,
+            DOMAIN,
+            build_presence_tracking_unique_id(area_id=area_id),
+        )
+        self._presence_entity_ids[area_id] = entity_id
+        return entity_id
+
+    def publish(self, entry_id: str, descriptor: AreaDescriptor) -> None:
+        """Refresh an indexed entry whose snapshot was rebuilt in place."""
+        descriptors = self._descriptors
+        if descriptors is None:
+            return
+        current = descriptors.get(entry_id)
+        if current is None or current == descriptor:
+            return
+        descriptors[entry_id] = descriptor
+        self._index_descriptors(descriptors)
+
+    def invalidate(self) -> None:
+        """Drop indexed descriptors; the next lookup re-reads loaded entries."""
+        self._descriptors = None
+        self._entry_ids_by_slug = {}
+        self._children.clear()
+
+    def invalidate_presence(
+        self, entity_ids: Iterable[str] | None = None, *, unresolved: bool = False
+    ) -> None:
+        """Drop cached presence entity ids, or only those naming ``entity_ids``.
+
+        With ``unresolved`` set, areas cached without a presence entity are
+        dropped too, so a newly registered entity is picked up.
+        """
+        if entity_ids is None:
+            self._presence_entity_ids.clear()
+            return
+        changed = set(entity_ids)
+        for area_id, entity_id in list(self._presence_entity_ids.items()):
+            if entity_id in changed or (unresolved and entity_id is None):
+                del self._presence_entity_ids[area_id]
+
+    def indexes_area(self, area_id: str | None) -> bool:
+        """Return whether an area registry change can affect the index."""
+        descriptors = self._descriptors
+        if descriptors is None or area_id is None:
+            return False
+        return any(descriptor.id == area_id for descriptor in descriptors.values())
+
+    def indexes_floor(self, floor_id: str | None) -> bool:
+        """Return whether a floor registry change can affect the index."""
+        descriptors = self._descriptors
+        if descriptors is None or floor_id is None:
+            return False
+        return any(
+            floor_id in (descriptor.floor_id, descriptor.id)
+            for descriptor in descriptors.values()
         )
 
-    meta_descriptor = AreaDescriptor(
-        id=area_id,
-        slug=slug,
-        floor_id=floor_id,
-        area_type=str(area_id),
-        is_meta=True,
-    )
-    return resolve_child_areas(meta_descriptor, descriptors)
+    def diagnostics(self) -> dict[str, object]:
+        """Return index size and lookup counters."""
+        return {
+            "areas": None if self._descriptors is None else len(self._descriptors),
+            "meta_areas": len(self._children),
+            "presence_entities": len(self._presence_entity_ids),
+            "rebuilds": self.rebuilds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def async_listen(self) -> None:
+        """Invalidate on config entry, area, floor, and entity registry changes."""
+        if self._unsubscribers:
+            return
+
+        @callback
+        def _config_entry_changed(_change: object, entry: object) -> None:
+            if getattr(entry, "domain", None) == DOMAIN:
+                self.invalidate()
+
+        def _area_registry_updated(
+            event: Event[ar.EventAreaRegistryUpdatedData],
+        ) -> None:
+            if self.indexes_area(event.data["area_id"]):
+                self.invalidate()
+
+        def _floor_registry_updated(
+            event: Event[fr.EventFloorRegistryUpdatedData],
+        ) -> None:
+            data = event.data
+            if data["action"] != "reorder" and self.indexes_floor(data["floor_id"]):
+                self.invalidate()
+
+        def _entity_registry_updated(
+            event: Event[er.EventEntityRegistryUpdatedData],
+        ) -> None:
+            if not self._presence_entity_ids:
+                return
+            changed = [event.data["entity_id"]]
+            if event.data["action"] == "update" and "old_entity_id" in event.data:
+                changed.append(event.data["old_entity_id"])
+            self.invalidate_presence(
+                changed, unresolved=event.data["action"] != "remove"
+            )
+
+        hass = self.hass
+        self._unsubscribers = [
+            async_dispatcher_connect(
+                hass, SIGNAL_CONFIG_ENTRY_CHANGED, _config_entry_changed
+            ),
+            hass.bus.async_listen(
+                ar.EVENT_AREA_REGISTRY_UPDATED, callback(_area_registry_updated)
+            ),
+            hass.bus.async_listen(
+                fr.EVENT_FLOOR_REGISTRY_UPDATED, callback(_floor_registry_updated)
+            ),
+            hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, callback(_entity_registry_updated)
+            ),
+        ]
+
+    def async_unlisten(self) -> None:
+        """Stop listening for topology changes."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+
+    def _ensure_descriptors(self) -> dict[str, AreaDescriptor]:
+        """Return indexed descriptors, re-reading loaded entries when stale."""
+        if self._descriptors is not None:
+            return self._descriptors
+        descriptors: dict[str, AreaDescriptor] = {}
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.state != ConfigEntryState.LOADED:
+                continue
+            coordinator = getattr(entry.runtime_data, "coordinator", None)
+            coordinator_data = getattr(coordinator, "data", None)
+            if coordinator_data is None:
+                continue
+            descriptors[entry.entry_id] = area_topology_descriptor(
+                coordinator_data.area_config
+            )
+        self._descriptors = descriptors
+        self._index_descriptors(descriptors)
+        self.rebuilds += 1
+        return descriptors
+
+    def _index_descriptors(self, descriptors: dict[str, AreaDescriptor]) -> None:
+        """Recompute the slug map and drop derived child lists."""
+        self._entry_ids_by_slug = {
+            descriptor.slug: entry_id for entry_id, descriptor in descriptors.items()
+        }
+        self._children.clear()
+
+
+AREA_TOPOLOGY_INDEX: HassKey[AreaTopologyIndex] = HassKey(f"{DOMAIN}_area_topology")
+
+
+def async_get_area_topology_index(hass: HomeAssistant) -> AreaTopologyIndex:
+    """Return the shared area topology index, subscribing it on first use."""
+    index = hass.data.get(AREA_TOPOLOGY_INDEX)
+    if index is None:
+        index = hass.data[AREA_TOPOLOGY_INDEX] = AreaTopologyIndex(hass=hass)
+        index.async_listen()
+    return index
+
+
+def async_release_area_topology_index(hass: HomeAssistant) -> None:
+    """Unsubscribe and drop the shared area topology index."""
+    index = hass.data.pop(AREA_TOPOLOGY_INDEX, None)
+    if index is not None:
+        index.async_unlisten()
 
 
 def resolve_child_areas(
@@ -127,27 +347,49 @@ def aggregate_secondary_states(
     Returns:
         List of aggregated secondary states.
 
+    """
+    all_states: list[str] = []
+    for state_list in child_state_lists:
+        all_states.extend(state_list)
+    return aggregate_secondary_state_counts(
+        Counter(all_states),
+        child_area_count=len(child_state_lists),
+        mode=mode,
+        configurable_states=configurable_states,
+    )
+
+
+def aggregate_secondary_state_counts(
+    state_counts: Mapping[str, int],
+    *,
+    child_area_count: int,
+    mode: str,
+    configurable_states: Sequence[str],
+) -> list[str]:
+    """Aggregate secondary states from per-state child counts.
+
+    Args:
+        state_counts: Number of child areas reporting each state.
+        child_area_count: Number of child areas contributing to the counts.
+        mode: Calculation mode ("any", "all", "majority").
+        configurable_states: States to consider for aggregation.
+
+    Returns:
+        List of aggregated secondary states.
+
     """
     states: list[str] = []
-    child_area_count = len(child_state_lists)
 
     if child_area_count == 0:
-        if AreaStates.DARK not in states:
-            states.append(AreaStates.BRIGHT)
+        states.append(AreaStates.BRIGHT)
         return states
 
-    all_states: list[str] = []
-    for state_list in child_state_lists:
-        all_states.extend(state_list)
-    state_counter = Counter(all_states)
-
     for secondary_state in configurable_states:
-        if secondary_state not in state_counter:
+        amt_states = state_counts.get(secondary_state, 0)
+        if amt_states <= 0:
             continue
 
-        amt_states = state_counter[secondary_state]
-
-        if mode == "any" and amt_states > 0:
+        if mode == "any":
             states.append(secondary_state)
         elif mode == "all" and amt_states == child_area_count:
             states.append(secondary_state)
@@ -158,3 +400,60 @@ def aggregate_secondary_states(
         states.append(AreaStates.BRIGHT)
 
     return states
+
+
+@dataclass(slots=True)
+class SecondaryStateCounters:
+    """Live per-state counts over a meta area's active children.
+
+    Each child contributes its current state set while active. Updates apply
+    only the difference between a child's previous and new states, so
+    aggregation never rescans children.
+    """
+
+    _child_states: dict[str, frozenset[str]] = field(default_factory=dict)
+    _counts: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def active_child_count(self) -> int:
+        """Return the number of children currently contributing states."""
+        return len(self._child_states)
+
+    def count(self, state: str) -> int:
+        """Return how many active children report a state."""
+        return self._counts.get(state, 0)
+
+    def set_child(self, child_id: str, states: Iterable[str] | None) -> bool:
+        """Set one child's states; ``None`` marks it inactive. Return if changed."""
+        new_states = None if states is None else frozenset(map(str, states))
+        old_states = self._child_states.get(child_id)
+        if new_states == old_states:
+            return False
+        removed = old_states or frozenset()
+        added = new_states or frozenset()
+        for state in removed - added:
+            self._counts[state] -= 1
+            if self._counts[state] <= 0:
+                del self._counts[state]
+        for state in added - removed:
+            self._counts[state] += 1
+        if new_states is None:
+            del self._child_states[child_id]
+        else:
+            self._child_states[child_id] = new_states
+        return True
+
+    def retain(self, child_ids: Iterable[str]) -> None:
+        """Drop children that are no longer members."""
+        keep = set(child_ids)
+        for child_id in [cid for cid in self._child_states if cid not in keep]:
+            self.set_child(child_id, None)
+
+    def aggregate(self, mode: str, configurable_states: Sequence[str]) -> list[str]:
+        """Aggregate secondary states from the live counts."""
+        return aggregate_secondary_state_counts(
+            self._counts,
+            child_area_count=len(self._child_states),
+            mode=mode,
+            configurable_states=configurable_states,
+        )
@@ -0,0 +1,260 @@
+"""Propagation tree that routes child presence changes through meta areas."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.magic_areas.area_state import MetaAreaType
+from custom_components.magic_areas.const import ATTR_STATES, DOMAIN
+
+type LeafSignature = tuple[str | None, frozenset[str] | None]
+
+
+def meta_parent_id(meta_id: str) -> str | None:
+    """Return the parent meta area in the area -> type -> global tree.
+
+    Interior and exterior metas partition the non-meta areas, so global is
+    their parent. Floor metas form a separate area -> floor branch. The tree
+    only composes a child into its parent when both are composable; see
+    ``MetaPropagationTree``.
+    """
+    if meta_id in (MetaAreaType.INTERIOR, MetaAreaType.EXTERIOR):
+        return MetaAreaType.GLOBAL
+    return None
+
+
+def leaf_signature(state: State | None) -> LeafSignature:
+    """Return the parts of a child presence state that meta areas consume."""
+    if state is None:
+        return (None, None)
+    states = state.attributes.get(ATTR_STATES)
+    return (
+        state.state,
+        frozenset(map(str, states)) if isinstance(states, list) else None,
+    )
+
+
+class MetaTreeMember(Protocol):
+    """Meta area fed by the propagation tree.
+
+    Children are leaf presence sensors or lower meta areas. Both are
+    described by a ``LeafSignature``; for a meta area it is the derived
+    signature returned by these methods.
+    """
+
+    def sync_meta_children(
+        self, children: Mapping[str, LeafSignature]
+    ) -> LeafSignature:
+        """Replace every child signature; return this meta area's signature."""
+
+    def apply_meta_child_change(
+        self, child_id: str, old: LeafSignature, new: LeafSignature
+    ) -> LeafSignature:
+        """Apply one child's new signature; return this meta area's signature."""
+
+
+@dataclass(slots=True)
+class MetaTreeNode:
+    """One meta area registered in the propagation tree."""
+
+    meta_id: str
+    parent_id: str | None
+    child_entity_ids: frozenset[str]
+    member: MetaTreeMember
+    composable: bool = False
+
+
+@dataclass(slots=True)
+class MetaPropagationTree:
+    """Single child-presence listener feeding meta areas bottom-up.
+
+    A leaf change is delivered to the lowest registered meta areas that
+    contain the leaf. Each meta area returns its recomputed signature. When
+    a meta area and its parent are both composable (their secondary states
+    use the "any" mode, which gives the same result over child metas as over
+    leaves), the parent receives that signature as one of its children
+    instead of the leaf event. Otherwise the parent keeps counting the
+    leaves itself. A meta area whose signature is unchanged stops
+    propagation on that branch. Leaf events that change neither the presence state nor
+    the published area states are dropped before any meta area runs.
+    """
+
+    hass: HomeAssistant
+    delivered: int = 0
+    suppressed: int = 0
+    stopped: int = 0
+    _nodes: dict[str, MetaTreeNode] = field(default_factory=dict)
+    _direct: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    _signatures: dict[str, LeafSignature] = field(default_factory=dict)
+    _derived: dict[str, LeafSignature] = field(default_factory=dict)
+    _parents: dict[str, str] = field(default_factory=dict)
+    _unsubscribe: Callable[[], None] | None = None
+
+    def register(
+        self,
+        meta_id: str,
+        child_entity_ids: Iterable[str],
+        member: MetaTreeMember,
+        *,
+        parent_id: str | None = None,
+        composable: bool = False,
+    ) -> Callable[[], None]:
+        """Register or replace a meta area node; return its remover."""
+        node = MetaTreeNode(
+            meta_id=meta_id,
+            parent_id=parent_id,
+            child_entity_ids=frozenset(child_entity_ids),
+            member=member,
+            composable=composable,
+        )
+        self._nodes[meta_id] = node
+        self._rebuild()
+
+        def _remove() -> None:
+            if self._nodes.get(meta_id) is node:
+                del self._nodes[meta_id]
+                self._derived.pop(meta_id, None)
+                self._rebuild()
+
+        return _remove
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return tree shape and propagation counters."""
+        return {
+            "meta_areas": {
+                meta_id: {
+                    "parent": self._parents.get(meta_id),
+                    "children": len(node.child_entity_ids),
+                }
+                for meta_id, node in sorted(self._nodes.items())
+            },
+            "tracked_children": len(self._direct),
+            "delivered": self.delivered,
+            "suppressed": self.suppressed,
+            "stopped": self.stopped,
+        }
+
+    def _rebuild(self) -> None:
+        """Recompute routing, resync every meta area, and resubscribe."""
+        covered: dict[str, set[str]] = {}
+        child_nodes: dict[str, list[str]] = {}
+        self._parents = {}
+        for node in self._nodes.values():
+            parent = self._nodes.get(node.parent_id or "")
+            if parent is None or not (node.composable and parent.composable):
+                continue
+            self._parents[node.meta_id] = parent.meta_id
+            covered.setdefault(parent.meta_id, set()).update(node.child_entity_ids)
+            child_nodes.setdefault(parent.meta_id, []).append(node.meta_id)
+
+        direct: dict[str, list[str]] = {}
+        for node in self._nodes.values():
+            node_covered = covered.get(node.meta_id, set())
+            for entity_id in node.child_entity_ids - node_covered:
+                direct.setdefault(entity_id, []).append(node.meta_id)
+        self._direct = {
+            entity_id: tuple(meta_ids) for entity_id, meta_ids in direct.items()
+        }
+        self._signatures = {
+            entity_id: self._signatures.get(entity_id)
+            or leaf_signature(self.hass.states.get(entity_id))
+            for entity_id in self._direct
+        }
+
+        # Children before parents, so each parent syncs from fresh signatures.
+        for node in sorted(self._nodes.values(), key=self._depth, reverse=True):
+            children: dict[str, LeafSignature] = {
+                entity_id: self._signatures[entity_id]
+                for entity_id in node.child_entity_ids
+                - covered.get(node.meta_id, set())
+            }
+            for child_id in child_nodes.get(node.meta_id, ()):
+                children[child_id] = self._derived[child_id]
+            self._derived[node.meta_id] = node.member.sync_meta_children(children)
+
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._direct:
+            self._unsubscribe = async_track_state_change_event(
+                self.hass, list(self._direct), self._child_state_changed
+            )
+
+    def _depth(self, node: MetaTreeNode) -> int:
+        """Return how many composing ancestors a node has."""
+        depth = 0
+        parent_id = self._parents.get(node.meta_id)
+        while parent_id is not None:
+            depth += 1
+            parent_id = self._parents.get(parent_id)
+        return depth
+
+    @callback
+    def _child_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Route one leaf presence change up the tree."""
+        entity_id = event.data["entity_id"]
+        signature = leaf_signature(event.data["new_state"])
+        previous = self._signatures.get(entity_id, (None, None))
+        if previous == signature:
+            self.suppressed += 1
+            return
+        self._signatures[entity_id] = signature
+
+        for meta_id in self._direct.get(entity_id, ()):
+            self._propagate(meta_id, entity_id, previous, signature)
+
+    def _propagate(
+        self, meta_id: str, child_id: str, old: LeafSignature, new: LeafSignature
+    ) -> None:
+        """Walk up from one meta area while derived signatures keep changing."""
+        current: str | None = meta_id
+        while current is not None:
+            node = self._nodes.get(current)
+            if node is None:
+                return
+            self.delivered += 1
+            previous = self._derived.get(current, (None, None))
+            derived = node.member.apply_meta_child_change(child_id, old, new)
+            self._derived[current] = derived
+            if derived == previous:
+                self.stopped += 1
+                return
+            child_id, old, new = current, previous, derived
+            current = self._parents.get(current)
+
+
+META_PROPAGATION_TREE: HassKey[MetaPropagationTree] = HassKey(
+    f"{DOMAIN}_meta_propagation_tree"
+)
+
+
+def async_get_meta_propagation_tree(hass: HomeAssistant) -> MetaPropagationTree:
+    """Return the shared meta propagation tree for this Home Assistant instance."""
+    tree = hass.data.get(META_PROPAGATION_TREE)
+    if tree is None:
+        tree = hass.data[META_PROPAGATION_TREE] = MetaPropagationTree(hass=hass)
+    return tree
+
+
+__all__ = [
+    "LeafSignature",
+    "META_PROPAGATION_TREE",
+    "MetaPropagationTree",
+    "MetaTreeMember",
+    "MetaTreeNode",
+    "async_get_meta_propagation_tree",
+    "leaf_signature",
+    "meta_parent_id",
+]
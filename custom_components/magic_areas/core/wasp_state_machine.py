@@ -1,7 +1,7 @@
 """Wasp In A Box state machine for Magic Areas.
 
 Encapsulates the temporal state logic for detecting motion (wasp) while a door
-is open (box). The machine receives pre-built sensor state dicts and returns
+is open (box). The machine keeps running ON counts per sensor group and returns
 WaspStateUpdate results — consistent with the existing policy pattern
 (LightGroupPolicy, FanControlPolicy, ClimatePresetPolicy).
 
@@ -26,10 +26,33 @@ class WaspStateUpdate:
     cancel_timer: bool = False
 
 
+@dataclass(slots=True)
+class WaspSensorCounts:
+    """Running count of ON sensors in one sensor group."""
+
+    total: int = 0
+    on: int = 0
+
+    def resync(self, states: dict[str, str]) -> None:
+        """Reset the count from a full sensor state dict."""
+        self.total = len(states)
+        self.on = sum(1 for state in states.values() if state == STATE_ON)
+
+    def apply(self, old_state: str | None, new_state: str | None) -> None:
+        """Apply one sensor's state transition to the count."""
+        delta = (new_state == STATE_ON) - (old_state == STATE_ON)
+        self.on = min(max(self.on + delta, 0), self.total)
+
+    @property
+    def state(self) -> str:
+        """Return STATE_ON if any sensor in the group is ON."""
+        return STATE_ON if self.on else STATE_OFF
+
+
 class WaspStateMachine:
     """State machine for door+motion presence coordination.
 
-    Receives pre-built sensor state dicts (wasp sensors + box sensors),
+    Keeps running ON counts for the wasp and box sensor groups and
     returns WaspStateUpdate results. Entity handles HA wiring (scheduling
     timers, writing HA state).
 
@@ -40,6 +63,9 @@ class WaspStateMachine:
     State owned by this machine:
     - wasp: bool — whether motion was recently detected
     - is_present: bool — derived presence result (presence when wasp detected or box open)
+    - wasp_counts / box_counts: running ON counts per sensor group, kept
+      current from state-change deltas and resynced from full state dicts
+      only on startup and periodically
     """
 
     def __init__(self, wasp_timeout: int) -> None:
@@ -52,6 +78,8 @@ class WaspStateMachine:
         self._wasp_timeout = wasp_timeout
         self.wasp: bool = False
         self._timeout_requested: bool = False
+        self.wasp_counts = WaspSensorCounts()
+        self.box_counts = WaspSensorCounts()
 
     @property
     def is_present(self) -> bool:
@@ -59,55 +87,34 @@ class WaspStateMachine:
         # Present if wasp is active (motion detected) or if timeout is pending
         return self.wasp or self._timeout_requested
 
-    def update_wasp(self, wasp_states: dict[str, str]) -> WaspStateUpdate:
-        """Update machine state from wasp sensor states.
-
-        Args:
-            wasp_states: Dict mapping sensor names to STATE_ON/STATE_OFF.
-
-        Returns:
-            WaspStateUpdate with new presence and timer decisions.
-
-        """
-        wasp_state = self._aggregate_states(wasp_states)
-        box_state = STATE_OFF  # We don't know box state, keep it OFF
-
-        return self._compute_update(wasp_state, box_state)
-
-    def update_box(self, box_states: dict[str, str]) -> WaspStateUpdate:
-        """Update machine state from box sensor states.
-
-        Args:
-            box_states: Dict mapping sensor names to STATE_ON/STATE_OFF.
+    def resync(self, wasp_states: dict[str, str], box_states: dict[str, str]) -> bool:
+        """Reset the running counts from full sensor state dicts.
 
         Returns:
-            WaspStateUpdate with new presence and timer decisions.
+            True if either aggregated group state differs from the counts.
 
         """
-        wasp_state = STATE_OFF  # We don't know wasp state, keep it OFF
-        box_state = self._aggregate_states(box_states)
+        before = (self.wasp_counts.state, self.box_counts.state)
+        self.wasp_counts.resync(wasp_states)
+        self.box_counts.resync(box_states)
+        return before != (self.wasp_counts.state, self.box_counts.state)
 
-        return self._compute_update(wasp_state, box_state)
+    def apply_wasp_change(self, old_state: str | None, new_state: str | None) -> None:
+        """Apply one wasp sensor transition to the running counts."""
+        self.wasp_counts.apply(old_state, new_state)
 
-    def update_all(
-        self, wasp_states: dict[str, str], box_states: dict[str, str]
-    ) -> WaspStateUpdate:
-        """Update machine state from both sensor groups.
+    def apply_box_change(self, old_state: str | None, new_state: str | None) -> None:
+        """Apply one box sensor transition to the running counts."""
+        self.box_counts.apply(old_state, new_state)
 
-        This is the most common call path when handling sensor state changes.
-
-        Args:
-            wasp_states: Dict mapping wasp sensor names to STATE_ON/STATE_OFF.
-            box_states: Dict mapping box sensor names to STATE_ON/STATE_OFF.
+    def evaluate(self) -> WaspStateUpdate:
+        """Update machine state from the running sensor counts.
 
         Returns:
             WaspStateUpdate with new presence and timer decisions.
 
         """
-        wasp_state = self._aggregate_states(wasp_states)
-        box_state = self._aggregate_states(box_states)
-
-        return self._compute_update(wasp_state, box_state)
+        return self._compute_update(self.wasp_counts.state, self.box_counts.state)
 
     def on_wasp_timeout(self) -> WaspStateUpdate:
         """Handle wasp timeout expiration.
@@ -130,42 +137,6 @@ class WaspStateMachine:
             cancel_timer=True,
         )
 
-    def on_delay_complete(
-        self, wasp_states: dict[str, str], box_states: dict[str, str]
-    ) -> WaspStateUpdate:
-        """Handle completion of the box-close delay.
-
-        After a box closes, there's a delay before running the full logic.
-        This method is called when that delay expires.
-
-        Args:
-            wasp_states: Dict mapping wasp sensor names to STATE_ON/STATE_OFF.
-            box_states: Dict mapping box sensor names to STATE_ON/STATE_OFF.
-
-        Returns:
-            WaspStateUpdate with new presence and timer decisions.
-
-        """
-        wasp_state = self._aggregate_states(wasp_states)
-        box_state = self._aggregate_states(box_states)
-
-        return self._compute_update(wasp_state, box_state)
-
-    def _aggregate_states(self, states: dict[str, str]) -> str:
-        """Aggregate sensor states to ON if any sensor is ON.
-
-        Args:
-            states: Dict mapping sensor names to STATE_ON/STATE_OFF.
-
-        Returns:
-            STATE_ON if any sensor is ON, STATE_OFF otherwise.
-
-        """
-        for state in states.values():
-            if state == STATE_ON:
-                return STATE_ON
-        return STATE_OFF
-
     def _compute_update(self, wasp_state: str, box_state: str) -> WaspStateUpdate:
         """Compute the next state and any timer requests.
 
@@ -35,6 +35,8 @@ ALL_PRESENCE_DEVICE_PLATFORMS = [
 
 DEFAULT_RELOAD_ON_REGISTRY_CHANGE = True
 DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES = True
+DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS = False
+DEFAULT_RELOAD_MAX_CONCURRENCY = 3
 
 DEFAULT_CLEAR_TIMEOUT = 1
 DEFAULT_CLEAR_TIMEOUT_META = 0
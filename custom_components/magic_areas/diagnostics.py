@@ -10,6 +10,22 @@ from homeassistant.helpers.entity_registry import async_get as entityreg_async_g
 from custom_components.magic_areas.const import ATTR_STATES
 from custom_components.magic_areas.config_keys.area import CONF_ID, CONF_NAME
 from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.announcements import ANNOUNCEMENT_DISPATCHER
+from custom_components.magic_areas.core.ble_location import BLE_LOCATION_ROUTER
+from custom_components.magic_areas.core.control_intents import ROLE_TARGET_CACHE
+from custom_components.magic_areas.core.controls import (
+    CONTROL_EVALUATION_LOG,
+    COVER_COMMAND_BATCHER,
+)
+from custom_components.magic_areas.core.meta import AREA_TOPOLOGY_INDEX
+from custom_components.magic_areas.core.meta_tree import META_PROPAGATION_TREE
+from custom_components.magic_areas.coordinator import (
+    INVENTORY_APPLY_STATS,
+    META_RELOAD_STATS,
+    RELOAD_QUEUE,
+    SETUP_PIPELINE,
+    SNAPSHOT_CACHE,
+)
 from custom_components.magic_areas.core.runtime_model import (
     build_presence_tracking_unique_id,
 )
@@ -36,6 +52,108 @@ def _get_area_states(hass: HomeAssistant, area_id: str) -> list[str]:
     return []
 
 
+def _runtime_controller_diagnostics(runtime_data: object) -> list[dict[str, object]]:
+    """Collect diagnostics from runtime controllers that expose them."""
+    controllers = getattr(runtime_data, "runtime_controllers", None) or []
+    diagnostics: list[dict[str, object]] = []
+    for controller in controllers:
+        get_diagnostics = getattr(controller, "diagnostics", None)
+        if callable(get_diagnostics):
+            diagnostics.append(get_diagnostics())
+    return diagnostics
+
+
+def _role_target_cache_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return shared role-target cache diagnostics when the cache exists."""
+    cache = hass.data.get(ROLE_TARGET_CACHE)
+    return None if cache is None else cache.diagnostics()
+
+
+def _meta_propagation_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return meta propagation tree diagnostics when the tree exists."""
+    tree = hass.data.get(META_PROPAGATION_TREE)
+    return None if tree is None else tree.diagnostics()
+
+
+def _ble_location_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return BLE location router counters."""
+    router = hass.data.get(BLE_LOCATION_ROUTER)
+    return None if router is None else router.diagnostics()
+
+
+def _announcement_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return per-platform announcement latency and failures."""
+    dispatcher = hass.data.get(ANNOUNCEMENT_DISPATCHER)
+    return None if dispatcher is None else dispatcher.diagnostics()
+
+
+def _area_topology_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return area topology index diagnostics when the index exists."""
+    index = hass.data.get(AREA_TOPOLOGY_INDEX)
+    return None if index is None else index.diagnostics()
+
+
+def _meta_inventory_diagnostics(runtime_data: object) -> dict[str, object] | None:
+    """Return meta child inventory diagnostics for meta area coordinators."""
+    coordinator = getattr(runtime_data, "coordinator", None)
+    inventory = getattr(coordinator, "meta_inventory", None)
+    return None if inventory is None else inventory.diagnostics()
+
+
+def _meta_reload_diagnostics(
+    hass: HomeAssistant, entry: MagicAreasConfigEntry
+) -> dict[str, object] | None:
+    """Return hot-update and reload counters for a meta area entry."""
+    stats = hass.data.get(META_RELOAD_STATS)
+    return None if stats is None else stats.diagnostics(entry.entry_id)
+
+
+def _inventory_apply_diagnostics(
+    hass: HomeAssistant, entry: MagicAreasConfigEntry
+) -> dict[str, object] | None:
+    """Return inventory hot-apply and reload counters for an area entry."""
+    stats = hass.data.get(INVENTORY_APPLY_STATS)
+    return None if stats is None else stats.diagnostics(entry.entry_id)
+
+
+def _reload_queue_diagnostics(
+    hass: HomeAssistant, entry: MagicAreasConfigEntry
+) -> dict[str, object] | None:
+    """Return shared reload queue state and this entry's reload history."""
+    queue = hass.data.get(RELOAD_QUEUE)
+    return None if queue is None else queue.diagnostics(entry.entry_id)
+
+
+def _snapshot_cache_diagnostics(
+    hass: HomeAssistant, entry: MagicAreasConfigEntry
+) -> dict[str, object] | None:
+    """Return warm-start snapshot cache counters for this entry."""
+    cache = hass.data.get(SNAPSHOT_CACHE)
+    return None if cache is None else cache.diagnostics(entry.entry_id)
+
+
+def _setup_pipeline_diagnostics(
+    hass: HomeAssistant, entry: MagicAreasConfigEntry
+) -> dict[str, object] | None:
+    """Return how long this entry's setup waited on its children."""
+    pipeline = hass.data.get(SETUP_PIPELINE)
+    return None if pipeline is None else pipeline.diagnostics(entry.entry_id)
+
+
+def _control_evaluation_diagnostics(
+    hass: HomeAssistant, area_id: str
+) -> dict[str, object] | None:
+    """Return control switch publishing counters and verbose evaluations."""
+    log = hass.data.get(CONTROL_EVALUATION_LOG)
+    return None if log is None else log.diagnostics(area_id)
+
+
+def _cover_command_diagnostics(hass: HomeAssistant) -> dict[str, object] | None:
+    """Return house-wide cover command batching counters."""
+    batcher = hass.data.get(COVER_COMMAND_BATCHER)
+    return None if batcher is None else batcher.diagnostics()
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: MagicAreasConfigEntry
 ) -> dict[str, object]:
@@ -68,4 +186,20 @@ async def async_get_config_entry_diagnostics(
             ),
             "updated_at": data.updated_at.isoformat(),
         },
+        "runtime_controllers": _runtime_controller_diagnostics(runtime_data),
+        "role_target_cache": _role_target_cache_diagnostics(hass),
+        "meta_propagation": _meta_propagation_diagnostics(hass),
+        "area_topology": _area_topology_diagnostics(hass),
+        "ble_location": _ble_location_diagnostics(hass),
+        "announcements": _announcement_diagnostics(hass),
+        "meta_inventory": _meta_inventory_diagnostics(runtime_data),
+        "meta_reload": _meta_reload_diagnostics(hass, entry),
+        "inventory_apply": _inventory_apply_diagnostics(hass, entry),
+        "reload_queue": _reload_queue_diagnostics(hass, entry),
+        "snapshot_cache": _snapshot_cache_diagnostics(hass, entry),
+        "setup_pipeline": _setup_pipeline_diagnostics(hass, entry),
+        "control_evaluations": _control_evaluation_diagnostics(
+            hass, data.area_config.id
+        ),
+        "cover_commands": _cover_command_diagnostics(hass),
     }
@@ -17,6 +17,7 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_COVER_GROUPS_ACCENT_ACTION,
     CONF_COVER_GROUPS_ACCENT_STATES,
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES,
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS,
     CONF_COVER_GROUPS_DAYLIGHT_ACTION,
     CONF_COVER_GROUPS_DAYLIGHT_STATES,
     CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS,
@@ -79,6 +80,7 @@ FAN_GROUPS_OPTION_KEYS: tuple[str, ...] = (
 COVER_GROUPS_OPTION_KEYS: tuple[str, ...] = (
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES,
     CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS,
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS,
     CONF_COVER_GROUPS_DAYLIGHT_ACTION,
     CONF_COVER_GROUPS_DAYLIGHT_STATES,
     CONF_COVER_GROUPS_PRIVACY_ACTION,
@@ -90,6 +92,9 @@ COVER_GROUPS_AUTOMATION_DEVICE_CLASSES_KEY: str = (
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES
 )
 COVER_GROUPS_MANUAL_HOLD_SECONDS_KEY: str = CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS
+COVER_GROUPS_COMMAND_STAGGER_SECONDS_KEY: str = (
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS
+)
 COVER_GROUPS_DAYLIGHT_ACTION_KEY: str = CONF_COVER_GROUPS_DAYLIGHT_ACTION
 COVER_GROUPS_DAYLIGHT_STATES_KEY: str = CONF_COVER_GROUPS_DAYLIGHT_STATES
 COVER_GROUPS_PRIVACY_ACTION_KEY: str = CONF_COVER_GROUPS_PRIVACY_ACTION
@@ -162,6 +167,10 @@ def cover_groups_config(feature_configs: FeatureConfig) -> CoverGroupsConfig:
             0,
             options.int_value(CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS),
         ),
+        command_stagger_seconds=max(
+            0.0,
+            options.float_value(CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS),
+        ),
         presets=tuple(_cover_preset_config(options, role) for role in CoverPresetRole),
     )
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from typing import TYPE_CHECKING, Protocol
 
 from homeassistant.core import HomeAssistant
@@ -15,7 +16,10 @@ from custom_components.magic_areas.components import MagicAreasConfigEntry
 from custom_components.magic_areas.core.config import normalize_custom_control_groups
 from custom_components.magic_areas.core.control_intents import custom_control_label_name
 from custom_components.magic_areas.core.runtime_model import AreaConfig
-from custom_components.magic_areas.core.runtime_model import LabelSurface
+from custom_components.magic_areas.core.runtime_model import (
+    ConfigEntryHelperSurface,
+    LabelSurface,
+)
 from custom_components.magic_areas.coordinator import MagicAreasData
 from custom_components.magic_areas.coordinator import MagicAreasCoordinator
 
@@ -152,12 +156,194 @@ async def async_start_feature_runtime_controllers(
             data,
         )
         for controller in controllers:
-            await controller.async_start()
             track_cleanup(controller.cleanup)
             started.append(controller)
+
+    # Controllers only subscribe to their own inputs, so start them together.
+    results = await asyncio.gather(
+        *(controller.async_start() for controller in started),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
     return started
 
 
+async def async_apply_feature_surfaces(
+    *,
+    hass: HomeAssistant,
+    owner_entry_id: str,
+    registry: FeatureRegistry,
+    data: MagicAreasData,
+    area_config: AreaConfig,
+    logger: logging.Logger,
+) -> None:
+    """Reconcile feature-managed helpers and Adaptive Lighting configs."""
+    from custom_components.magic_areas.coordinator import (
+        SETUP_PHASE_ADAPTIVE_LIGHTING,
+        SETUP_PHASE_MANAGED_SURFACES,
+        async_get_setup_pipeline,
+        async_reconcile_managed_adaptive_lighting,
+        async_reconcile_managed_surfaces,
+    )
+
+    setup_pipeline = async_get_setup_pipeline(hass)
+    with setup_pipeline.phase(owner_entry_id, SETUP_PHASE_MANAGED_SURFACES):
+        await async_reconcile_managed_surfaces(
+            hass=hass,
+            owner_entry_id=owner_entry_id,
+            desired_surfaces=collect_feature_managed_surfaces(
+                registry=registry,
+                data=data,
+                area_config=area_config,
+                logger=logger,
+            ),
+        )
+    with setup_pipeline.phase(owner_entry_id, SETUP_PHASE_ADAPTIVE_LIGHTING):
+        await async_reconcile_managed_adaptive_lighting(
+            hass=hass,
+            area_id=area_config.id,
+            desired_configs=collect_feature_managed_adaptive_lighting_configs(
+                registry=registry,
+                data=data,
+                area_config=area_config,
+                logger=logger,
+            ),
+        )
+
+
+type FeatureEntitySignature = frozenset[tuple[str, Hashable]]
+
+
+def feature_entity_signature(
+    *,
+    registry: FeatureRegistry,
+    data: MagicAreasData,
+    area_config: AreaConfig,
+    coordinator: MagicAreasCoordinator,
+    logger: logging.Logger,
+) -> FeatureEntitySignature:
+    """Return what feature-built platform entities bind when they are added.
+
+    Computed from the snapshot without building entities: each enabled
+    module's optional ``platform_entity_inputs`` (members bound at
+    construction) plus the managed helpers that switches and sensors resolve
+    in ``async_added_to_hass`` (aggregates, fan/cover/media player groups).
+    """
+    signature: set[tuple[str, Hashable]] = {
+        ("helper", surface.unique_id)
+        for surface in collect_feature_managed_surfaces(
+            registry=registry,
+            data=data,
+            area_config=area_config,
+            logger=logger,
+        )
+        if isinstance(surface, ConfigEntryHelperSurface)
+    }
+    for module in registry.modules():
+        if not module.is_enabled(data):
+            continue
+        inputs_builder = getattr(module, "platform_entity_inputs", None)
+        if inputs_builder is not None:
+            signature.add(
+                (str(module.id), inputs_builder(area_config, coordinator, data))
+            )
+    return frozenset(signature)
+
+
+def register_feature_control_groups(
+    *,
+    registry: FeatureRegistry,
+    data: MagicAreasData,
+    area_config: AreaConfig,
+) -> None:
+    """Re-register enabled features' control-group definitions for a snapshot."""
+    for module in registry.modules():
+        if not module.is_enabled(data):
+            continue
+        register = getattr(module, "register_control_groups", None)
+        if register is not None:
+            register(area_config, data)
+
+
+async def async_hot_apply_feature_inventory(
+    *,
+    hass: HomeAssistant,
+    config_entry: MagicAreasConfigEntry,
+    registry: FeatureRegistry,
+    logger: logging.Logger,
+) -> bool:
+    """Apply a changed entity inventory to a loaded area without reloading.
+
+    The coordinator is refreshed, which re-tracks presence sensors in place.
+    Control-group definitions and managed helpers (aggregates, light/fan/cover
+    groups) follow the new members and runtime controllers are restarted.
+    Returns False when platform entities would be added or removed, or would
+    bind different members or helpers; the caller then reloads the entry.
+    """
+    runtime_data = getattr(config_entry, "runtime_data", None)
+    coordinator = getattr(runtime_data, "coordinator", None)
+    if runtime_data is None or coordinator is None:
+        return False
+    previous = coordinator.data
+    if previous is None:
+        return False
+    area_config = previous.area_config
+    previous_signature = feature_entity_signature(
+        registry=registry,
+        data=previous,
+        area_config=area_config,
+        coordinator=coordinator,
+        logger=logger,
+    )
+
+    await coordinator.async_refresh()
+    data = coordinator.data
+    if data is None or not coordinator.last_update_success:
+        return False
+    if (
+        feature_entity_signature(
+            registry=registry,
+            data=data,
+            area_config=area_config,
+            coordinator=coordinator,
+            logger=logger,
+        )
+        != previous_signature
+    ):
+        return False
+    if data.entities == previous.entities:
+        return True
+
+    register_feature_control_groups(
+        registry=registry,
+        data=data,
+        area_config=area_config,
+    )
+    await async_apply_feature_surfaces(
+        hass=hass,
+        owner_entry_id=config_entry.entry_id,
+        registry=registry,
+        data=data,
+        area_config=area_config,
+        logger=logger,
+    )
+    for controller in runtime_data.runtime_controllers or []:
+        controller.cleanup()
+        if controller.cleanup in runtime_data.listeners:
+            runtime_data.listeners.remove(controller.cleanup)
+    runtime_data.runtime_controllers = await async_start_feature_runtime_controllers(
+        registry=registry,
+        data=data,
+        area_config=area_config,
+        coordinator=coordinator,
+        track_cleanup=runtime_data.listeners.append,
+        logger=logger,
+    )
+    return True
+
+
 def _custom_control_group_label_surfaces(
     *,
     area_config: AreaConfig,
@@ -277,9 +463,13 @@ async def async_setup_feature_platform(
 
 
 __all__ = [
+    "async_apply_feature_surfaces",
+    "async_hot_apply_feature_inventory",
     "async_setup_feature_platform",
     "async_start_feature_runtime_controllers",
     "collect_feature_entities",
     "collect_feature_managed_adaptive_lighting_configs",
     "collect_feature_managed_surfaces",
+    "feature_entity_signature",
+    "register_feature_control_groups",
 ]
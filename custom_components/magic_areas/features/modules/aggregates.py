@@ -89,14 +89,21 @@ class AggregatesFeatureModule(BaseFeatureModule):
         data: MagicAreasData,
     ) -> list[Entity]:
         """Build entities for the aggregates feature."""
-        definitions = _aggregate_definitions(data)
+        self.register_control_groups(area_config, data)
+        return []
+
+    def register_control_groups(
+        self,
+        area_config: AreaConfig,
+        data: MagicAreasData,
+    ) -> None:
+        """Register aggregate definitions for the snapshot's entities."""
         register_aggregate_definitions(
             group_registry=data.group_registry,
             area_id=area_config.id,
-            definitions=definitions,
+            definitions=_aggregate_definitions(data),
             owner_entry_id=area_config.hass_config.entry_id,
         )
-        return []
 
     def desired_managed_surfaces(
         self,
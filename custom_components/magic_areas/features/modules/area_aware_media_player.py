@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable
 from typing import TYPE_CHECKING
 
 from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import Entity
 
@@ -69,46 +71,7 @@ class AreaAwareMediaPlayerFeatureModule(BaseFeatureModule):
         if not (area_config.is_meta() and area_config.id == META_AREA_GLOBAL.lower()):
             return []
 
-        hass = coordinator.hass
-        entries = hass.config_entries.async_entries(DOMAIN)
-        areas_with_media_players: dict[str, AreaMediaData] = {}
-
-        for entry in entries:
-            if entry.domain != DOMAIN or not hasattr(entry, "runtime_data"):
-                continue
-
-            runtime_data = entry.runtime_data
-            snapshot = runtime_data.coordinator.data
-            if snapshot is None:  # pragma: no cover
-                _LOGGER.debug("Skipping area %s; no coordinator data", entry.entry_id)
-                continue
-
-            area_snapshot = snapshot.area_config
-            entities_by_domain = snapshot.entities
-
-            if area_snapshot.is_meta():
-                continue
-
-            if (
-                MagicAreasFeatures.AREA_AWARE_MEDIA_PLAYER
-                not in snapshot.enabled_features
-            ):
-                continue
-
-            if MEDIA_PLAYER_DOMAIN not in entities_by_domain:
-                continue
-
-            config = area_aware_media_player_config(snapshot.feature_configs)
-            notification_devices = config.notify_devices
-            if not notification_devices:
-                continue
-
-            areas_with_media_players[area_snapshot.id] = {
-                "entities_by_domain": entities_by_domain,
-                "notification_devices": notification_devices,
-                "notification_states": config.notify_states,
-            }
-
+        areas_with_media_players = _areas_with_media_players(coordinator.hass)
         if not areas_with_media_players:
             _LOGGER.debug(
                 "No areas with %s entities. Skipping creation of area-aware-media-player",
@@ -125,5 +88,70 @@ class AreaAwareMediaPlayerFeatureModule(BaseFeatureModule):
             AreaAwareMediaPlayer(area_config, coordinator, areas_with_media_players)
         ]
 
+    def platform_entity_inputs(
+        self,
+        area_config: AreaConfig,
+        coordinator: MagicAreasCoordinator,
+        data: MagicAreasData,
+    ) -> Hashable:
+        """Return the area media players the global player binds when added."""
+        del data
+        if not (area_config.is_meta() and area_config.id == META_AREA_GLOBAL.lower()):
+            return None
+        return frozenset(
+            (
+                area_id,
+                tuple(
+                    entity["entity_id"]
+                    for entity in area_data["entities_by_domain"][MEDIA_PLAYER_DOMAIN]
+                ),
+                tuple(area_data["notification_devices"]),
+            )
+            for area_id, area_data in _areas_with_media_players(
+                coordinator.hass
+            ).items()
+        )
+
+
+def _areas_with_media_players(hass: HomeAssistant) -> dict[str, AreaMediaData]:
+    """Collect regular areas whose media players feed the global player."""
+    entries = hass.config_entries.async_entries(DOMAIN)
+    areas_with_media_players: dict[str, AreaMediaData] = {}
+
+    for entry in entries:
+        if entry.domain != DOMAIN or not hasattr(entry, "runtime_data"):
+            continue
+
+        runtime_data = entry.runtime_data
+        snapshot = runtime_data.coordinator.data
+        if snapshot is None:  # pragma: no cover
+            _LOGGER.debug("Skipping area %s; no coordinator data", entry.entry_id)
+            continue
+
+        area_snapshot = snapshot.area_config
+        entities_by_domain = snapshot.entities
+
+        if area_snapshot.is_meta():
+            continue
+
+        if MagicAreasFeatures.AREA_AWARE_MEDIA_PLAYER not in snapshot.enabled_features:
+            continue
+
+        if MEDIA_PLAYER_DOMAIN not in entities_by_domain:
+            continue
+
+        config = area_aware_media_player_config(snapshot.feature_configs)
+        notification_devices = config.notify_devices
+        if not notification_devices:
+            continue
+
+        areas_with_media_players[area_snapshot.id] = {
+            "entities_by_domain": entities_by_domain,
+            "notification_devices": notification_devices,
+            "notification_states": config.notify_states,
+        }
+
+    return areas_with_media_players
+
 
 __all__ = ["AreaAwareMediaPlayerFeatureModule"]
@@ -34,6 +34,7 @@ from custom_components.magic_areas.features.config.readers import (
     COVER_GROUPS_ACCENT_STATES_KEY,
     COVER_GROUPS_ACTION_VALUES,
     COVER_GROUPS_AUTOMATION_DEVICE_CLASSES_KEY,
+    COVER_GROUPS_COMMAND_STAGGER_SECONDS_KEY,
     COVER_GROUPS_DAYLIGHT_ACTION_KEY,
     COVER_GROUPS_DAYLIGHT_STATES_KEY,
     COVER_GROUPS_DEFAULT_AUTOMATION_DEVICE_CLASSES,
@@ -78,6 +79,10 @@ COVER_GROUP_FEATURE_SCHEMA = schema_from_default_options(
             COVER_GROUPS_MANUAL_HOLD_SECONDS_KEY,
             vol.All(vol.Coerce(int), vol.Range(min=0)),
         ),
+        (
+            COVER_GROUPS_COMMAND_STAGGER_SECONDS_KEY,
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+        ),
         (COVER_GROUPS_DAYLIGHT_ACTION_KEY, vol.In(COVER_GROUPS_ACTION_VALUES)),
         (
             COVER_GROUPS_DAYLIGHT_STATES_KEY,
@@ -111,6 +116,17 @@ class CoverGroupsFeatureModule(BaseFeatureModule):
         data: MagicAreasData,
     ) -> list[Entity]:
         """Build entities for the cover groups feature."""
+        self.register_control_groups(area_config, data)
+        if area_config.is_meta():
+            return []
+        return [switch_platform.CoverControlSwitch(area_config, coordinator)]
+
+    def register_control_groups(
+        self,
+        area_config: AreaConfig,
+        data: MagicAreasData,
+    ) -> None:
+        """Register cover control-group definitions for the snapshot's covers."""
         definitions = [
             build_control_group_definition(
                 group_id=_cover_group_surface_unique_id(
@@ -133,9 +149,6 @@ class CoverGroupsFeatureModule(BaseFeatureModule):
             policy_id=str(ControlGroupPolicyId.COVER_GROUPS),
             group_registry=data.group_registry,
         )
-        if area_config.is_meta():
-            return []
-        return [switch_platform.CoverControlSwitch(area_config, coordinator)]
 
     def desired_managed_surfaces(
         self,
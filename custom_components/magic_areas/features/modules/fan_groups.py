@@ -76,6 +76,17 @@ class FanGroupsFeatureModule(BaseFeatureModule):
         data: MagicAreasData,
     ) -> list[Entity]:
         """Build entities for the fan groups feature."""
+        self.register_control_groups(area_config, data)
+        if area_config.is_meta():
+            return []
+        return [switch_platform.FanControlSwitch(area_config, coordinator)]
+
+    def register_control_groups(
+        self,
+        area_config: AreaConfig,
+        data: MagicAreasData,
+    ) -> None:
+        """Register the fan control-group definition for the snapshot's fans."""
         config = fan_groups_config(data.feature_configs)
         member_ids = [
             entity["entity_id"] for entity in data.entities.get(FAN_DOMAIN, [])
@@ -97,9 +108,6 @@ class FanGroupsFeatureModule(BaseFeatureModule):
             policy_id=str(ControlGroupPolicyId.FAN_GROUPS),
             group_registry=data.group_registry,
         )
-        if area_config.is_meta():
-            return []
-        return [switch_platform.FanControlSwitch(area_config, coordinator)]
 
     def desired_managed_surfaces(
         self,
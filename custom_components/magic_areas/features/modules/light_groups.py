@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable
 from typing import TYPE_CHECKING
 
 from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
@@ -80,36 +81,22 @@ class LightGroupsFeatureModule(BaseFeatureModule):
         data: MagicAreasData,
     ) -> list[Entity]:
         """Build entities for the light groups feature."""
-        light_entities = [e["entity_id"] for e in data.entities.get(LIGHT_DOMAIN, [])]
-        feature_config = light_groups_feature_config(data.feature_configs)
+        self.register_control_groups(area_config, data)
         light_groups: list[Entity] = []
-        registered_group_defs: list[ControlGroupDefinition] = []
 
         if LIGHT_DOMAIN not in data.entities:
             _LOGGER.debug(
                 "%s: No %s entities for area.", area_config.name, LIGHT_DOMAIN
             )
-        else:
-            if area_config.is_meta():
-                light_groups, registered_group_defs = self._build_meta_light_groups(
-                    area_config=area_config,
-                    coordinator=coordinator,
-                    light_entities=light_entities,
-                )
-            else:
-                light_groups, registered_group_defs = self._build_area_light_groups(
-                    area_config=area_config,
-                    coordinator=coordinator,
-                    light_entities=light_entities,
-                    feature_config=feature_config,
+        elif area_config.is_meta():
+            light_groups.append(
+                MagicLightGroup(
+                    area_config,
+                    coordinator,
+                    [e["entity_id"] for e in data.entities[LIGHT_DOMAIN]],
+                    translation_key=LightGroupCategory.ALL,
                 )
-
-        register_area_default_groups(
-            area_id=area_config.id,
-            definitions=registered_group_defs,
-            policy_id=LIGHT_GROUPS_POLICY_ID,
-            group_registry=data.group_registry,
-        )
+            )
 
         light_groups.extend(
             build_control_switch_entities(
@@ -125,6 +112,45 @@ class LightGroupsFeatureModule(BaseFeatureModule):
 
         return light_groups
 
+    def register_control_groups(
+        self,
+        area_config: AreaConfig,
+        data: MagicAreasData,
+    ) -> None:
+        """Register light control-group definitions for the snapshot's lights."""
+        definitions: list[ControlGroupDefinition] = []
+        if LIGHT_DOMAIN in data.entities:
+            light_entities = [e["entity_id"] for e in data.entities[LIGHT_DOMAIN]]
+            if not area_config.is_meta():
+                definitions = self._area_light_group_definitions(
+                    area_config=area_config,
+                    light_entities=light_entities,
+                    feature_config=light_groups_feature_config(data.feature_configs),
+                )
+            definitions.append(
+                _all_lights_group_definition(
+                    area_config=area_config, light_entities=light_entities
+                )
+            )
+
+        register_area_default_groups(
+            area_id=area_config.id,
+            definitions=definitions,
+            policy_id=LIGHT_GROUPS_POLICY_ID,
+            group_registry=data.group_registry,
+        )
+
+    def platform_entity_inputs(
+        self,
+        area_config: AreaConfig,
+        coordinator: MagicAreasCoordinator,
+        data: MagicAreasData,
+    ) -> Hashable:
+        """Return the members a meta light group binds when it is added."""
+        if not area_config.is_meta() or LIGHT_DOMAIN not in data.entities:
+            return None
+        return frozenset(e["entity_id"] for e in data.entities[LIGHT_DOMAIN])
+
     def desired_managed_surfaces(
         self,
         area_config: AreaConfig,
@@ -223,44 +249,13 @@ class LightGroupsFeatureModule(BaseFeatureModule):
                 configs.append(config)
         return configs
 
-    def _build_meta_light_groups(
+    def _area_light_group_definitions(
         self,
         *,
         area_config: AreaConfig,
-        coordinator: MagicAreasCoordinator,
-        light_entities: list[str],
-    ) -> tuple[list[Entity], list[ControlGroupDefinition]]:
-        groups: list[Entity] = [
-            MagicLightGroup(
-                area_config,
-                coordinator,
-                light_entities,
-                translation_key=LightGroupCategory.ALL,
-            )
-        ]
-        definitions = [
-            build_control_group_definition(
-                group_id=build_light_group_id(
-                    area_id=area_config.id, category=LightGroupCategory.ALL
-                ),
-                members=light_entities,
-                trigger_states=(),
-                policy_id=LIGHT_GROUPS_POLICY_ID,
-                feature_id=MagicAreasFeatures.LIGHT_GROUPS,
-                role=None,
-                metadata={GroupMetadataKey.CATEGORY: LightGroupCategory.ALL},
-            )
-        ]
-        return groups, definitions
-
-    def _build_area_light_groups(
-        self,
-        *,
-        area_config: AreaConfig,
-        coordinator: MagicAreasCoordinator,
         light_entities: list[str],
         feature_config: dict[str, object],
-    ) -> tuple[list[Entity], list[ControlGroupDefinition]]:
+    ) -> list[ControlGroupDefinition]:
         specs = [
             CategorizedGroupSpec(
                 category=preset.category,
@@ -274,40 +269,22 @@ class LightGroupsFeatureModule(BaseFeatureModule):
             for preset in LIGHT_GROUP_PRESETS
         ]
 
-        definitions: list[ControlGroupDefinition] = []
-        for spec in specs:
-            if not spec.members:
-                continue
-            definitions.append(
-                build_control_group_definition(
-                    group_id=build_light_group_id(
-                        area_id=area_config.id,
-                        category=spec.category,
-                    ),
-                    members=spec.members,
-                    trigger_states=spec.trigger_states,
-                    policy_id=LIGHT_GROUPS_POLICY_ID,
-                    feature_id=MagicAreasFeatures.LIGHT_GROUPS,
-                    role=None,
-                    metadata={GroupMetadataKey.CATEGORY: spec.category},
-                )
-            )
-
-        definitions.append(
+        return [
             build_control_group_definition(
                 group_id=build_light_group_id(
-                    area_id=area_config.id, category=LightGroupCategory.ALL
+                    area_id=area_config.id,
+                    category=spec.category,
                 ),
-                members=light_entities,
-                trigger_states=(),
+                members=spec.members,
+                trigger_states=spec.trigger_states,
                 policy_id=LIGHT_GROUPS_POLICY_ID,
                 feature_id=MagicAreasFeatures.LIGHT_GROUPS,
                 role=None,
-                metadata={GroupMetadataKey.CATEGORY: LightGroupCategory.ALL},
+                metadata={GroupMetadataKey.CATEGORY: spec.category},
             )
-        )
-
-        return [], definitions
+            for spec in specs
+            if spec.members
+        ]
 
     def build_runtime_controllers(
         self,
@@ -361,6 +338,25 @@ class LightGroupsFeatureModule(BaseFeatureModule):
         return controllers
 
 
+def _all_lights_group_definition(
+    *,
+    area_config: AreaConfig,
+    light_entities: list[str],
+) -> ControlGroupDefinition:
+    """Build the control-group definition for all of an area's lights."""
+    return build_control_group_definition(
+        group_id=build_light_group_id(
+            area_id=area_config.id, category=LightGroupCategory.ALL
+        ),
+        members=light_entities,
+        trigger_states=(),
+        policy_id=LIGHT_GROUPS_POLICY_ID,
+        feature_id=MagicAreasFeatures.LIGHT_GROUPS,
+        role=None,
+        metadata={GroupMetadataKey.CATEGORY: LightGroupCategory.ALL},
+    )
+
+
 def _light_group_surface_unique_id(
     *,
     area_config: AreaConfig,
@@ -51,6 +51,17 @@ class MediaPlayerGroupsFeatureModule(BaseFeatureModule):
         data: MagicAreasData,
     ) -> list[Entity]:
         """Build entities for the media player groups feature."""
+        self.register_control_groups(area_config, data)
+        if area_config.is_meta():
+            return []
+        return [switch_platform.MediaPlayerControlSwitch(area_config, coordinator)]
+
+    def register_control_groups(
+        self,
+        area_config: AreaConfig,
+        data: MagicAreasData,
+    ) -> None:
+        """Register the media player control-group definition for the snapshot."""
         member_ids = [
             entity["entity_id"] for entity in data.entities.get(MEDIA_PLAYER_DOMAIN, [])
         ]
@@ -71,9 +82,6 @@ class MediaPlayerGroupsFeatureModule(BaseFeatureModule):
             policy_id=str(ControlGroupPolicyId.MEDIA_PLAYER_GROUPS),
             group_registry=data.group_registry,
         )
-        if area_config.is_meta():
-            return []
-        return [switch_platform.MediaPlayerControlSwitch(area_config, coordinator)]
 
     def desired_managed_surfaces(
         self,
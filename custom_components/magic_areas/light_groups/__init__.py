@@ -6,6 +6,10 @@ from custom_components.magic_areas.light_groups.entities import (
 from custom_components.magic_areas.light_groups.controller import (
     LightGroupRuntimeController,
 )
+from custom_components.magic_areas.light_groups.decision_table import (
+    LightDecisionTable,
+    build_light_decision_table,
+)
 from custom_components.magic_areas.light_groups.identity import (
     LIGHT_GROUP_ROLE_LABELS,
     build_light_group_helper_surface_unique_id,
@@ -134,6 +138,7 @@ __all__ = [
     "CONF_TASK_LIGHTS_ACT_ON",
     "CONF_TASK_LIGHTS_STATES",
     "ActOnMode",
+    "LightDecisionTable",
     "LIGHT_GROUP_BRIGHTNESS_MODE_ADAPTIVE",
     "LIGHT_GROUP_BRIGHTNESS_MODE_ADVISORY",
     "LIGHT_GROUP_BRIGHTNESS_MODE_INHIBIT",
@@ -185,6 +190,7 @@ __all__ = [
     "LightGroupRuntimeController",
     "MagicLightGroup",
     "build_light_group_helper_surface_unique_id",
+    "build_light_decision_table",
     "process_secondary_group_state_change",
     "schedule_adaptive_lighting_manual_restore",
     "schedule_adaptive_lighting_state_coordination",
@@ -15,9 +15,12 @@ from homeassistant.helpers.event import EventStateChangedData
 from custom_components.magic_areas.core.control_intents import (
     AdaptiveLightingSwitchSet,
     ControlTargetSource,
-    resolve_role_target,
+    async_get_role_target_cache,
+)
+from custom_components.magic_areas.core.controls import (
+    async_get_command_context_index,
+    execute_control_group_decision,
 )
-from custom_components.magic_areas.core.controls import execute_control_group_decision
 from custom_components.magic_areas.core.listener_registry import ListenerRegistry
 from custom_components.magic_areas.core.managed_surface_registry import (
     resolve_managed_surface_entity_id,
@@ -253,6 +256,14 @@ class LightGroupRuntimeController:
         """Remove runtime listeners."""
         self._listener_registry.cleanup()
 
+    def diagnostics(self) -> dict[str, object]:
+        """Return runtime diagnostics for config-entry diagnostics."""
+        return {
+            "runtime": self.unique_id,
+            "category": str(self.category),
+            "decision_table": self.policy.policy.decision_table.diagnostics(),
+        }
+
     async def _setup_listeners(self) -> None:
         """Set up listeners for area/native-helper state changes."""
         from custom_components.magic_areas.light_groups.runtime import setup_listeners
@@ -288,10 +299,16 @@ class LightGroupRuntimeController:
     ) -> None:
         """Dispatch canonical light action through shared control execution."""
         target_entity_ids = target_entity_ids or (self._control_target_entity_id(),)
+        context = async_get_command_context_index(self.hass).issue(
+            area_id=self._area_id,
+            controller=self.unique_id,
+            action=str(action),
+        )
         self.hass.async_create_task(
             execute_control_group_decision(
                 self.hass,
                 light_action_to_control_group(action, target_entity_ids),
+                context=context,
             )
         )
 
@@ -328,7 +345,7 @@ class LightGroupRuntimeController:
             preset,
             available_entities=list(self._entity_ids),
         )
-        target = resolve_role_target(
+        target = async_get_role_target_cache(self.hass).resolve(
             self.hass,
             area_id=self._area_id,
             domain=LIGHT_DOMAIN,
@@ -0,0 +1,166 @@
+"""Compiled light-group decision table keyed by discrete policy inputs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from custom_components.magic_areas.area_state import AreaStates
+from custom_components.magic_areas.core.state_priority import LIGHT_PRIORITY_STATES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from custom_components.magic_areas.light_groups.policy import (
+        LightAction,
+        LightGroupDecision,
+    )
+
+LIGHT_DECISION_TABLE_MAX_ENTRIES = 1024
+
+# Area states the light policy branches on regardless of group assignment.
+_POLICY_AREA_STATES: frozenset[str] = frozenset(
+    {
+        AreaStates.CLEAR,
+        AreaStates.OCCUPIED,
+        AreaStates.SLEEP,
+        AreaStates.ACCENT,
+        AreaStates.BRIGHT,
+        AreaStates.DARK,
+        *LIGHT_PRIORITY_STATES,
+    }
+)
+
+type LightDecisionKey = tuple[
+    frozenset[str],
+    bool,
+    frozenset[str],
+    bool,
+    frozenset[str],
+    bool,
+    bool,
+    bool | None,
+    bool,
+    bool,
+    bool,
+]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledLightDecision:
+    """Immutable table entry for one light policy outcome."""
+
+    action: LightAction
+    reason: str
+    should_track_control: bool
+    reset_control: bool
+
+
+@dataclass(slots=True)
+class LightDecisionTable:
+    """Per-configuration map from projected policy inputs to decisions.
+
+    The key keeps only the area states the policy can branch on (its fixed
+    states plus the group's assigned states) and the guard booleans, so two
+    inputs with the same key always produce the same decision. Entries are
+    compiled from the full evaluator the first time a key is seen; once the
+    table is full, new keys fall back to the full evaluator uncached.
+    """
+
+    relevant_states: frozenset[str]
+    max_entries: int = LIGHT_DECISION_TABLE_MAX_ENTRIES
+    hits: int = 0
+    compiled: int = 0
+    fallbacks: int = 0
+    _entries: dict[LightDecisionKey, CompiledLightDecision] = field(
+        default_factory=dict
+    )
+
+    def key(
+        self,
+        new_states: Sequence[str],
+        lost_states: Sequence[str],
+        current_states: Iterable[str],
+        *,
+        bright_dwell_met: bool,
+        min_on_met: bool,
+        inside_bright_met: bool | None,
+        outside_context_ok: bool,
+        attribution_hold_met: bool,
+        ambient_rise_met: bool,
+    ) -> LightDecisionKey:
+        """Project evaluation inputs onto the discrete table key."""
+        relevant = self.relevant_states
+        return (
+            frozenset(state for state in new_states if state in relevant),
+            bool(new_states),
+            frozenset(state for state in lost_states if state in relevant),
+            bool(lost_states),
+            frozenset(state for state in current_states if state in relevant),
+            bright_dwell_met,
+            min_on_met,
+            inside_bright_met,
+            outside_context_ok,
+            attribution_hold_met,
+            ambient_rise_met,
+        )
+
+    def lookup(self, key: LightDecisionKey) -> CompiledLightDecision | None:
+        """Return the compiled decision for a key, counting hits."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def record(self, key: LightDecisionKey, decision: LightGroupDecision) -> bool:
+        """Compile a full-evaluator decision; return False when the table is full."""
+        if len(self._entries) >= max(0, self.max_entries):
+            self.fallbacks += 1
+            return False
+        self._entries[key] = CompiledLightDecision(
+            action=decision.action,
+            reason=decision.reason,
+            should_track_control=decision.should_track_control,
+            reset_control=decision.reset_control,
+        )
+        self.compiled += 1
+        return True
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return table size and hit/fallback counters."""
+        evaluations = self.hits + self.compiled + self.fallbacks
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evaluations": evaluations,
+            "hits": self.hits,
+            "compiled": self.compiled,
+            "fallbacks": self.fallbacks,
+            "fallback_rate": (
+                round(self.fallbacks / evaluations, 4) if evaluations else 0.0
+            ),
+        }
+
+    def __len__(self) -> int:
+        """Return the number of compiled entries."""
+        return len(self._entries)
+
+
+def build_light_decision_table(
+    assigned_states: Iterable[str],
+    *,
+    max_entries: int = LIGHT_DECISION_TABLE_MAX_ENTRIES,
+) -> LightDecisionTable:
+    """Build an empty decision table for one light-group configuration."""
+    return LightDecisionTable(
+        relevant_states=_POLICY_AREA_STATES | frozenset(assigned_states),
+        max_entries=max_entries,
+    )
+
+
+__all__ = [
+    "CompiledLightDecision",
+    "LIGHT_DECISION_TABLE_MAX_ENTRIES",
+    "LightDecisionKey",
+    "LightDecisionTable",
+    "build_light_decision_table",
+]
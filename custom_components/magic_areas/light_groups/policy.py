@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from collections.abc import Mapping
 
@@ -25,6 +25,10 @@ from custom_components.magic_areas.core.controls import (
     ControlRuntimeEffectType,
 )
 from custom_components.magic_areas.area_state import AreaStates
+from custom_components.magic_areas.light_groups.decision_table import (
+    LightDecisionTable,
+    build_light_decision_table,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -125,6 +129,11 @@ class LightGroupPolicy:
     ambient_rise_window_seconds: int = 120
     ambient_rise_min_delta: int = 20
     use_priority_filtering: bool = True
+    decision_table: LightDecisionTable = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the decision table for this configuration."""
+        self.decision_table = build_light_decision_table(self.assigned_states)
 
     @staticmethod
     def _decision(
@@ -144,7 +153,55 @@ class LightGroupPolicy:
             next_control_state=next_control_state,
         )
 
-    def evaluate(  # noqa: C901
+    def evaluate(
+        self,
+        new_states: Sequence[str],
+        lost_states: Sequence[str],
+        current_states: Sequence[str],
+        *,
+        bright_dwell_met: bool = True,
+        min_on_met: bool = True,
+        inside_bright_met: bool | None = None,
+        outside_context_ok: bool = True,
+        attribution_hold_met: bool = True,
+        ambient_rise_met: bool = True,
+    ) -> LightGroupDecision:
+        """Evaluate a secondary-group light action via the compiled table."""
+        table = self.decision_table
+        key = table.key(
+            new_states,
+            lost_states,
+            current_states,
+            bright_dwell_met=bright_dwell_met,
+            min_on_met=min_on_met,
+            inside_bright_met=inside_bright_met,
+            outside_context_ok=outside_context_ok,
+            attribution_hold_met=attribution_hold_met,
+            ambient_rise_met=ambient_rise_met,
+        )
+        compiled = table.lookup(key)
+        if compiled is not None:
+            return self._decision(
+                compiled.action,
+                compiled.reason,
+                should_track_control=compiled.should_track_control,
+                reset_control=compiled.reset_control,
+            )
+        decision = self.evaluate_uncompiled(
+            new_states,
+            lost_states,
+            current_states,
+            bright_dwell_met=bright_dwell_met,
+            min_on_met=min_on_met,
+            inside_bright_met=inside_bright_met,
+            outside_context_ok=outside_context_ok,
+            attribution_hold_met=attribution_hold_met,
+            ambient_rise_met=ambient_rise_met,
+        )
+        table.record(key, decision)
+        return decision
+
+    def evaluate_uncompiled(  # noqa: C901
         self,
         new_states: Sequence[str],
         lost_states: Sequence[str],
@@ -157,7 +214,7 @@ class LightGroupPolicy:
         attribution_hold_met: bool = True,
         ambient_rise_met: bool = True,
     ) -> LightGroupDecision:
-        """Evaluate a secondary-group light action from area state transitions."""
+        """Evaluate a secondary-group light action with the full rule engine."""
         current_state_set = set(current_states)
 
         if AreaStates.CLEAR in new_states:
@@ -26,6 +26,7 @@ from custom_components.magic_areas.core.controls import (
     ControlRuntimeEffect,
     ControlRuntimeEffectType,
     evaluate_and_execute_control_group_policy_sync,
+    event_is_self_caused,
     execute_control_group_runtime_effects,
     read_area_presence_states,
     register_area_and_group_state_listeners,
@@ -505,6 +506,9 @@ def handle_group_state_change(
         return False
 
     origin_event = event.context.origin_event
+    self_caused = event_is_self_caused(
+        host.hass, event, controller=getattr(host, "unique_id", None)
+    )
     if host.category != LightGroupCategory.ALL:
         if _is_origin_light_attribute_change(origin_event):
             host._last_control_activity_monotonic = monotonic()
@@ -521,7 +525,9 @@ def handle_group_state_change(
             host.category != LightGroupCategory.ALL
             and _origin_new_state(origin_event) == STATE_ON
         ):
-            if not process_secondary_group_state_change(host, origin_event):
+            if not process_secondary_group_state_change(
+                host, origin_event, self_caused=self_caused
+            ):
                 return False
         else:
             host._reset_control_state()
@@ -536,7 +542,9 @@ def handle_group_state_change(
             )
             host._set_echo_state(host._echo_state.set_controlling(controlling))
     else:
-        if not process_secondary_group_state_change(host, origin_event):
+        if not process_secondary_group_state_change(
+            host, origin_event, self_caused=self_caused
+        ):
             return False
 
     host._attr_extra_state_attributes["controlling"] = host.controlling
@@ -628,12 +636,20 @@ def _current_area_states_for_group_event(host: _LightGroupHost) -> list[str]:
 
 
 def process_secondary_group_state_change(
-    host: _LightGroupHost, origin_event: object | None
+    host: _LightGroupHost,
+    origin_event: object | None,
+    *,
+    self_caused: bool = False,
 ) -> bool:
-    """Validate and apply secondary group-state change handling."""
+    """Validate and apply secondary group-state change handling.
+
+    ``self_caused`` is the context-index classification of the event; the
+    pending-echo flag remains the fallback for events whose context Home
+    Assistant no longer attributes to our service call.
+    """
     if not is_valid_origin_state_toggle(origin_event):
         return False
-    if host._echo_state.awaiting_echo:
+    if self_caused or host._echo_state.awaiting_echo:
         host.logger.debug("%s: Group controlled by us.", host.name)
         host._set_echo_state(host._echo_state.command_completed())
     else:
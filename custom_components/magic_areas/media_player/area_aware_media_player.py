@@ -11,14 +11,19 @@ from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_TYPE,
     DOMAIN as MEDIA_PLAYER_DOMAIN,
     MediaPlayerState,
-    SERVICE_PLAY_MEDIA,
     MediaPlayerEntityFeature,
 )
-from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
+from homeassistant.const import STATE_ON
+from homeassistant.core import Event, EventStateChangedData, State, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
 
 from custom_components.magic_areas.entity import MagicEntity
-from custom_components.magic_areas.const import DOMAIN as MA_DOMAIN
+from custom_components.magic_areas.const import ATTR_STATES, DOMAIN as MA_DOMAIN
+from custom_components.magic_areas.core.announcements import (
+    async_get_announcement_dispatcher,
+)
+from custom_components.magic_areas.core.listener_registry import ListenerRegistry
 from custom_components.magic_areas.core.runtime_model import (
     build_presence_tracking_unique_id,
 )
@@ -43,6 +48,15 @@ class AreaMediaData(TypedDict):
     notification_states: list[str]
 
 
+def _area_state_routable(state: State, notification_states: list[str]) -> bool:
+    """Return whether an area presence sensor state accepts routed media."""
+    return evaluate_area_routing(
+        is_occupied=state.state == STATE_ON,
+        area_states=state.attributes.get(ATTR_STATES, []),
+        notification_states=notification_states,
+    )
+
+
 class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
     """Area-aware media player."""
 
@@ -63,13 +77,22 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
 
         self.areas_data = areas_data
         self._tracked_entities: list[str] = []
+        self._listener_registry = ListenerRegistry(logger_name=type(self).__module__)
 
-        for _area_id, area_data in self.areas_data.items():
+        # Routing index: area -> notification players is fixed per snapshot;
+        # the routable set follows area presence sensor transitions.
+        self._area_players: dict[str, tuple[str, ...]] = {}
+        self._area_sensors: dict[str, str] = {}
+        self._sensor_areas: dict[str, str] = {}
+        self._routable_areas: set[str] = set()
+
+        for area_id, area_data in self.areas_data.items():
             entity_list = self.get_media_players_for_area(
                 area_data["entities_by_domain"],
                 area_data["notification_devices"],
             )
             if entity_list:
+                self._area_players[area_id] = tuple(sorted(entity_list))
                 self._tracked_entities.extend(entity_list)
 
         _LOGGER.debug("AreaAwareMediaPlayer loaded.")
@@ -84,11 +107,11 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
 
     def update_attributes(self) -> None:
         """Update entity attributes."""
-        area_sensors = []
-        for area_id in self.areas_data:
-            area_sensor = self._resolve_area_state_sensor(area_id)
-            if area_sensor:
-                area_sensors.append(area_sensor)
+        area_sensors = [
+            self._area_sensors[area_id]
+            for area_id in self.areas_data
+            if area_id in self._area_sensors
+        ]
         self._attr_extra_state_attributes["areas"] = area_sensors
         self._attr_extra_state_attributes["entity_id"] = self._tracked_entities
 
@@ -126,8 +149,53 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
         else:
             self._state = MediaPlayerState.IDLE
 
+        self._index_area_sensors()
         self.set_state()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove area presence listeners."""
+        self._listener_registry.cleanup()
+        await super().async_will_remove_from_hass()
+
+    def _index_area_sensors(self) -> None:
+        """Resolve not-yet-indexed area sensors and start following them.
+
+        Each newly resolved sensor seeds the routable set from its current
+        state and is tracked so later transitions update the set in place.
+        """
+        for area_id in self.areas_data:
+            if area_id in self._area_sensors:
+                continue
+            sensor = self._resolve_area_state_sensor(area_id)
+            if not sensor:
+                continue
+            self._area_sensors[area_id] = sensor
+            self._sensor_areas[sensor] = area_id
+            self._set_area_routable(area_id, self.hass.states.get(sensor))
+            self._listener_registry.track(
+                f"area_state_change_{area_id}",
+                async_track_state_change_event(
+                    self.hass, sensor, self._area_state_changed
+                ),
+            )
+
+    def _set_area_routable(self, area_id: str, state: State | None) -> None:
+        """Add or remove one area from the routable set."""
+        notification_states = self.areas_data[area_id].get(
+            "notification_states", DEFAULT_NOTIFY_STATES
+        )
+        if state is not None and _area_state_routable(state, notification_states):
+            self._routable_areas.add(area_id)
+        else:
+            self._routable_areas.discard(area_id)
+
+    @callback
+    def _area_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the routable set from an area presence transition."""
+        area_id = self._sensor_areas.get(event.data["entity_id"])
+        if area_id is not None:
+            self._set_area_routable(area_id, event.data["new_state"])
+
     @property
     def state(self) -> MediaPlayerState | None:
         """Return the state of the media player."""
@@ -141,53 +209,6 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
             | MediaPlayerEntityFeature.MEDIA_ANNOUNCE
         )
 
-    def get_active_areas(self) -> list[str]:
-        """Return area IDs that are occupied and should receive media."""
-        from custom_components.magic_areas.const import ATTR_STATES
-
-        active_area_ids = []
-
-        # Iterate through area_data keys to get list of area IDs
-        for area_id in self.areas_data:
-            area_data = self.areas_data[area_id]
-            area_binary_sensor_name = self._resolve_area_state_sensor(area_id)
-
-            if not area_binary_sensor_name:
-                _LOGGER.debug(
-                    "%s: Area state sensor not resolved for area %s, skipping",
-                    self.name,
-                    area_id,
-                )
-                continue
-
-            area_binary_sensor_state = self.hass.states.get(area_binary_sensor_name)
-            if not area_binary_sensor_state:
-                _LOGGER.debug(
-                    "%s: Area state sensor '%s' not found",
-                    self.name,
-                    area_binary_sensor_name,
-                )
-                continue
-
-            is_occupied = area_binary_sensor_state.state == STATE_ON
-
-            # Get area states from the presence sensor attributes (ATTR_STATES = "states")
-            area_states = area_binary_sensor_state.attributes.get(ATTR_STATES, [])
-
-            # Use notification states from area's feature config
-            notification_states = area_data.get(
-                "notification_states", DEFAULT_NOTIFY_STATES
-            )
-
-            if evaluate_area_routing(
-                is_occupied=is_occupied,
-                area_states=area_states,
-                notification_states=notification_states,
-            ):
-                active_area_ids.append(area_id)
-
-        return active_area_ids
-
     def update_state(self) -> None:
         """Update entity state and attributes."""
         self.update_attributes()
@@ -204,23 +225,23 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
     ) -> None:
         """Forward a piece of media to media players in active areas."""
 
-        # Read active areas
-        active_areas = self.get_active_areas()
+        # Pick up area sensors registered after this entity was added
+        if len(self._area_sensors) < len(self.areas_data):
+            self._index_area_sensors()
 
         # Fail early
-        if not active_areas:
+        if not self._routable_areas:
             _LOGGER.debug("No areas active. Ignoring.")
             return
 
         # Gather media_player entities
-        media_players: list[str] = []
-        for area_id in active_areas:
-            area_data = self.areas_data[area_id]
-            media_players.extend(
-                self.get_media_players_for_area(
-                    area_data["entities_by_domain"], area_data["notification_devices"]
-                )
-            )
+        media_players = sorted(
+            {
+                player
+                for area_id in self._routable_areas
+                for player in self._area_players.get(area_id, ())
+            }
+        )
 
         if not media_players:
             _LOGGER.debug(
@@ -231,11 +252,9 @@ class AreaAwareMediaPlayer(MagicEntity, MediaPlayerEntity):
         data: dict[str, object] = {
             ATTR_MEDIA_CONTENT_ID: media_id,
             ATTR_MEDIA_CONTENT_TYPE: media_type,
-            ATTR_ENTITY_ID: media_players,
         }
         if kwargs:
             data.update(kwargs)
 
-        await self.hass.services.async_call(
-            MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA, data
-        )
+        # Slow speakers must not hold up the service call that triggered this.
+        async_get_announcement_dispatcher(self.hass).async_announce(media_players, data)
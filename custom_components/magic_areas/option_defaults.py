@@ -16,6 +16,7 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_COVER_GROUPS_ACCENT_ACTION,
     CONF_COVER_GROUPS_ACCENT_STATES,
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES,
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS,
     CONF_COVER_GROUPS_DAYLIGHT_ACTION,
     CONF_COVER_GROUPS_DAYLIGHT_STATES,
     CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS,
@@ -113,6 +114,7 @@ FEATURE_OPTION_DEFAULTS: dict[MagicAreasFeatures, FeatureOptionDefaults] = {
             DEFAULT_COVER_AUTOMATION_DEVICE_CLASSES
         ),
         CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS: 900,
+        CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS: 0,
         CONF_COVER_GROUPS_DAYLIGHT_ACTION: DEFAULT_COVER_PRESETS[
             CoverPresetRole.DAYLIGHT
         ].action.value,
@@ -3,6 +3,7 @@
 from custom_components.magic_areas.schemas.area import (
     META_AREA_SCHEMA,
     DOMAIN_SCHEMA,
+    GLOBAL_META_AREA_BASIC_OPTIONS_SCHEMA,
     META_AREA_BASIC_OPTIONS_SCHEMA,
     META_AREA_PRESENCE_TRACKING_OPTIONS_SCHEMA,
     META_AREA_SECONDARY_STATES_SCHEMA,
@@ -39,6 +40,7 @@ __all__ = [
     "DOMAIN_SCHEMA",
     "InvalidEntityError",
     "META_AREA_SCHEMA",
+    "GLOBAL_META_AREA_BASIC_OPTIONS_SCHEMA",
     "META_AREA_BASIC_OPTIONS_SCHEMA",
     "META_AREA_PRESENCE_TRACKING_OPTIONS_SCHEMA",
     "META_AREA_SECONDARY_STATES_SCHEMA",
@@ -34,7 +34,9 @@ from custom_components.magic_areas.config_keys.area import (
 )
 from custom_components.magic_areas.config_keys.area import (
     CONF_IGNORE_DIAGNOSTIC_ENTITIES,
+    CONF_RELOAD_MAX_CONCURRENCY,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
+    CONF_VERBOSE_CONTROL_DIAGNOSTICS,
 )
 from custom_components.magic_areas.schemas.control_groups import (
     CUSTOM_CONTROL_GROUPS_SCHEMA,
@@ -48,8 +50,10 @@ from custom_components.magic_areas.defaults import (
     DEFAULT_PRESENCE_DEVICE_PLATFORMS,
     DEFAULT_CLEAR_TIMEOUT,
     DEFAULT_CLEAR_TIMEOUT_META,
+    DEFAULT_RELOAD_MAX_CONCURRENCY,
     DEFAULT_RELOAD_ON_REGISTRY_CHANGE,
     DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES,
+    DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS,
 )
 from custom_components.magic_areas.defaults import DEFAULT_PRESENCE_DEVICE_SENSOR_CLASS
 from custom_components.magic_areas.schemas.features import FEATURES_SCHEMA
@@ -111,6 +115,10 @@ REGULAR_AREA_BASIC_OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_IGNORE_DIAGNOSTIC_ENTITIES, default=DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
         ): cv.boolean,
+        vol.Optional(
+            CONF_VERBOSE_CONTROL_DIAGNOSTICS,
+            default=DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS,
+        ): cv.boolean,
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -127,6 +135,14 @@ META_AREA_BASIC_OPTIONS_SCHEMA = vol.Schema(
     extra=vol.REMOVE_EXTRA,
 )
 
+GLOBAL_META_AREA_BASIC_OPTIONS_SCHEMA = META_AREA_BASIC_OPTIONS_SCHEMA.extend(
+    {
+        vol.Optional(
+            CONF_RELOAD_MAX_CONCURRENCY, default=DEFAULT_RELOAD_MAX_CONCURRENCY
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
 
 # Presence Tracking Schema
 REGULAR_AREA_PRESENCE_TRACKING_OPTIONS_SCHEMA = vol.Schema(
@@ -170,6 +186,10 @@ REGULAR_AREA_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_IGNORE_DIAGNOSTIC_ENTITIES, default=DEFAULT_IGNORE_DIAGNOSTIC_ENTITIES
         ): cv.boolean,
+        vol.Optional(
+            CONF_VERBOSE_CONTROL_DIAGNOSTICS,
+            default=DEFAULT_VERBOSE_CONTROL_DIAGNOSTICS,
+        ): cv.boolean,
         vol.Optional(CONF_KEEP_ONLY_ENTITIES, default=[]): cv.entity_ids,
         vol.Optional(
             CONF_PRESENCE_DEVICE_PLATFORMS, default=DEFAULT_PRESENCE_DEVICE_PLATFORMS
@@ -201,6 +221,9 @@ META_AREA_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_RELOAD_ON_REGISTRY_CHANGE, default=DEFAULT_RELOAD_ON_REGISTRY_CHANGE
         ): cv.boolean,
+        vol.Optional(CONF_RELOAD_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(
             CONF_CLEAR_TIMEOUT, default=DEFAULT_CLEAR_TIMEOUT_META
         ): cv.positive_int,
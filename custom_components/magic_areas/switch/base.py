@@ -1,7 +1,8 @@
 """Base classes for switch."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from logging import Logger
+from time import monotonic
 from typing import TYPE_CHECKING
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
@@ -15,11 +16,16 @@ from homeassistant.helpers.event import async_track_state_change_event
 from custom_components.magic_areas.entity import MagicEntity
 from custom_components.magic_areas.const import ONE_MINUTE
 from custom_components.magic_areas.core.controls import (
+    ControlActionType,
+    async_get_command_context_index,
+    async_get_control_evaluation_log,
     evaluate_and_execute_control_group_policy,
     execute_control_group_decision,
+    merged_extra_state_attributes,
     resolve_group_entity_id_by_metadata,
     resolve_group_member_entity_id_by_metadata,
 )
+from custom_components.magic_areas.core.config import verbose_control_diagnostics
 from custom_components.magic_areas.core.runtime_model import GroupMetadataKey, GroupRole
 from custom_components.magic_areas.core.runtime_model import (
     build_presence_tracking_unique_id,
@@ -28,7 +34,7 @@ from custom_components.magic_areas.core.listener_registry import ListenerRegistr
 from custom_components.magic_areas.enums import MagicAreasEvents
 
 if TYPE_CHECKING:
-    from homeassistant.core import Event, EventStateChangedData
+    from homeassistant.core import Context, Event, EventStateChangedData
     from homeassistant.helpers.entity_registry import EntityRegistry
 
     from custom_components.magic_areas.core.runtime_model import AreaConfig
@@ -145,6 +151,9 @@ class ControlSwitchBase(SwitchBase):
     """Base class for control switches that react to area state changes."""
 
     _listener_registry: ListenerRegistry
+    _verbose_diagnostics: bool
+    _published_debug_attributes: dict[str, object] | None
+    _debug_attributes_published_at: float
 
     def __init__(
         self, area_config: "AreaConfig", coordinator: "MagicAreasCoordinator"
@@ -152,6 +161,54 @@ class ControlSwitchBase(SwitchBase):
         """Initialize control switch scaffolding."""
         super().__init__(area_config, coordinator)
         self._listener_registry = ListenerRegistry(logger_name=type(self).__module__)
+        self._verbose_diagnostics = verbose_control_diagnostics(area_config.config)
+        self._published_debug_attributes = None
+        self._debug_attributes_published_at = 0.0
+
+    def _publish_debug_attributes(
+        self,
+        controller: str,
+        details: dict[str, object],
+        *,
+        volatile: Collection[str] = (),
+        volatile_interval: float | None = None,
+    ) -> bool:
+        """Publish evaluation details and return whether the entity changed.
+
+        Details are merged into the state attributes only when they differ
+        from the last published ones. Keys in ``volatile`` (counters,
+        latencies) are left out of that comparison; they refresh when another
+        detail changes or, with ``volatile_interval``, at most once per that
+        many seconds. With verbose control diagnostics the details
+        go to the control evaluation log instead, and any copies left on the
+        entity are removed once.
+        """
+        log = async_get_control_evaluation_log(self.hass)
+        current = getattr(self, "_attr_extra_state_attributes", None) or {}
+        if self._verbose_diagnostics:
+            log.log(self._area_id, controller, details)
+            if not any(key in current for key in details):
+                return False
+            self._attr_extra_state_attributes = {
+                key: value for key, value in current.items() if key not in details
+            }
+            return True
+        stable = {key: value for key, value in details.items() if key not in volatile}
+        now = monotonic()
+        if stable == self._published_debug_attributes and not (
+            volatile_interval is not None
+            and now - self._debug_attributes_published_at >= volatile_interval
+            and any(current.get(key) != details.get(key) for key in volatile)
+        ):
+            log.unchanged(self._area_id)
+            return False
+        self._published_debug_attributes = stable
+        self._debug_attributes_published_at = now
+        self._attr_extra_state_attributes = merged_extra_state_attributes(
+            current, details
+        )
+        log.published(self._area_id)
+        return True
 
     def _track_area_state_dispatcher(self, handler: AreaStateEventHandler) -> None:
         """Track area-state dispatcher listener."""
@@ -224,8 +281,21 @@ class ControlSwitchBase(SwitchBase):
     async def _execute_decision(
         self, decision: "ControlGroupDecision", *, blocking: bool = False
     ) -> None:
-        """Execute a control-group decision."""
-        await execute_control_group_decision(self.hass, decision, blocking=blocking)
+        """Execute a control-group decision under a Magic Areas-issued context."""
+        context = None
+        if decision.action_type != ControlActionType.NOOP and decision.actions:
+            context = self._issue_command_context(str(decision.action_type))
+        await execute_control_group_decision(
+            self.hass, decision, blocking=blocking, context=context
+        )
+
+    def _issue_command_context(self, action: str) -> "Context":
+        """Create a context that marks resulting state changes as self-caused."""
+        return async_get_command_context_index(self.hass).issue(
+            area_id=self._area_id,
+            controller=str(self.unique_id),
+            action=action,
+        )
 
     async def _evaluate_policy(
         self,
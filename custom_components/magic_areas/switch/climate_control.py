@@ -1,15 +1,22 @@
 """Climate control feature switch."""
 
+import asyncio
+from dataclasses import dataclass
+from functools import partial
 import logging
+from time import monotonic
 from typing import TYPE_CHECKING
 
-from homeassistant.const import EntityCategory, STATE_OFF, STATE_ON
-from homeassistant.core import Event, callback
+from homeassistant.components.climate.const import ATTR_PRESET_MODE
+from homeassistant.const import ATTR_ENTITY_ID, EntityCategory, STATE_OFF, STATE_ON
+from homeassistant.core import Context, Event, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import EventStateChangedData
 
 if TYPE_CHECKING:
     from custom_components.magic_areas.core.runtime_model import AreaConfig
     from custom_components.magic_areas.coordinator import MagicAreasCoordinator
+    from custom_components.magic_areas.core.controls import ControlGroupDecision
 from custom_components.magic_areas.core.controls.policies.climate import (
     build_climate_control_group_policy,
     build_preset_policy,
@@ -20,9 +27,14 @@ from custom_components.magic_areas.core.controls.policies.climate import (
 from custom_components.magic_areas.features.config.readers import (
     climate_control_config,
 )
-from custom_components.magic_areas.core.controls import ControlGroupContext
+from custom_components.magic_areas.core.controls import (
+    ControlAction,
+    ControlActionType,
+    ControlGroupContext,
+)
 from custom_components.magic_areas.core.runtime_model import ControlGroupPolicyId
 from custom_components.magic_areas.area_state import AreaStates
+from custom_components.magic_areas.const import DOMAIN
 from custom_components.magic_areas.enums import MagicAreasFeatures
 from custom_components.magic_areas.switch.base import ControlSwitchBase
 
@@ -34,6 +46,35 @@ _EXPECTED_CONTROL_ERRORS = (
     AttributeError,
     RuntimeError,
 )
+_EXPECTED_PRESET_CALL_ERRORS = (HomeAssistantError, *_EXPECTED_CONTROL_ERRORS)
+
+CLIMATE_PRESET_CALL_TIMEOUT = 10.0
+CLIMATE_PRESET_STATS_INTERVAL = 60.0
+
+# Preset attributes that change on nearly every call. They refresh when a
+# stable attribute changes, or at most once per CLIMATE_PRESET_STATS_INTERVAL,
+# so they do not force a state write on every call.
+_VOLATILE_PRESET_ATTRIBUTES = (
+    "preset_calls_applied",
+    "preset_calls_skipped_current",
+    "preset_calls_skipped_in_flight",
+    "preset_call_last_seconds",
+    "preset_call_max_seconds",
+)
+
+
+@dataclass(slots=True)
+class ClimatePresetStats:
+    """Skip, failure and latency counters for preset service calls."""
+
+    applied: int = 0
+    skipped_current: int = 0
+    skipped_in_flight: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    last_applied: str | None = None
+    last_seconds: float | None = None
+    max_seconds: float = 0.0
 
 
 class ClimateControlSwitch(ControlSwitchBase):
@@ -46,6 +87,8 @@ class ClimateControlSwitch(ControlSwitchBase):
     _preset_policy: ClimatePresetPolicy
     climate_entity_id: str | None
     _area_sensor_entity_id: str | None
+    _preset_stats: ClimatePresetStats
+    _presets_in_flight: dict[str, str]
 
     def __init__(
         self, area_config: "AreaConfig", coordinator: "MagicAreasCoordinator"
@@ -62,6 +105,8 @@ class ClimateControlSwitch(ControlSwitchBase):
         self.policy = build_climate_control_group_policy(feature_config)
         # Entity ID resolved in async_added_to_hass from coordinator snapshot
         self._area_sensor_entity_id = None
+        self._preset_stats = ClimatePresetStats()
+        self._presets_in_flight = {}
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -171,3 +216,148 @@ class ClimateControlSwitch(ControlSwitchBase):
             )
         except _EXPECTED_CONTROL_ERRORS as exc:
             self.logger.exception("%s: Error applying preset: %s", self.name, str(exc))
+
+    async def _execute_decision(
+        self, decision: "ControlGroupDecision", *, blocking: bool = False
+    ) -> None:
+        """Set presets, skipping entities already on the target.
+
+        The switch waits at most ``CLIMATE_PRESET_CALL_TIMEOUT`` for each
+        call, so a slow cloud thermostat cannot stall it. Entities that already
+        report the preset, or are still being moved to it by an earlier call,
+        are left alone.
+        """
+        if decision.action_type == ControlActionType.NOOP or not decision.actions:
+            await super()._execute_decision(decision, blocking=blocking)
+            return
+
+        calls = [
+            (entity_id, action)
+            for action in decision.actions
+            for entity_id in action.target_entity_ids
+            if self._preset_needed(entity_id, action)
+        ]
+        if calls:
+            context = self._issue_command_context(str(decision.action_type))
+            for entity_id, action in calls:
+                await self._async_call_preset(entity_id, action, context)
+        if self._write_preset_debug_attributes() and self.platform is not None:
+            self.async_write_ha_state()
+
+    def _preset_needed(self, entity_id: str, action: ControlAction) -> bool:
+        """Return whether a preset call would change the entity."""
+        preset = action.service_data.get(ATTR_PRESET_MODE)
+        if self._presets_in_flight.get(entity_id) == preset:
+            self._preset_stats.skipped_in_flight += 1
+            return False
+        state = self.hass.states.get(entity_id)
+        if state is not None and state.attributes.get(ATTR_PRESET_MODE) == preset:
+            self._preset_stats.skipped_current += 1
+            return False
+        return True
+
+    async def _async_call_preset(
+        self, entity_id: str, action: ControlAction, context: Context
+    ) -> None:
+        """Issue one preset call and record its latency or failure.
+
+        A call that outlives the timeout is counted as a timeout but left to
+        finish, as announcements do: cancelling it would not stop a cloud
+        thermostat that already accepted the request. The entity stays in
+        flight until the call ends.
+        """
+        preset = str(action.service_data.get(ATTR_PRESET_MODE))
+        self._presets_in_flight[entity_id] = preset
+        stats = self._preset_stats
+        started_at = monotonic()
+        call = self.hass.async_create_background_task(
+            self.hass.services.async_call(
+                action.domain,
+                action.service,
+                {**action.service_data, ATTR_ENTITY_ID: entity_id},
+                blocking=True,
+                context=context,
+            ),
+            f"{DOMAIN} climate preset for {entity_id}",
+        )
+        done, _ = await asyncio.wait({call}, timeout=CLIMATE_PRESET_CALL_TIMEOUT)
+        if done:
+            self._preset_call_done(entity_id, preset, call)
+        else:
+            stats.failures += 1
+            stats.timeouts += 1
+            self.logger.warning(
+                "%s: Timed out setting preset %s on %s", self.name, preset, entity_id
+            )
+            call.add_done_callback(
+                partial(self._late_preset_call_done, entity_id, preset)
+            )
+        seconds = round(monotonic() - started_at, 3)
+        stats.last_seconds = seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def _preset_call_done(
+        self, entity_id: str, preset: str, call: "asyncio.Task[object]"
+    ) -> None:
+        """Record the outcome of a preset call that finished in time."""
+        self._clear_preset_in_flight(entity_id, preset)
+        stats = self._preset_stats
+        if call.cancelled():
+            stats.failures += 1
+            return
+        if (exc := call.exception()) is not None:
+            if not isinstance(exc, _EXPECTED_PRESET_CALL_ERRORS):
+                raise exc
+            stats.failures += 1
+            self.logger.warning(
+                "%s: Error setting preset %s on %s: %s",
+                self.name,
+                preset,
+                entity_id,
+                str(exc),
+            )
+            return
+        stats.applied += 1
+        stats.last_applied = preset
+
+    def _late_preset_call_done(
+        self, entity_id: str, preset: str, call: "asyncio.Task[object]"
+    ) -> None:
+        """Release a timed-out entity and log how its call ended."""
+        self._clear_preset_in_flight(entity_id, preset)
+        if call.cancelled():
+            return
+        if (exc := call.exception()) is not None:
+            self.logger.warning(
+                "%s: Setting preset %s on %s failed after timing out: %s",
+                self.name,
+                preset,
+                entity_id,
+                str(exc),
+            )
+            return
+        self._preset_stats.last_applied = preset
+
+    def _clear_preset_in_flight(self, entity_id: str, preset: str) -> None:
+        """Forget an in-flight preset once its call has ended."""
+        if self._presets_in_flight.get(entity_id) == preset:
+            del self._presets_in_flight[entity_id]
+
+    def _write_preset_debug_attributes(self) -> bool:
+        """Expose preset call counters for troubleshooting."""
+        stats = self._preset_stats
+        return self._publish_debug_attributes(
+            "climate_control",
+            {
+                "preset_call_last_applied": stats.last_applied,
+                "preset_calls_applied": stats.applied,
+                "preset_calls_skipped_current": stats.skipped_current,
+                "preset_calls_skipped_in_flight": stats.skipped_in_flight,
+                "preset_call_failures": stats.failures,
+                "preset_call_timeouts": stats.timeouts,
+                "preset_call_last_seconds": stats.last_seconds,
+                "preset_call_max_seconds": stats.max_seconds,
+            },
+            volatile=_VOLATILE_PRESET_ATTRIBUTES,
+            volatile_interval=CLIMATE_PRESET_STATS_INTERVAL,
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Callable
 from time import monotonic
@@ -19,11 +20,13 @@ if TYPE_CHECKING:  # pragma: no cover
 
 from custom_components.magic_areas.area_state import AreaStates
 from custom_components.magic_areas.core.controls import (
+    ControlActionType,
     ControlGroupContext,
     MonotonicDeadlineMap,
-    merged_extra_state_attributes,
+    async_get_cover_command_batcher,
+    event_is_self_caused,
     resolve_area_presence_states,
-    resolve_group_entity_id_by_metadata,
+    resolve_group_entity_ids_by_metadata,
 )
 from custom_components.magic_areas.core.controls.policies.cover import (
     CoverControlGroupPolicy,
@@ -107,6 +110,12 @@ class CoverControlSwitch(ControlSwitchBase):
         if old_state is None or new_state is None or old_state.state == new_state.state:
             return
 
+        if event_is_self_caused(self.hass, event, controller=str(self.unique_id)):
+            self._expected_cover_group_state_changes.discard(entity_id)
+            return
+
+        # Fallback for echoes that arrive after Home Assistant stops attributing
+        # the entity state write to our service-call context.
         if entity_id in self._expected_cover_group_state_changes:
             self._expected_cover_group_state_changes.discard(entity_id)
             return
@@ -150,9 +159,9 @@ class CoverControlSwitch(ControlSwitchBase):
             context=context,
             logger=_LOGGER,
         )
-        self._write_policy_debug_attributes()
+        attributes_changed = self._write_policy_debug_attributes()
         self._schedule_next_manual_hold_expiry_check()
-        if self.platform is not None:
+        if self.platform is not None and attributes_changed:
             self.async_write_ha_state()
 
     async def _execute_decision(
@@ -161,10 +170,31 @@ class CoverControlSwitch(ControlSwitchBase):
         *,
         blocking: bool = False,
     ) -> None:
-        """Track expected cover state changes before executing service calls."""
+        """Queue cover actions on the shared batcher and expect their echoes.
+
+        With ``blocking`` set, wait until the batched calls have been sent.
+        """
+        if decision.action_type == ControlActionType.NOOP or not decision.actions:
+            await super()._execute_decision(decision, blocking=blocking)
+            return
+
+        context = self._issue_command_context(str(decision.action_type))
+        batcher = async_get_cover_command_batcher(self.hass)
+        waiters = []
         for action in decision.actions:
             self._expected_cover_group_state_changes.update(action.target_entity_ids)
-        await super()._execute_decision(decision, blocking=blocking)
+            waiters.append(
+                batcher.submit(
+                    action,
+                    area_id=self._area_id,
+                    context=context,
+                    stagger_seconds=self.policy.config.command_stagger_seconds,
+                    on_skipped=self._expected_cover_group_state_changes.discard,
+                    blocking=blocking,
+                )
+            )
+        if blocking:
+            await asyncio.gather(*waiters)
 
     def _manual_hold_active(self, entity_id: str | None = None) -> bool:
         """Return whether manual cover movement is currently holding automation."""
@@ -213,25 +243,24 @@ class CoverControlSwitch(ControlSwitchBase):
         if group_registry is None:
             return {}
 
-        resolved: dict[str, str] = {}
-        for device_class in self.policy.config.automation_device_classes:
-            entity_id = resolve_group_entity_id_by_metadata(
-                self.hass,
-                group_registry=group_registry,
-                area_id=self._area_id,
-                policy_id=str(ControlGroupPolicyId.COVER_GROUPS),
-                domain=COVER_DOMAIN,
-                metadata_key=str(GroupMetadataKey.CATEGORY),
-                metadata_value=f"cover_group_{device_class}",
-            )
-            if entity_id is not None:
-                resolved[device_class] = entity_id
-        return resolved
+        by_category = resolve_group_entity_ids_by_metadata(
+            self.hass,
+            group_registry=group_registry,
+            area_id=self._area_id,
+            policy_id=str(ControlGroupPolicyId.COVER_GROUPS),
+            domain=COVER_DOMAIN,
+            metadata_key=str(GroupMetadataKey.CATEGORY),
+        )
+        return {
+            device_class: by_category[f"cover_group_{device_class}"]
+            for device_class in self.policy.config.automation_device_classes
+            if f"cover_group_{device_class}" in by_category
+        }
 
-    def _write_policy_debug_attributes(self) -> None:
+    def _write_policy_debug_attributes(self) -> bool:
         """Expose cover automation details for troubleshooting."""
-        self._attr_extra_state_attributes = merged_extra_state_attributes(
-            getattr(self, "_attr_extra_state_attributes", None),
+        return self._publish_debug_attributes(
+            "cover_groups",
             {
                 "cover_automation_targets": dict(self._cover_group_entity_ids),
                 "manual_cover_hold_active": self._manual_hold_active(),
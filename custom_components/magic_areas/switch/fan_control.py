@@ -32,12 +32,15 @@ from custom_components.magic_areas.core.controls.policies.fan import (
     LEGACY_FAN_SENSOR_KEY,
     FanPolicySignals,
     FanSensorUnavailableBehavior,
+    FanValueBand,
+    fan_controller_value_band,
 )
 from custom_components.magic_areas.core.controls.fan_signals import (
+    StreamingTrend,
     fan_controller_trend_signal_surface,
 )
 from custom_components.magic_areas.core.managed_surface_registry import (
-    resolve_managed_surface_entity_id,
+    resolve_managed_surface_entity_ids,
 )
 from custom_components.magic_areas.features.config.readers import (
     fan_groups_config,
@@ -46,7 +49,6 @@ from custom_components.magic_areas.area_state import AreaStates
 from custom_components.magic_areas.core.controls import (
     ControlGroupContext,
     MonotonicDeadlineMap,
-    merged_extra_state_attributes,
     resolve_area_presence_states,
 )
 from custom_components.magic_areas.core.aggregates import resolve_aggregate_entity_id
@@ -80,6 +82,12 @@ class FanControlSwitch(ControlSwitchBase):
     _controller_sensor_entity_ids: tuple[str, ...]
     _controller_trend_signal_unique_ids: dict[str, str]
     _controller_trend_signal_entity_ids: dict[str, str]
+    _streaming_trends: dict[str, StreamingTrend]
+    _streaming_trends_by_sensor: dict[str, tuple[StreamingTrend, ...]]
+    _sample_trend_states: dict[str, bool | None]
+    _band_controllers: dict[str, tuple[FanControllerConfig, ...]]
+    _sample_bands: dict[str, tuple[FanValueBand, ...]]
+    _sample_fan_group_state: str | None
     _post_clear_hold_until_monotonic: MonotonicDeadlineMap[str]
     _unavailable_hold_until_monotonic: MonotonicDeadlineMap[str]
     _hold_timer_cancel: Callable[[], None] | None
@@ -128,10 +136,31 @@ class FanControlSwitch(ControlSwitchBase):
                     signal_surface.unique_id
                 )
         self._controller_trend_signal_entity_ids = {}
+        self._streaming_trends = {}
+        streaming_trends_by_sensor: dict[str, list[StreamingTrend]] = {}
+        for controller in self.policy.controllers:
+            if (
+                controller.detection_mode
+                is not FanDetectionMode.THRESHOLD_STREAMING_TREND
+                or not controller.sensor_entity_id
+            ):
+                continue
+            trend = self._streaming_trends[controller.controller_id] = StreamingTrend()
+            streaming_trends_by_sensor.setdefault(
+                controller.sensor_entity_id, []
+            ).append(trend)
+        self._streaming_trends_by_sensor = {
+            entity_id: tuple(trends)
+            for entity_id, trends in streaming_trends_by_sensor.items()
+        }
+        self._sample_trend_states = {}
         self._post_clear_hold_until_monotonic = MonotonicDeadlineMap()
         self._unavailable_hold_until_monotonic = MonotonicDeadlineMap()
         self._hold_timer_cancel = None
         self._last_states = []
+        self._band_controllers = {}
+        self._sample_bands = {}
+        self._sample_fan_group_state = None
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -157,6 +186,7 @@ class FanControlSwitch(ControlSwitchBase):
                 policy_id=str(ControlGroupPolicyId.FAN_GROUPS),
                 domain=FAN_DOMAIN,
             )
+        self._band_controllers = self._build_band_controllers()
         self._area_sensor_entity_id = self._track_area_state_with_sensor(
             area_state_handler=self.area_state_changed,
             area_sensor_handler=self._area_sensor_state_changed,
@@ -190,6 +220,10 @@ class FanControlSwitch(ControlSwitchBase):
     ) -> None:
         """Call update state from track state change event."""
 
+        self._feed_streaming_trends(event)
+        if self._sample_within_band(event):
+            return
+
         # Resolve area states from cached dispatcher payload, with sensor fallback.
         current_states = resolve_area_presence_states(
             hass=self.hass,
@@ -236,6 +270,7 @@ class FanControlSwitch(ControlSwitchBase):
 
         if not self.is_on:
             _LOGGER.debug("%s: Control disabled, skipping.", self.name)
+            self._sample_bands.clear()
             return
 
         sensor_value = self._read_float_state(
@@ -259,6 +294,7 @@ class FanControlSwitch(ControlSwitchBase):
             controller_id: self._read_trend_signal_state(entity_id)
             for controller_id, entity_id in self._controller_trend_signal_entity_ids.items()
         }
+        trend_states.update(self._streaming_trend_states())
         current_states = resolve_area_presence_states(
             hass=self.hass,
             area_id=self._area_id,
@@ -297,12 +333,118 @@ class FanControlSwitch(ControlSwitchBase):
             context=context,
             logger=_LOGGER,
         )
-        self._write_policy_debug_attributes()
+        self._record_sample_bands(
+            sensor_value=sensor_value,
+            sensor_values=sensor_values,
+            fan_group_state=fan_state.state if fan_state else None,
+        )
+        attributes_changed = self._write_policy_debug_attributes()
         self._publish_fan_runtime_states()
         self._schedule_next_hold_expiry_check()
-        if self.platform is not None:
+        if self.platform is not None and attributes_changed:
             self.async_write_ha_state()
 
+    def _build_band_controllers(self) -> dict[str, tuple[FanControllerConfig, ...]]:
+        """Map each tracked numeric sensor to the controllers reading it."""
+        band_controllers: dict[str, list[FanControllerConfig]] = {
+            entity_id: []
+            for entity_id in (
+                self.tracked_entity_id,
+                *self._controller_sensor_entity_ids,
+            )
+            if entity_id
+        }
+        for controller in self.policy.controllers:
+            if controller.detection_mode is FanDetectionMode.ROOM_STATE:
+                continue
+            entity_id = (
+                self.tracked_entity_id
+                if controller.sensor_entity_id == LEGACY_FAN_SENSOR_KEY
+                else controller.sensor_entity_id
+            )
+            if entity_id:
+                band_controllers.setdefault(entity_id, []).append(controller)
+        return {
+            entity_id: tuple(controllers)
+            for entity_id, controllers in band_controllers.items()
+        }
+
+    def _record_sample_bands(
+        self,
+        *,
+        sensor_value: float | None,
+        sensor_values: dict[str, float | None],
+        fan_group_state: str | None,
+    ) -> None:
+        """Remember the value band of every sensor the last evaluation saw."""
+        values = dict(sensor_values)
+        if self.tracked_entity_id:
+            values[self.tracked_entity_id] = sensor_value
+        self._sample_bands = {
+            entity_id: tuple(
+                fan_controller_value_band(controller, values.get(entity_id))
+                for controller in controllers
+            )
+            for entity_id, controllers in self._band_controllers.items()
+        }
+        self._sample_fan_group_state = fan_group_state
+        self._sample_trend_states = self._streaming_trend_states()
+
+    def _sample_within_band(self, event: Event[EventStateChangedData]) -> bool:
+        """Return whether a sensor sample cannot change the last decision.
+
+        Samples that stay in the band recorded by the last evaluation, for
+        every controller reading that sensor, are absorbed without
+        re-evaluating the policy or writing state.
+        """
+        entity_id = event.data.get("entity_id")
+        if not isinstance(entity_id, str) or not self.is_on:
+            return False
+        previous = self._sample_bands.get(entity_id)
+        if previous is None:
+            return False
+        fan_state = (
+            self.hass.states.get(self._fan_group_entity_id)
+            if self._fan_group_entity_id
+            else None
+        )
+        if (fan_state.state if fan_state else None) != self._sample_fan_group_state:
+            return False
+        if self._streaming_trend_states() != self._sample_trend_states:
+            return False
+        new_state = event.data.get("new_state")
+        try:
+            value = float(new_state.state) if new_state is not None else None
+        except ValueError:
+            value = None
+        return previous == tuple(
+            fan_controller_value_band(controller, value)
+            for controller in self._band_controllers[entity_id]
+        )
+
+    def _feed_streaming_trends(self, event: Event[EventStateChangedData]) -> None:
+        """Add a controller sensor sample to its in-process trend estimators."""
+        entity_id = event.data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return
+        trends = self._streaming_trends_by_sensor.get(entity_id)
+        new_state = event.data.get("new_state")
+        if not trends or new_state is None:
+            return
+        try:
+            value = float(new_state.state)
+        except ValueError:
+            return
+        for trend in trends:
+            trend.add(new_state.last_reported_timestamp, value)
+
+    def _streaming_trend_states(self) -> dict[str, bool | None]:
+        """Return in-process trend states keyed by controller ID."""
+        return {
+            controller_id: trend.rising
+            for controller_id, trend in self._streaming_trends.items()
+        }
+
     def _refresh_controller_hold_deadlines(
         self,
         *,
@@ -421,22 +563,20 @@ class FanControlSwitch(ControlSwitchBase):
 
     def _resolve_controller_trend_signal_entity_ids(self) -> dict[str, str]:
         """Resolve managed Trend helper entity IDs for threshold+trend controllers."""
-        entity_registry = er.async_get(self.hass)
-        resolved: dict[str, str] = {}
-        for (
-            controller_id,
-            unique_id,
-        ) in self._controller_trend_signal_unique_ids.items():
-            entity_id = resolve_managed_surface_entity_id(
-                self.hass,
-                entity_registry,
-                unique_id=unique_id,
-                entity_domain=BINARY_SENSOR_DOMAIN,
-                config_entry_domain=TREND_DOMAIN,
-            )
-            if entity_id is not None:
-                resolved[controller_id] = entity_id
-        return resolved
+        unique_ids = self._controller_trend_signal_unique_ids
+        if not unique_ids:
+            return {}
+        entity_ids = resolve_managed_surface_entity_ids(
+            self.hass,
+            er.async_get(self.hass),
+            [(unique_id, BINARY_SENSOR_DOMAIN) for unique_id in unique_ids.values()],
+            config_entry_domain=TREND_DOMAIN,
+        )
+        return {
+            controller_id: entity_ids[(unique_id, BINARY_SENSOR_DOMAIN)]
+            for controller_id, unique_id in unique_ids.items()
+            if (unique_id, BINARY_SENSOR_DOMAIN) in entity_ids
+        }
 
     def _read_trend_signal_state(self, entity_id: str) -> bool | None:
         """Read a native Trend helper binary state."""
@@ -445,14 +585,14 @@ class FanControlSwitch(ControlSwitchBase):
             return None
         return state.state == STATE_ON
 
-    def _write_policy_debug_attributes(self) -> None:
+    def _write_policy_debug_attributes(self) -> bool:
         """Expose fan controller evaluation details for troubleshooting."""
         evaluation = self.policy.last_evaluation
         if evaluation is None:
-            return
+            return False
 
-        self._attr_extra_state_attributes = merged_extra_state_attributes(
-            getattr(self, "_attr_extra_state_attributes", None),
+        return self._publish_debug_attributes(
+            "fan_groups",
             {
                 "active_fan_reasons": [
                     reason.controller_id for reason in evaluation.active_reasons
@@ -492,6 +632,11 @@ class FanControlSwitch(ControlSwitchBase):
             states,
         )
 
+    async def async_turn_off(self, **kwargs: object) -> None:
+        """Turn off fan control and forget the last evaluated sensor bands."""
+        self._sample_bands.clear()
+        await super().async_turn_off(**kwargs)
+
     async def async_will_remove_from_hass(self) -> None:
         """Clean up fan hold timer on entity removal."""
         if self._hold_timer_cancel is not None:
@@ -37,8 +37,10 @@ async def setup_config_entries(
     for config_entry in config_entries:
         if not hass.config_entries.async_get_entry(config_entry.entry_id):
             config_entry.add_to_hass(hass)
-        if config_entry.state is not ConfigEntryState.LOADED:
-            assert await hass.config_entries.async_setup(config_entry.entry_id)
+        # A first setup stores managed entry data, which queues one reload of
+        # the entry; only entries nothing has set up yet need a setup call.
+        if config_entry.state is ConfigEntryState.NOT_LOADED:
+            await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
 
     if start_hass:
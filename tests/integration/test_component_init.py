@@ -1,10 +1,11 @@
 """Tests for component setup helpers."""
 
 from collections.abc import Awaitable, Callable
+import inspect
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import EventBus, HomeAssistant
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -16,11 +17,31 @@ from custom_components.magic_areas import (
 )
 from custom_components.magic_areas.components import MagicAreasRuntimeData
 from custom_components.magic_areas.config_keys.area import (
+    CONF_CLEAR_TIMEOUT,
+    CONF_RELOAD_MAX_CONCURRENCY,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
 )
 from custom_components.magic_areas.const import DOMAIN
-from tests.const import DEFAULT_MOCK_AREA
+from custom_components.magic_areas.core.control_intents import (
+    ROLE_TARGET_CACHE,
+    async_get_role_target_cache,
+)
+from custom_components.magic_areas.core.meta import (
+    AREA_TOPOLOGY_INDEX,
+    async_get_area_topology_index,
+)
+from custom_components.magic_areas.coordinator.pipeline.reload_queue import (
+    ReloadQueue,
+    async_get_reload_queue,
+)
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    SETUP_PHASE_CONFIG,
+    SETUP_PIPELINE,
+    async_get_setup_pipeline,
+)
+from tests.const import DEFAULT_MOCK_AREA, MockAreaIds
 from tests.helpers.config_entries import get_basic_config_entry_data
+from tests.helpers.lifecycle import init_integration, shutdown_integration
 
 EventCallback = Callable[[object], Awaitable[object]]
 
@@ -29,7 +50,8 @@ async def test_async_update_options_reloads_config_entry(
     hass: HomeAssistant,
 ) -> None:
     """The registered options listener should reload its config entry."""
-    config_entry = MockConfigEntry(domain=DOMAIN)
+    config_entry = MockConfigEntry(domain=DOMAIN, state=ConfigEntryState.LOADED)
+    config_entry.add_to_hass(hass)
 
     with patch.object(
         hass.config_entries,
@@ -40,10 +62,46 @@ async def test_async_update_options_reloads_config_entry(
             hass,
             cast(ConfigEntry[MagicAreasRuntimeData], config_entry),
         )
+        await hass.async_block_till_done()
 
     async_reload.assert_awaited_once_with(config_entry.entry_id)
 
 
+async def test_options_update_requests_queued_reload(
+    hass: HomeAssistant,
+) -> None:
+    """An options change on a loaded entry goes through the reload queue."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    )
+    await init_integration(hass, [config_entry])
+
+    with patch.object(ReloadQueue, "request") as request:
+        hass.config_entries.async_update_entry(
+            config_entry, options={**config_entry.options, CONF_CLEAR_TIMEOUT: 9}
+        )
+        await hass.async_block_till_done()
+        request.assert_called_once_with(config_entry.entry_id, reason="options updated")
+
+    await shutdown_integration(hass, [config_entry])
+
+
+async def test_global_meta_option_sets_reload_concurrency(
+    hass: HomeAssistant,
+) -> None:
+    """The global meta area's option caps concurrent entry reloads."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=get_basic_config_entry_data(MockAreaIds.GLOBAL),
+        options={CONF_RELOAD_MAX_CONCURRENCY: 1},
+    )
+    await init_integration(hass, [config_entry])
+
+    assert async_get_reload_queue(hass).max_concurrency == 1
+
+    await shutdown_integration(hass, [config_entry])
+
+
 async def test_async_unload_entry_cleans_runtime_resources(
     hass: HomeAssistant,
 ) -> None:
@@ -60,6 +118,11 @@ async def test_async_unload_entry_cleans_runtime_resources(
         coordinator=coordinator,
         listeners=[listener],
     )
+    role_targets = async_get_role_target_cache(hass)
+    topology = async_get_area_topology_index(hass)
+    setup_pipeline = async_get_setup_pipeline(hass)
+    with setup_pipeline.phase(config_entry.entry_id, SETUP_PHASE_CONFIG):
+        pass
 
     with patch.object(
         hass.config_entries,
@@ -77,6 +140,13 @@ async def test_async_unload_entry_cleans_runtime_resources(
     )
     coordinator.async_shutdown.assert_awaited_once_with()
     listener.assert_called_once_with()
+    # The last area to unload drops the house-level registry listeners.
+    assert ROLE_TARGET_CACHE not in hass.data
+    assert role_targets._unsubscribers == []
+    assert AREA_TOPOLOGY_INDEX not in hass.data
+    assert topology._unsubscribers == []
+    assert SETUP_PIPELINE not in hass.data
+    assert setup_pipeline._unsubscribers == []
 
 
 async def test_async_setup_entry_reload_skipped_before_start(
@@ -96,7 +166,9 @@ async def test_async_setup_entry_reload_skipped_before_start(
         *args: object,
         **kwargs: object,
     ) -> Callable[[], None]:
-        callbacks[str(event_type)] = callback
+        # Only the coroutine area-reload handler; other house listeners are sync.
+        if inspect.iscoroutinefunction(callback):
+            callbacks[str(event_type)] = callback
         return lambda: None
 
     with (
@@ -143,7 +215,9 @@ async def test_async_setup_entry_registry_update_respects_disabled_reload(
         *args: object,
         **kwargs: object,
     ) -> Callable[[], None]:
-        callbacks[str(event_type)] = callback
+        # Only the coroutine area-reload handler; other house listeners are sync.
+        if inspect.iscoroutinefunction(callback):
+            callbacks[str(event_type)] = callback
         return lambda: None
 
     with (
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from collections.abc import Callable
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntry
@@ -26,12 +26,19 @@ from custom_components.magic_areas.coordinator import (
     MagicAreasCoordinator,
     MagicAreasData,
 )
+from custom_components.magic_areas.coordinator.pipeline import (
+    ReloadQueue,
+    async_get_meta_reload_stats,
+)
 from custom_components.magic_areas.core.runtime_model import AreaConfig, AreaRuntime
 from custom_components.magic_areas.core.controls import GroupRegistry
 from custom_components.magic_areas.core.runtime_model import EntityReferences
 from custom_components.magic_areas.enums import MagicAreasEvents
 
 
+_BUILD_SNAPSHOT = "custom_components.magic_areas.coordinator.build_snapshot"
+
+
 def _build_area_config(
     *,
     area_id: str,
@@ -260,7 +267,7 @@ async def test_meta_coordinator_retries_snapshot_ready_after_startup(
     lifecycle = coordinator.lifecycle
     assert lifecycle is not None
 
-    with patch.object(hass.config_entries, "async_schedule_reload"):
+    with patch.object(ReloadQueue, "request"):
         lifecycle.handle_snapshot_ready("interior", None, "kitchen")
         await hass.async_block_till_done()
         assert lifecycle.reloading is False
@@ -292,7 +299,7 @@ async def test_meta_coordinator_retries_until_meta_snapshot_available(
     lifecycle = coordinator.lifecycle
     assert lifecycle is not None
 
-    with patch.object(hass.config_entries, "async_schedule_reload"):
+    with patch.object(ReloadQueue, "request"):
         lifecycle.evaluate_and_schedule_reload("interior", "kitchen")
         assert lifecycle.pending_reload_handle is not None
         assert lifecycle.reloading is False
@@ -328,7 +335,7 @@ async def test_meta_reload_guard_callback_clears_stale_reloading_state(
         return MagicMock()
 
     with (
-        patch.object(hass.config_entries, "async_schedule_reload"),
+        patch.object(ReloadQueue, "request"),
         patch.object(hass.loop, "call_later", side_effect=_capture_guard),
     ):
         await lifecycle.async_execute_reload("interior", "kitchen")
@@ -349,7 +356,10 @@ async def test_meta_coordinator_snapshot_ready_reloads_for_matching_child(
         hass_config=cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
     )
     coordinator = MagicAreasCoordinator(
-        hass, area_config, cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry)
+        hass,
+        area_config,
+        cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
+        hot_apply=AsyncMock(return_value=True),
     )
     coordinator.data = _build_snapshot(area_config, child_areas=["kitchen"])
 
@@ -360,7 +370,9 @@ async def test_meta_coordinator_snapshot_ready_reloads_for_matching_child(
 
     assert lifecycle.meta_data_retry_attempts == 0
     mock_schedule.assert_called_once()
-    assert mock_schedule.call_args.kwargs["callback"] == lifecycle.async_execute_reload
+    assert (
+        mock_schedule.call_args.kwargs["callback"] == lifecycle.async_execute_hot_update
+    )
 
 
 async def test_meta_coordinator_snapshot_ready_ignores_unmatched_child(
@@ -385,3 +397,69 @@ async def test_meta_coordinator_snapshot_ready_ignores_unmatched_child(
     assert lifecycle.meta_data_retry_attempts == 0
     assert lifecycle.reloading is False
     mock_schedule.assert_not_called()
+
+
+async def test_meta_hot_update_skips_reload_when_applied_in_place(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """A child change the entry can apply in place avoids a reload."""
+    area_config = _build_area_config(
+        area_id="interior",
+        area_type="meta",
+        hass_config=cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
+    )
+    hot_apply = AsyncMock(return_value=True)
+    coordinator = MagicAreasCoordinator(
+        hass,
+        area_config,
+        cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
+        hot_apply=hot_apply,
+    )
+    coordinator.data = _build_snapshot(area_config, child_areas=["kitchen"])
+    lifecycle = coordinator.lifecycle
+    assert lifecycle is not None
+
+    with patch.object(ReloadQueue, "request") as mock_reload:
+        await lifecycle.async_execute_hot_update("interior", "office")
+
+    hot_apply.assert_awaited_once()
+    mock_reload.assert_not_called()
+    assert lifecycle.reloading is False
+    stats = async_get_meta_reload_stats(hass).diagnostics(mock_config_entry.entry_id)
+    assert stats["hot_updates"] == 1
+    assert stats["reloads"] == 0
+
+
+async def test_meta_hot_update_reloads_and_times_declined_applies(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """A change the entry cannot apply in place falls back to a timed reload."""
+    area_config = _build_area_config(
+        area_id="interior",
+        area_type="meta",
+        hass_config=cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
+    )
+    coordinator = MagicAreasCoordinator(
+        hass,
+        area_config,
+        cast(ConfigEntry[MagicAreasRuntimeData], mock_config_entry),
+        hot_apply=AsyncMock(return_value=False),
+    )
+    coordinator.data = _build_snapshot(area_config, child_areas=["kitchen"])
+    lifecycle = coordinator.lifecycle
+    assert lifecycle is not None
+
+    with patch.object(ReloadQueue, "request") as mock_reload:
+        await lifecycle.async_execute_hot_update("interior", "office")
+
+    mock_reload.assert_called_once_with(
+        mock_config_entry.entry_id, reason="meta membership change"
+    )
+    stats = async_get_meta_reload_stats(hass)
+    assert stats.diagnostics(mock_config_entry.entry_id)["reload_in_flight"] is True
+
+    stats.record_snapshot_built(mock_config_entry.entry_id)
+    diagnostics = stats.diagnostics(mock_config_entry.entry_id)
+    assert diagnostics["reloads"] == 1
+    assert diagnostics["reload_in_flight"] is False
+    assert isinstance(diagnostics["last_reload_seconds"], float)
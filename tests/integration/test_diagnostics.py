@@ -52,6 +52,28 @@ async def test_diagnostics(
     assert area_config["id"] == "**REDACTED**"
     assert area_config["name"] == "**REDACTED**"
     assert "updated_at" in area_diag
+    assert isinstance(diagnostics["runtime_controllers"], list)
+    assert "role_target_cache" in diagnostics
+    assert "meta_propagation" in diagnostics
+    assert "area_topology" in diagnostics
+    assert "ble_location" in diagnostics
+    assert "announcements" in diagnostics
+    assert "meta_inventory" in diagnostics
+    assert "meta_reload" in diagnostics
+    assert "inventory_apply" in diagnostics
+    assert "reload_queue" in diagnostics
+    assert "control_evaluations" in diagnostics
+    assert "cover_commands" in diagnostics
+    snapshot_cache = diagnostics["snapshot_cache"]
+    assert isinstance(snapshot_cache, dict)
+    assert snapshot_cache["cached"] is True
+    setup_pipeline = diagnostics["setup_pipeline"]
+    assert isinstance(setup_pipeline, dict)
+    assert setup_pipeline["setting_up"] == []
+    phases = setup_pipeline["phases"]
+    assert isinstance(phases, dict)
+    assert "first_refresh" in phases
+    assert "house" in setup_pipeline
 
     await shutdown_integration(hass, [mock_config_entry])
 
@@ -0,0 +1,146 @@
+"""Registry-driven inventory changes applied without entry reloads."""
+
+from datetime import timedelta
+
+from homeassistant.components.fan import DOMAIN as FAN_DOMAIN
+from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.magic_areas.config_keys.area import CONF_ENABLED_FEATURES
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.lifecycle import (
+    async_get_inventory_apply_stats,
+    async_get_meta_reload_stats,
+)
+from custom_components.magic_areas.enums import MagicAreasFeatures
+from tests.const import DEFAULT_MOCK_AREA, MockAreaIds
+from tests.helpers.config_entries import get_basic_config_entry_data
+from tests.helpers.entities import setup_mock_entities
+from tests.helpers.lifecycle import init_integration, shutdown_integration
+from tests.mocks import MockFan, MockLight
+
+
+def _config_entry(*features: MagicAreasFeatures) -> MockConfigEntry:
+    data = get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    data[CONF_ENABLED_FEATURES] = {feature: {} for feature in features}
+    return MockConfigEntry(domain=DOMAIN, data=data)
+
+
+async def _move_to_area_and_converge(hass: HomeAssistant, entity_id: str) -> None:
+    er.async_get(hass).async_update_entity(entity_id, area_id=DEFAULT_MOCK_AREA.value)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+
+def _group_members(hass: HomeAssistant, domain: str) -> list[list[str]]:
+    return [
+        list(state.attributes[ATTR_ENTITY_ID])
+        for state in hass.states.async_all(domain)
+        if ATTR_ENTITY_ID in state.attributes
+    ]
+
+
+async def test_member_change_updates_light_group_in_place(
+    hass: HomeAssistant,
+) -> None:
+    """A light joining the area updates the light group helper without a reload."""
+    lights = [
+        MockLight(name="kitchen_light", state="off", unique_id="hot_apply_light_1"),
+        MockLight(name="hallway_light", state="off", unique_id="hot_apply_light_2"),
+    ]
+    await setup_mock_entities(
+        hass,
+        LIGHT_DOMAIN,
+        {DEFAULT_MOCK_AREA: [lights[0]], MockAreaIds.LIVING_ROOM: [lights[1]]},
+    )
+    config_entry = _config_entry(MagicAreasFeatures.LIGHT_GROUPS)
+    await init_integration(
+        hass, [config_entry], areas=[DEFAULT_MOCK_AREA, MockAreaIds.LIVING_ROOM]
+    )
+    coordinator = config_entry.runtime_data.coordinator
+
+    await _move_to_area_and_converge(hass, lights[1].entity_id)
+
+    assert config_entry.runtime_data.coordinator is coordinator
+    assert {
+        entity[ATTR_ENTITY_ID] for entity in coordinator.data.entities[LIGHT_DOMAIN]
+    } == {lights[0].entity_id, lights[1].entity_id}
+    assert sorted([lights[0].entity_id, lights[1].entity_id]) in [
+        sorted(members) for members in _group_members(hass, LIGHT_DOMAIN)
+    ]
+    stats = async_get_inventory_apply_stats(hass).diagnostics(config_entry.entry_id)
+    assert stats["hot_applies"] == 1
+    assert stats["reloads"] == 0
+
+    await shutdown_integration(hass, [config_entry])
+
+
+async def test_first_fan_reloads_to_bind_new_fan_group_helper(
+    hass: HomeAssistant,
+) -> None:
+    """The first fan creates a helper the fan control switch binds, so it reloads."""
+    fan = MockFan(name="ceiling_fan", unique_id="hot_apply_fan")
+    await setup_mock_entities(hass, FAN_DOMAIN, {MockAreaIds.LIVING_ROOM: [fan]})
+    config_entry = _config_entry(MagicAreasFeatures.FAN_GROUPS)
+    await init_integration(
+        hass, [config_entry], areas=[DEFAULT_MOCK_AREA, MockAreaIds.LIVING_ROOM]
+    )
+    coordinator = config_entry.runtime_data.coordinator
+    assert not _group_members(hass, FAN_DOMAIN)
+
+    await _move_to_area_and_converge(hass, fan.entity_id)
+
+    assert config_entry.runtime_data.coordinator is not coordinator
+    assert _group_members(hass, FAN_DOMAIN) == [[fan.entity_id]]
+    stats = async_get_inventory_apply_stats(hass).diagnostics(config_entry.entry_id)
+    assert stats["hot_applies"] == 0
+    assert stats["reloads"] == 1
+
+    await shutdown_integration(hass, [config_entry])
+
+
+async def test_child_light_updates_meta_area_without_reload(
+    hass: HomeAssistant,
+) -> None:
+    """A light joining a child area reaches the meta area without a reload."""
+    lights = [
+        MockLight(name="kitchen_light", state="off", unique_id="hot_apply_meta_1"),
+        MockLight(name="hallway_light", state="off", unique_id="hot_apply_meta_2"),
+    ]
+    await setup_mock_entities(
+        hass,
+        LIGHT_DOMAIN,
+        {DEFAULT_MOCK_AREA: [lights[0]], MockAreaIds.LIVING_ROOM: [lights[1]]},
+    )
+    child_entry = _config_entry(MagicAreasFeatures.LIGHT_GROUPS)
+    meta_data = get_basic_config_entry_data(MockAreaIds.INTERIOR)
+    meta_data[CONF_ENABLED_FEATURES] = {MagicAreasFeatures.LIGHT_GROUPS: {}}
+    meta_entry = MockConfigEntry(domain=DOMAIN, data=meta_data)
+    await init_integration(
+        hass,
+        [child_entry, meta_entry],
+        areas=[DEFAULT_MOCK_AREA, MockAreaIds.LIVING_ROOM],
+    )
+    meta_coordinator = meta_entry.runtime_data.coordinator
+    child_entities = list(meta_coordinator.data.entities[LIGHT_DOMAIN])
+    assert child_entities
+
+    await _move_to_area_and_converge(hass, lights[1].entity_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    assert meta_entry.runtime_data.coordinator is meta_coordinator
+    assert meta_coordinator.data.entities[LIGHT_DOMAIN] == child_entities
+    stats = async_get_meta_reload_stats(hass).diagnostics(meta_entry.entry_id)
+    assert stats["hot_updates"]
+    assert stats["reloads"] == 0
+
+    await shutdown_integration(hass, [child_entry, meta_entry])
@@ -12,6 +12,7 @@ from custom_components.magic_areas.const import ATTR_AREAS
 
 from tests.const import MockAreaIds
 from tests.helpers.assertions import assert_state
+from tests.helpers.waits import wait_for_state
 from tests.mocks import MockBinarySensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -252,12 +253,14 @@ async def test_meta_area_attributes_coverage(
 
     hass.states.async_set(master_bedroom_area_sensor_entity_id, STATE_ON)
     await hass.async_block_till_done()
+    await wait_for_state(hass, second_floor_area_sensor_entity_id, STATE_ON)
 
     second_floor_area_sensor_state = hass.states.get(second_floor_area_sensor_entity_id)
     assert_state(second_floor_area_sensor_state, STATE_ON)
 
     hass.states.async_set(master_bedroom_area_sensor_entity_id, STATE_OFF)
     await hass.async_block_till_done()
+    await wait_for_state(hass, second_floor_area_sensor_entity_id, STATE_OFF)
 
     second_floor_area_sensor_state = hass.states.get(second_floor_area_sensor_entity_id)
     assert_state(second_floor_area_sensor_state, STATE_OFF)
@@ -0,0 +1,98 @@
+"""Warm-start snapshots served from the persisted snapshot cache."""
+
+from unittest.mock import patch
+
+from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator import registry_fingerprint
+from custom_components.magic_areas.coordinator.pipeline.snapshot_cache import (
+    async_get_snapshot_cache,
+)
+from tests.const import DEFAULT_MOCK_AREA
+from tests.helpers.config_entries import get_basic_config_entry_data
+from tests.helpers.entities import setup_mock_entities
+from tests.helpers.lifecycle import init_integration, shutdown_integration
+from tests.mocks import MockLight
+
+
+async def test_reload_warm_starts_then_verifies(hass: HomeAssistant) -> None:
+    """A reload with unchanged registry inputs starts from the cache."""
+    light = MockLight(name="kitchen_light", state="off", unique_id="warm_light")
+    await setup_mock_entities(hass, LIGHT_DOMAIN, {DEFAULT_MOCK_AREA: [light]})
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    )
+    await init_integration(hass, [config_entry])
+    cache = await async_get_snapshot_cache(hass)
+    assert cache.diagnostics(config_entry.entry_id)["warm_started"] is False
+
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = config_entry.runtime_data.coordinator
+    assert [
+        entity[ATTR_ENTITY_ID] for entity in coordinator.data.entities[LIGHT_DOMAIN]
+    ] == [light.entity_id]
+    diagnostics = cache.diagnostics(config_entry.entry_id)
+    assert diagnostics["warm_started"] is True
+    assert diagnostics["hits"] == 1
+    assert coordinator.last_update_success
+
+    await shutdown_integration(hass, [config_entry])
+
+
+async def test_registry_change_invalidates_cached_snapshot(
+    hass: HomeAssistant,
+) -> None:
+    """A registry edit since the last build forces a cold snapshot."""
+    light = MockLight(name="kitchen_light", state="off", unique_id="stale_light")
+    await setup_mock_entities(hass, LIGHT_DOMAIN, {DEFAULT_MOCK_AREA: [light]})
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    )
+    await init_integration(hass, [config_entry])
+    cache = await async_get_snapshot_cache(hass)
+
+    er.async_get(hass).async_update_entity(light.entity_id, name="Renamed light")
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = cache.diagnostics(config_entry.entry_id)
+    assert diagnostics["warm_started"] is False
+    assert diagnostics["stale"] == 1
+
+    await shutdown_integration(hass, [config_entry])
+
+
+async def test_registry_fingerprint_memoized_until_registry_update(
+    hass: HomeAssistant,
+) -> None:
+    """Refreshes reuse the fingerprint until a registry update invalidates it."""
+    light = MockLight(name="kitchen_light", state="off", unique_id="memo_light")
+    await setup_mock_entities(hass, LIGHT_DOMAIN, {DEFAULT_MOCK_AREA: [light]})
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=get_basic_config_entry_data(DEFAULT_MOCK_AREA)
+    )
+    await init_integration(hass, [config_entry])
+    coordinator = config_entry.runtime_data.coordinator
+
+    with patch(
+        "custom_components.magic_areas.coordinator.registry_fingerprint",
+        wraps=registry_fingerprint,
+    ) as fingerprint:
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert fingerprint.call_count == 0
+
+        er.async_get(hass).async_update_entity(light.entity_id, name="Renamed light")
+        await hass.async_block_till_done()
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert fingerprint.call_count == 1
+
+    await shutdown_integration(hass, [config_entry])
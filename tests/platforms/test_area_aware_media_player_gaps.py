@@ -13,9 +13,11 @@ from homeassistant.components.media_player.const import (
     MediaPlayerState,
 )
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.const import STATE_ON
+from homeassistant.components.media_player.const import SERVICE_PLAY_MEDIA
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from unittest.mock import MagicMock
+from pytest_homeassistant_custom_component.common import async_mock_service
 
 from custom_components.magic_areas.media_player import (
     AreaAwareMediaPlayer,
@@ -39,86 +41,79 @@ def test_area_aware_media_player_exposes_media_entity_contract() -> None:
     )
 
 
-@pytest.mark.asyncio
-async def test_area_sensor_not_found_skips_area(
-    hass: HomeAssistant,
-) -> None:
-    """Verify area is skipped if presence sensor not resolved (lines 146-152)."""
-    # Create a minimal mock media player that can be queried
+def _indexing_media_player(
+    hass: HomeAssistant, areas_data: dict[str, dict[str, object]]
+) -> MagicMock:
+    """Return a media player mock that runs the real area sensor indexing."""
     media_player = MagicMock(spec=AreaAwareMediaPlayer)
     media_player.hass = hass
     media_player.name = "test_player"
-
-    # Create areas_data with a test area
-    areas_data = {
-        "missing_sensor_area": {
-            "entities_by_domain": {MEDIA_PLAYER_DOMAIN: []},
-            "notification_devices": [],
-            "notification_states": ["occupied"],
-        }
-    }
     media_player.areas_data = areas_data
+    media_player._area_sensors = {}
+    media_player._sensor_areas = {}
+    media_player._routable_areas = set()
+    media_player._listener_registry = MagicMock()
+    media_player._set_area_routable = lambda area_id, state: (
+        AreaAwareMediaPlayer._set_area_routable(media_player, area_id, state)
+    )
+    return media_player
 
-    # Mock _resolve_area_state_sensor to return None (entity not found)
-    media_player._resolve_area_state_sensor = MagicMock(return_value=None)
 
-    # Mock get_active_areas to use the real implementation
-    real_get_active_areas = AreaAwareMediaPlayer.get_active_areas
-    media_player.get_active_areas = lambda: real_get_active_areas(media_player)
+@pytest.mark.asyncio
+async def test_area_sensor_not_found_skips_area(
+    hass: HomeAssistant,
+) -> None:
+    """An area whose presence sensor is not resolved is never routable."""
+    media_player = _indexing_media_player(
+        hass,
+        {
+            "missing_sensor_area": {
+                "entities_by_domain": {MEDIA_PLAYER_DOMAIN: []},
+                "notification_devices": [],
+                "notification_states": ["occupied"],
+            }
+        },
+    )
+    media_player._resolve_area_state_sensor = MagicMock(return_value=None)
 
-    # Call get_active_areas() which should return empty list
-    # because _resolve_area_state_sensor returns None
-    active_areas = media_player.get_active_areas()
+    AreaAwareMediaPlayer._index_area_sensors(media_player)
 
-    # Verify the area was skipped (empty result) because sensor wasn't found
-    assert len(active_areas) == 0
+    assert media_player._area_sensors == {}
+    assert media_player._routable_areas == set()
+    media_player._listener_registry.track.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_no_media_players_skips_service_call(
     hass: HomeAssistant,
 ) -> None:
-    """Verify service call skipped if no active media players (lines 214-218)."""
-    # Create minimal media player mock
-    media_player = MagicMock(spec=AreaAwareMediaPlayer)
-    media_player.hass = hass
-    media_player.name = "test_player"
-
-    # Create areas_data with NO media players (empty entities_by_domain)
-    areas_data = {
-        "test_kitchen": {
-            "entities_by_domain": {},  # No media players
-            "notification_devices": [],
-            "notification_states": ["occupied"],
-        }
-    }
-    media_player.areas_data = areas_data
-
-    # Set up area state sensor to indicate occupied
+    """An occupied area without media players makes no play_media call."""
+    calls = async_mock_service(hass, MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA)
+    media_player = _indexing_media_player(
+        hass,
+        {
+            "test_kitchen": {
+                "entities_by_domain": {},  # No media players
+                "notification_devices": [],
+                "notification_states": ["occupied"],
+            }
+        },
+    )
     area_sensor_id = (
         f"{BINARY_SENSOR_DOMAIN}.magic_areas_presence_tracking_test_kitchen_area_state"
     )
     hass.states.async_set(area_sensor_id, STATE_ON, {ATTR_STATES: ["occupied"]})
     await hass.async_block_till_done()
-
-    # Mock _resolve_area_state_sensor to return the sensor entity
     media_player._resolve_area_state_sensor = MagicMock(return_value=area_sensor_id)
 
-    # Mock get_active_areas using the real implementation
-    real_get_active_areas = AreaAwareMediaPlayer.get_active_areas
-    media_player.get_active_areas = lambda: real_get_active_areas(media_player)
+    AreaAwareMediaPlayer._index_area_sensors(media_player)
+    assert media_player._routable_areas == {"test_kitchen"}
 
-    # Call get_active_areas() - should return the area since sensor is found
-    active_areas = media_player.get_active_areas()
-    assert len(active_areas) == 1  # Area should be active
-
-    # Now test async_play_media with no media players
-    # The real implementation should return early when no media players found
-    real_async_play_media = AreaAwareMediaPlayer.async_play_media
+    media_player._area_players = {}
+    await AreaAwareMediaPlayer.async_play_media(media_player, "music", "test_media_id")
+    await hass.async_block_till_done()
 
-    # Call async_play_media - it should return without calling the service
-    # This test verifies that the early return at line 214-218 works correctly
-    await real_async_play_media(media_player, "music", "test_media_id")
+    assert calls == []
 
 
 def test_update_state_uses_single_write_path() -> None:
@@ -134,3 +129,60 @@ def test_update_state_uses_single_write_path() -> None:
     media_player.update_attributes.assert_called_once()
     media_player.async_write_ha_state.assert_called_once()
     media_player.schedule_update_ha_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_play_media_routes_from_area_transitions(
+    hass: HomeAssistant,
+) -> None:
+    """Area transitions maintain the routable set that playback unions over."""
+    calls = async_mock_service(hass, MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA)
+    media_player = MagicMock(spec=AreaAwareMediaPlayer)
+    media_player.hass = hass
+    media_player.name = "test_player"
+    media_player.areas_data = {
+        area_id: {
+            "entities_by_domain": {},
+            "notification_devices": [],
+            "notification_states": ["occupied"],
+        }
+        for area_id in ("kitchen", "office")
+    }
+    media_player._area_players = {
+        "kitchen": ("media_player.kitchen", "media_player.shared"),
+        "office": ("media_player.office", "media_player.shared"),
+    }
+    media_player._area_sensors = {
+        "kitchen": "binary_sensor.kitchen_state",
+        "office": "binary_sensor.office_state",
+    }
+    media_player._sensor_areas = {
+        sensor: area_id for area_id, sensor in media_player._area_sensors.items()
+    }
+    media_player._routable_areas = set()
+    media_player._set_area_routable = lambda area_id, state: (
+        AreaAwareMediaPlayer._set_area_routable(media_player, area_id, state)
+    )
+
+    def _transition(sensor: str, state: str, area_states: list[str]) -> None:
+        hass.states.async_set(sensor, state, {ATTR_STATES: area_states})
+        event = MagicMock()
+        event.data = {"entity_id": sensor, "new_state": hass.states.get(sensor)}
+        AreaAwareMediaPlayer._area_state_changed(media_player, event)
+
+    _transition("binary_sensor.kitchen_state", STATE_ON, ["occupied"])
+    _transition("binary_sensor.office_state", STATE_ON, ["occupied"])
+    _transition("binary_sensor.office_state", STATE_OFF, ["clear"])
+    _transition("binary_sensor.office_state", STATE_ON, ["occupied"])
+    _transition("binary_sensor.kitchen_state", STATE_ON, ["occupied", "sleep"])
+
+    assert media_player._routable_areas == {"office"}
+
+    await AreaAwareMediaPlayer.async_play_media(media_player, "music", "chime")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data[ATTR_ENTITY_ID] == [
+        "media_player.office",
+        "media_player.shared",
+    ]
@@ -30,6 +30,7 @@ from tests.helpers.entities import setup_mock_entities
 from tests.helpers.config_entries import get_basic_config_entry_data
 from tests.helpers.lifecycle import shutdown_integration
 from tests.helpers.lifecycle import init_integration as init_integration_helper
+from tests.helpers.waits import wait_for_state
 from tests.mocks import MockSensor
 
 # Fixtures
@@ -126,6 +127,8 @@ async def test_ble_tracker_presence_sensor(
     ble_tracker_state = hass.states.get(ble_tracker_entity_id)
     assert_state(ble_tracker_state, STATE_ON)
 
+    # Area presence reacts to the tracker on a later loop iteration.
+    await wait_for_state(hass, area_sensor_entity_id, STATE_ON)
     area_sensor_state = hass.states.get(area_sensor_entity_id)
     assert_state(area_sensor_state, STATE_ON)
     assert_in_attribute(area_sensor_state, ATTR_ACTIVE_SENSORS, ble_tracker_entity_id)
@@ -140,8 +143,7 @@ async def test_ble_tracker_presence_sensor(
     ble_tracker_state = hass.states.get(ble_tracker_entity_id)
     assert_state(ble_tracker_state, STATE_OFF)
 
-    area_sensor_state = hass.states.get(area_sensor_entity_id)
-    assert_state(area_sensor_state, STATE_OFF)
+    await wait_for_state(hass, area_sensor_entity_id, STATE_OFF)
 
 
 async def test_ble_tracker_missing_entity(
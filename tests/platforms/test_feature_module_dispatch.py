@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -21,6 +22,7 @@ from custom_components.magic_areas.enums import MagicAreasFeatures
 from custom_components.magic_areas.features.base import FeatureConfigStep
 from custom_components.magic_areas.features.dispatch import (
     collect_feature_managed_surfaces,
+    feature_entity_signature,
 )
 from custom_components.magic_areas.features.registry import FeatureRegistry
 from tests.const import DEFAULT_MOCK_AREA
@@ -292,3 +294,39 @@ def test_collect_managed_surfaces_includes_custom_control_group_labels() -> None
         "light.other_lamp",
         "switch.task_relay",
     )
+
+
+def test_feature_entity_signature_uses_inputs_without_building() -> None:
+    """The signature follows bound inputs and never builds entities."""
+    bound = ["light.kitchen_group"]
+
+    class _BindingModule(FeatureModuleDouble):
+        def platform_entity_inputs(self, *_args: object) -> frozenset[str]:
+            return frozenset(bound)
+
+    area_config = MagicMock()
+    area_config.config = {}
+    data = MagicMock()
+    data.enabled_features = {MagicAreasFeatures.LIGHT_GROUPS}
+    data.entities = {}
+    module = _BindingModule(
+        id=MagicAreasFeatures.LIGHT_GROUPS,
+        domains={"light"},
+        entities=[MagicMock(spec=Entity)],
+    )
+    registry = FeatureRegistry([module])
+
+    def _signature() -> frozenset[tuple[str, Hashable]]:
+        return feature_entity_signature(
+            registry=registry,
+            data=data,
+            area_config=area_config,
+            coordinator=MagicMock(),
+            logger=MagicMock(),
+        )
+
+    first = _signature()
+    assert _signature() == first
+    bound.append("light.office_group")
+    assert _signature() != first
+    module.build_entities.assert_not_called()
@@ -37,6 +37,7 @@ def _capture_adaptive_lighting_intents(
     async def _capture(
         _hass: HomeAssistant,
         intents: tuple[AdaptiveLightingServiceIntent, ...],
+        **_kwargs: object,
     ) -> None:
         captured.extend(intents)
 
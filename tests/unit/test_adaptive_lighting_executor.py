@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 
 from custom_components.magic_areas.core.control_intents import (
     ATTR_LIGHTS,
+    AdaptiveLightingCoordinationReason,
+    AdaptiveLightingServiceIntent,
     adaptive_lighting_accent_adaptation_intents,
     adaptive_lighting_manual_restore_intents,
     adaptive_lighting_sleep_switch_intents,
     async_execute_adaptive_lighting_intents,
+    async_get_adaptive_lighting_executor,
+    async_release_adaptive_lighting_executor,
 )
 from tests.unit.adaptive_lighting_testkit import (
     ADAPTIVE_LIGHTING_DOMAIN,
@@ -110,3 +116,106 @@ async def test_executor_skips_missing_optional_service(
     )
 
     assert harness.calls == []
+
+
+def _switch_intent(service: str, entity_id: str) -> AdaptiveLightingServiceIntent:
+    return AdaptiveLightingServiceIntent(
+        domain="switch",
+        service=service,
+        data={ATTR_ENTITY_ID: entity_id},
+        reason=AdaptiveLightingCoordinationReason.ACCENT_ACTIVE,
+    )
+
+
+async def test_executor_orders_each_switch_and_overlaps_switches(
+    hass: HomeAssistant,
+) -> None:
+    """One switch's intents stay ordered; other switches' intents overlap."""
+    release = asyncio.Event()
+    started: list[tuple[str, object]] = []
+    finished: list[tuple[str, object]] = []
+
+    async def _handle(call: ServiceCall) -> None:
+        started.append((call.service, call.data[ATTR_ENTITY_ID]))
+        await release.wait()
+        finished.append((call.service, call.data[ATTR_ENTITY_ID]))
+
+    for service in ("turn_on", "turn_off"):
+        hass.services.async_register("switch", service, _handle)
+
+    tasks = [
+        hass.async_create_task(
+            async_execute_adaptive_lighting_intents(
+                hass,
+                (
+                    _switch_intent("turn_off", "switch.kitchen_brightness"),
+                    _switch_intent("turn_off", "switch.kitchen_color"),
+                ),
+            )
+        ),
+        hass.async_create_task(
+            async_execute_adaptive_lighting_intents(
+                hass,
+                (
+                    _switch_intent("turn_on", "switch.kitchen_brightness"),
+                    _switch_intent("turn_on", "switch.office_sleep"),
+                ),
+            )
+        ),
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert started == [
+        ("turn_off", "switch.kitchen_brightness"),
+        ("turn_off", "switch.kitchen_color"),
+        ("turn_on", "switch.office_sleep"),
+    ]
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert [call for call in finished if call[1] == "switch.kitchen_brightness"] == [
+        ("turn_off", "switch.kitchen_brightness"),
+        ("turn_on", "switch.kitchen_brightness"),
+    ]
+
+
+async def test_executor_bounds_concurrent_calls(hass: HomeAssistant) -> None:
+    """No more than max_concurrency calls run at once house-wide."""
+    release = asyncio.Event()
+    started: list[object] = []
+
+    async def _handle(call: ServiceCall) -> None:
+        started.append(call.data[ATTR_ENTITY_ID])
+        await release.wait()
+
+    hass.services.async_register("switch", "turn_on", _handle)
+    async_get_adaptive_lighting_executor(hass).max_concurrency = 2
+
+    task = hass.async_create_task(
+        async_execute_adaptive_lighting_intents(
+            hass,
+            tuple(
+                _switch_intent("turn_on", f"switch.{name}_sleep")
+                for name in ("kitchen", "office", "den")
+            ),
+        )
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert started == ["switch.kitchen_sleep", "switch.office_sleep"]
+
+    release.set()
+    await task
+    assert len(started) == 3
+
+
+async def test_executor_is_released(hass: HomeAssistant) -> None:
+    """Releasing drops the shared executor so a fresh one is created."""
+    executor = async_get_adaptive_lighting_executor(hass)
+
+    async_release_adaptive_lighting_executor(hass)
+
+    assert async_get_adaptive_lighting_executor(hass) is not executor
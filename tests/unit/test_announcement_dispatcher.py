@@ -0,0 +1,158 @@
+"""Tests for the house-level announcement dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.components.media_player.const import (
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
+    SERVICE_PLAY_MEDIA,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+import voluptuous as vol
+
+from custom_components.magic_areas.core.announcements import (
+    ANNOUNCEMENT_ERROR_TIMEOUT,
+    ANNOUNCEMENT_UNKNOWN_PLATFORM,
+    async_get_announcement_dispatcher,
+)
+
+
+def _register(hass: HomeAssistant, platform: str, object_id: str) -> str:
+    return (
+        er.async_get(hass)
+        .async_get_or_create(
+            MEDIA_PLAYER_DOMAIN, platform, object_id, suggested_object_id=object_id
+        )
+        .entity_id
+    )
+
+
+async def test_partitions_run_concurrently_and_report_failures(
+    hass: HomeAssistant,
+) -> None:
+    """Each platform gets its own call; slow and failing ones stay isolated."""
+    kitchen = _register(hass, "sonos", "kitchen")
+    office = _register(hass, "sonos", "office")
+    hallway = _register(hass, "cast", "hallway")
+    garage = _register(hass, "esphome", "garage")
+    calls: list[list[str]] = []
+    never = asyncio.Event()
+
+    async def _play_media(call: ServiceCall) -> None:
+        entity_ids = list(call.data[ATTR_ENTITY_ID])
+        calls.append(entity_ids)
+        if hallway in entity_ids:
+            await never.wait()
+        if garage in entity_ids:
+            raise HomeAssistantError("speaker offline")
+
+    hass.services.async_register(MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA, _play_media)
+    dispatcher = async_get_announcement_dispatcher(hass)
+    dispatcher.partition_timeout = 0.05
+
+    results = await dispatcher.async_dispatch(
+        [kitchen, hallway, office, garage, "media_player.unregistered"],
+        {"media_content_id": "chime", "media_content_type": "music"},
+    )
+
+    assert sorted(calls) == sorted(
+        [[kitchen, office], [hallway], [garage], ["media_player.unregistered"]]
+    )
+    errors = {result.platform: result.error for result in results}
+    assert errors["sonos"] is None
+    assert errors[ANNOUNCEMENT_UNKNOWN_PLATFORM] is None
+    assert errors["cast"] == ANNOUNCEMENT_ERROR_TIMEOUT
+    assert errors["esphome"] == "HomeAssistantError: speaker offline"
+
+    platforms = dispatcher.diagnostics()["platforms"]
+    assert isinstance(platforms, dict)
+    assert platforms["cast"]["timeouts"] == 1
+    assert platforms["esphome"]["failures"] == 1
+    assert platforms["sonos"]["failures"] == 0
+    assert platforms["sonos"]["last_seconds"] is not None
+
+    never.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_no_targets_sends_nothing(hass: HomeAssistant) -> None:
+    """An empty target list neither calls services nor counts an announcement."""
+    dispatcher = async_get_announcement_dispatcher(hass)
+
+    assert await dispatcher.async_dispatch([], {}) == ()
+    assert dispatcher.diagnostics()["announcements"] == 0
+
+
+async def test_timed_out_call_keeps_playing(hass: HomeAssistant) -> None:
+    """A partition past its timeout is reported but its call is not cancelled."""
+    hallway = _register(hass, "cast", "hallway")
+    release = asyncio.Event()
+    finished: list[str] = []
+
+    async def _play_media(call: ServiceCall) -> None:
+        await release.wait()
+        finished.extend(call.data[ATTR_ENTITY_ID])
+
+    hass.services.async_register(MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA, _play_media)
+    dispatcher = async_get_announcement_dispatcher(hass)
+    dispatcher.partition_timeout = 0.01
+
+    results = await dispatcher.async_dispatch([hallway], {})
+    assert [result.error for result in results] == [ANNOUNCEMENT_ERROR_TIMEOUT]
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert finished == [hallway]
+
+
+async def test_unexpected_partition_errors_do_not_drop_others(
+    hass: HomeAssistant,
+) -> None:
+    """Schema and unexpected errors are recorded per partition."""
+    kitchen = _register(hass, "sonos", "kitchen")
+    hallway = _register(hass, "cast", "hallway")
+    garage = _register(hass, "esphome", "garage")
+
+    async def _play_media(call: ServiceCall) -> None:
+        entity_ids = list(call.data[ATTR_ENTITY_ID])
+        if hallway in entity_ids:
+            raise vol.Invalid("bad media type")
+        if garage in entity_ids:
+            raise ZeroDivisionError("boom")
+
+    hass.services.async_register(MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA, _play_media)
+    dispatcher = async_get_announcement_dispatcher(hass)
+
+    results = await dispatcher.async_dispatch([kitchen, hallway, garage], {})
+
+    errors = {result.platform: result.error for result in results}
+    assert errors == {
+        "sonos": None,
+        "cast": "Invalid: bad media type",
+        "esphome": "ZeroDivisionError: boom",
+    }
+
+
+async def test_announce_returns_before_players_finish(hass: HomeAssistant) -> None:
+    """Background announcements do not hold up their caller."""
+    kitchen = _register(hass, "sonos", "kitchen")
+    release = asyncio.Event()
+
+    async def _play_media(call: ServiceCall) -> None:
+        await release.wait()
+
+    hass.services.async_register(MEDIA_PLAYER_DOMAIN, SERVICE_PLAY_MEDIA, _play_media)
+    dispatcher = async_get_announcement_dispatcher(hass)
+
+    dispatcher.async_announce([kitchen], {})
+    assert dispatcher.diagnostics()["last"] == []
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    last = dispatcher.diagnostics()["last"]
+    assert isinstance(last, list)
+    assert [entry["error"] for entry in last] == [None]
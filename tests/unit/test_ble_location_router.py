@@ -0,0 +1,115 @@
+"""Tests for the house-level BLE location router."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.magic_areas.core.ble_location import (
+    BLEActiveSensorsHandler,
+    async_get_ble_location_router,
+)
+
+PHONE = "sensor.phone_room"
+WATCH = "sensor.watch_room"
+
+
+def _recorder(
+    calls: list[tuple[str, tuple[str, ...]]], area_id: str
+) -> BLEActiveSensorsHandler:
+    def _handler(active_sensors: tuple[str, ...]) -> None:
+        calls.append((area_id, active_sensors))
+
+    return _handler
+
+
+async def test_reading_moves_sensor_between_two_areas_only(
+    hass: HomeAssistant,
+) -> None:
+    """A new reading updates only the area left and the area entered."""
+    hass.states.async_set(PHONE, "Kitchen")
+    router = async_get_ble_location_router(hass)
+    calls: list[tuple[str, tuple[str, ...]]] = []
+    for area_id, name in (
+        ("kitchen", "Kitchen"),
+        ("office", "Office"),
+        ("garage", "Garage"),
+    ):
+        router.register(
+            area_id,
+            sensors=[PHONE, WATCH],
+            locations=(area_id, area_id, name),
+            on_change=_recorder(calls, area_id),
+        )
+    assert router.active_sensors("kitchen") == (PHONE,)
+
+    hass.states.async_set(PHONE, "office")
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == [("kitchen", ()), ("office", (PHONE,))]
+    assert router.active_sensors("garage") == ()
+
+
+async def test_unchanged_readings_and_untracked_areas_are_skipped(
+    hass: HomeAssistant,
+) -> None:
+    """Repeated values are suppressed; areas not tracking a sensor ignore it."""
+    router = async_get_ble_location_router(hass)
+    calls: list[tuple[str, tuple[str, ...]]] = []
+    router.register(
+        "kitchen",
+        sensors=[PHONE, WATCH],
+        locations=("kitchen",),
+        on_change=_recorder(calls, "kitchen"),
+    )
+    remove_office = router.register(
+        "office",
+        sensors=[WATCH],
+        locations=("office",),
+        on_change=_recorder(calls, "office"),
+    )
+
+    hass.states.async_set(WATCH, "kitchen")
+    hass.states.async_set(PHONE, "kitchen")
+    await hass.async_block_till_done()
+    hass.states.async_set(PHONE, "kitchen", {"rssi": -60})
+    hass.states.async_set(PHONE, "office")
+    await hass.async_block_till_done()
+
+    assert calls == [
+        ("kitchen", (WATCH,)),
+        ("kitchen", (PHONE, WATCH)),
+        ("kitchen", (WATCH,)),
+    ]
+    remove_office()
+    diagnostics = router.diagnostics()
+    assert diagnostics["areas"] == 1
+    assert diagnostics["suppressed"] == 1
+
+
+async def test_registration_only_subscribes_new_sensors(hass: HomeAssistant) -> None:
+    """Areas share sensor listeners; the last area using a sensor drops it."""
+    router = async_get_ble_location_router(hass)
+    calls: list[tuple[str, tuple[str, ...]]] = []
+    remove_kitchen = router.register(
+        "kitchen",
+        sensors=[PHONE],
+        locations=("kitchen",),
+        on_change=_recorder(calls, "kitchen"),
+    )
+    phone_listener = router._sensor_unsubscribers[PHONE]
+    remove_office = router.register(
+        "office",
+        sensors=[PHONE, WATCH],
+        locations=("office",),
+        on_change=_recorder(calls, "office"),
+    )
+    assert router._sensor_unsubscribers[PHONE] is phone_listener
+
+    remove_kitchen()
+    assert router.diagnostics()["tracked_sensors"] == 2
+    remove_office()
+    assert router.diagnostics()["tracked_sensors"] == 0
+
+    hass.states.async_set(PHONE, "office")
+    await hass.async_block_till_done()
+    assert calls == []
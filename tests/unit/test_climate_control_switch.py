@@ -1,12 +1,24 @@
 """Unit tests for ClimateControlSwitch runtime resolution behavior."""
 
+import asyncio
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.core import HomeAssistant
+from homeassistant.components.climate.const import (
+    ATTR_PRESET_MODE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_PRESET_MODE,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
 
 from custom_components.magic_areas.coordinator import MagicAreasCoordinator
+from custom_components.magic_areas.core.controls import (
+    ControlAction,
+    ControlActionType,
+    ControlGroupDecision,
+)
 from custom_components.magic_areas.core.runtime_model import AreaConfig
 from custom_components.magic_areas.switch import ClimateControlSwitch
 
@@ -150,3 +162,143 @@ async def test_async_added_to_hass_does_not_fallback_area_sensor_entity_id(
         None,
         switch._area_sensor_state_changed,
     )
+
+
+def _preset_decision(preset: str, *entity_ids: str) -> ControlGroupDecision:
+    return ControlGroupDecision(
+        action_type=ControlActionType.ACTIVATE,
+        reason=f"apply_preset_{preset}",
+        actions=(
+            ControlAction(
+                domain=CLIMATE_DOMAIN,
+                service=SERVICE_SET_PRESET_MODE,
+                target_entity_ids=entity_ids,
+                service_data={ATTR_PRESET_MODE: preset},
+            ),
+        ),
+    )
+
+
+async def test_preset_calls_skip_current_and_time_out_individually(
+    hass: HomeAssistant,
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Matching presets are skipped; a slow entity times out on its own."""
+    called: list[str] = []
+    never = asyncio.Event()
+
+    async def _set_preset(call: ServiceCall) -> None:
+        called.append(call.data[ATTR_ENTITY_ID])
+        if call.data[ATTR_ENTITY_ID] == "climate.attic":
+            await never.wait()
+
+    hass.services.async_register(CLIMATE_DOMAIN, SERVICE_SET_PRESET_MODE, _set_preset)
+    hass.states.async_set("climate.office", "heat", {ATTR_PRESET_MODE: "eco"})
+    hass.states.async_set("climate.den", "heat", {ATTR_PRESET_MODE: "comfort"})
+    hass.states.async_set("climate.attic", "heat", {ATTR_PRESET_MODE: "comfort"})
+    monkeypatch.setattr(
+        "custom_components.magic_areas.switch.climate_control.CLIMATE_PRESET_CALL_TIMEOUT",
+        0.05,
+    )
+    switch = ClimateControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = hass
+    switch._attr_name = "Climate Control"
+
+    await switch._execute_decision(
+        _preset_decision("eco", "climate.office", "climate.den", "climate.attic")
+    )
+
+    assert sorted(called) == ["climate.attic", "climate.den"]
+    attributes = switch.extra_state_attributes or {}
+    assert attributes["preset_calls_applied"] == 1
+    assert attributes["preset_calls_skipped_current"] == 1
+    assert attributes["preset_call_failures"] == 1
+    assert attributes["preset_call_timeouts"] == 1
+    assert attributes["preset_call_last_seconds"] is not None
+    # The timed-out call is left running; the entity stays in flight.
+    assert switch._presets_in_flight == {"climate.attic": "eco"}
+
+    never.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert switch._presets_in_flight == {}
+    assert switch._preset_stats.last_applied == "eco"
+
+
+async def test_preset_call_in_flight_is_not_repeated(
+    hass: HomeAssistant,
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+) -> None:
+    """A second request for a preset still being applied sends nothing."""
+    called: list[str] = []
+    release = asyncio.Event()
+
+    async def _set_preset(call: ServiceCall) -> None:
+        called.append(call.data[ATTR_ENTITY_ID])
+        await release.wait()
+
+    hass.services.async_register(CLIMATE_DOMAIN, SERVICE_SET_PRESET_MODE, _set_preset)
+    hass.states.async_set("climate.office", "heat", {ATTR_PRESET_MODE: "comfort"})
+    switch = ClimateControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = hass
+    switch._attr_name = "Climate Control"
+    decision = _preset_decision("away", "climate.office")
+
+    first = hass.async_create_task(switch._execute_decision(decision))
+    await asyncio.sleep(0)
+    await switch._execute_decision(decision)
+    release.set()
+    await first
+
+    assert called == ["climate.office"]
+    attributes = switch.extra_state_attributes or {}
+    assert attributes["preset_calls_applied"] == 1
+    assert attributes["preset_calls_skipped_in_flight"] == 1
+
+
+async def test_counter_only_changes_do_not_write_state(
+    hass: HomeAssistant,
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+) -> None:
+    """Repeated skips bump counters without publishing a new state."""
+    hass.states.async_set("climate.office", "heat", {ATTR_PRESET_MODE: "eco"})
+    switch = ClimateControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = hass
+    decision = _preset_decision("eco", "climate.office")
+
+    await switch._execute_decision(decision)
+    assert not switch._write_preset_debug_attributes()
+    await switch._execute_decision(decision)
+
+    assert switch._preset_stats.skipped_current == 2
+    assert not switch._write_preset_debug_attributes()
+    attributes = switch.extra_state_attributes or {}
+    assert attributes["preset_calls_skipped_current"] == 1
+
+
+async def test_counter_changes_publish_on_the_stats_interval(
+    hass: HomeAssistant,
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Skip counters reach the entity once the stats interval has passed."""
+    monkeypatch.setattr(
+        "custom_components.magic_areas.switch.climate_control.CLIMATE_PRESET_STATS_INTERVAL",
+        0.0,
+    )
+    hass.states.async_set("climate.office", "heat", {ATTR_PRESET_MODE: "eco"})
+    switch = ClimateControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = hass
+    decision = _preset_decision("eco", "climate.office")
+
+    await switch._execute_decision(decision)
+    await switch._execute_decision(decision)
+
+    assert not switch._write_preset_debug_attributes()
+    attributes = switch.extra_state_attributes or {}
+    assert attributes["preset_calls_skipped_current"] == 2
@@ -0,0 +1,95 @@
+"""Tests for the integration-wide command-context index."""
+
+from types import SimpleNamespace
+
+from homeassistant.core import Context
+
+from custom_components.magic_areas.core.controls import (
+    CommandContextIndex,
+    async_get_command_context_index,
+    event_is_self_caused,
+)
+
+
+def test_issued_context_resolves_to_command_origin() -> None:
+    """Issued contexts map back to the area, controller and action."""
+    index = CommandContextIndex()
+
+    context = index.issue(
+        area_id="kitchen",
+        controller="light_groups_kitchen_overhead",
+        action="turn_on",
+        now=10.0,
+    )
+    record = index.lookup(context, now=11.0)
+
+    assert record is not None
+    assert record.area_id == "kitchen"
+    assert record.controller == "light_groups_kitchen_overhead"
+    assert record.action == "turn_on"
+
+
+def test_child_context_is_classified_by_parent() -> None:
+    """Contexts derived from an issued context are self-caused."""
+    index = CommandContextIndex()
+    context = index.issue(area_id="kitchen", controller="a", action="x", now=0.0)
+
+    child = Context(parent_id=context.id)
+
+    assert index.is_self_caused(child, now=1.0)
+    assert index.is_self_caused(child, controller="a", now=1.0)
+    assert not index.is_self_caused(child, controller="b", now=1.0)
+    assert not index.is_self_caused(Context(), now=1.0)
+    assert not index.is_self_caused(None, now=1.0)
+
+
+def test_shared_context_is_self_caused_for_each_controller() -> None:
+    """A context shared with another controller's context counts for both."""
+    index = CommandContextIndex()
+    first = index.issue(area_id="kitchen", controller="a", action="x", now=0.0)
+    second = index.issue(area_id="office", controller="b", action="x", now=0.0)
+
+    assert index.share(first, second, now=1.0)
+
+    assert index.is_self_caused(first, controller="a", now=1.0)
+    assert index.is_self_caused(first, controller="b", now=1.0)
+    assert not index.is_self_caused(first, controller="c", now=1.0)
+    assert not index.share(first, Context(), now=1.0)
+
+
+def test_records_expire_after_ttl() -> None:
+    """Expired contexts are no longer classified as self-caused."""
+    index = CommandContextIndex(ttl_seconds=5.0)
+    context = index.issue(area_id="kitchen", controller="a", action="x", now=0.0)
+
+    assert index.is_self_caused(context, now=4.9)
+    assert not index.is_self_caused(context, now=5.0)
+    assert len(index) == 0
+
+
+def test_index_is_bounded_by_evicting_oldest() -> None:
+    """The oldest records are evicted once the size bound is exceeded."""
+    index = CommandContextIndex(max_entries=2)
+    first = index.issue(area_id="a", controller="a", action="x", now=0.0)
+    second = index.issue(area_id="b", controller="b", action="x", now=1.0)
+    third = index.issue(area_id="c", controller="c", action="x", now=2.0)
+
+    assert len(index) == 2
+    assert index.lookup(first, now=3.0) is None
+    assert index.lookup(second, now=3.0) is not None
+    assert index.lookup(third, now=3.0) is not None
+
+
+def test_event_classification_uses_shared_index() -> None:
+    """State events are classified through the per-hass shared index."""
+    hass = SimpleNamespace(data={})
+    context = async_get_command_context_index(hass).issue(  # type: ignore[arg-type]
+        area_id="kitchen", controller="cover_control_kitchen", action="activate"
+    )
+
+    assert async_get_command_context_index(hass) is async_get_command_context_index(  # type: ignore[arg-type]
+        hass  # type: ignore[arg-type]
+    )
+    assert event_is_self_caused(hass, SimpleNamespace(context=context))  # type: ignore[arg-type]
+    assert not event_is_self_caused(hass, SimpleNamespace(context=Context()))  # type: ignore[arg-type]
+    assert not event_is_self_caused(SimpleNamespace(), SimpleNamespace(context=context))  # type: ignore[arg-type]
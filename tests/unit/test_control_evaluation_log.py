@@ -0,0 +1,37 @@
+"""Tests for the control evaluation log."""
+
+from custom_components.magic_areas.core.controls import ControlEvaluationLog
+
+
+def test_log_keeps_a_bounded_ring_per_area() -> None:
+    """Verbose evaluations are kept per area, newest last, up to the bound."""
+    log = ControlEvaluationLog(max_entries=2)
+    for index in range(3):
+        log.log("kitchen", "fan_groups", {"active_fan_reasons": [str(index)]})
+    log.log("office", "cover_groups", {"manual_cover_hold_active": False})
+
+    diagnostics = log.diagnostics("kitchen")
+    assert diagnostics["logged"] == 3
+    recent = diagnostics["recent"]
+    assert isinstance(recent, list)
+    assert [entry["details"] for entry in recent] == [
+        {"active_fan_reasons": ["1"]},
+        {"active_fan_reasons": ["2"]},
+    ]
+    assert log.diagnostics("office")["logged"] == 1
+
+
+def test_publish_counters_are_per_area() -> None:
+    """Published and unchanged evaluations are counted separately."""
+    log = ControlEvaluationLog()
+    log.published("kitchen")
+    log.unchanged("kitchen")
+    log.unchanged("kitchen")
+
+    assert log.diagnostics("kitchen") == {
+        "published": 1,
+        "unchanged": 2,
+        "logged": 0,
+        "recent": [],
+    }
+    assert log.diagnostics("unknown")["published"] == 0
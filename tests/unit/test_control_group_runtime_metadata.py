@@ -281,3 +281,34 @@ def test_resolve_group_entity_ids_for_metadata_values_returns_none_when_empty(
         metadata_values=["task", "overhead"],
     )
     assert resolved is None
+
+
+def test_resolve_group_entity_ids_by_metadata_shares_helper_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Groups missing from the registry fall back to one helper-entry scan."""
+    patch_entity_registry(monkeypatch, fixed_value=None)
+    registry = GroupRegistry()
+    for device_class in ("blind", "shade", "shutter"):
+        register_group(
+            registry,
+            area_id="kitchen",
+            group_id=f"cover_groups_kitchen_{device_class}",
+            members=(f"cover.{device_class}",),
+            policy_id="cover_groups",
+            metadata={"category": f"cover_group_{device_class}"},
+        )
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = []
+
+    resolved = resolve_group_entity_ids_by_metadata(
+        hass,
+        group_registry=registry,
+        area_id="kitchen",
+        policy_id="cover_groups",
+        domain="cover",
+        metadata_key="category",
+    )
+
+    assert resolved == {}
+    hass.config_entries.async_entries.assert_called_once_with("group")
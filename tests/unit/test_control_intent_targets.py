@@ -12,6 +12,8 @@ from custom_components.magic_areas.core.control_intents import (
     ControlTargetPrecision,
     ControlTargetSource,
     RoleTarget,
+    async_get_role_target_cache,
+    async_release_role_target_cache,
     custom_control_label_name,
     resolve_custom_control_target,
     resolve_role_target,
@@ -308,3 +310,58 @@ def test_resolve_custom_control_target_falls_back_to_config_members(
     assert target.kind is ControlTargetKind.ENTITY_SUBSET
     assert target.source is ControlTargetSource.CONFIG_RECONCILIATION
     assert target.entity_ids == ("switch.vent",)
+
+
+async def test_role_target_cache_reuses_targets_until_registry_update(
+    hass: HomeAssistant,
+) -> None:
+    """Cached role targets are served until a label or entity registry update."""
+    entity_registry = er.async_get(hass)
+    sleep_lamp = entity_registry.async_get_or_create("light", "test", "sleep_lamp")
+    reading_lamp = entity_registry.async_get_or_create("light", "test", "reading")
+    label = lr.async_get(hass).async_create("ma:sleep")
+    entity_registry.async_update_entity(sleep_lamp.entity_id, labels={label.label_id})
+    await hass.async_block_till_done()
+    cache = async_get_role_target_cache(hass)
+    assert async_get_role_target_cache(hass) is cache
+    area_entity_ids = (sleep_lamp.entity_id, reading_lamp.entity_id)
+
+    def _resolve() -> RoleTarget:
+        return cache.resolve(
+            hass,
+            area_id="living_room",
+            domain="light",
+            role="sleep",
+            area_entity_ids=area_entity_ids,
+            label_name="ma:sleep",
+        )
+
+    first = _resolve()
+    assert _resolve() is first
+    assert first.entity_ids == (sleep_lamp.entity_id,)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    # Registry changes to entities outside the slot leave it cached.
+    elsewhere = entity_registry.async_get_or_create("light", "test", "garage")
+    entity_registry.async_update_entity(elsewhere.entity_id, labels={label.label_id})
+    await hass.async_block_till_done()
+    assert _resolve() is first
+
+    entity_registry.async_update_entity(reading_lamp.entity_id, labels={label.label_id})
+    await hass.async_block_till_done()
+
+    assert len(cache) == 0
+    assert _resolve().entity_ids == area_entity_ids
+    diagnostics = cache.diagnostics()
+    assert diagnostics["entries"] == 1
+    assert diagnostics["misses"] == 2
+    assert diagnostics["invalidations"] == 1
+    assert diagnostics["seconds_since_invalidation"] is not None
+
+    lr.async_get(hass).async_update(label.label_id, name="ma:asleep")
+    await hass.async_block_till_done()
+    assert len(cache) == 0
+
+    async_release_role_target_cache(hass)
+    assert async_get_role_target_cache(hass) is not cache
+    async_release_role_target_cache(hass)
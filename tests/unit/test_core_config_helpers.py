@@ -12,6 +12,7 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_COVER_GROUPS_ACCENT_ACTION,
     CONF_COVER_GROUPS_ACCENT_STATES,
     CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES,
+    CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS,
     CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS,
     CONF_FAN_GROUPS_TRACKED_DEVICE_CLASS,
     CONF_IGNORE_DIAGNOSTIC_ENTITIES,
@@ -22,7 +23,9 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_PRESENCE_DEVICE_PLATFORMS,
     CONF_PRESENCE_SENSOR_DEVICE_CLASS,
     CONF_PRESENCE_HOLD_TIMEOUT,
+    CONF_RELOAD_MAX_CONCURRENCY,
     CONF_RELOAD_ON_REGISTRY_CHANGE,
+    CONF_VERBOSE_CONTROL_DIAGNOSTICS,
     CONF_SECONDARY_STATES,
     CONF_SECONDARY_STATES_CALCULATION_MODE,
     CONF_SLEEP_ENTITY,
@@ -48,7 +51,9 @@ from custom_components.magic_areas.core.config import (
     normalize_feature_config,
     presence_device_platforms,
     presence_sensor_device_classes,
+    reload_max_concurrency,
     reload_on_registry_change,
+    verbose_control_diagnostics,
     secondary_states_calculation_mode,
     secondary_states_config,
 )
@@ -57,6 +62,7 @@ from custom_components.magic_areas.defaults import (
     DEFAULT_NOTIFY_STATES,
     DEFAULT_PRESENCE_DEVICE_PLATFORMS,
     DEFAULT_PRESENCE_HOLD_TIMEOUT,
+    DEFAULT_RELOAD_MAX_CONCURRENCY,
     DEFAULT_RELOAD_ON_REGISTRY_CHANGE,
     DEFAULT_SECONDARY_STATES_CALCULATION_MODE,
     DEFAULT_WASP_IN_A_BOX_DELAY,
@@ -177,6 +183,7 @@ def test_cover_groups_config_uses_preset_defaults_and_overrides() -> None:
     assert "door" not in default_config.automation_device_classes
     assert "damper" not in default_config.automation_device_classes
     assert default_config.manual_hold_seconds == 900
+    assert default_config.command_stagger_seconds == 0.0
     presets = {preset.role: preset for preset in default_config.presets}
     assert presets[CoverPresetRole.DAYLIGHT].action is CoverPresetAction.OPEN
     assert presets[CoverPresetRole.PRIVACY].states == (AreaStates.SLEEP.value,)
@@ -186,6 +193,7 @@ def test_cover_groups_config_uses_preset_defaults_and_overrides() -> None:
         {
             CONF_COVER_GROUPS_AUTOMATION_DEVICE_CLASSES: ["blind"],
             CONF_COVER_GROUPS_MANUAL_HOLD_SECONDS: 120,
+            CONF_COVER_GROUPS_COMMAND_STAGGER_SECONDS: 1.5,
             CONF_COVER_GROUPS_ACCENT_ACTION: "none",
             CONF_COVER_GROUPS_ACCENT_STATES: [AreaStates.ACCENT.value, "sleep"],
         }
@@ -193,6 +201,7 @@ def test_cover_groups_config_uses_preset_defaults_and_overrides() -> None:
     custom_presets = {preset.role: preset for preset in custom_config.presets}
     assert custom_config.automation_device_classes == ("blind",)
     assert custom_config.manual_hold_seconds == 120
+    assert custom_config.command_stagger_seconds == 1.5
     assert custom_presets[CoverPresetRole.ACCENT].action is CoverPresetAction.NONE
     assert custom_presets[CoverPresetRole.ACCENT].states == ("accented", "sleep")
 
@@ -209,6 +218,27 @@ def test_reload_on_registry_change_helper() -> None:
     assert reload_on_registry_change({CONF_RELOAD_ON_REGISTRY_CHANGE: False}) is False
 
 
+def test_verbose_control_diagnostics_helper() -> None:
+    """Verbose control diagnostics is off unless explicitly enabled."""
+    assert verbose_control_diagnostics({}) is False
+    assert (
+        verbose_control_diagnostics({CONF_VERBOSE_CONTROL_DIAGNOSTICS: "yes"}) is False
+    )
+    assert verbose_control_diagnostics({CONF_VERBOSE_CONTROL_DIAGNOSTICS: True}) is True
+
+
+def test_reload_max_concurrency_helper() -> None:
+    """Reload concurrency falls back to the default for invalid values."""
+    assert reload_max_concurrency({}) == DEFAULT_RELOAD_MAX_CONCURRENCY
+    assert reload_max_concurrency({CONF_RELOAD_MAX_CONCURRENCY: 0}) == (
+        DEFAULT_RELOAD_MAX_CONCURRENCY
+    )
+    assert reload_max_concurrency({CONF_RELOAD_MAX_CONCURRENCY: True}) == (
+        DEFAULT_RELOAD_MAX_CONCURRENCY
+    )
+    assert reload_max_concurrency({CONF_RELOAD_MAX_CONCURRENCY: 5.0}) == 5
+
+
 def test_ble_tracker_config_helper() -> None:
     """BLE tracker config should return a normalized list."""
     assert ble_tracker_config({}).entities == []
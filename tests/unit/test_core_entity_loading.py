@@ -215,7 +215,12 @@ async def test_load_meta_area_entities_with_child_areas(hass: HomeAssistant) ->
     mock_child_entry.domain = "magic_areas"
     mock_child_entry.entry_id = "child_config"
     # Mock the coordinator snapshot with area_config
+    mock_child_entry.unique_id = None
     mock_child_entry.runtime_data.coordinator.data.area_config.slug = "bedroom"
+    mock_child_entry.runtime_data.coordinator.data.magic_entities = {
+        "sensor": [{"entity_id": child_entity.entity_id}]
+    }
+    mock_entity_registry.async_get.return_value = child_entity
 
     # Mock async_entries to return our mock entry
     with (
@@ -226,6 +231,9 @@ async def test_load_meta_area_entities_with_child_areas(hass: HomeAssistant) ->
         patch.object(
             hass.config_entries, "async_entries", return_value=[mock_child_entry]
         ),
+        patch.object(
+            hass.config_entries, "async_get_entry", return_value=mock_child_entry
+        ),
     ):
         entities, magic_entities = await load_meta_area_entities(
             hass, ["bedroom"], "parent_config", {}
@@ -264,8 +272,19 @@ async def test_load_meta_area_entities_respects_exclude_list(
     mock_child_entry.state = ConfigEntryState.LOADED
     mock_child_entry.domain = "magic_areas"
     mock_child_entry.entry_id = "child_config"
+    mock_child_entry.unique_id = None
     # Mock the coordinator snapshot with area_config
     mock_child_entry.runtime_data.coordinator.data.area_config.slug = "bedroom"
+    mock_child_entry.runtime_data.coordinator.data.magic_entities = {
+        "sensor": [
+            {"entity_id": excluded_entity.entity_id},
+            {"entity_id": included_entity.entity_id},
+        ]
+    }
+    mock_entity_registry.async_get.side_effect = {
+        excluded_entity.entity_id: excluded_entity,
+        included_entity.entity_id: included_entity,
+    }.get
 
     with (
         patch(
@@ -275,6 +294,9 @@ async def test_load_meta_area_entities_respects_exclude_list(
         patch.object(
             hass.config_entries, "async_entries", return_value=[mock_child_entry]
         ),
+        patch.object(
+            hass.config_entries, "async_get_entry", return_value=mock_child_entry
+        ),
     ):
         entities, magic_entities = await load_meta_area_entities(
             hass,
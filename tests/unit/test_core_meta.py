@@ -1,7 +1,25 @@
 """Tests for core meta area helpers."""
 
-from custom_components.magic_areas.area_state import AreaStates
-from custom_components.magic_areas.core.meta import aggregate_secondary_states
+from unittest.mock import MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
+
+from custom_components.magic_areas.area_state import AreaStates, MetaAreaType
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.core.meta import (
+    SecondaryStateCounters,
+    aggregate_secondary_states,
+    area_topology_descriptor,
+    async_get_area_topology_index,
+)
+from custom_components.magic_areas.core.runtime_model import (
+    build_presence_tracking_unique_id,
+)
 
 
 class TestAggregateSecondaryStates:
@@ -208,3 +226,145 @@ class TestAggregateSecondaryStates:
         assert AreaStates.OCCUPIED in result
         assert AreaStates.DARK in result
         assert AreaStates.BRIGHT not in result
+
+
+class TestSecondaryStateCounters:
+    """Tests for incremental meta-area secondary-state counters."""
+
+    _STATES = [AreaStates.DARK, AreaStates.SLEEP, AreaStates.OCCUPIED]
+
+    def test_counters_match_full_aggregation(self) -> None:
+        """Counter aggregation matches the list-based aggregation in every mode."""
+        children: dict[str, list[str]] = {
+            "kitchen": [AreaStates.OCCUPIED, AreaStates.DARK],
+            "bedroom": [AreaStates.OCCUPIED, AreaStates.SLEEP, AreaStates.DARK],
+            "office": [AreaStates.OCCUPIED],
+        }
+        counters = SecondaryStateCounters()
+        for child_id, states in children.items():
+            counters.set_child(child_id, states)
+
+        for mode in ("any", "all", "majority"):
+            assert counters.aggregate(mode, self._STATES) == (
+                aggregate_secondary_states(list(children.values()), mode, self._STATES)
+            )
+
+    def test_deltas_update_counts_in_place(self) -> None:
+        """Child transitions adjust only the states that changed."""
+        counters = SecondaryStateCounters()
+        counters.set_child("kitchen", [AreaStates.OCCUPIED, AreaStates.DARK])
+        counters.set_child("bedroom", [AreaStates.OCCUPIED, AreaStates.DARK])
+
+        assert counters.aggregate("all", self._STATES) == [
+            AreaStates.DARK,
+            AreaStates.OCCUPIED,
+        ]
+        assert not counters.set_child("kitchen", [AreaStates.DARK, "occupied"])
+
+        assert counters.set_child("kitchen", [AreaStates.OCCUPIED])
+        assert counters.count(AreaStates.DARK) == 1
+        assert counters.aggregate("all", self._STATES) == [
+            AreaStates.OCCUPIED,
+            AreaStates.BRIGHT,
+        ]
+
+        assert counters.set_child("bedroom", None)
+        counters.retain(["bedroom"])
+
+        assert counters.active_child_count == 0
+        assert counters.count(AreaStates.OCCUPIED) == 0
+        assert counters.aggregate("any", self._STATES) == [AreaStates.BRIGHT]
+
+
+def _loaded_area_entry(
+    entry_id: str, area_id: str, *, floor_id: str | None = None
+) -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.state = ConfigEntryState.LOADED
+    area_config = entry.runtime_data.coordinator.data.area_config
+    area_config.id = area_id
+    area_config.slug = area_id
+    area_config.floor_id = floor_id
+    area_config.config = {"type": "interior"}
+    return entry
+
+
+class TestAreaTopologyIndex:
+    """Tests for the maintained meta-area topology index."""
+
+    async def test_child_areas_scan_entries_once_until_invalidated(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Meta lookups reuse the index until an indexed area changes."""
+        ar.async_get(hass).async_create("Kitchen")
+        entries = [
+            _loaded_area_entry("kitchen_entry", "kitchen", floor_id="ground"),
+            _loaded_area_entry("bedroom_entry", "bedroom", floor_id="upstairs"),
+        ]
+        index = async_get_area_topology_index(hass)
+        with patch.object(
+            hass.config_entries, "async_entries", return_value=entries
+        ) as mock_entries:
+            assert index.child_areas(MetaAreaType.GLOBAL, "global", None) == [
+                "kitchen",
+                "bedroom",
+            ]
+            assert index.child_areas("ground", "ground", "ground") == ["kitchen"]
+            assert index.child_areas("ground", "ground", "ground") == ["kitchen"]
+            assert index.child_entry_ids(["bedroom", "attic"]) == ["bedroom_entry"]
+            assert mock_entries.call_count == 1
+
+            # Areas and floors without a loaded Magic Areas entry are ignored.
+            ar.async_get(hass).async_create("Hallway")
+            fr.async_get(hass).async_create("Attic")
+            await hass.async_block_till_done()
+            index.child_areas(MetaAreaType.GLOBAL, "global", None)
+            assert mock_entries.call_count == 1
+
+            ar.async_get(hass).async_update("kitchen", aliases={"Cookhouse"})
+            await hass.async_block_till_done()
+            index.child_areas(MetaAreaType.GLOBAL, "global", None)
+            assert mock_entries.call_count == 2
+
+        assert index.diagnostics()["hits"] == 2
+
+    async def test_presence_ids_drop_only_for_touched_entities(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Entity registry events drop the presence id they name, not the map."""
+        registry = er.async_get(hass)
+        kitchen = registry.async_get_or_create(
+            BINARY_SENSOR_DOMAIN,
+            DOMAIN,
+            build_presence_tracking_unique_id(area_id="kitchen"),
+        )
+        index = async_get_area_topology_index(hass)
+        assert index.presence_entity_id("kitchen") == kitchen.entity_id
+        assert index.presence_entity_id("bedroom") is None
+
+        registry.async_get_or_create("light", "test", "unrelated")
+        await hass.async_block_till_done()
+        assert index.diagnostics()["presence_entities"] == 1
+
+        registry.async_update_entity(kitchen.entity_id, new_entity_id="binary_sensor.k")
+        await hass.async_block_till_done()
+        assert index.diagnostics()["presence_entities"] == 0
+        assert index.presence_entity_id("kitchen") == "binary_sensor.k"
+
+    async def test_publish_refreshes_changed_child_in_place(
+        self, hass: HomeAssistant
+    ) -> None:
+        """A child snapshot rebuilt with a new floor moves between floor metas."""
+        entry = _loaded_area_entry("kitchen_entry", "kitchen", floor_id="ground")
+        index = async_get_area_topology_index(hass)
+        with patch.object(hass.config_entries, "async_entries", return_value=[entry]):
+            assert index.child_areas("ground", "ground", "ground") == ["kitchen"]
+
+            area_config = entry.runtime_data.coordinator.data.area_config
+            area_config.floor_id = "upstairs"
+            index.publish("kitchen_entry", area_topology_descriptor(area_config))
+
+            assert index.child_areas("ground", "ground", "ground") == []
+            assert index.child_areas("upstairs", "upstairs", "upstairs") == ["kitchen"]
+        assert index.diagnostics()["rebuilds"] == 1
@@ -8,6 +8,30 @@ from custom_components.magic_areas.core.wasp_state_machine import (
 )
 
 
+def _evaluate(
+    machine: WaspStateMachine,
+    wasp_states: dict[str, str],
+    box_states: dict[str, str],
+) -> WaspStateUpdate:
+    """Resync the running counts from full state dicts and evaluate."""
+    machine.resync(wasp_states, box_states)
+    return machine.evaluate()
+
+
+def _evaluate_wasp(
+    machine: WaspStateMachine, wasp_states: dict[str, str]
+) -> WaspStateUpdate:
+    """Evaluate wasp sensor states with every box sensor closed."""
+    return _evaluate(machine, wasp_states, {})
+
+
+def _evaluate_box(
+    machine: WaspStateMachine, box_states: dict[str, str]
+) -> WaspStateUpdate:
+    """Evaluate box sensor states with no wasp sensor active."""
+    return _evaluate(machine, {}, box_states)
+
+
 class TestWaspStateUpdate:
     """Tests for WaspStateUpdate dataclass."""
 
@@ -71,11 +95,12 @@ class TestWaspUpdate:
     def test_update_wasp_sensor_on(self) -> None:
         """Test wasp sensor turning ON → motion detected."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_wasp(
+        result = _evaluate_wasp(
+            machine,
             {
                 "motion_sensor_1": STATE_ON,
                 "motion_sensor_2": STATE_OFF,
-            }
+            },
         )
         assert result.wasp_active is True
         assert result.is_present is True
@@ -87,16 +112,18 @@ class TestWaspUpdate:
         """Test wasp sensor turning OFF when box also OFF."""
         machine = WaspStateMachine(wasp_timeout=300)
         # First set wasp active
-        machine.update_wasp(
+        _evaluate_wasp(
+            machine,
             {
                 "motion_sensor": STATE_ON,
-            }
+            },
         )
         # Then all OFF with timeout configured
-        result = machine.update_wasp(
+        result = _evaluate_wasp(
+            machine,
             {
                 "motion_sensor": STATE_OFF,
-            }
+            },
         )
         # Should request timer to eventually clear wasp
         assert result.wasp_active is True  # Still active, waiting for timeout
@@ -106,7 +133,7 @@ class TestWaspUpdate:
     def test_update_wasp_empty_dict(self) -> None:
         """Test update with empty sensor dict → all OFF."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_wasp({})
+        result = _evaluate_wasp(machine, {})
         assert result.wasp_active is False
         assert result.box_open is False
 
@@ -117,11 +144,12 @@ class TestBoxUpdate:
     def test_update_box_open(self) -> None:
         """Test box sensor turning ON → door open."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_box(
+        result = _evaluate_box(
+            machine,
             {
                 "door_sensor_1": STATE_ON,
                 "door_sensor_2": STATE_OFF,
-            }
+            },
         )
         assert result.box_open is True
         assert result.wasp_active is False
@@ -138,10 +166,11 @@ class TestBoxUpdate:
         machine._timeout_requested = True
 
         # Then box opens (sensor ON)
-        result = machine.update_box(
+        result = _evaluate_box(
+            machine,
             {
                 "door_sensor": STATE_ON,
-            }
+            },
         )
         assert result.wasp_active is False
         assert result.box_open is True
@@ -151,17 +180,18 @@ class TestBoxUpdate:
     def test_update_box_empty_dict(self) -> None:
         """Test update with empty sensor dict → box OFF."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_box({})
+        result = _evaluate_box(machine, {})
         assert result.box_open is False
 
 
 class TestCombinedUpdate:
-    """Tests for update_all() with both sensors."""
+    """Tests for evaluating both sensor groups."""
 
     def test_wasp_on_box_off(self) -> None:
         """Test motion detected while door is closed."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
@@ -172,7 +202,8 @@ class TestCombinedUpdate:
     def test_wasp_off_box_on(self) -> None:
         """Test no motion while door is open."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_ON},
         )
@@ -183,7 +214,8 @@ class TestCombinedUpdate:
     def test_wasp_on_box_on(self) -> None:
         """Test motion detected while door is open."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_ON},
         )
@@ -194,7 +226,8 @@ class TestCombinedUpdate:
     def test_wasp_off_box_off_no_timeout(self) -> None:
         """Test both OFF with no previous state → stay OFF."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -207,12 +240,14 @@ class TestCombinedUpdate:
         """Test both OFF after motion detected → request timer."""
         machine = WaspStateMachine(wasp_timeout=300)
         # First detect motion
-        machine.update_all(
+        _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
         # Then both OFF
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -223,12 +258,14 @@ class TestCombinedUpdate:
         """Test with timeout=0 → no timer requested."""
         machine = WaspStateMachine(wasp_timeout=0)
         # Detect motion
-        machine.update_all(
+        _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
         # Then both OFF
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -266,7 +303,7 @@ class TestWaspTimeout:
     def test_is_present_reflects_timeout_state(self) -> None:
         """Test is_present changes when timeout clears wasp."""
         machine = WaspStateMachine(wasp_timeout=300)
-        machine.update_all({"motion": STATE_ON}, {"door": STATE_OFF})
+        _evaluate(machine, {"motion": STATE_ON}, {"door": STATE_OFF})
         assert machine.is_present is True
 
         machine.on_wasp_timeout()
@@ -276,32 +313,35 @@ class TestWaspTimeout:
 class TestDelayComplete:
     """Tests for box-close delay completion."""
 
-    def test_on_delay_complete_motion_on(self) -> None:
+    def test_delay_complete_motion_on(self) -> None:
         """Test delay completion with motion still detected."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.on_delay_complete(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
         assert result.wasp_active is True
         assert result.cancel_timer is True
 
-    def test_on_delay_complete_motion_off(self) -> None:
+    def test_delay_complete_motion_off(self) -> None:
         """Test delay completion with no motion."""
         machine = WaspStateMachine(wasp_timeout=300)
         machine.wasp = True  # Simulate prior state
-        result = machine.on_delay_complete(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
         assert result.wasp_active is True
         assert result.request_timer == 300.0
 
-    def test_on_delay_complete_door_still_open(self) -> None:
+    def test_delay_complete_door_still_open(self) -> None:
         """Test delay completion with door still open."""
         machine = WaspStateMachine(wasp_timeout=300)
         machine.wasp = True
-        result = machine.on_delay_complete(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_ON},
         )
@@ -317,7 +357,8 @@ class TestTimerRequests:
         """Test request_timer field matches timeout."""
         machine = WaspStateMachine(wasp_timeout=600)
         machine.wasp = True
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -327,7 +368,8 @@ class TestTimerRequests:
         """Test cancel_timer is True when motion detected."""
         machine = WaspStateMachine(wasp_timeout=300)
         machine._timeout_requested = True
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
@@ -337,7 +379,8 @@ class TestTimerRequests:
         """Test cancel_timer is True when box opens."""
         machine = WaspStateMachine(wasp_timeout=300)
         machine._timeout_requested = True
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_ON},
         )
@@ -346,7 +389,8 @@ class TestTimerRequests:
     def test_no_cancel_timer_when_already_off(self) -> None:
         """Test cancel_timer is False when no timeout pending."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -359,14 +403,15 @@ class TestEdgeCases:
     def test_no_sensors_all_empty(self) -> None:
         """Test with completely empty sensor dicts."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all({}, {})
+        result = _evaluate(machine, {}, {})
         assert result.wasp_active is False
         assert result.box_open is False
 
     def test_all_sensors_off(self) -> None:
         """Test with all sensors explicitly OFF."""
         machine = WaspStateMachine(wasp_timeout=300)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"m1": STATE_OFF, "m2": STATE_OFF, "m3": STATE_OFF},
             {"d1": STATE_OFF, "d2": STATE_OFF},
         )
@@ -377,7 +422,8 @@ class TestEdgeCases:
         """Test aggregation of multiple wasp sensors (OR logic)."""
         machine = WaspStateMachine(wasp_timeout=300)
         # One of many sensors ON → ON
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"m1": STATE_OFF, "m2": STATE_ON, "m3": STATE_OFF},
             {"d1": STATE_OFF},
         )
@@ -387,7 +433,8 @@ class TestEdgeCases:
         """Test aggregation of multiple box sensors (OR logic)."""
         machine = WaspStateMachine(wasp_timeout=300)
         # One of many sensors ON → ON
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"m1": STATE_OFF},
             {"d1": STATE_OFF, "d2": STATE_ON, "d3": STATE_OFF},
         )
@@ -398,7 +445,8 @@ class TestEdgeCases:
         machine = WaspStateMachine(wasp_timeout=300)
 
         # Scenario: Person enters room (motion detected)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_OFF},
         )
@@ -406,7 +454,8 @@ class TestEdgeCases:
         assert result.is_present is True
 
         # Person exits (door opens)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_ON},
         )
@@ -414,7 +463,8 @@ class TestEdgeCases:
         assert result.wasp_active is False  # Cleared by box open
 
         # Door closes, motion sensor still off
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
@@ -427,14 +477,16 @@ class TestEdgeCases:
         machine = WaspStateMachine(wasp_timeout=300)
 
         # Motion detected while door is open
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_ON},
             {"door": STATE_ON},
         )
         assert result.wasp_active is True
 
         # Door bounces (closes momentarily)
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},  # Motion ends during door bounce
             {"door": STATE_OFF},
         )
@@ -443,7 +495,8 @@ class TestEdgeCases:
         assert result.request_timer == 300.0
 
         # Door opens again before timeout
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_ON},
         )
@@ -454,9 +507,51 @@ class TestEdgeCases:
         """Test timeout values are converted to floats correctly."""
         machine = WaspStateMachine(wasp_timeout=600)
         machine.wasp = True
-        result = machine.update_all(
+        result = _evaluate(
+            machine,
             {"motion": STATE_OFF},
             {"door": STATE_OFF},
         )
         assert isinstance(result.request_timer, float)
         assert result.request_timer == 600.0
+
+
+class TestRunningCounts:
+    """Tests for delta-maintained sensor counts."""
+
+    def test_deltas_track_any_sensor_on(self) -> None:
+        """Counts follow transitions without re-reading every sensor."""
+        machine = WaspStateMachine(wasp_timeout=0)
+        machine.resync(
+            {"motion_a": STATE_OFF, "motion_b": STATE_OFF}, {"door": STATE_OFF}
+        )
+
+        machine.apply_wasp_change(STATE_OFF, STATE_ON)
+        machine.apply_wasp_change(STATE_OFF, STATE_ON)
+        machine.apply_wasp_change(STATE_ON, STATE_OFF)
+        assert machine.evaluate().wasp_active is True
+
+        machine.apply_wasp_change(STATE_ON, "unavailable")
+        machine.apply_box_change(None, STATE_ON)
+        result = machine.evaluate()
+        assert machine.wasp_counts.state == STATE_OFF
+        assert result.box_open is True
+        assert result.wasp_active is False
+
+    def test_counts_are_clamped_to_group_size(self) -> None:
+        """Duplicate deltas cannot push a count outside the sensor group."""
+        machine = WaspStateMachine(wasp_timeout=0)
+        machine.resync({"motion": STATE_OFF}, {})
+
+        machine.apply_wasp_change(STATE_ON, STATE_OFF)
+        machine.apply_wasp_change(STATE_OFF, STATE_ON)
+        machine.apply_wasp_change(STATE_OFF, STATE_ON)
+
+        assert machine.wasp_counts.on == 1
+
+    def test_resync_reports_drift(self) -> None:
+        """Resync reports whether the aggregated group states changed."""
+        machine = WaspStateMachine(wasp_timeout=0)
+        assert machine.resync({"motion": STATE_OFF}, {"door": STATE_OFF}) is False
+        assert machine.resync({"motion": STATE_OFF}, {"door": STATE_ON}) is True
+        assert machine.box_counts.state == STATE_ON
@@ -0,0 +1,211 @@
+"""Tests for the house-level cover command batcher."""
+
+from __future__ import annotations
+
+from homeassistant.components.cover import ATTR_CURRENT_POSITION
+from homeassistant.components.cover.const import DOMAIN as COVER_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_CLOSE_COVER,
+    SERVICE_OPEN_COVER,
+    STATE_CLOSED,
+    STATE_OPEN,
+)
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.magic_areas.core.controls import (
+    ControlAction,
+    async_get_command_context_index,
+    async_get_cover_command_batcher,
+    async_release_cover_command_batcher,
+)
+
+
+def _action(service: str, *entity_ids: str) -> ControlAction:
+    return ControlAction(
+        domain=COVER_DOMAIN, service=service, target_entity_ids=entity_ids
+    )
+
+
+async def test_actions_from_many_areas_share_one_call(hass: HomeAssistant) -> None:
+    """Identical commands merge into one call; covers at target are skipped."""
+    opened = async_mock_service(hass, COVER_DOMAIN, SERVICE_OPEN_COVER)
+    closed = async_mock_service(hass, COVER_DOMAIN, SERVICE_CLOSE_COVER)
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    hass.states.async_set("cover.office", STATE_CLOSED)
+    hass.states.async_set("cover.den", STATE_OPEN, {ATTR_CURRENT_POSITION: 100})
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+    skipped: list[str] = []
+
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"))
+    batcher.submit(
+        _action(SERVICE_OPEN_COVER, "cover.office", "cover.den"),
+        on_skipped=skipped.append,
+    )
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"))
+    await hass.async_block_till_done()
+
+    assert len(opened) == 1
+    assert opened[0].data[ATTR_ENTITY_ID] == ["cover.kitchen", "cover.office"]
+    assert closed == []
+    assert skipped == ["cover.den"]
+    assert batcher.diagnostics() == {
+        "submitted": 3,
+        "calls": 1,
+        "failed": 0,
+        "skipped_at_target": 1,
+        "pending": 0,
+    }
+
+
+async def test_batches_are_staggered_in_position_order(hass: HomeAssistant) -> None:
+    """Closing batches go before opening ones, separated by the stagger."""
+    order: list[str] = []
+    for service in (SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER):
+        hass.services.async_register(
+            COVER_DOMAIN,
+            service,
+            lambda call: order.append(call.service),
+        )
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    hass.states.async_set("cover.bedroom", STATE_OPEN)
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"))
+    batcher.submit(_action(SERVICE_CLOSE_COVER, "cover.bedroom"), stagger_seconds=0.01)
+    await hass.async_block_till_done()
+
+    assert order == [SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER]
+
+
+async def test_merged_call_context_is_shared_with_every_submitter(
+    hass: HomeAssistant,
+) -> None:
+    """Each contributing controller recognizes the merged call as its own."""
+    opened = async_mock_service(hass, COVER_DOMAIN, SERVICE_OPEN_COVER)
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    hass.states.async_set("cover.office", STATE_CLOSED)
+    index = async_get_command_context_index(hass)
+    kitchen = index.issue(area_id="kitchen", controller="kitchen", action="open")
+    office = index.issue(area_id="office", controller="office", action="open")
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"), context=kitchen)
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.office"), context=office)
+    await hass.async_block_till_done()
+
+    assert len(opened) == 1
+    assert opened[0].context is kitchen
+    assert index.is_self_caused(opened[0].context, controller="kitchen")
+    assert index.is_self_caused(opened[0].context, controller="office")
+
+
+async def test_failed_batch_does_not_stop_later_batches(hass: HomeAssistant) -> None:
+    """A failing call is logged and reported; the next batch is still sent."""
+
+    def _fail(call: ServiceCall) -> None:
+        raise HomeAssistantError("cover offline")
+
+    hass.services.async_register(COVER_DOMAIN, SERVICE_CLOSE_COVER, _fail)
+    opened = async_mock_service(hass, COVER_DOMAIN, SERVICE_OPEN_COVER)
+    hass.states.async_set("cover.bedroom", STATE_OPEN)
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+    skipped: list[str] = []
+
+    closing = batcher.submit(
+        _action(SERVICE_CLOSE_COVER, "cover.bedroom"),
+        on_skipped=skipped.append,
+        blocking=True,
+    )
+    opening = batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"))
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError):
+        await closing
+    await opening
+    assert len(opened) == 1
+    assert skipped == ["cover.bedroom"]
+    assert batcher.diagnostics()["failed"] == 1
+    assert batcher.diagnostics()["calls"] == 1
+
+
+async def test_stagger_only_spaces_batches_of_the_same_area(
+    hass: HomeAssistant,
+) -> None:
+    """An area's stagger does not delay a batch it did not contribute to."""
+    order: list[str] = []
+    for service in (SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER):
+        hass.services.async_register(
+            COVER_DOMAIN,
+            service,
+            lambda call: order.append(call.service),
+        )
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    hass.states.async_set("cover.bedroom", STATE_OPEN)
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+
+    batcher.submit(
+        _action(SERVICE_CLOSE_COVER, "cover.bedroom"),
+        area_id="bedroom",
+        stagger_seconds=3600,
+    )
+    batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"), area_id="kitchen")
+    await hass.async_block_till_done()
+
+    assert order == [SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER]
+
+
+async def test_release_cancels_pending_flush(hass: HomeAssistant) -> None:
+    """Releasing the batcher cancels the flush and its waiting submitters."""
+    opened = async_mock_service(hass, COVER_DOMAIN, SERVICE_OPEN_COVER)
+    hass.states.async_set("cover.kitchen", STATE_CLOSED)
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 3600
+
+    waiter = batcher.submit(_action(SERVICE_OPEN_COVER, "cover.kitchen"))
+    async_release_cover_command_batcher(hass)
+    await hass.async_block_till_done()
+
+    assert waiter.cancelled()
+    assert opened == []
+    assert batcher.diagnostics()["pending"] == 0
+
+
+async def test_partially_open_group_is_still_opened(hass: HomeAssistant) -> None:
+    """A group reporting open is sent the command while a member is closed."""
+    opened = async_mock_service(hass, COVER_DOMAIN, SERVICE_OPEN_COVER)
+    hass.states.async_set("cover.left", STATE_OPEN)
+    hass.states.async_set("cover.right", STATE_CLOSED)
+    hass.states.async_set("cover.blind", STATE_OPEN, {ATTR_CURRENT_POSITION: 100})
+    hass.states.async_set(
+        "cover.living_room_blinds",
+        STATE_OPEN,
+        {ATTR_ENTITY_ID: ["cover.left", "cover.right", "cover.blind"]},
+    )
+    hass.states.async_set(
+        "cover.office_blinds",
+        STATE_OPEN,
+        {ATTR_ENTITY_ID: ["cover.left", "cover.blind"]},
+    )
+    batcher = async_get_cover_command_batcher(hass)
+    batcher.window_seconds = 0
+    skipped: list[str] = []
+
+    batcher.submit(
+        _action(SERVICE_OPEN_COVER, "cover.living_room_blinds", "cover.office_blinds"),
+        on_skipped=skipped.append,
+    )
+    await hass.async_block_till_done()
+
+    assert len(opened) == 1
+    assert opened[0].data[ATTR_ENTITY_ID] == ["cover.living_room_blinds"]
+    assert skipped == ["cover.office_blinds"]
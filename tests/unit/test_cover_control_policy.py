@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from homeassistant.core import Context
 from homeassistant.const import (
     SERVICE_CLOSE_COVER,
     SERVICE_OPEN_COVER,
@@ -10,7 +11,10 @@ from homeassistant.const import (
 )
 
 from custom_components.magic_areas.area_state import AreaStates
-from custom_components.magic_areas.core.controls import ControlActionType
+from custom_components.magic_areas.core.controls import (
+    ControlActionType,
+    async_get_command_context_index,
+)
 from custom_components.magic_areas.core.controls.policies.cover import (
     CoverGroupsConfig,
     CoverPresetAction,
@@ -35,7 +39,14 @@ class _State:
 class _Event:
     """Minimal event object for manual-hold tests."""
 
-    def __init__(self, entity_id: str, old_state: str, new_state: str) -> None:
+    def __init__(
+        self,
+        entity_id: str,
+        old_state: str,
+        new_state: str,
+        context: Context | None = None,
+    ) -> None:
+        self.context = context
         self.data = {
             "entity_id": entity_id,
             "old_state": _State(old_state),
@@ -268,6 +279,68 @@ async def test_cover_switch_expected_state_change_does_not_start_hold(
     assert switch._expected_cover_group_state_changes == set()
 
 
+async def test_cover_switch_self_caused_context_does_not_start_hold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """State changes carrying a context we issued should be classified as ours."""
+    switch = object.__new__(CoverControlSwitch)
+    switch.hass = Mock(data={})
+    switch._attr_unique_id = "cover_control_kitchen"
+    switch._manual_hold_seconds = 900
+    switch._manual_hold_until_monotonic = MonotonicDeadlineMap()
+    switch._manual_hold_timer_cancel = None
+    switch._expected_cover_group_state_changes = {"cover.kitchen_blinds"}
+    schedule_check = Mock()
+    monkeypatch.setattr(
+        switch, "_schedule_next_manual_hold_expiry_check", schedule_check
+    )
+    context = async_get_command_context_index(switch.hass).issue(
+        area_id="kitchen",
+        controller="cover_control_kitchen",
+        action="activate",
+    )
+
+    await switch.cover_group_state_changed(
+        _Event("cover.kitchen_blinds", "closed", "opening", context)  # type: ignore[arg-type]
+    )
+    await switch.cover_group_state_changed(
+        _Event("cover.kitchen_blinds", "opening", "open", Context(parent_id=context.id))  # type: ignore[arg-type]
+    )
+
+    schedule_check.assert_not_called()
+    assert not switch._manual_hold_active()
+    assert switch._expected_cover_group_state_changes == set()
+
+
+async def test_cover_switch_foreign_context_starts_hold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Contexts issued for another controller should not suppress manual holds."""
+    switch = object.__new__(CoverControlSwitch)
+    switch.hass = Mock(data={})
+    switch._attr_unique_id = "cover_control_kitchen"
+    switch._manual_hold_seconds = 900
+    switch._manual_hold_until_monotonic = MonotonicDeadlineMap()
+    switch._manual_hold_timer_cancel = None
+    switch._expected_cover_group_state_changes = set()
+    schedule_check = Mock()
+    monkeypatch.setattr(
+        switch, "_schedule_next_manual_hold_expiry_check", schedule_check
+    )
+    context = async_get_command_context_index(switch.hass).issue(
+        area_id="office",
+        controller="cover_control_office",
+        action="activate",
+    )
+
+    await switch.cover_group_state_changed(
+        _Event("cover.kitchen_blinds", "closed", "open", context)  # type: ignore[arg-type]
+    )
+
+    schedule_check.assert_called_once_with()
+    assert switch._manual_hold_active("cover.kitchen_blinds")
+
+
 def test_cover_manual_hold_entities_prune_and_sort(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
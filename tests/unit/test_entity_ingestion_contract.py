@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.magic_areas.area_state import AreaType
@@ -62,6 +63,7 @@ def test_entity_loading_public_api_exports() -> None:
     assert callable(entity_ingestion.group_entities)
     assert "load_area_entities" in entity_ingestion.__all__
     assert "load_meta_area_entities" in entity_ingestion.__all__
+    assert "MetaChildInventory" in entity_ingestion.__all__
     assert "filter_entity_list" in entity_ingestion.__all__
     assert "should_exclude_entity" in entity_ingestion.__all__
 
@@ -129,26 +131,42 @@ async def test_load_area_entities_parity_include_shape(
     assert entities["light"][0]["entity_id"] == "light.contract_included"
 
 
+def _meta_child_entry(
+    entry_id: str, slug: str, magic_entities: _EntityMap
+) -> MagicMock:
+    from homeassistant.config_entries import ConfigEntryState
+
+    entry = MagicMock()
+    entry.state = ConfigEntryState.LOADED
+    entry.domain = "magic_areas"
+    entry.entry_id = entry_id
+    entry.unique_id = None
+    snapshot = entry.runtime_data.coordinator.data
+    snapshot.area_config.slug = slug
+    snapshot.magic_entities = magic_entities
+    return entry
+
+
+def _registry_entry(entity_id: str) -> MagicMock:
+    entity = MagicMock()
+    entity.entity_id = entity_id
+    entity.domain = entity_id.split(".")[0]
+    entity.original_device_class = None
+    entity.unit_of_measurement = None
+    return entity
+
+
 @pytest.mark.asyncio
 async def test_load_meta_area_entities_parity_shape(
     hass: HomeAssistant,
 ) -> None:
     """Meta-area loading keeps grouped output shape for child entities."""
-    from homeassistant.config_entries import ConfigEntryState
-
     mock_entity_registry = MagicMock()
-    child_entity = MagicMock()
-    child_entity.entity_id = "sensor.child_temp"
-    child_entity.domain = "sensor"
     mock_entity_registry.entities.get_entries_for_config_entry_id.return_value = [
-        child_entity
+        _registry_entry("sensor.child_temp")
     ]
-
-    mock_child_entry = MagicMock()
-    mock_child_entry.state = ConfigEntryState.LOADED
-    mock_child_entry.domain = "magic_areas"
-    mock_child_entry.entry_id = "child_config"
-    mock_child_entry.runtime_data.coordinator.data.area_config.slug = "bedroom"
+    mock_child_entry = _meta_child_entry("child_config", "bedroom", {})
+    hass.states.async_set("sensor.child_temp", "21", {"unit": "C"})
 
     with (
         patch(
@@ -158,6 +176,9 @@ async def test_load_meta_area_entities_parity_shape(
         patch.object(
             hass.config_entries, "async_entries", return_value=[mock_child_entry]
         ),
+        patch.object(
+            hass.config_entries, "async_get_entry", return_value=mock_child_entry
+        ),
     ):
         entities, magic_entities = await entity_ingestion.load_meta_area_entities(
             hass,
@@ -167,8 +188,116 @@ async def test_load_meta_area_entities_parity_shape(
         )
 
     assert magic_entities == {}
-    assert "sensor" in entities
-    assert entities["sensor"][0]["entity_id"] == "sensor.child_temp"
+    assert entities == {"sensor": [{"entity_id": "sensor.child_temp", "unit": "C"}]}
+
+
+@pytest.mark.asyncio
+async def test_meta_inventory_recomposes_only_changed_children(
+    hass: HomeAssistant,
+) -> None:
+    """Only children marked by their own updates are rebuilt on compose."""
+    registry_entries = {
+        "kitchen_entry": [_registry_entry("light.kitchen")],
+        "bedroom_entry": [
+            _registry_entry("light.bedroom"),
+            _registry_entry("light.excluded"),
+        ],
+    }
+    mock_entity_registry = MagicMock()
+    mock_entity_registry.entities.get_entries_for_config_entry_id.side_effect = (
+        lambda entry_id: registry_entries[entry_id]
+    )
+    entries = {
+        "kitchen_entry": _meta_child_entry(
+            "kitchen_entry", "kitchen", {"light": [{"entity_id": "light.kitchen"}]}
+        ),
+        "bedroom_entry": _meta_child_entry(
+            "bedroom_entry", "bedroom", {"light": [{"entity_id": "light.bedroom"}]}
+        ),
+    }
+    inventory = entity_ingestion.MetaChildInventory()
+
+    def _compose() -> list[str]:
+        return [
+            entity.entity_id
+            for entity in inventory.compose(
+                hass,
+                mock_entity_registry,
+                child_entry_ids=["kitchen_entry", "bedroom_entry"],
+                exclude_entities=["light.excluded"],
+            )
+        ]
+
+    with patch.object(hass.config_entries, "async_get_entry", side_effect=entries.get):
+        assert _compose() == ["light.kitchen", "light.bedroom"]
+        assert _compose() == ["light.kitchen", "light.bedroom"]
+
+        # A child refresh with the same magic entities leaves it clean.
+        bedroom_coordinator = entries["bedroom_entry"].runtime_data.coordinator
+        (bedroom_listener,) = bedroom_coordinator.async_add_listener.call_args.args
+        bedroom_listener()
+        assert inventory.diagnostics()["dirty"] == 0
+
+        registry_entries["bedroom_entry"].append(_registry_entry("switch.bedroom"))
+        bedroom_coordinator.data = MagicMock()
+        bedroom_coordinator.data.magic_entities = {
+            "light": [{"entity_id": "light.bedroom"}],
+            "switch": [{"entity_id": "switch.bedroom"}],
+        }
+        bedroom_listener()
+        assert _compose() == ["light.kitchen", "light.bedroom", "switch.bedroom"]
+
+        hass.states.async_set("light.kitchen", "on", {"device_class": "light"})
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "update", "entity_id": "light.kitchen", "changes": {}},
+        )
+        await hass.async_block_till_done()
+        (kitchen, *_rest) = inventory.compose(
+            hass,
+            mock_entity_registry,
+            child_entry_ids=["kitchen_entry", "bedroom_entry"],
+            exclude_entities=["light.excluded"],
+        )
+
+    assert kitchen.attributes == {"device_class": "light"}
+    assert inventory.diagnostics() == {
+        "children": 2,
+        "entities": 4,
+        "dirty": 0,
+        "recomposed": 4,
+        "reused": 4,
+    }
+
+
+@pytest.mark.asyncio
+async def test_meta_inventory_unlisten_drops_child_subscriptions(
+    hass: HomeAssistant,
+) -> None:
+    """Unlisten releases child coordinator listeners and registry events."""
+    entries = {"kitchen_entry": _meta_child_entry("kitchen_entry", "kitchen", {})}
+    unsubscribe = MagicMock()
+    coordinator = entries["kitchen_entry"].runtime_data.coordinator
+    coordinator.async_add_listener.return_value = unsubscribe
+    inventory = entity_ingestion.MetaChildInventory()
+
+    with patch.object(hass.config_entries, "async_get_entry", side_effect=entries.get):
+        inventory.compose(
+            hass,
+            MagicMock(),
+            child_entry_ids=["kitchen_entry"],
+            exclude_entities=[],
+        )
+    inventory.async_unlisten()
+    hass.bus.async_fire(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "create", "entity_id": "light.new"},
+    )
+    await hass.async_block_till_done()
+
+    unsubscribe.assert_called_once()
+    assert inventory.diagnostics()["children"] == 0
+    assert inventory.diagnostics()["dirty"] == 0
 
 
 @pytest.mark.asyncio
@@ -3,20 +3,24 @@
 from typing import cast
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from homeassistant.core import Event, State
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from homeassistant.core import Event, EventStateChangedData, State
 from homeassistant.const import STATE_OFF, STATE_ON
 
 from custom_components.magic_areas.coordinator import MagicAreasCoordinator
 from custom_components.magic_areas.switch import FanControlSwitch
 from custom_components.magic_areas.core.runtime_model import AreaConfig
 from custom_components.magic_areas.area_state import AreaStates
-from custom_components.magic_areas.core.controls import ControlGroupContext
+from custom_components.magic_areas.core.controls import (
+    ControlGroupContext,
+    async_get_control_evaluation_log,
+)
 from custom_components.magic_areas.core.controls.runtime_support import (
     MonotonicDeadlineMap,
 )
 from custom_components.magic_areas.core.controls.policies.fan import FanPolicySignals
 from custom_components.magic_areas.config_keys.area import (
+    CONF_VERBOSE_CONTROL_DIAGNOSTICS,
     CONF_FAN_CONTROLLER_ACTIVE_STATES,
     CONF_FAN_CONTROLLER_CLEAR_BEHAVIOR,
     CONF_FAN_CONTROLLER_DETECTION_MODE,
@@ -397,6 +401,73 @@ async def test_run_logic_exposes_fan_controller_debug_attributes(
     assert attrs["unavailable_hold_fan_reasons"] == ["odor"]
 
 
+@pytest.mark.asyncio
+async def test_run_logic_writes_state_only_when_debug_attributes_change(
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    mock_hass: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated evaluations with the same outcome do not rewrite the entity."""
+    switch = FanControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = mock_hass
+    switch._attr_is_on = True
+    switch._fan_group_entity_id = "fan.test_fan"
+    switch.tracked_entity_id = "sensor.test_sensor"
+    switch._attr_name = "Test Switch"
+    switch.platform = MagicMock()
+    write_state = MagicMock()
+    monkeypatch.setattr(switch, "async_write_ha_state", write_state)
+    sensor = {"value": "30"}
+
+    def get_state(entity_id: str) -> State | None:
+        if entity_id == "sensor.test_sensor":
+            return State(entity_id, sensor["value"])
+        if entity_id == "fan.test_fan":
+            return State(entity_id, STATE_ON)
+        return None
+
+    mock_hass.states.get.side_effect = get_state
+
+    await switch.run_logic([AreaStates.OCCUPIED, AreaStates.EXTENDED])
+    await switch.run_logic([AreaStates.OCCUPIED, AreaStates.EXTENDED])
+    assert write_state.call_count == 1
+
+    sensor["value"] = "-10"
+    await switch.run_logic([AreaStates.OCCUPIED, AreaStates.EXTENDED])
+    assert write_state.call_count == 2
+    assert switch._attr_extra_state_attributes["inactive_fan_reasons"] == ["cooling"]
+
+
+@pytest.mark.asyncio
+async def test_verbose_diagnostics_keep_details_off_the_entity(
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    mock_hass: MagicMock,
+) -> None:
+    """Verbose control diagnostics log evaluations instead of attributes."""
+    mock_area_config.config = {CONF_VERBOSE_CONTROL_DIAGNOSTICS: True}
+    mock_hass.data = {}
+    switch = FanControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = mock_hass
+    switch._attr_is_on = True
+    switch._fan_group_entity_id = "fan.test_fan"
+    switch.tracked_entity_id = "sensor.test_sensor"
+    switch._attr_name = "Test Switch"
+    switch._attr_extra_state_attributes = {"active_fan_reasons": ["cooling"]}
+    mock_hass.states.get.side_effect = lambda entity_id: (
+        State(entity_id, "30") if entity_id == "sensor.test_sensor" else None
+    )
+
+    await switch.run_logic([AreaStates.OCCUPIED, AreaStates.EXTENDED])
+
+    assert switch._attr_extra_state_attributes == {}
+    log = async_get_control_evaluation_log(mock_hass)
+    recent = log.diagnostics("test_area")["recent"]
+    assert isinstance(recent, list)
+    assert recent[0]["details"]["active_fan_reasons"] == ["cooling"]
+
+
 @pytest.mark.asyncio
 async def test_run_logic_uses_persisted_role_controller_sensors_and_members(
     mock_area_config: AreaConfig,
@@ -443,6 +514,7 @@ async def test_run_logic_uses_persisted_role_controller_sensors_and_members(
         "turn_on",
         {"entity_id": "fan.bathroom"},
         blocking=False,
+        context=ANY,
     )
     attrs = switch._attr_extra_state_attributes
     assert attrs["active_fan_reasons"] == ["humidity"]
@@ -502,10 +574,136 @@ async def test_run_logic_uses_threshold_trend_signal_state(
         "turn_on",
         {"entity_id": "fan.bathroom"},
         blocking=False,
+        context=ANY,
     )
     assert switch._attr_extra_state_attributes["active_fan_reasons"] == ["humidity"]
 
 
+@pytest.mark.asyncio
+async def test_sensor_samples_inside_last_band_skip_reevaluation(
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    mock_hass: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Controller sensor samples are absorbed until they cross a threshold."""
+    mock_coordinator.data.feature_configs = {
+        MagicAreasFeatures.FAN_GROUPS.value: {
+            CONF_FAN_GROUPS_CONTROLLERS: {
+                FanControllerRole.HUMIDITY.value: {
+                    CONF_FAN_CONTROLLER_MEMBERS: ["fan.bathroom"],
+                    CONF_FAN_CONTROLLER_SENSOR_ENTITY_ID: "sensor.bathroom_humidity",
+                    CONF_FAN_CONTROLLER_DETECTION_MODE: FanDetectionMode.THRESHOLD.value,
+                    CONF_FAN_CONTROLLER_ON_THRESHOLD: 60,
+                    CONF_FAN_CONTROLLER_HYSTERESIS: 5,
+                    CONF_FAN_CONTROLLER_ACTIVE_STATES: [AreaStates.OCCUPIED.value],
+                }
+            }
+        }
+    }
+    switch = FanControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = mock_hass
+    switch._attr_is_on = True
+    switch._fan_group_entity_id = "fan.all_bathroom_fans"
+    switch._attr_name = "Test Switch"
+    switch._band_controllers = switch._build_band_controllers()
+
+    def get_state(entity_id: str) -> State | None:
+        if entity_id == "sensor.bathroom_humidity":
+            return State(entity_id, "65")
+        if entity_id == "fan.all_bathroom_fans":
+            return State(entity_id, STATE_ON)
+        return None
+
+    mock_hass.states.get.side_effect = get_state
+    await switch.run_logic([AreaStates.OCCUPIED.value])
+    run_logic_mock = AsyncMock()
+    monkeypatch.setattr(switch, "run_logic", run_logic_mock)
+
+    def sample(value: str) -> Event[EventStateChangedData]:
+        return Event(
+            "state_changed",
+            {
+                "entity_id": "sensor.bathroom_humidity",
+                "old_state": None,
+                "new_state": State("sensor.bathroom_humidity", value),
+            },
+        )
+
+    await switch.aggregate_sensor_state_changed(sample("72"))
+    run_logic_mock.assert_not_awaited()
+
+    await switch.aggregate_sensor_state_changed(sample("58"))
+    run_logic_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_streaming_trend_activates_inside_hysteresis(
+    mock_area_config: AreaConfig,
+    mock_coordinator: MagicAreasCoordinator,
+    mock_hass: MagicMock,
+) -> None:
+    """In-process trend controllers learn the trend from their sensor samples."""
+    mock_coordinator.data.feature_configs = {
+        MagicAreasFeatures.FAN_GROUPS.value: {
+            CONF_FAN_GROUPS_CONTROLLERS: {
+                FanControllerRole.HUMIDITY.value: {
+                    CONF_FAN_CONTROLLER_MEMBERS: ["fan.bathroom"],
+                    CONF_FAN_CONTROLLER_SENSOR_ENTITY_ID: "sensor.bathroom_humidity",
+                    CONF_FAN_CONTROLLER_DETECTION_MODE: (
+                        FanDetectionMode.THRESHOLD_STREAMING_TREND.value
+                    ),
+                    CONF_FAN_CONTROLLER_ON_THRESHOLD: 60,
+                    CONF_FAN_CONTROLLER_HYSTERESIS: 5,
+                    CONF_FAN_CONTROLLER_ACTIVE_STATES: [AreaStates.OCCUPIED.value],
+                    CONF_FAN_CONTROLLER_CLEAR_BEHAVIOR: (
+                        FanClearBehavior.RUN_UNTIL_CLEAR.value
+                    ),
+                }
+            }
+        }
+    }
+    switch = FanControlSwitch(mock_area_config, mock_coordinator)
+    switch.hass = mock_hass
+    switch._attr_is_on = True
+    switch._fan_group_entity_id = "fan.all_bathroom_fans"
+    switch._attr_name = "Test Switch"
+    switch._band_controllers = switch._build_band_controllers()
+    assert switch._controller_trend_signal_unique_ids == {}
+    humidity = {"value": "56"}
+
+    def get_state(entity_id: str) -> State | None:
+        if entity_id == "sensor.bathroom_humidity":
+            return State(entity_id, humidity["value"])
+        if entity_id == "fan.all_bathroom_fans":
+            return State(entity_id, STATE_OFF)
+        return None
+
+    mock_hass.states.get.side_effect = get_state
+    switch._last_states = [AreaStates.OCCUPIED.value]
+
+    for value in ("56", "57"):
+        humidity["value"] = value
+        await switch.aggregate_sensor_state_changed(
+            Event(
+                "state_changed",
+                {
+                    "entity_id": "sensor.bathroom_humidity",
+                    "old_state": None,
+                    "new_state": State("sensor.bathroom_humidity", value),
+                },
+            )
+        )
+
+    mock_hass.services.async_call.assert_awaited_with(
+        "fan",
+        "turn_on",
+        {"entity_id": "fan.bathroom"},
+        blocking=False,
+        context=ANY,
+    )
+
+
 @pytest.mark.asyncio
 async def test_run_logic_publishes_fan_runtime_area_states(
     mock_area_config: AreaConfig,
@@ -819,5 +1017,6 @@ async def test_run_logic_supports_sensorless_odor_room_state_fallback(
         "turn_on",
         {"entity_id": "fan.bathroom"},
         blocking=False,
+        context=ANY,
     )
     assert switch._attr_extra_state_attributes["active_fan_reasons"] == ["odor"]
@@ -9,7 +9,9 @@ from custom_components.magic_areas.core.controls.policies.fan import (
     FanDetectionMode,
     FanSensorUnavailableBehavior,
     FanPolicySignals,
+    FanValueBand,
     evaluate_fan_controllers,
+    fan_controller_value_band,
     fan_controller_evaluation_to_control_group,
     legacy_cooling_controller,
 )
@@ -592,3 +594,13 @@ def test_controller_evaluation_targets_role_members_before_all_fan_group() -> No
     )
 
     assert decision.actions[0].target_entity_ids == ("fan.ceiling",)
+
+
+def test_value_band_splits_at_clear_and_on_thresholds() -> None:
+    """Value bands follow the thresholds the controller evaluation compares."""
+    controller = _controller(FanControllerRole.HUMIDITY)
+
+    assert fan_controller_value_band(controller, None) is FanValueBand.UNAVAILABLE
+    assert fan_controller_value_band(controller, 44.9) is FanValueBand.BELOW_CLEAR
+    assert fan_controller_value_band(controller, 45.0) is FanValueBand.HYSTERESIS
+    assert fan_controller_value_band(controller, 50.0) is (FanValueBand.AT_OR_ABOVE_ON)
@@ -0,0 +1,71 @@
+"""Tests for fan controller trend signals."""
+
+from custom_components.magic_areas.area_state import AreaStates
+from custom_components.magic_areas.core.controls.fan_signals import (
+    StreamingTrend,
+    fan_controller_trend_signal_surface,
+)
+from custom_components.magic_areas.core.controls.policies.fan import (
+    FanControllerConfig,
+    FanControllerRole,
+    FanDetectionMode,
+)
+
+
+def test_streaming_trend_needs_two_distinct_samples() -> None:
+    """A single sample, or samples at one instant, have no slope."""
+    trend = StreamingTrend()
+    trend.add(100.0, 50.0)
+    assert trend.rising is None
+    trend.add(100.0, 52.0)
+    assert trend.rising is None
+
+    trend.add(105.0, 55.0)
+    assert trend.rising is True
+
+
+def test_streaming_trend_slides_its_window() -> None:
+    """Only the newest samples decide the trend direction."""
+    trend = StreamingTrend(max_samples=3)
+    for timestamp, value in ((0.0, 10.0), (5.0, 20.0), (10.0, 30.0)):
+        trend.add(timestamp, value)
+    assert trend.gradient == 2.0
+
+    for timestamp, value in ((15.0, 25.0), (20.0, 20.0), (25.0, 15.0)):
+        trend.add(timestamp, value)
+    assert trend.gradient == -1.0
+    assert trend.rising is False
+
+
+def test_streaming_trend_keeps_precision_across_rebases() -> None:
+    """Long-running estimators rebase sample times without changing slopes."""
+    trend = StreamingTrend()
+    for step in range(2000):
+        trend.add(1_700_000_000.0 + step * 10.0, 40.0 + step * 0.5)
+
+    gradient = trend.gradient
+    assert gradient is not None
+    assert abs(gradient - 0.05) < 1e-9
+
+
+def test_streaming_trend_mode_has_no_managed_helper() -> None:
+    """In-process trend controllers do not plan a Trend helper surface."""
+    controller = FanControllerConfig(
+        controller_id=FanControllerRole.HUMIDITY,
+        members=("fan.bathroom",),
+        sensor_entity_id="sensor.bathroom_humidity",
+        detection_mode=FanDetectionMode.THRESHOLD_STREAMING_TREND,
+        on_threshold=60.0,
+        hysteresis=5.0,
+        active_states=(AreaStates.OCCUPIED,),
+    )
+
+    assert (
+        fan_controller_trend_signal_surface(
+            entry_id="entry",
+            area_id="bathroom",
+            area_name="Bathroom",
+            controller=controller,
+        )
+        is None
+    )
@@ -115,6 +115,8 @@ def _assert_allowlist_exact(
 
 CORE_PUBLIC_API_SURFACES: set[str] = {
     "custom_components.magic_areas.core.aggregates",
+    "custom_components.magic_areas.core.announcements",
+    "custom_components.magic_areas.core.ble_location",
     "custom_components.magic_areas.core.config",
     "custom_components.magic_areas.core.control_intents",
     "custom_components.magic_areas.core.controls",
@@ -130,6 +132,7 @@ CORE_PUBLIC_API_SURFACES: set[str] = {
     "custom_components.magic_areas.core.managed_surface_registry",
     "custom_components.magic_areas.core.meta",
     "custom_components.magic_areas.core.meta_reload",
+    "custom_components.magic_areas.core.meta_tree",
     "custom_components.magic_areas.core.presence_tracker",
     "custom_components.magic_areas.core.runtime_model",
     "custom_components.magic_areas.core.runtime_model.feature_ids",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +15,7 @@ from custom_components.magic_areas.coordinator.pipeline.lifecycle import (
     ReadinessConvergenceManager,
     _MAX_WINDOW_RELOADS,
     _snapshot_entity_ids,
+    async_get_inventory_apply_stats,
     build_readiness_gate_plan,
     build_readiness_request_plan,
     should_trigger_readiness_reload,
@@ -56,9 +58,14 @@ def _make_snapshot() -> MagicAreasData:
     )
 
 
-def _make_manager(*, should_auto_reload: bool = True) -> ReadinessConvergenceManager:
+def _make_manager(
+    *,
+    should_auto_reload: bool = True,
+    hot_apply: Callable[[], Awaitable[bool]] | None = None,
+) -> ReadinessConvergenceManager:
     loop = asyncio.get_running_loop()
     hass = MagicMock()
+    hass.data = {}
     hass.loop = loop
     hass.is_running = True
     hass.bus.async_listen.return_value = lambda: None
@@ -72,6 +79,7 @@ def _make_manager(*, should_auto_reload: bool = True) -> ReadinessConvergenceMan
         area_config=_make_snapshot().area_config,
         get_snapshot=_make_snapshot,
         should_auto_reload=lambda: should_auto_reload,
+        hot_apply=hot_apply,
     )
 
 
@@ -177,6 +185,52 @@ async def test_convergence_execute_reload_resets_in_flight_guard() -> None:
     assert manager._reload_in_flight is False
 
 
+@pytest.mark.asyncio
+async def test_convergence_hot_apply_skips_reload() -> None:
+    """A successful in-place apply replaces the entry reload."""
+    hot_apply = AsyncMock(return_value=True)
+    manager = _make_manager(hot_apply=hot_apply)
+    manager._pending_reason = "entity registry change"
+
+    with patch(
+        "custom_components.magic_areas.coordinator.pipeline.lifecycle.async_reload_entry",
+        new=AsyncMock(),
+    ) as reload_entry:
+        await manager._async_execute_reload()
+
+    hot_apply.assert_awaited_once()
+    reload_entry.assert_not_awaited()
+    assert manager._reload_count == 0
+    stats = async_get_inventory_apply_stats(manager._hass).diagnostics(
+        manager._config_entry.entry_id
+    )
+    assert stats == {
+        "hot_applies": 1,
+        "reloads": 0,
+        "last_reason": "entity registry change",
+    }
+
+
+@pytest.mark.asyncio
+async def test_convergence_structural_change_falls_back_to_reload() -> None:
+    """A declined in-place apply reloads the entry and counts the reload."""
+    manager = _make_manager(hot_apply=AsyncMock(return_value=False))
+
+    with patch(
+        "custom_components.magic_areas.coordinator.pipeline.lifecycle.async_reload_entry",
+        new=AsyncMock(),
+    ) as reload_entry:
+        await manager._async_execute_reload()
+
+    reload_entry.assert_awaited_once()
+    assert manager._reload_count == 1
+    stats = async_get_inventory_apply_stats(manager._hass).diagnostics(
+        manager._config_entry.entry_id
+    )
+    assert stats["reloads"] == 1
+    assert stats["hot_applies"] == 0
+
+
 def test_build_readiness_request_plan_resets_window_and_schedules() -> None:
     """Stale/missing window should reset and allow scheduling."""
     plan = build_readiness_request_plan(
@@ -244,6 +244,18 @@ def test_process_secondary_group_state_change_marks_external_change() -> None:
     assert group.last_state.controlling is False
 
 
+def test_process_secondary_group_state_change_trusts_self_caused_context() -> None:
+    """Context-classified echoes complete the command even without a pending flag."""
+    group = _FakeSecondaryStateGroup(awaiting_echo=False)
+    result = process_secondary_group_state_change(
+        cast(_LightGroupHost, group), object(), self_caused=True
+    )
+    assert result is True
+    assert group.last_state is not None
+    assert group.last_state.controlling is True
+    assert group.last_state.awaiting_echo is False
+
+
 @pytest.mark.asyncio
 async def test_turn_on_uses_control_group_executor(
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,127 @@
+"""Unit tests for the compiled light-group decision table."""
+
+from itertools import combinations, product
+from types import SimpleNamespace
+
+from custom_components.magic_areas.area_state import AreaStates
+from custom_components.magic_areas.diagnostics import _runtime_controller_diagnostics
+from custom_components.magic_areas.light_groups import (
+    ActOnMode,
+    LightAction,
+    LightGroupPolicy,
+    build_light_decision_table,
+)
+
+_STATES = (
+    AreaStates.OCCUPIED,
+    AreaStates.CLEAR,
+    AreaStates.DARK,
+    AreaStates.BRIGHT,
+    AreaStates.SLEEP,
+    AreaStates.EXTENDED,
+)
+
+
+def _subsets(states: tuple[str, ...], size: int) -> list[list[str]]:
+    return [list(combo) for n in range(size + 1) for combo in combinations(states, n)]
+
+
+def _policy(**kwargs: object) -> LightGroupPolicy:
+    return LightGroupPolicy(
+        assigned_states=[AreaStates.DARK, AreaStates.SLEEP],
+        act_on_modes=[ActOnMode.OCCUPANCY_CHANGE, ActOnMode.STATE_CHANGE],
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_compiled_decisions_match_full_evaluator() -> None:
+    """Table lookups return exactly what the full rule engine returns."""
+    policy = _policy(brightness_mode="adaptive")
+    reference = _policy(brightness_mode="adaptive")
+    policy.decision_table = build_light_decision_table(
+        policy.assigned_states, max_entries=100_000
+    )
+    subsets = _subsets(_STATES, 2)
+
+    for _ in range(2):
+        for new_states, lost_states, current_states, guards in product(
+            subsets[:12],
+            subsets[:8],
+            subsets,
+            ((True, None), (False, True), (True, False)),
+        ):
+            min_on_met, inside_bright_met = guards
+            compiled = policy.evaluate(
+                new_states,
+                lost_states,
+                current_states,
+                min_on_met=min_on_met,
+                inside_bright_met=inside_bright_met,
+            )
+            expected = reference.evaluate_uncompiled(
+                new_states,
+                lost_states,
+                current_states,
+                min_on_met=min_on_met,
+                inside_bright_met=inside_bright_met,
+            )
+            assert compiled == expected
+
+    diagnostics = policy.decision_table.diagnostics()
+    assert diagnostics["compiled"] == diagnostics["entries"]
+    assert policy.decision_table.hits >= policy.decision_table.compiled
+    assert diagnostics["fallbacks"] == 0
+
+
+def test_irrelevant_states_share_one_table_entry() -> None:
+    """States the policy never branches on do not widen the table key."""
+    policy = _policy()
+
+    first = policy.evaluate(
+        [AreaStates.EXTENDED], [], [AreaStates.OCCUPIED, AreaStates.EXTENDED]
+    )
+    second = policy.evaluate(["custom_state"], [], [AreaStates.OCCUPIED])
+
+    assert first.action is second.action is LightAction.NOOP
+    assert len(policy.decision_table) == 1
+    assert policy.decision_table.hits == 1
+
+
+def test_full_table_falls_back_to_full_evaluator_and_reports_rate() -> None:
+    """Keys beyond table capacity are evaluated uncached and counted."""
+    policy = _policy()
+    policy.decision_table = build_light_decision_table(
+        policy.assigned_states, max_entries=1
+    )
+
+    on = policy.evaluate(
+        [AreaStates.OCCUPIED], [AreaStates.CLEAR], [AreaStates.OCCUPIED, "dark"]
+    )
+    policy.evaluate([AreaStates.CLEAR], [AreaStates.OCCUPIED], [AreaStates.CLEAR])
+    policy.evaluate([AreaStates.CLEAR], [AreaStates.OCCUPIED], [AreaStates.CLEAR])
+
+    assert on.action is LightAction.TURN_ON
+    assert policy.decision_table.diagnostics() == {
+        "entries": 1,
+        "max_entries": 1,
+        "evaluations": 3,
+        "hits": 0,
+        "compiled": 1,
+        "fallbacks": 2,
+        "fallback_rate": 0.6667,
+    }
+
+
+def test_runtime_controller_diagnostics_skip_controllers_without_hook() -> None:
+    """Config-entry diagnostics collect only controllers exposing diagnostics."""
+    runtime_data = SimpleNamespace(
+        runtime_controllers=[
+            SimpleNamespace(diagnostics=lambda: {"runtime": "kitchen_overhead"}),
+            SimpleNamespace(),
+        ]
+    )
+
+    assert _runtime_controller_diagnostics(runtime_data) == [
+        {"runtime": "kitchen_overhead"}
+    ]
+    assert _runtime_controller_diagnostics(SimpleNamespace()) == []
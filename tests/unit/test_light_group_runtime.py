@@ -19,6 +19,7 @@ from custom_components.magic_areas.core.controls import (
     ControlActionType,
     ControlRuntimeEffect,
     ControlRuntimeEffectType,
+    async_get_command_context_index,
 )
 from custom_components.magic_areas.light_groups import CommandEchoState
 from custom_components.magic_areas.light_groups import LightGroupRuntimeController
@@ -265,8 +266,10 @@ async def test_dispatch_light_action_targets_native_helper(
         return task
 
     group = SimpleNamespace(
-        hass=SimpleNamespace(async_create_task=async_create_task),
+        hass=SimpleNamespace(async_create_task=async_create_task, data={}),
         entity_id="light.magic_areas_light_groups_living_room_overhead",
+        unique_id="light_groups_living_room_overhead",
+        _area_id="living_room",
         _control_target_entity_id=Mock(
             return_value="light.magic_areas_native_living_room_overhead"
         ),
@@ -282,6 +285,11 @@ async def test_dispatch_light_action_targets_native_helper(
     assert decision.actions[0].target_entity_ids == (
         "light.magic_areas_native_living_room_overhead",
     )
+    context = execute_mock.await_args.kwargs["context"]
+    record = async_get_command_context_index(group.hass).lookup(context)
+    assert record is not None
+    assert record.area_id == "living_room"
+    assert record.controller == "light_groups_living_room_overhead"
 
 
 @pytest.mark.asyncio
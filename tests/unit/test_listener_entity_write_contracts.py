@@ -41,8 +41,8 @@ def _coordinator_with_feature(
     return coordinator
 
 
-def test_ble_tracker_update_state_uses_scheduled_write_path() -> None:
-    """BLE tracker keeps scheduler writes because callbacks may arrive off-loop."""
+def test_ble_tracker_update_state_uses_immediate_write() -> None:
+    """BLE tracker writes immediately; the location router calls it on the loop."""
     coordinator = _coordinator_with_feature(
         MagicAreasFeatures.BLE_TRACKER, {"ble_tracker_entities": ["sensor.ble_1"]}
     )
@@ -56,8 +56,8 @@ def test_ble_tracker_update_state_uses_scheduled_write_path() -> None:
     ):
         entity._update_state()
 
-    mock_schedule.assert_called_once()
-    mock_write.assert_not_called()
+    mock_write.assert_called_once()
+    mock_schedule.assert_not_called()
 
 
 def test_wasp_apply_update_uses_immediate_write() -> None:
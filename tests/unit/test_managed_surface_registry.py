@@ -16,6 +16,7 @@ from custom_components.magic_areas.core.managed_surface_registry import (
     iter_managed_surface_config_entries,
     iter_managed_surface_entity_entries,
     resolve_managed_surface_entity_id,
+    resolve_managed_surface_entity_ids,
 )
 
 
@@ -176,3 +177,49 @@ def test_iter_managed_surface_entity_entries_and_resolver(
         )
         == "fan.magic_areas_fan_group"
     )
+
+
+def test_batch_resolution_scans_config_entries_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Many managed-surface requests should share one config-entry scan."""
+    prefix = "magic_areas:owner-1:area-1:fan_groups:config_entry_helper"
+    entries = [
+        _entry(entry_id=f"trend-{index}", unique_id=f"{prefix}:trend_{index}")
+        for index in range(3)
+    ]
+    registry_entries = {
+        entry.entry_id: [
+            SimpleNamespace(domain="binary_sensor", entity_id=f"binary_sensor.{name}")
+        ]
+        for entry, name in zip(entries, ("first", "second", "third"), strict=True)
+    }
+    scans: list[str | None] = []
+
+    def _async_entries(domain: str | None = None) -> list[SimpleNamespace]:
+        scans.append(domain)
+        return entries
+
+    hass = SimpleNamespace(config_entries=SimpleNamespace(async_entries=_async_entries))
+    monkeypatch.setattr(
+        "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+        lambda registry, entry_id: registry_entries.get(entry_id, []),
+    )
+
+    resolved = resolve_managed_surface_entity_ids(
+        _hass(hass),
+        _entity_registry(SimpleNamespace()),
+        [
+            (f"{prefix}:trend_0", "binary_sensor"),
+            (f"{prefix}:trend_2", "binary_sensor"),
+            (f"{prefix}:trend_2", "sensor"),
+            (f"{prefix}:missing", "binary_sensor"),
+        ],
+        config_entry_domain="trend",
+    )
+
+    assert resolved == {
+        (f"{prefix}:trend_0", "binary_sensor"): "binary_sensor.first",
+        (f"{prefix}:trend_2", "binary_sensor"): "binary_sensor.third",
+    }
+    assert scans == ["trend"]
@@ -0,0 +1,216 @@
+"""Tests for the meta-area child presence propagation tree."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import cast
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+
+from custom_components.magic_areas.area_state import AreaStates, MetaAreaType
+from custom_components.magic_areas.const import ATTR_STATES
+from custom_components.magic_areas.core.meta_tree import (
+    LeafSignature,
+    async_get_meta_propagation_tree,
+    meta_parent_id,
+)
+
+KITCHEN = "binary_sensor.kitchen_area_state"
+DEN = "binary_sensor.den_area_state"
+PATIO = "binary_sensor.patio_area_state"
+
+
+class _Member:
+    """Meta area stand-in deriving "any child on" plus the union of states."""
+
+    def __init__(self, calls: list[tuple[str, str]], meta_id: str) -> None:
+        self.calls = calls
+        self.meta_id = meta_id
+        self.children: dict[str, LeafSignature] = {}
+
+    def sync_meta_children(
+        self, children: Mapping[str, LeafSignature]
+    ) -> LeafSignature:
+        self.children = dict(children)
+        return self._derived()
+
+    def apply_meta_child_change(
+        self, child_id: str, old: LeafSignature, new: LeafSignature
+    ) -> LeafSignature:
+        assert self.children.get(child_id, (None, None)) == old
+        self.calls.append((self.meta_id, child_id))
+        self.children[child_id] = new
+        return self._derived()
+
+    def _derived(self) -> LeafSignature:
+        active = [
+            states or frozenset()
+            for state, states in self.children.values()
+            if state == STATE_ON
+        ]
+        return (
+            STATE_ON if active else STATE_OFF,
+            frozenset().union(*active),
+        )
+
+
+def test_meta_parent_id_links_interior_and_exterior_to_global() -> None:
+    """Interior/exterior roll up to global; global and floors are roots."""
+    assert meta_parent_id(MetaAreaType.INTERIOR) == MetaAreaType.GLOBAL
+    assert meta_parent_id(MetaAreaType.EXTERIOR) == MetaAreaType.GLOBAL
+    assert meta_parent_id(MetaAreaType.GLOBAL) is None
+    assert meta_parent_id("ground_floor") is None
+
+
+async def test_parents_receive_the_derived_child_meta_signature(
+    hass: HomeAssistant,
+) -> None:
+    """Global consumes interior's recomputed signature, not the leaf event."""
+    tree = async_get_meta_propagation_tree(hass)
+    calls: list[tuple[str, str]] = []
+    global_member = _Member(calls, MetaAreaType.GLOBAL)
+    interior = _Member(calls, MetaAreaType.INTERIOR)
+    tree.register(
+        MetaAreaType.GLOBAL, [KITCHEN, DEN, PATIO], global_member, composable=True
+    )
+    tree.register(
+        MetaAreaType.INTERIOR,
+        [KITCHEN, DEN],
+        interior,
+        parent_id=MetaAreaType.GLOBAL,
+        composable=True,
+    )
+    tree.register(
+        MetaAreaType.EXTERIOR,
+        [PATIO],
+        _Member(calls, MetaAreaType.EXTERIOR),
+        parent_id=MetaAreaType.GLOBAL,
+        composable=True,
+    )
+    tree.register("ground_floor", [KITCHEN], _Member(calls, "ground_floor"))
+
+    assert set(global_member.children) == {
+        MetaAreaType.INTERIOR,
+        MetaAreaType.EXTERIOR,
+    }
+
+    hass.states.async_set(KITCHEN, "on", {ATTR_STATES: [AreaStates.OCCUPIED]})
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == sorted(
+        [
+            (MetaAreaType.INTERIOR, KITCHEN),
+            (MetaAreaType.GLOBAL, MetaAreaType.INTERIOR),
+            ("ground_floor", KITCHEN),
+        ]
+    )
+    assert global_member.children[MetaAreaType.INTERIOR] == (
+        STATE_ON,
+        frozenset({AreaStates.OCCUPIED}),
+    )
+    assert tree.diagnostics()["delivered"] == 3
+
+
+async def test_non_any_parent_keeps_counting_every_leaf(
+    hass: HomeAssistant,
+) -> None:
+    """A parent whose mode is not "any" gets the leaves, not child metas."""
+    tree = async_get_meta_propagation_tree(hass)
+    calls: list[tuple[str, str]] = []
+    global_member = _Member(calls, MetaAreaType.GLOBAL)
+    tree.register(MetaAreaType.GLOBAL, [KITCHEN, DEN, PATIO], global_member)
+    tree.register(
+        MetaAreaType.INTERIOR,
+        [KITCHEN, DEN],
+        _Member(calls, MetaAreaType.INTERIOR),
+        parent_id=MetaAreaType.GLOBAL,
+        composable=True,
+    )
+
+    assert set(global_member.children) == {KITCHEN, DEN, PATIO}
+
+    hass.states.async_set(KITCHEN, "on", {ATTR_STATES: [AreaStates.OCCUPIED]})
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == sorted(
+        [(MetaAreaType.INTERIOR, KITCHEN), (MetaAreaType.GLOBAL, KITCHEN)]
+    )
+    meta_areas = cast(dict[str, dict[str, object]], tree.diagnostics()["meta_areas"])
+    assert meta_areas[MetaAreaType.INTERIOR]["parent"] is None
+
+
+async def test_unchanged_derived_signature_stops_propagation(
+    hass: HomeAssistant,
+) -> None:
+    """A leaf change that leaves its meta area's signature alone stops there."""
+    tree = async_get_meta_propagation_tree(hass)
+    calls: list[tuple[str, str]] = []
+    hass.states.async_set(KITCHEN, "on", {ATTR_STATES: [AreaStates.DARK]})
+    tree.register(
+        MetaAreaType.GLOBAL, [KITCHEN, DEN], _Member(calls, "global"), composable=True
+    )
+    tree.register(
+        MetaAreaType.INTERIOR,
+        [KITCHEN, DEN],
+        _Member(calls, "interior"),
+        parent_id=MetaAreaType.GLOBAL,
+        composable=True,
+    )
+
+    hass.states.async_set(DEN, "on", {ATTR_STATES: [AreaStates.DARK]})
+    await hass.async_block_till_done()
+
+    assert calls == [("interior", DEN)]
+    assert tree.diagnostics()["stopped"] == 1
+
+    hass.states.async_set(KITCHEN, "off")
+    hass.states.async_set(DEN, "off")
+    await hass.async_block_till_done()
+
+    assert calls[-1] == ("global", MetaAreaType.INTERIOR)
+
+
+async def test_attribute_only_child_changes_are_suppressed(
+    hass: HomeAssistant,
+) -> None:
+    """Child updates that keep presence and area states do not reach metas."""
+    tree = async_get_meta_propagation_tree(hass)
+    calls: list[tuple[str, str]] = []
+    tree.register(MetaAreaType.GLOBAL, [KITCHEN], _Member(calls, "global"))
+
+    hass.states.async_set(KITCHEN, "on", {ATTR_STATES: [AreaStates.OCCUPIED]})
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        KITCHEN,
+        "on",
+        {ATTR_STATES: [AreaStates.OCCUPIED], "last_active_sensors": ["x"]},
+    )
+    await hass.async_block_till_done()
+
+    assert calls == [("global", KITCHEN)]
+    assert tree.diagnostics()["suppressed"] == 1
+
+
+async def test_removing_a_child_meta_hands_its_leaves_to_the_parent(
+    hass: HomeAssistant,
+) -> None:
+    """Without interior, global tracks the leaves directly again."""
+    tree = async_get_meta_propagation_tree(hass)
+    calls: list[tuple[str, str]] = []
+    global_member = _Member(calls, "global")
+    tree.register(MetaAreaType.GLOBAL, [KITCHEN], global_member, composable=True)
+    remove_interior = tree.register(
+        MetaAreaType.INTERIOR,
+        [KITCHEN],
+        _Member(calls, "interior"),
+        parent_id=MetaAreaType.GLOBAL,
+        composable=True,
+    )
+
+    remove_interior()
+    assert set(global_member.children) == {KITCHEN}
+
+    hass.states.async_set(KITCHEN, "on")
+    await hass.async_block_till_done()
+    assert calls == [("global", KITCHEN)]
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, Mock, patch
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
@@ -16,6 +17,7 @@ from custom_components.magic_areas.config_keys.area import (
     CONF_SECONDARY_STATES_CALCULATION_MODE,
 )
 from custom_components.magic_areas.const import ATTR_STATES, DOMAIN
+from custom_components.magic_areas.core.meta_tree import leaf_signature
 from custom_components.magic_areas.core.runtime_model import (
     build_presence_tracking_unique_id,
 )
@@ -196,14 +198,13 @@ def test_apply_sensor_inventory_update_tracks_added_sensors() -> None:
     mock_track.assert_called_once_with(["binary_sensor.motion_1"])
 
 
-def test_meta_secondary_states_read_registered_active_child_entities(
+def test_meta_secondary_states_aggregate_live_child_state_counters(
     hass: HomeAssistant,
 ) -> None:
-    """Meta secondary states should aggregate valid active child attributes."""
+    """Meta secondary states come from counters fed by child presence events."""
     coordinator = _coordinator()
     coordinator.hass = hass
     coordinator.data.presence_sensors = []
-    coordinator.data.active_areas = ["kitchen", "bedroom", "office", "missing"]
     entity = MetaAreaStateBinarySensor(_meta_area_config(), coordinator)
     entity.hass = hass
     registry = er.async_get(hass)
@@ -225,8 +226,27 @@ def test_meta_secondary_states_read_registered_active_child_entities(
     )
     hass.states.async_set(
         child_entity_ids["bedroom"],
-        "off",
+        "on",
         {ATTR_STATES: "invalid"},
     )
+    entity.sync_meta_children(
+        {
+            entity_id: leaf_signature(hass.states.get(entity_id))
+            for entity_id in child_entity_ids.values()
+        }
+    )
+
+    assert entity._get_secondary_states() == [AreaStates.SLEEP, AreaStates.DARK]
+
+    office = child_entity_ids["office"]
+    with patch.object(entity, "_update_state") as mock_update:
+        derived = entity.apply_meta_child_change(
+            office,
+            leaf_signature(hass.states.get(office)),
+            (STATE_ON, frozenset({AreaStates.OCCUPIED})),
+        )
+    mock_update.assert_called_once()
+    assert derived == (STATE_ON, frozenset({AreaStates.SLEEP, AreaStates.DARK}))
 
+    assert entity._secondary_counters.active_child_count == 2
     assert entity._get_secondary_states() == [AreaStates.SLEEP, AreaStates.DARK]
@@ -0,0 +1,146 @@
+"""Tests for the integration-wide config entry reload queue."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ID
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.magic_areas.area_state import MetaAreaType
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.reload_queue import (
+    RELOAD_RANK_AREA,
+    RELOAD_RANK_GLOBAL,
+    RELOAD_RANK_META,
+    ReloadQueue,
+    entry_reload_rank,
+)
+
+
+def _entry(
+    hass: HomeAssistant,
+    area_id: str,
+    state: ConfigEntryState = ConfigEntryState.LOADED,
+) -> str:
+    entry = MockConfigEntry(domain=DOMAIN, data={ATTR_ID: area_id}, state=state)
+    entry.add_to_hass(hass)
+    return entry.entry_id
+
+
+class _Reloads:
+    """Record reload order; optionally hold reloads until released."""
+
+    def __init__(self, *, hold: bool = False) -> None:
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+        if not hold:
+            self.release.set()
+
+    async def __call__(self, entry_id: str) -> bool:
+        self.started.append(entry_id)
+        await self.release.wait()
+        return True
+
+
+async def test_entry_reload_rank_orders_children_before_metas(
+    hass: HomeAssistant,
+) -> None:
+    """Regular areas rank below type metas, which rank below global."""
+    assert entry_reload_rank(hass, _entry(hass, "kitchen")) == RELOAD_RANK_AREA
+    assert (
+        entry_reload_rank(hass, _entry(hass, MetaAreaType.INTERIOR)) == RELOAD_RANK_META
+    )
+    assert (
+        entry_reload_rank(hass, _entry(hass, MetaAreaType.GLOBAL)) == RELOAD_RANK_GLOBAL
+    )
+
+
+async def test_requests_for_a_queued_entry_coalesce(hass: HomeAssistant) -> None:
+    """Repeated requests merge into one queued reload with all reasons."""
+    busy = _entry(hass, "office")
+    kitchen = _entry(hass, "kitchen")
+    queue = ReloadQueue(hass=hass, max_concurrency=1)
+    reloads = _Reloads(hold=True)
+
+    with patch.object(hass.config_entries, "async_reload", new=reloads):
+        queue.request(busy, reason="options updated")
+        queue.request(kitchen, reason="registry change")
+        queue.request(kitchen, reason="registry change")
+        queue.request(kitchen, reason="options updated")
+        assert queue.queue_depth == 1
+        reloads.release.set()
+        await hass.async_block_till_done()
+
+    assert reloads.started == [busy, kitchen]
+    diagnostics = queue.diagnostics(kitchen)
+    assert diagnostics["coalesced"] == 2
+    assert diagnostics["queue_depth"] == 0
+    entry_diagnostics = diagnostics["entry"]
+    assert isinstance(entry_diagnostics, dict)
+    assert entry_diagnostics["last_reasons"] == ["registry change", "options updated"]
+    assert entry_diagnostics["reloads"] == 1
+
+
+async def test_meta_parents_wait_for_queued_children(hass: HomeAssistant) -> None:
+    """Global reloads after interior, which reloads after the regular areas."""
+    busy = _entry(hass, "office")
+    global_meta = _entry(hass, MetaAreaType.GLOBAL)
+    interior = _entry(hass, MetaAreaType.INTERIOR)
+    kitchen = _entry(hass, "kitchen")
+    queue = ReloadQueue(hass=hass, max_concurrency=2)
+    reloads = _Reloads(hold=True)
+
+    with patch.object(hass.config_entries, "async_reload", new=reloads):
+        queue.request(busy, reason="options updated")
+        queue.request(global_meta, reason="meta membership change")
+        queue.request(interior, reason="meta membership change")
+        queue.request(kitchen, reason="registry change")
+        await asyncio.sleep(0)
+        started = list(reloads.started)
+        reloads.release.set()
+        await hass.async_block_till_done()
+
+    assert started == [busy, kitchen]
+    assert reloads.started == [busy, kitchen, interior, global_meta]
+
+
+async def test_concurrent_reloads_are_capped(hass: HomeAssistant) -> None:
+    """No more than the configured number of reloads run at once."""
+    entry_ids = [_entry(hass, f"area_{index}") for index in range(5)]
+    queue = ReloadQueue(hass=hass, max_concurrency=2)
+    reloads = _Reloads(hold=True)
+
+    with patch.object(hass.config_entries, "async_reload", new=reloads):
+        for entry_id in entry_ids:
+            queue.request(entry_id, reason="registry change")
+        await asyncio.sleep(0)
+        assert len(reloads.started) == 2
+        diagnostics = queue.diagnostics()
+        assert diagnostics["running"] == 2
+        assert diagnostics["queue_depth"] == 3
+        reloads.release.set()
+        await hass.async_block_till_done()
+
+    assert reloads.started == entry_ids
+    assert queue.diagnostics()["max_queue_depth"] == 3
+
+
+async def test_unloaded_entries_are_not_set_up_again(hass: HomeAssistant) -> None:
+    """A reload queued for an entry unloaded meanwhile is dropped."""
+    unloaded = _entry(hass, "kitchen", ConfigEntryState.NOT_LOADED)
+    queue = ReloadQueue(hass=hass)
+    reloads = _Reloads()
+
+    with patch.object(hass.config_entries, "async_reload", new=reloads):
+        queue.request(unloaded, reason="meta membership change")
+        queue.request("removed_entry", reason="registry change")
+        await hass.async_block_till_done()
+
+    assert reloads.started == []
+    diagnostics = queue.diagnostics()
+    assert diagnostics["skipped"] == 2
+    assert diagnostics["running"] == 0
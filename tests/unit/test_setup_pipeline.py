@@ -0,0 +1,108 @@
+"""Tests for the house-level config entry setup pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ID
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.magic_areas.area_state import MetaAreaType
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.setup_pipeline import (
+    SetupPipeline,
+    record_registry_lookups,
+)
+
+
+def _entry(
+    hass: HomeAssistant,
+    area_id: str,
+    state: ConfigEntryState = ConfigEntryState.SETUP_IN_PROGRESS,
+) -> str:
+    entry = MockConfigEntry(domain=DOMAIN, data={ATTR_ID: area_id}, state=state)
+    entry.add_to_hass(hass)
+    return entry.entry_id
+
+
+async def test_meta_waits_for_children_setting_up(hass: HomeAssistant) -> None:
+    """A meta setup resumes once every child still setting up is ready."""
+    kitchen = _entry(hass, "kitchen")
+    office = _entry(hass, "office")
+    _entry(hass, "loaded_room", ConfigEntryState.LOADED)
+    interior = _entry(hass, MetaAreaType.INTERIOR)
+    pipeline = SetupPipeline(hass=hass)
+    for entry_id in (kitchen, office, interior):
+        pipeline.begin(entry_id)
+
+    waiter = hass.async_create_task(pipeline.async_wait_for_children(interior))
+    pipeline.mark_ready(kitchen)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert pipeline.diagnostics(interior)["setting_up"] == sorted([office, interior])
+
+    pipeline.mark_ready(office)
+    await waiter
+    diagnostics = pipeline.diagnostics(interior)
+    assert diagnostics["waited_for"] == 2
+    assert diagnostics["timed_out"] is False
+
+
+async def test_regular_areas_never_wait(hass: HomeAssistant) -> None:
+    """Regular areas set up without waiting on anything."""
+    _entry(hass, MetaAreaType.GLOBAL)
+    kitchen = _entry(hass, "kitchen")
+    pipeline = SetupPipeline(hass=hass)
+
+    await pipeline.async_wait_for_children(kitchen)
+
+    assert pipeline.diagnostics(kitchen)["waited_for"] == 0
+
+
+async def test_child_wait_is_bounded(hass: HomeAssistant) -> None:
+    """A child that never finishes setting up does not block its meta forever."""
+    _entry(hass, "kitchen")
+    global_meta = _entry(hass, MetaAreaType.GLOBAL)
+    pipeline = SetupPipeline(hass=hass, child_wait_timeout=0.01)
+
+    await pipeline.async_wait_for_children(global_meta)
+
+    assert pipeline.diagnostics(global_meta)["timed_out"] is True
+
+
+async def test_phase_records_timing_and_side_effects(hass: HomeAssistant) -> None:
+    """Phases count service calls made inside them and nothing outside."""
+    kitchen = _entry(hass, "kitchen")
+    pipeline = SetupPipeline(hass=hass)
+    hass.services.async_register("test", "noop", lambda call: None)
+
+    with pipeline.phase(kitchen, "first_refresh"):
+        await hass.services.async_call("test", "noop", blocking=True)
+        record_registry_lookups(3)
+    await hass.services.async_call("test", "noop", blocking=True)
+    record_registry_lookups()
+    with pipeline.phase(kitchen, "first_refresh"):
+        pass
+
+    phase = pipeline.diagnostics(kitchen)["phases"]
+    assert isinstance(phase, dict)
+    assert phase["first_refresh"]["runs"] == 2
+    assert phase["first_refresh"]["service_calls"] == 1
+    assert phase["first_refresh"]["registry_lookups"] == 3
+    assert phase["first_refresh"]["last_seconds"] is not None
+
+
+async def test_unlisten_detaches_phase_counters(hass: HomeAssistant) -> None:
+    """Releasing the pipeline removes the bus listeners its phases attached."""
+    kitchen = _entry(hass, "kitchen")
+    pipeline = SetupPipeline(hass=hass)
+    before = hass.bus.async_listeners()
+
+    with pipeline.phase(kitchen, "first_refresh"):
+        pass
+    assert hass.bus.async_listeners() != before
+
+    pipeline.async_unlisten()
+    assert hass.bus.async_listeners() == before
@@ -0,0 +1,77 @@
+"""Tests for the persisted warm-start snapshot cache."""
+
+from __future__ import annotations
+
+from homeassistant.const import ATTR_ID, EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.magic_areas.const import DOMAIN
+from custom_components.magic_areas.coordinator.pipeline.snapshot_cache import (
+    SNAPSHOT_CACHE_STORAGE_KEY,
+    CachedSnapshot,
+    SnapshotCache,
+)
+from custom_components.magic_areas.core.runtime_model import EntityReferences
+
+
+def _cached(fingerprint: str = "abc", brightness: str = "10") -> CachedSnapshot:
+    return CachedSnapshot(
+        fingerprint=fingerprint,
+        entities={"light": [{"entity_id": "light.one", "brightness": brightness}]},
+        magic_entities={},
+        presence_sensors=["binary_sensor.motion"],
+        entity_references=EntityReferences(area_state_sensor="binary_sensor.area"),
+    )
+
+
+async def test_cached_snapshot_round_trips_through_storage(
+    hass: HomeAssistant, hass_storage: dict[str, object]
+) -> None:
+    """Stored inventories load back for matching fingerprints only."""
+    entry = MockConfigEntry(domain=DOMAIN, data={ATTR_ID: "kitchen"})
+    entry.add_to_hass(hass)
+    hass_storage[SNAPSHOT_CACHE_STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": SNAPSHOT_CACHE_STORAGE_KEY,
+        "data": {entry.entry_id: _cached().as_dict(), "gone": {"fingerprint": 1}},
+    }
+    cache = SnapshotCache(hass=hass)
+    await cache.async_load()
+
+    assert cache.get(entry.entry_id, "other") is None
+    assert cache.get("gone", "abc") is None
+    assert cache.get(entry.entry_id, "abc") == _cached()
+    diagnostics = cache.diagnostics(entry.entry_id)
+    assert diagnostics["entries"] == 1
+    assert (diagnostics["hits"], diagnostics["misses"], diagnostics["stale"]) == (
+        1,
+        1,
+        1,
+    )
+    assert diagnostics["warm_started"] is True
+
+
+async def test_put_saves_only_inventory_changes(
+    hass: HomeAssistant, hass_storage: dict[str, object]
+) -> None:
+    """Attribute-only changes stay in memory; inventory changes are saved."""
+    entry = MockConfigEntry(domain=DOMAIN, data={ATTR_ID: "kitchen"})
+    entry.add_to_hass(hass)
+    cache = SnapshotCache(hass=hass)
+    await cache.async_load()
+
+    cache.put(entry.entry_id, _cached())
+    cache.put(entry.entry_id, _cached(brightness="200"))
+    cache.put("removed_entry", _cached())
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert cache.updates == 2
+    stored = hass_storage[SNAPSHOT_CACHE_STORAGE_KEY]
+    assert isinstance(stored, dict)
+    assert stored["data"] == {entry.entry_id: _cached(brightness="200").as_dict()}
+
+    cache.put(entry.entry_id, _cached(fingerprint="def"))
+    assert cache.updates == 3